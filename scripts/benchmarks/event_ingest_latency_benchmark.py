@@ -0,0 +1,175 @@
+"""Measure event ingestion latency while utilization reports are running.
+
+Runs an EventManager over the in-memory MongoDB backend, with every query
+delayed by a simulated database round trip, and posts events to /event at a
+fixed rate while other threads request /utilization/user reports back to
+back. Compares two modes:
+
+- inline: database calls run directly in the async route handlers, blocking
+  the event loop, as the event manager did before it used worker pools.
+- pooled: database calls run on the event manager's database and report
+  worker pools.
+
+Reports /event latency percentiles and how many reports completed.
+
+Usage:
+    python scripts/benchmarks/event_ingest_latency_benchmark.py
+    python scripts/benchmarks/event_ingest_latency_benchmark.py --seconds 10 --query-ms 200 --reporters 2
+"""
+
+import argparse
+import logging
+import statistics
+import threading
+import time
+from typing import Any, Callable
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+from madsci.common.db_handlers import InMemoryMongoHandler
+from madsci.common.types.event_types import Event, EventManagerSettings, EventType
+from madsci.event_manager.event_server import EventManager
+
+MODES = ("inline", "pooled")
+
+
+class DelayedCollection:
+    """An events collection where reads cost a simulated query and writes a round trip"""
+
+    READS = ("find", "find_one", "count_documents")
+
+    def __init__(self, collection: Any, query_delay: float, write_delay: float) -> None:
+        """Wrap a collection"""
+        self._collection = collection
+        self._query_delay = query_delay
+        self._write_delay = write_delay
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        """Delay method calls"""
+        method = getattr(self._collection, name)
+        delay = self._query_delay if name in self.READS else self._write_delay
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            time.sleep(delay)
+            return method(*args, **kwargs)
+
+        return call
+
+
+class DelayedMongoHandler(InMemoryMongoHandler):
+    """An in-memory MongoDB handler whose collections are delayed"""
+
+    def __init__(self, query_delay: float, write_delay: float) -> None:
+        """Create an empty in-memory database"""
+        super().__init__(database_name="benchmark")
+        self._query_delay = query_delay
+        self._write_delay = write_delay
+
+    def get_collection(self, name: str) -> Any:
+        """Return a delayed in-memory collection"""
+        return DelayedCollection(
+            super().get_collection(name), self._query_delay, self._write_delay
+        )
+
+
+async def run_inline(_self: EventManager, func: Callable[..., Any], *args: Any) -> Any:
+    """Run a database call directly on the event loop"""
+    return func(*args)
+
+
+def run(mode: str, args: argparse.Namespace) -> dict[str, Any]:
+    """Run the workload in one mode and return /event latencies and report count"""
+    manager = EventManager(
+        settings=EventManagerSettings(
+            manager_name="benchmark",
+            enable_registry_resolution=False,
+            rate_limit_enabled=False,
+        ),
+        mongo_handler=DelayedMongoHandler(args.query_ms / 1000, args.write_ms / 1000),
+    )
+    latencies: list[float] = []
+    reports = 0
+    reports_lock = threading.Lock()
+    stop = threading.Event()
+
+    patches = []
+    if mode == "inline":
+        patches = [
+            patch.object(EventManager, "_run_db", run_inline),
+            patch.object(EventManager, "_run_report", run_inline),
+        ]
+    for p in patches:
+        p.start()
+    try:
+        # * Entering the client runs every request on one shared event loop
+        with TestClient(manager.create_server()) as client:
+
+            def reporter() -> None:
+                nonlocal reports
+                while not stop.is_set():
+                    client.get("/utilization/user").raise_for_status()
+                    with reports_lock:
+                        reports += 1
+
+            threads = [
+                threading.Thread(target=reporter, daemon=True)
+                for _ in range(args.reporters)
+            ]
+            for thread in threads:
+                thread.start()
+            end = time.monotonic() + args.seconds
+            while time.monotonic() < end:
+                event = Event(
+                    event_type=EventType.TEST, event_data={"n": len(latencies)}
+                )
+                start = time.perf_counter()
+                client.post(
+                    "/event", json=event.model_dump(mode="json")
+                ).raise_for_status()
+                latencies.append(time.perf_counter() - start)
+                time.sleep(args.event_interval)
+            stop.set()
+            for thread in threads:
+                thread.join()
+    finally:
+        for p in patches:
+            p.stop()
+
+    ordered = sorted(latencies)
+    return {
+        "events": len(latencies),
+        "p50_ms": ordered[len(ordered) // 2] * 1000,
+        "p99_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000,
+        "max_ms": ordered[-1] * 1000,
+        "mean_ms": statistics.mean(latencies) * 1000,
+        "reports": reports,
+    }
+
+
+def main() -> None:
+    """Run the benchmark in each mode and print a comparison table"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--query-ms", type=float, default=100.0)
+    parser.add_argument("--write-ms", type=float, default=1.0)
+    parser.add_argument("--reporters", type=int, default=1)
+    parser.add_argument("--event-interval", type=float, default=0.01)
+    parser.add_argument("--modes", nargs="+", default=list(MODES), choices=MODES)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    results = {mode: run(mode, args) for mode in args.modes}
+    columns = list(next(iter(results.values())))
+    print(f"{'mode':<8}" + "".join(f"{column:>12}" for column in columns))
+    for mode, result in results.items():
+        print(
+            f"{mode:<8}"
+            + "".join(
+                f"{value:>12.2f}" if isinstance(value, float) else f"{value:>12}"
+                for value in result.values()
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,314 @@
+"""Measure lock contention in the workcell state handler.
+
+Replays a mixed engine/server workload against a WorkcellStateHandler backed
+by the in-memory Redis, with every Redis command delayed by a simulated
+network round trip, in two modes:
+
+- global: every operation runs under wc_state_lock, as the engine and server
+  did before per-workflow and per-node locks were introduced.
+- scoped: step polls are optimistic single-record updates with no lock, node
+  refreshes take their node's state lock, submissions take no lock, and only
+  scheduler ticks take wc_state_lock.
+
+Reports, per operation, how often it ran and how long it waited for a lock.
+
+Usage:
+    python scripts/benchmarks/lock_contention_benchmark.py
+    python scripts/benchmarks/lock_contention_benchmark.py --seconds 10 --rtt-ms 1 --running 16
+"""
+
+import argparse
+import contextlib
+import statistics
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from typing import Any, Callable
+
+from madsci.common.db_handlers import InMemoryMongoHandler, InMemoryRedisHandler
+from madsci.common.types.action_types import ActionResult, ActionStatus
+from madsci.common.types.node_types import Node, NodeStatus
+from madsci.common.types.step_types import Step
+from madsci.common.types.workcell_types import WorkcellManagerSettings
+from madsci.common.types.workflow_types import Workflow, WorkflowStatus
+from madsci.workcell_manager.state_handler import WorkcellStateHandler
+
+MODES = ("global", "scoped")
+
+
+class DelayedLock:
+    """A lock whose acquire and release each cost one round trip"""
+
+    def __init__(self, lock: Any, rtt: float) -> None:
+        """Wrap a lock"""
+        self._lock = lock
+        self._rtt = rtt
+
+    def __enter__(self) -> Any:
+        """Acquire the lock"""
+        time.sleep(self._rtt)
+        return self._lock.__enter__()
+
+    def __exit__(self, *args: Any) -> None:
+        """Release the lock"""
+        self._lock.__exit__(*args)
+        time.sleep(self._rtt)
+
+    def locked(self) -> bool:
+        """Whether the lock is held"""
+        time.sleep(self._rtt)
+        return self._lock.locked()
+
+
+class DelayedCollection:
+    """A Redis-backed dict or list where every operation costs one round trip"""
+
+    def __init__(self, collection: Any, rtt: float) -> None:
+        """Wrap a collection"""
+        self._collection = collection
+        self._rtt = rtt
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        """Delay method calls"""
+        method = getattr(self._collection, name)
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            time.sleep(self._rtt)
+            return method(*args, **kwargs)
+
+        return call
+
+    def __getitem__(self, key: Any) -> Any:
+        """Delay item reads"""
+        time.sleep(self._rtt)
+        return self._collection[key]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        """Delay item writes"""
+        time.sleep(self._rtt)
+        self._collection[key] = value
+
+    def __delitem__(self, key: Any) -> None:
+        """Delay item deletes"""
+        time.sleep(self._rtt)
+        del self._collection[key]
+
+    def __contains__(self, key: Any) -> bool:
+        """Delay membership checks"""
+        time.sleep(self._rtt)
+        return key in self._collection
+
+    def __iter__(self) -> Iterator[Any]:
+        """Delay iteration (one scan)"""
+        time.sleep(self._rtt)
+        return iter(self._collection)
+
+    def __len__(self) -> int:
+        """Delay length checks"""
+        time.sleep(self._rtt)
+        return len(self._collection)
+
+
+class DelayedRedisHandler:
+    """Wraps a RedisHandler, sleeping for one simulated round trip per command.
+
+    Sleeps happen outside the in-memory store's own lock, so they model network
+    latency without serializing unrelated commands.
+    """
+
+    # * A WATCH/MULTI/EXEC transaction costs a WATCH, its reads, and the EXEC
+    ROUND_TRIPS: dict[str, int] = {"transaction": 3}  # noqa: RUF012
+
+    def __init__(self, handler: InMemoryRedisHandler, rtt: float) -> None:
+        """Wrap a handler"""
+        self._handler = handler
+        self._rtt = rtt
+
+    def __getattr__(self, name: str) -> Any:
+        """Delay handler methods, and wrap the collections and locks they create"""
+        attr = getattr(self._handler, name)
+        if not callable(attr):
+            return attr
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            result = attr(*args, **kwargs)
+            if name in ("create_dict", "create_list"):
+                return DelayedCollection(result, self._rtt)
+            if name == "create_lock":
+                return DelayedLock(result, self._rtt)
+            if name not in ("create_pubsub", "close"):
+                time.sleep(self._rtt * self.ROUND_TRIPS.get(name, 1))
+            return result
+
+        return call
+
+
+class Recorder:
+    """Collects lock waits and operation counts per operation"""
+
+    def __init__(self) -> None:
+        """Start empty"""
+        self.waits: dict[str, list[float]] = defaultdict(list)
+        self.durations: dict[str, list[float]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def locked(self, operation: str, lock: Any) -> Iterator[None]:
+        """Hold a lock, recording how long it took to acquire"""
+        start = time.perf_counter()
+        with lock:
+            with self._lock:
+                self.waits[operation].append(time.perf_counter() - start)
+            yield
+
+    @contextlib.contextmanager
+    def operation(self, operation: str) -> Iterator[None]:
+        """Record an operation's total duration"""
+        start = time.perf_counter()
+        yield
+        with self._lock:
+            self.durations[operation].append(time.perf_counter() - start)
+
+
+def make_state_handler(rtt: float) -> WorkcellStateHandler:
+    """A state handler over an in-memory Redis with simulated latency"""
+    return WorkcellStateHandler(
+        workcell_settings=WorkcellManagerSettings(
+            manager_name="benchmark", enable_registry_resolution=False
+        ),
+        redis_handler=DelayedRedisHandler(InMemoryRedisHandler(), rtt),
+        mongo_handler=InMemoryMongoHandler(),
+    )
+
+
+def make_workflow(index: int, running: bool) -> Workflow:
+    """A three-step workflow, optionally already running its first step"""
+    return Workflow(
+        name=f"wf{index}",
+        steps=[
+            Step(name=f"step{i}", action="run", node=f"node{index % 8}")
+            for i in range(3)
+        ],
+        status=WorkflowStatus(running=running, has_started=running),
+    )
+
+
+def run(mode: str, args: argparse.Namespace) -> Recorder:  # noqa: PLR0915
+    """Run the workload in one mode and return what was recorded"""
+    rtt = args.rtt_ms / 1000
+    state = make_state_handler(rtt)
+    recorder = Recorder()
+    stop = threading.Event()
+    scoped = mode == "scoped"
+
+    running = [make_workflow(i, running=True) for i in range(args.running)]
+    for wf in running:
+        state.set_active_workflow(wf)
+        state.enqueue_workflow(wf.workflow_id)
+    node_names = [f"node{i}" for i in range(args.nodes)]
+    for name in node_names:
+        state.set_node(name, Node(node_url=f"http://{name}", status=NodeStatus()))
+
+    def step_poller(wf: Workflow) -> None:
+        step = wf.steps[0].model_copy(update={"status": ActionStatus.RUNNING})
+        while not stop.is_set():
+            time.sleep(args.poll_interval)
+            step.history.append(ActionResult(status=ActionStatus.RUNNING))
+            with recorder.operation("step_poll"):
+                if scoped:
+                    state.update_current_step(wf.workflow_id, step)
+                else:
+                    with recorder.locked("step_poll", state.wc_state_lock()):
+                        stored = state.get_workflow(wf.workflow_id)
+                        stored.steps[stored.status.current_step_index] = step
+                        state.set_active_workflow(stored)
+
+    def node_refresher(name: str) -> None:
+        while not stop.is_set():
+            time.sleep(args.node_interval)
+            node = Node(node_url=f"http://{name}", status=NodeStatus(busy=True))
+            lock = state.node_state_lock(name) if scoped else state.wc_state_lock()
+            with (
+                recorder.operation("node_refresh"),
+                recorder.locked("node_refresh", lock),
+            ):
+                state.set_node(name, node)
+
+    def submitter() -> None:
+        index = args.running
+        while not stop.is_set():
+            time.sleep(args.submit_interval)
+            wf = make_workflow(index, running=False)
+            index += 1
+            with recorder.operation("submit"):
+                if scoped:
+                    state.set_active_workflow(wf)
+                    state.enqueue_workflow(wf.workflow_id)
+                else:
+                    with recorder.locked("submit", state.wc_state_lock()):
+                        state.set_active_workflow(wf)
+                        state.enqueue_workflow(wf.workflow_id)
+
+    def scheduler() -> None:
+        while not stop.is_set():
+            time.sleep(args.scheduler_interval)
+            with (
+                recorder.operation("scheduler_tick"),
+                recorder.locked("scheduler_tick", state.wc_state_lock()),
+            ):
+                state.update_workflow_queue()
+                state.get_workflow_queue()
+                state.get_nodes()
+
+    threads = [threading.Thread(target=step_poller, args=(wf,)) for wf in running]
+    threads += [threading.Thread(target=node_refresher, args=(n,)) for n in node_names]
+    threads += [threading.Thread(target=submitter), threading.Thread(target=scheduler)]
+    for thread in threads:
+        thread.start()
+    time.sleep(args.seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return recorder
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """The given percentile of a list of values"""
+    return sorted(values)[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def main() -> None:
+    """Run the benchmark in each mode and print a comparison table"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--rtt-ms", type=float, default=0.5)
+    parser.add_argument("--running", type=int, default=16)
+    parser.add_argument("--nodes", type=int, default=8)
+    parser.add_argument("--poll-interval", type=float, default=0.05)
+    parser.add_argument("--node-interval", type=float, default=0.1)
+    parser.add_argument("--submit-interval", type=float, default=0.05)
+    parser.add_argument("--scheduler-interval", type=float, default=0.1)
+    parser.add_argument("--modes", nargs="+", default=list(MODES), choices=MODES)
+    args = parser.parse_args()
+
+    header = ["mode", "operation", "count", "wait_mean_ms", "wait_p95_ms", "op_mean_ms"]
+    print("".join(f"{column:>16}" for column in header))
+    for mode in args.modes:
+        recorder = run(mode, args)
+        for operation in sorted(recorder.durations):
+            durations = recorder.durations[operation]
+            waits = recorder.waits.get(operation) or [0.0]
+            row = [
+                mode,
+                operation,
+                str(len(durations)),
+                f"{statistics.mean(waits) * 1000:.2f}",
+                f"{percentile(waits, 0.95) * 1000:.2f}",
+                f"{statistics.mean(durations) * 1000:.2f}",
+            ]
+            print("".join(f"{value:>16}" for value in row))
+
+
+if __name__ == "__main__":
+    main()
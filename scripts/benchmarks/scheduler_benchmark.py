@@ -0,0 +1,218 @@
+"""Compare workcell schedulers on a synthetic workload.
+
+Simulates a workcell with a fixed set of nodes and a queue of synthetic
+workflows, then replays it through each scheduler: every tick the scheduler
+ranks the queue, every ready workflow whose node is free is dispatched (as in
+WORKCELL_DISPATCH_MODE=concurrent), and simulated time advances to the next
+step completion. Reports the wall-clock cost of run_iteration per tick, and
+the simulated makespan, mean turnaround, and deadline misses.
+
+Usage:
+    python scripts/benchmarks/scheduler_benchmark.py
+    python scripts/benchmarks/scheduler_benchmark.py --workflows 1000 --nodes 8 --seed 1
+"""
+
+import argparse
+import heapq
+import logging
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import Any
+from unittest.mock import MagicMock
+
+from madsci.common.types.action_types import ActionDefinition
+from madsci.common.types.auth_types import OwnershipInfo
+from madsci.common.types.node_types import Node, NodeInfo, NodeStatus
+from madsci.common.types.step_types import Step
+from madsci.common.types.workcell_types import WorkcellInfo, WorkcellManagerSettings
+from madsci.common.types.workflow_types import Workflow, WorkflowStatus
+from madsci.common.utils import new_ulid_str
+from madsci.workcell_manager.schedulers import default_scheduler, priority_scheduler
+
+SCHEDULERS = {
+    "default": default_scheduler.Scheduler,
+    "priority": priority_scheduler.Scheduler,
+}
+
+
+class SimulatedLock:
+    """Stand-in for a node's Redlock"""
+
+    def __init__(self) -> None:
+        """Start unlocked"""
+        self.held = False
+
+    def locked(self) -> bool:
+        """Whether the node is running an action"""
+        return self.held
+
+
+class SimulatedStateHandler:
+    """Just enough of WorkcellStateHandler for the schedulers' readiness checks"""
+
+    def __init__(
+        self, node_names: list[str], settings: WorkcellManagerSettings
+    ) -> None:
+        """Create idle nodes that all support the benchmark action"""
+        info = NodeInfo(
+            node_name="sim",
+            module_name="sim",
+            actions={"run": ActionDefinition(name="run", description="Benchmark")},
+        )
+        self.workcell_settings = settings
+        self.nodes = {
+            name: Node(node_url=f"http://{name}", status=NodeStatus(), info=info)
+            for name in node_names
+        }
+        self.locks = {name: SimulatedLock() for name in node_names}
+
+    def get_node(self, node_name: str) -> Node:
+        """Get a node"""
+        return self.nodes[node_name]
+
+    def get_nodes(self) -> dict[str, Node]:
+        """Get all nodes"""
+        return self.nodes
+
+    def node_lock(self, node_name: str) -> SimulatedLock:
+        """Get a node's lock"""
+        return self.locks[node_name]
+
+    def set_busy(self, node_name: str, busy: bool) -> None:
+        """Mark a node as running (or done running) an action"""
+        self.nodes[node_name] = self.nodes[node_name].model_copy(
+            update={"status": NodeStatus(busy=busy)}
+        )
+        self.locks[node_name].held = busy
+
+
+def make_workload(args: argparse.Namespace) -> tuple[list[Workflow], dict[str, list]]:
+    """Generate workflows, plus each workflow's simulated step durations"""
+    rng = random.Random(args.seed)
+    owners = [new_ulid_str() for _ in range(args.owners)]
+    start = datetime.now().astimezone()
+    workflows = []
+    durations = {}
+    for i in range(args.workflows):
+        steps = [
+            Step(name=f"step{j}", action="run", node=f"node{rng.randrange(args.nodes)}")
+            for j in range(rng.randint(1, args.max_steps))
+        ]
+        deadline = None
+        if rng.random() < args.deadline_fraction:
+            deadline = start + timedelta(seconds=rng.uniform(60, args.workflows * 5))
+        wf = Workflow(
+            name=f"wf{i}",
+            steps=steps,
+            submitted_time=start + timedelta(microseconds=i),
+            priority=rng.choice([0, 0, 0, 1, 2]),
+            deadline=deadline,
+            ownership_info=OwnershipInfo(experiment_id=rng.choice(owners)),
+        )
+        workflows.append(wf)
+        durations[wf.workflow_id] = [rng.uniform(1, 30) for _ in steps]
+    return workflows, durations
+
+
+def simulate(name: str, args: argparse.Namespace) -> dict[str, Any]:
+    """Run the workload to completion with one scheduler"""
+    workflows, durations = make_workload(args)
+    start = workflows[0].submitted_time
+    settings = WorkcellManagerSettings(deadline_urgency_window=300.0)
+    state = SimulatedStateHandler([f"node{i}" for i in range(args.nodes)], settings)
+    scheduler = SCHEDULERS[name](WorkcellInfo(name="benchmark"), state)
+    scheduler.location_client = None
+    scheduler.resource_client = None
+    scheduler.logger = MagicMock()
+
+    queue = {wf.workflow_id: wf for wf in workflows}
+    completions: list[tuple[float, str, str]] = []
+    now = 0.0
+
+    def simulated_time() -> datetime:
+        """Measure deadlines against simulated rather than wall-clock time"""
+        return start + timedelta(seconds=now)
+
+    scheduler.current_time = simulated_time
+    tick_costs = []
+    finished = {}
+    while queue:
+        tick_start = time.perf_counter()
+        metadata = scheduler.run_iteration(list(queue.values()))
+        tick_costs.append(time.perf_counter() - tick_start)
+
+        ready = sorted(
+            (wf for wf in queue.values() if metadata[wf.workflow_id].ready_to_run),
+            key=lambda wf: metadata[wf.workflow_id].priority,
+            reverse=True,
+        )
+        claimed = set()
+        for wf in ready:
+            node = wf.steps[wf.status.current_step_index].node
+            if node in claimed:
+                continue
+            claimed.add(node)
+            state.set_busy(node, True)
+            wf.status = wf.status.model_copy(update={"running": True})
+            wf.steps[wf.status.current_step_index].start_time = simulated_time()
+            duration = durations[wf.workflow_id][wf.status.current_step_index]
+            heapq.heappush(completions, (now + duration, wf.workflow_id, node))
+
+        now, workflow_id, node = heapq.heappop(completions)
+        state.set_busy(node, False)
+        wf = queue[workflow_id]
+        wf.steps[wf.status.current_step_index].end_time = simulated_time()
+        wf.status = WorkflowStatus(current_step_index=wf.status.current_step_index + 1)
+        if wf.status.current_step_index >= len(wf.steps):
+            finished[workflow_id] = now
+            del queue[workflow_id]
+
+    missed = sum(
+        1
+        for wf in workflows
+        if wf.deadline is not None
+        and start + timedelta(seconds=finished[wf.workflow_id]) > wf.deadline
+    )
+    return {
+        "ticks": len(tick_costs),
+        "mean_tick_ms": statistics.mean(tick_costs) * 1000,
+        "p95_tick_ms": sorted(tick_costs)[int(len(tick_costs) * 0.95)] * 1000,
+        "makespan_s": now,
+        "mean_turnaround_s": statistics.mean(finished.values()),
+        "deadlines": sum(1 for wf in workflows if wf.deadline is not None),
+        "deadlines_missed": missed,
+    }
+
+
+def main() -> None:
+    """Run the benchmark for each scheduler and print a comparison table"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workflows", type=int, default=1000)
+    parser.add_argument("--nodes", type=int, default=8)
+    parser.add_argument("--owners", type=int, default=4)
+    parser.add_argument("--max-steps", type=int, default=4)
+    parser.add_argument("--deadline-fraction", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--schedulers", nargs="+", default=list(SCHEDULERS), choices=SCHEDULERS
+    )
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    results = {name: simulate(name, args) for name in args.schedulers}
+    columns = list(next(iter(results.values())))
+    print(f"{'scheduler':<10}" + "".join(f"{column:>18}" for column in columns))
+    for name, result in results.items():
+        print(
+            f"{name:<10}"
+            + "".join(
+                f"{value:>18.2f}" if isinstance(value, float) else f"{value:>18}"
+                for value in result.values()
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""Measure how long utilization period reports take to assign time to buckets.
+
+Builds a synthetic year of events at hourly granularity in the in-memory
+MongoDB backend: multi-day workcell sessions with one experiment and node
+action per hour while they run. Then generates daily, weekly, and monthly
+utilization period reports over the whole year in two modes:
+
+- per_bucket: every bucket loops over every session, re-analyzing each
+  overlapping session and querying experiment starts for the bucket, as the
+  TimeSeriesAnalyzer did before it swept sessions into buckets.
+- sweep: sessions are swept into all buckets in one sorted pass, each session
+  is analyzed once, and experiment starts are queried once.
+
+Reports wall time and events-collection queries per report.
+
+Usage:
+    python scripts/benchmarks/time_series_bucket_benchmark.py
+    python scripts/benchmarks/time_series_bucket_benchmark.py --days 90 --session-days 3 --types daily
+"""
+
+import argparse
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Optional
+
+from madsci.common.local_backends.inmemory_collection import InMemoryCollection
+from madsci.common.types.event_types import Event, EventType
+from madsci.event_manager.time_series_analyzer import TimeSeriesAnalyzer
+from madsci.event_manager.utilization_analyzer import UtilizationAnalyzer
+
+MODES = ("per_bucket", "sweep")
+ANALYSIS_TYPES = ("daily", "weekly", "monthly")
+
+
+class CountingCollection:
+    """An events collection that counts the queries made against it"""
+
+    QUERIES = ("find", "find_one", "count_documents", "aggregate")
+
+    def __init__(self, collection: Any) -> None:
+        """Wrap a collection"""
+        self._collection = collection
+        self.queries = 0
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        """Count query method calls"""
+        method = getattr(self._collection, name)
+        if name not in self.QUERIES:
+            return method
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            self.queries += 1
+            return method(*args, **kwargs)
+
+        return call
+
+
+class PerBucketTimeSeriesAnalyzer(TimeSeriesAnalyzer):
+    """Assigns sessions to buckets one bucket at a time, as before the sweep"""
+
+    def _sweep_sessions_into_buckets(
+        self,
+        windows: list[Optional[tuple[datetime, datetime]]],
+        sessions: list[dict],
+    ) -> dict[str, list[list]]:
+        """Re-analyze every overlapping session and query experiments per bucket"""
+        overlaps: list[list] = []
+        experiments: list[list] = []
+        for window in windows:
+            bucket: list = []
+            if window:
+                for session in sessions:
+                    overlap_start = max(window[0], session["start_time"])
+                    overlap_end = min(window[1], session["end_time"])
+                    if overlap_start < overlap_end:
+                        bucket.append(
+                            (
+                                session,
+                                self._analyze_session_safely(session),
+                                overlap_start,
+                                overlap_end,
+                            )
+                        )
+            overlaps.append(bucket)
+            experiments.append(
+                self._get_experiments_in_time_period(*window) if window else []
+            )
+        return {"overlaps": overlaps, "experiments": experiments}
+
+
+def build_events(args: argparse.Namespace) -> tuple[InMemoryCollection, datetime]:
+    """Fill an events collection with a synthetic year of hourly activity"""
+    collection = InMemoryCollection("events")
+    start = datetime(2025, 1, 1)
+    end = start + timedelta(days=args.days)
+    events = []
+
+    def add(event_type: EventType, timestamp: datetime, **event_data: Any) -> None:
+        events.append(
+            Event(
+                event_type=event_type,
+                event_data=event_data,
+                event_timestamp=timestamp,
+            ).to_mongo()
+        )
+
+    session_start = start
+    session_length = timedelta(days=args.session_days)
+    while session_start < end:
+        session_end = min(session_start + session_length, end)
+        add(EventType.WORKCELL_START, session_start, workcell_id="workcell")
+        add(EventType.NODE_START, session_start, node_id="node")
+        hour = session_start
+        while hour + timedelta(hours=1) <= session_end:
+            experiment_id = f"experiment_{len(events)}"
+            action_id = f"action_{len(events)}"
+            running = hour + timedelta(minutes=5)
+            completed = running + timedelta(minutes=args.busy_minutes)
+            add(EventType.EXPERIMENT_START, running, experiment_id=experiment_id)
+            add(
+                EventType.ACTION_STATUS_CHANGE,
+                running,
+                node_id="node",
+                action_id=action_id,
+                status="running",
+            )
+            add(
+                EventType.ACTION_STATUS_CHANGE,
+                completed,
+                node_id="node",
+                action_id=action_id,
+                status="completed",
+            )
+            add(EventType.EXPERIMENT_COMPLETE, completed, experiment_id=experiment_id)
+            hour += timedelta(hours=1)
+        add(EventType.NODE_STOP, session_end, node_id="node")
+        add(EventType.WORKCELL_STOP, session_end, workcell_id="workcell")
+        # * Leave an idle gap between sessions
+        session_start = session_end + timedelta(hours=args.gap_hours)
+
+    collection.insert_many(events)
+    return collection, end
+
+
+def run(
+    mode: str,
+    analysis_type: str,
+    collection: InMemoryCollection,
+    end: datetime,
+    args: argparse.Namespace,
+) -> dict[str, Any]:
+    """Generate one report in one mode and return its cost"""
+    counting = CountingCollection(collection)
+    analyzer_class = (
+        PerBucketTimeSeriesAnalyzer if mode == "per_bucket" else TimeSeriesAnalyzer
+    )
+    analyzer = analyzer_class(UtilizationAnalyzer(counting))
+    start = end - timedelta(days=args.days)
+
+    began = time.perf_counter()
+    report = analyzer.generate_summary_report(start, end, analysis_type, "UTC")
+    elapsed = time.perf_counter() - began
+    if "error" in report:
+        raise RuntimeError(report["error"])
+
+    return {
+        "seconds": elapsed,
+        "queries": counting.queries,
+        "buckets": len(report["time_series"]["system"]),
+        "active_hours": report["key_metrics"]["total_active_time_hours"],
+    }
+
+
+def main() -> None:
+    """Run the benchmark in each mode and print a comparison table"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--session-days", type=float, default=6.0)
+    parser.add_argument("--gap-hours", type=float, default=24.0)
+    parser.add_argument("--busy-minutes", type=float, default=30.0)
+    parser.add_argument(
+        "--types", nargs="+", default=list(ANALYSIS_TYPES), choices=ANALYSIS_TYPES
+    )
+    parser.add_argument("--modes", nargs="+", default=list(MODES), choices=MODES)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    collection, end = build_events(args)
+    print(f"{collection.count_documents({})} events over {args.days} days")
+    print(
+        f"{'type':<9}{'mode':<12}"
+        + "".join(
+            f"{column:>14}" for column in ("seconds", "queries", "buckets", "active_h")
+        )
+    )
+    for analysis_type in args.types:
+        for mode in args.modes:
+            result = run(mode, analysis_type, collection, end, args)
+            print(
+                f"{analysis_type:<9}{mode:<12}"
+                + "".join(
+                    f"{value:>14.2f}" if isinstance(value, float) else f"{value:>14}"
+                    for value in result.values()
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
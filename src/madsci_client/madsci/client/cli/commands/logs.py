@@ -9,9 +9,16 @@ import json
 import re
 import time
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, Callable
 
 import click
+from madsci.client.cli.utils.event_stream import (
+    STREAM_READ_TIMEOUT,
+    STREAM_RETRY_SECONDS,
+    SSEDecoder,
+    event_stream_params,
+    event_stream_url,
+)
 
 # Default Event Manager URL
 DEFAULT_EVENT_MANAGER_URL = "http://localhost:8001/"
@@ -147,6 +154,46 @@ def fetch_logs_from_event_manager(
         return []
 
 
+def follow_event_stream(
+    base_url: str,
+    on_entry: Callable[[dict[str, Any]], None],
+    level: str | None = None,
+    source: str | None = None,
+    timeout: float = 10.0,
+) -> bool:
+    """Pass events from the Event Manager's live stream to ``on_entry`` as they arrive.
+
+    Dropped connections are re-established, resuming after the last event
+    received. Runs until interrupted, unless the Event Manager has no live
+    stream, in which case it returns False.
+    """
+    import httpx
+
+    decoder = SSEDecoder()
+    while True:
+        try:
+            with (
+                httpx.Client(
+                    timeout=httpx.Timeout(timeout, read=STREAM_READ_TIMEOUT)
+                ) as client,
+                client.stream(
+                    "GET",
+                    event_stream_url(base_url),
+                    params=event_stream_params(level, source),
+                    headers=decoder.headers(),
+                ) as response,
+            ):
+                if response.status_code == 404:
+                    return False
+                if response.status_code == 200:
+                    for line in response.iter_lines():
+                        if (entry := decoder.feed(line)) is not None:
+                            on_entry(entry)
+        except httpx.HTTPError:
+            pass
+        time.sleep(STREAM_RETRY_SECONDS)
+
+
 def filter_logs(
     logs: list[dict[str, Any]],
     level: str | None = None,
@@ -224,7 +271,7 @@ def filter_logs(
     help="Output as JSON.",
 )
 @click.pass_context
-def logs(  # noqa: C901, PLR0912
+def logs(  # noqa: C901
     ctx: click.Context,
     services: tuple[str, ...],
     follow: bool,
@@ -317,25 +364,33 @@ def logs(  # noqa: C901, PLR0912
 
         console.print("[dim]Following logs... (Ctrl+C to stop)[/dim]")
 
+        def print_new_entries(new_entries: list[dict[str, Any]]) -> None:
+            for entry in filter_logs(new_entries, level=level, grep=grep):
+                entry_id = entry.get("event_id", entry.get("id", str(hash(str(entry)))))
+                if entry_id not in seen_ids:
+                    seen_ids.add(entry_id)
+                    console.print(format_log_entry(entry, timestamps, no_color))
+
+        source = services[0] if len(services) == 1 else None
         try:
-            while True:
+            streamed = follow_event_stream(
+                base_url=event_manager_url,
+                on_entry=lambda entry: print_new_entries([entry]),
+                level=level,
+                source=source,
+            )
+            # * Event Managers without /events/stream are polled instead
+            while not streamed:
                 time.sleep(2)
-                new_entries = fetch_logs_from_event_manager(
-                    base_url=event_manager_url,
-                    limit=50,
-                    level=level,
-                    source=services[0] if len(services) == 1 else None,
-                    grep=grep,
-                )
-                new_entries = filter_logs(new_entries, level=level, grep=grep)
-
-                for entry in new_entries:
-                    entry_id = entry.get(
-                        "event_id", entry.get("id", str(hash(str(entry))))
+                print_new_entries(
+                    fetch_logs_from_event_manager(
+                        base_url=event_manager_url,
+                        limit=50,
+                        level=level,
+                        source=source,
+                        grep=grep,
                     )
-                    if entry_id not in seen_ids:
-                        seen_ids.add(entry_id)
-                        console.print(format_log_entry(entry, timestamps, no_color))
+                )
         except KeyboardInterrupt:
             console.print("\n[dim]Stopped following logs.[/dim]")
             return
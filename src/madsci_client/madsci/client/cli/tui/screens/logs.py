@@ -3,12 +3,20 @@
 Provides real-time log viewing with filtering capabilities.
 """
 
+import asyncio
 from collections import OrderedDict
 from datetime import datetime
 from typing import Any, ClassVar
 
 import httpx
 from madsci.client.cli.tui.constants import DEFAULT_SERVICES
+from madsci.client.cli.utils.event_stream import (
+    STREAM_READ_TIMEOUT,
+    STREAM_RETRY_SECONDS,
+    SSEDecoder,
+    event_stream_params,
+    event_stream_url,
+)
 from textual.app import ComposeResult
 from textual.binding import BindingType
 from textual.containers import Container, Horizontal
@@ -65,6 +73,7 @@ class LogsScreen(Screen):
         # prevent unbounded memory growth in long-running follow mode.
         self._seen_ids: OrderedDict[str, None] = OrderedDict()
         self._follow_timer: Any = None
+        self._follow_worker: Any = None
         self._max_seen_ids = 10_000
 
     def compose(self) -> ComposeResult:
@@ -111,7 +120,11 @@ class LogsScreen(Screen):
                 )
             return
 
-        # Add new logs to display
+        self._show_entries(logs)
+
+    def _show_entries(self, logs: list[dict]) -> None:
+        """Add log entries that haven't been shown yet to the log view."""
+        log_view = self.query_one("#log-view", RichLog)
         for entry in logs:
             entry_id = entry.get("_id", entry.get("event_id", str(hash(str(entry)))))
             if entry_id not in self._seen_ids:
@@ -244,15 +257,62 @@ class LogsScreen(Screen):
         self.follow_mode = not self.follow_mode
         if self.follow_mode:
             self.notify("Follow mode enabled", timeout=2)
-            self._follow_timer = self.set_interval(
-                2.0, self._follow_refresh, name="follow-timer"
-            )
+            self._start_following()
         else:
-            if self._follow_timer is not None:
-                self._follow_timer.stop()
-                self._follow_timer = None
+            self._stop_following()
             self.notify("Follow mode disabled", timeout=2)
 
+    def _start_following(self) -> None:
+        """Follow the Event Manager's live event stream."""
+        self._follow_worker = self.run_worker(self._follow_stream(), group="follow")
+
+    def _stop_following(self) -> None:
+        """Stop following, whether by stream or by polling."""
+        if self._follow_worker is not None:
+            self._follow_worker.cancel()
+            self._follow_worker = None
+        if self._follow_timer is not None:
+            self._follow_timer.stop()
+            self._follow_timer = None
+
+    async def _follow_stream(self) -> None:
+        """Show events from the live event stream as they arrive.
+
+        Dropped connections are re-established, resuming after the last event
+        received. Event Managers without a live stream are polled instead.
+        """
+        level_value = self.query_one("#level-select", Select).value
+        level = str(level_value) if level_value and level_value != "all" else None
+        event_url = self.app.service_urls.get(
+            "event_manager", DEFAULT_SERVICES["event_manager"]
+        )
+        decoder = SSEDecoder()
+        while self.follow_mode:
+            try:
+                async with (
+                    httpx.AsyncClient(
+                        timeout=httpx.Timeout(5.0, read=STREAM_READ_TIMEOUT)
+                    ) as client,
+                    client.stream(
+                        "GET",
+                        event_stream_url(event_url),
+                        params=event_stream_params(level),
+                        headers=decoder.headers(),
+                    ) as response,
+                ):
+                    if response.status_code == 404:
+                        self._follow_timer = self.set_interval(
+                            2.0, self._follow_refresh, name="follow-timer"
+                        )
+                        return
+                    if response.status_code == 200:
+                        async for line in response.aiter_lines():
+                            if (entry := decoder.feed(line)) is not None:
+                                self._show_entries([entry])
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(STREAM_RETRY_SECONDS)
+
     async def _follow_refresh(self) -> None:
         """Refresh logs in follow mode."""
         if self.follow_mode:
@@ -261,9 +321,7 @@ class LogsScreen(Screen):
     def action_go_back(self) -> None:
         """Go back to the previous screen."""
         self.follow_mode = False
-        if self._follow_timer is not None:
-            self._follow_timer.stop()
-            self._follow_timer = None
+        self._stop_following()
         self.app.switch_screen("dashboard")
 
     def on_select_changed(self, event: Select.Changed) -> None:  # noqa: ARG002
@@ -273,6 +331,10 @@ class LogsScreen(Screen):
         log_view.clear()
         self._seen_ids.clear()
         self.run_worker(self.refresh_data())
+        if self.follow_mode:
+            # * Reconnect so the stream is filtered on the new level
+            self._stop_following()
+            self._start_following()
 
     def on_input_submitted(self, event: Input.Submitted) -> None:  # noqa: ARG002
         """Handle search input submission."""
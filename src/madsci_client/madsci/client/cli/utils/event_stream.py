@@ -0,0 +1,94 @@
+"""Helpers for following the Event Manager's live event stream.
+
+The Event Manager pushes newly stored events from ``/events/stream`` as
+Server-Sent Events. Each message's ID is the event ID, so a follower that
+reconnects with the last ID it received is sent whatever it missed.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+# Seconds to wait before reconnecting to a dropped stream
+STREAM_RETRY_SECONDS = 2.0
+# The server sends a keepalive at least this often on an idle stream, so a
+# longer silence means the connection is dead
+STREAM_READ_TIMEOUT = 60.0
+
+# Log level names to the numeric levels the Event Manager filters on
+LOG_LEVEL_VALUES = {
+    "DEBUG": 10,
+    "INFO": 20,
+    "WARNING": 30,
+    "WARN": 30,
+    "ERROR": 40,
+    "CRITICAL": 50,
+}
+
+
+def event_stream_url(base_url: str) -> str:
+    """Return the live event stream URL for an Event Manager."""
+    return base_url.rstrip("/") + "/events/stream"
+
+
+def event_stream_params(
+    level: str | None = None, source: str | None = None
+) -> dict[str, Any]:
+    """Build server-side filters for the live event stream."""
+    params: dict[str, Any] = {}
+    if level:
+        params["level"] = LOG_LEVEL_VALUES.get(level.upper(), 0)
+    if source:
+        params["source"] = source
+    return params
+
+
+class SSEDecoder:
+    """Decodes Server-Sent Events, one line at a time, into event dictionaries.
+
+    Remembers the ID of the last complete message for resuming a stream.
+    """
+
+    def __init__(self, last_event_id: str | None = None) -> None:
+        """Create a decoder, optionally resuming after ``last_event_id``."""
+        self.last_event_id = last_event_id
+        self._message_id: str | None = None
+        self._data: list[str] = []
+
+    def headers(self) -> dict[str, str]:
+        """Return the request headers that resume the stream after the last message."""
+        return {"Last-Event-ID": self.last_event_id} if self.last_event_id else {}
+
+    def feed(self, line: str) -> dict[str, Any] | None:
+        """Decode one line, returning the event once its message is complete."""
+        if not line:
+            return self._dispatch()
+        if line.startswith(":"):
+            # * Comment, such as a keepalive
+            return None
+        field, _, value = line.partition(":")
+        value = value.removeprefix(" ")
+        if field == "id":
+            # * A new message starting also completes any unterminated one
+            event = self._dispatch()
+            self._message_id = value
+            return event
+        if field == "data":
+            self._data.append(value)
+        return None
+
+    def _dispatch(self) -> dict[str, Any] | None:
+        """Complete the current message and return its event, if it has one."""
+        data = "\n".join(self._data)
+        message_id = self._message_id
+        self._data = []
+        self._message_id = None
+        if not data:
+            return None
+        if message_id:
+            self.last_event_id = message_id
+        try:
+            return json.loads(data)
+        except json.JSONDecodeError:
+            return None
@@ -1,12 +1,17 @@
 """Client for the MADSci Experiment Manager."""
 
+import hashlib
+import json
 import shutil
+from contextlib import ExitStack
 from json import JSONDecodeError
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, Iterator, Optional, Union
 
+from madsci.client.datapoint_cache import DatapointCache, DatapointCacheStats
 from madsci.client.event_client import EventClient
 from madsci.common.context import get_current_madsci_context
+from madsci.common.db_handlers.minio_handler import DOWNLOAD_CHUNK_SIZE
 from madsci.common.object_storage_helpers import (
     ObjectNamingStrategy,
     create_minio_client,
@@ -15,6 +20,7 @@ from madsci.common.object_storage_helpers import (
     upload_file_to_object_storage,
 )
 from madsci.common.ownership import get_current_ownership_info
+from madsci.common.pagination import NEXT_CURSOR_HEADER
 from madsci.common.types.client_types import DataClientConfig
 from madsci.common.types.datapoint_types import (
     DataPoint,
@@ -27,6 +33,11 @@ from madsci.common.warnings import MadsciLocalOnlyWarning
 from pydantic import AnyUrl
 from ulid import ULID
 
+PARTIAL_CONTENT = 206
+RANGE_NOT_SATISFIABLE = 416
+# Status codes from Data Managers that predate the batch endpoints
+BATCH_UNSUPPORTED = (404, 405)
+
 
 class DataClient:
     """Client for the MADSci Experiment Manager."""
@@ -71,6 +82,18 @@ class DataClient:
         # Store config and create session
         self.config = config if config is not None else DataClientConfig()
         self.session = create_http_session(config=self.config)
+        self._cache: Optional[DatapointCache] = (
+            DatapointCache(self.config)
+            if self.config.cache_enabled and self.data_server_url is not None
+            else None
+        )
+
+    @property
+    def cache_stats(self) -> Optional[DatapointCacheStats]:
+        """Hit, miss, and eviction counts for the local datapoint cache, or None if caching is disabled."""
+        if self._cache is None:
+            return None
+        return self._cache.stats
 
     def get_datapoint(
         self, datapoint_id: Union[str, ULID], timeout: Optional[float] = None
@@ -85,13 +108,20 @@ class DataClient:
             if datapoint_id in self._local_datapoints:
                 return self._local_datapoints[datapoint_id]
             raise ValueError(f"Datapoint {datapoint_id} not found in local storage")
+        if self._cache is not None and (
+            cached := self._cache.get_datapoint(str(datapoint_id))
+        ):
+            return cached
 
         response = self.session.get(
             f"{self.data_server_url}datapoint/{datapoint_id}",
             timeout=timeout or self.config.timeout_default,
         )
         response.raise_for_status()
-        return DataPoint.discriminate(response.json())
+        datapoint = DataPoint.discriminate(response.json())
+        if self._cache is not None:
+            self._cache.put_datapoint(datapoint)
+        return datapoint
 
     def get_datapoint_value(
         self, datapoint_id: Union[str, ULID], timeout: Optional[float] = None
@@ -102,9 +132,64 @@ class DataClient:
         Args:
             datapoint_id: The ID of the datapoint to get.
             timeout: Optional timeout override in seconds. If None, uses config.timeout_data_operations.
+
+        With caching enabled, file values are cached. Use
+        get_datapoint_value_view() to read a cached value without loading it.
         """
         # First get the datapoint metadata
         datapoint = self.get_datapoint(datapoint_id, timeout=timeout)
+        if self._cache is None or datapoint.data_type not in (
+            DataPointTypeEnum.FILE,
+            DataPointTypeEnum.OBJECT_STORAGE,
+        ):
+            return self._fetch_datapoint_value(datapoint, timeout)
+        cached = self._cache.get_value(datapoint.datapoint_id)
+        if cached is not None:
+            return cached
+        value = self._fetch_datapoint_value(datapoint, timeout)
+        if isinstance(value, bytes):
+            self._cache.put_value(datapoint.datapoint_id, value)
+        return value
+
+    def get_datapoint_value_view(
+        self, datapoint_id: Union[str, ULID], timeout: Optional[float] = None
+    ) -> memoryview:
+        """Get a file datapoint's value as a read-only memoryview.
+
+        With caching enabled, a cached value is returned as a view of its
+        memory-mapped cache file, so only the parts that are read are loaded.
+        Otherwise the value is downloaded, cached if caching is enabled, and
+        returned as a view of the downloaded bytes.
+
+        Args:
+            datapoint_id: The ID of the datapoint to get.
+            timeout: Optional timeout override in seconds. If None, uses config.timeout_data_operations.
+        """
+        datapoint = self.get_datapoint(datapoint_id, timeout=timeout)
+        is_file = datapoint.data_type in (
+            DataPointTypeEnum.FILE,
+            DataPointTypeEnum.OBJECT_STORAGE,
+        )
+        if (
+            self._cache is not None
+            and is_file
+            and (view := self._cache.get_value_view(datapoint.datapoint_id)) is not None
+        ):
+            return view
+        value = self._fetch_datapoint_value(datapoint, timeout)
+        if not isinstance(value, bytes):
+            raise ValueError(
+                f"Value of datapoint {datapoint.datapoint_id} is not binary data"
+            )
+        if self._cache is not None and is_file:
+            self._cache.put_value(datapoint.datapoint_id, value)
+        return memoryview(value)
+
+    def _fetch_datapoint_value(
+        self, datapoint: DataPoint, timeout: Optional[float] = None
+    ) -> Any:
+        """Get a datapoint's value from its file, object storage, or the server."""
+        datapoint_id = datapoint.datapoint_id
         # Handle based on datapoint type (regardless of URL configuration)
         if self._minio_client is not None:
             # Use MinIO client if configured
@@ -152,23 +237,118 @@ class DataClient:
 
         raise ValueError(f"Could not get value for datapoint {datapoint_id}")
 
+    def stream_datapoint_value(
+        self,
+        datapoint_id: Union[str, ULID],
+        offset: int = 0,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        timeout: Optional[float] = None,
+    ) -> Iterator[bytes]:
+        """Stream a datapoint's value in chunks, without loading it all into memory.
+
+        File and object storage datapoints yield the file's contents; value
+        datapoints yield their value encoded as JSON.
+
+        Args:
+            datapoint_id: The ID of the datapoint to stream.
+            offset: Number of bytes to skip from the start of the value, e.g. to resume a download.
+            chunk_size: Maximum size of each chunk in bytes.
+            timeout: Optional timeout override in seconds. If None, uses config.timeout_data_operations.
+        """
+        if self.data_server_url is None:
+            datapoint = self._local_datapoints[datapoint_id]
+            if datapoint.data_type == DataPointTypeEnum.FILE:
+                yield from self._read_file_chunks(
+                    Path(datapoint.path).expanduser(), offset, chunk_size
+                )
+            else:
+                data = json.dumps(datapoint.value).encode()
+                for start in range(offset, len(data), chunk_size):
+                    yield data[start : start + chunk_size]
+            return
+        if self._cache is not None and (
+            cached_path := self._cache.get_value_path(str(datapoint_id))
+        ):
+            yield from self._read_file_chunks(cached_path, offset, chunk_size)
+            return
+
+        if self._minio_client is not None:
+            datapoint = self.get_datapoint(datapoint_id, timeout=timeout)
+            if datapoint.data_type == DataPointTypeEnum.OBJECT_STORAGE:
+                response = self._minio_client.get_object(
+                    datapoint.bucket_name, datapoint.object_name, offset=offset
+                )
+                try:
+                    yield from response.stream(chunk_size)
+                finally:
+                    response.close()
+                    response.release_conn()
+                return
+
+        response = self._get_value_response(datapoint_id, offset, timeout)
+        try:
+            if response.status_code == RANGE_NOT_SATISFIABLE:
+                # * The offset is at or past the end of the value
+                return
+            response.raise_for_status()
+            # * Servers that ignore the Range header send the whole value
+            skip = offset if response.status_code != PARTIAL_CONTENT else 0
+            for chunk in response.iter_content(chunk_size):
+                data = chunk[skip:]
+                skip = max(skip - len(chunk), 0)
+                if data:
+                    yield data
+        finally:
+            response.close()
+
+    @staticmethod
+    def _read_file_chunks(path: Path, offset: int, chunk_size: int) -> Iterator[bytes]:
+        """Read a file in chunks, starting `offset` bytes in."""
+        with path.open("rb") as f:
+            f.seek(offset)
+            yield from iter(lambda: f.read(chunk_size), b"")
+
+    @classmethod
+    def _file_sha256(cls, path: Path) -> str:
+        """Return the hex SHA-256 digest of a file's contents, read in chunks."""
+        sha256 = hashlib.sha256()
+        for chunk in cls._read_file_chunks(path, 0, DOWNLOAD_CHUNK_SIZE):
+            sha256.update(chunk)
+        return sha256.hexdigest()
+
     def save_datapoint_value(
         self,
         datapoint_id: Union[str, ULID],
         output_filepath: str,
         timeout: Optional[float] = None,
+        resume: bool = False,
     ) -> None:
-        """Get an datapoint value by ID.
+        """Save a datapoint's value to a file.
+
+        Files are written in chunks as they download, so they can be larger
+        than memory.
 
         Args:
             datapoint_id: The ID of the datapoint to save.
             output_filepath: Path where the datapoint value should be saved.
             timeout: Optional timeout override in seconds. If None, uses config.timeout_data_operations.
+            resume: If the output file already exists, treat it as a partial download and fetch only the rest.
         """
         output_filepath = Path(output_filepath).expanduser()
         output_filepath.parent.mkdir(parents=True, exist_ok=True)
 
         datapoint = self.get_datapoint(datapoint_id, timeout=timeout)
+        is_file = datapoint.data_type in (
+            DataPointTypeEnum.FILE,
+            DataPointTypeEnum.OBJECT_STORAGE,
+        )
+        if (
+            self._cache is not None
+            and is_file
+            and (cached_path := self._cache.get_value_path(datapoint.datapoint_id))
+        ):
+            shutil.copyfile(cached_path, output_filepath)
+            return
         # Handle object storage datapoints specifically
         if (
             self._minio_client is not None
@@ -180,6 +360,7 @@ class DataClient:
                 output_filepath,
             )
         ):
+            self._cache_value_file(datapoint.datapoint_id, output_filepath)
             return
             # If download failed, fall back to server API
 
@@ -193,6 +374,50 @@ class DataClient:
                     f.write(str(self._local_datapoints[datapoint_id].value))
             return
 
+        if not is_file:
+            self._save_value_response(datapoint_id, output_filepath, timeout)
+            return
+
+        # * Datapoint files never change once stored, so a partial download can be continued by offset
+        offset = (
+            output_filepath.stat().st_size if resume and output_filepath.exists() else 0
+        )
+        response = self._get_value_response(datapoint_id, offset, timeout)
+        try:
+            # * A 416 means the partial download is already complete
+            if response.status_code != RANGE_NOT_SATISFIABLE:
+                response.raise_for_status()
+                mode = "ab" if response.status_code == PARTIAL_CONTENT else "wb"
+                with output_filepath.open(mode) as f:
+                    for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+        finally:
+            response.close()
+        self._cache_value_file(datapoint.datapoint_id, output_filepath)
+
+    def _cache_value_file(self, datapoint_id: str, path: Path) -> None:
+        """Cache a completely downloaded value, if caching is enabled."""
+        if self._cache is not None:
+            self._cache.put_value_file(datapoint_id, path)
+
+    def _get_value_response(
+        self, datapoint_id: Union[str, ULID], offset: int, timeout: Optional[float]
+    ) -> Any:
+        """Request a datapoint's value from the server as a stream, from `offset` bytes in."""
+        return self.session.get(
+            f"{self.data_server_url}datapoint/{datapoint_id}/value",
+            headers={"Range": f"bytes={offset}-"} if offset else None,
+            stream=True,
+            timeout=timeout or self.config.timeout_data_operations,
+        )
+
+    def _save_value_response(
+        self,
+        datapoint_id: Union[str, ULID],
+        output_filepath: Path,
+        timeout: Optional[float],
+    ) -> None:
+        """Save a value datapoint's value, fetched from the server, to a file."""
         response = self.session.get(
             f"{self.data_server_url}datapoint/{datapoint_id}/value",
             timeout=timeout or self.config.timeout_data_operations,
@@ -203,7 +428,6 @@ class DataClient:
                 f.write(str(response.json()["value"]))
 
         except Exception:
-            Path(output_filepath).expanduser().parent.mkdir(parents=True, exist_ok=True)
             with Path.open(output_filepath, "wb") as f:
                 f.write(response.content)
 
@@ -217,12 +441,14 @@ class DataClient:
             timeout: Optional timeout override in seconds. If None, uses config.timeout_default.
         """
         if self.data_server_url is None:
-            return list(self._local_datapoints.values()).sort(
-                key=lambda x: x.datapoint_id, reverse=True
+            return sorted(
+                self._local_datapoints.values(),
+                key=lambda x: x.datapoint_id,
+                reverse=True,
             )[:number]
         response = self.session.get(
             f"{self.data_server_url}datapoints",
-            params={number: number},
+            params={"number": number},
             timeout=timeout or self.config.timeout_default,
         )
         response.raise_for_status()
@@ -230,6 +456,40 @@ class DataClient:
             DataPoint.discriminate(datapoint) for datapoint in response.json().values()
         ]
 
+    def iter_datapoints(
+        self, page_size: int = 100, timeout: Optional[float] = None
+    ) -> Iterator[DataPoint]:
+        """Iterate over all datapoints, newest first, fetching pages as needed.
+
+        Pages are requested lazily with the cursor the server returns for the
+        next page, so stopping early doesn't fetch the rest.
+
+        Args:
+            page_size: Number of datapoints to request per page.
+            timeout: Optional timeout override in seconds. If None, uses config.timeout_default.
+        """
+        if self.data_server_url is None:
+            yield from sorted(
+                self._local_datapoints.values(),
+                key=lambda x: x.datapoint_id,
+                reverse=True,
+            )
+            return
+        params: dict[str, Any] = {"number": page_size}
+        while True:
+            response = self.session.get(
+                f"{self.data_server_url}datapoints",
+                params=params,
+                timeout=timeout or self.config.timeout_default,
+            )
+            response.raise_for_status()
+            for datapoint in response.json().values():
+                yield DataPoint.discriminate(datapoint)
+            cursor = response.headers.get(NEXT_CURSOR_HEADER)
+            if not cursor:
+                return
+            params["cursor"] = cursor
+
     def query_datapoints(
         self, selector: Any, timeout: Optional[float] = None
     ) -> dict[str, DataPoint]:
@@ -322,7 +582,14 @@ class DataClient:
             self._local_datapoints[datapoint.datapoint_id] = datapoint
             return datapoint
 
-        if datapoint.data_type == DataPointTypeEnum.FILE:
+        stored = self._stored_file_hashes([datapoint], timeout)
+        if datapoint.datapoint_id in stored:
+            # * The Data Manager already has the contents; reference them instead
+            datapoint = datapoint.model_copy(
+                update={"sha256": stored[datapoint.datapoint_id]}
+            )
+            files = {}
+        elif datapoint.data_type == DataPointTypeEnum.FILE:
             files = {
                 (
                     "files",
@@ -418,28 +685,56 @@ class DataClient:
         self._local_datapoints[datapoint.datapoint_id] = datapoint
         return datapoint
 
-    def get_datapoints_by_ids(self, datapoint_ids: list[str]) -> dict[str, DataPoint]:
+    def get_datapoints_by_ids(
+        self, datapoint_ids: list[str], timeout: Optional[float] = None
+    ) -> dict[str, DataPoint]:
         """Fetch multiple datapoints by their IDs in a batch operation.
 
         This method enables just-in-time fetching of datapoints when only IDs are stored
         in workflows, following the principle of efficient datapoint management.
+        The datapoints are fetched with a single request; Data Managers without
+        the batch endpoint are asked for each datapoint in turn.
 
         Args:
             datapoint_ids: List of datapoint ULID strings to fetch
+            timeout: Optional timeout override in seconds. If None, uses config.timeout_default.
 
         Returns:
-            Dictionary mapping datapoint IDs to DataPoint objects
-
-        Raises:
-            Exception: If any datapoint cannot be fetched
+            Dictionary mapping datapoint IDs to DataPoint objects. Datapoints
+            that could not be fetched are left out.
         """
         if not datapoint_ids:
             return {}
+        if self.data_server_url is None:
+            return {
+                datapoint_id: self._local_datapoints[datapoint_id]
+                for datapoint_id in datapoint_ids
+                if datapoint_id in self._local_datapoints
+            }
+
+        result = self._cached_datapoints(datapoint_ids)
+        datapoint_ids = [
+            datapoint_id for datapoint_id in datapoint_ids if datapoint_id not in result
+        ]
+        if not datapoint_ids:
+            return result
+
+        response = self.session.post(
+            f"{self.data_server_url}datapoints/batch_get",
+            json=[str(datapoint_id) for datapoint_id in datapoint_ids],
+            timeout=timeout or self.config.timeout_default,
+        )
+        if response.status_code not in BATCH_UNSUPPORTED:
+            response.raise_for_status()
+            for datapoint_id, datapoint in response.json().items():
+                result[datapoint_id] = DataPoint.discriminate(datapoint)
+                if self._cache is not None:
+                    self._cache.put_datapoint(result[datapoint_id])
+            return result
 
-        result = {}
         for datapoint_id in datapoint_ids:
             try:
-                datapoint = self.get_datapoint(datapoint_id)
+                datapoint = self.get_datapoint(datapoint_id, timeout=timeout)
                 result[datapoint_id] = datapoint
             except Exception as e:
                 # Log warning but continue with other datapoints
@@ -452,6 +747,162 @@ class DataClient:
 
         return result
 
+    def _cached_datapoints(self, datapoint_ids: list[str]) -> dict[str, DataPoint]:
+        """Return whichever of the given datapoints are in the local cache."""
+        if self._cache is None:
+            return {}
+        return {
+            datapoint_id: cached
+            for datapoint_id in datapoint_ids
+            if (cached := self._cache.get_datapoint(str(datapoint_id)))
+        }
+
+    def submit_datapoints(
+        self, datapoints: list[DataPoint], timeout: Optional[float] = None
+    ) -> list[DataPoint]:
+        """Submit several datapoints at once.
+
+        Value datapoints and files bound for the Data Manager are sent
+        together in one request and inserted in one write. Files that this
+        client uploads to object storage itself, and submissions to Data
+        Managers without the batch endpoint, are submitted one at a time
+        with `submit_datapoint`.
+
+        Args:
+            datapoints: The datapoints to submit.
+            timeout: Optional timeout override in seconds. If None, uses config.timeout_data_operations.
+
+        Returns:
+            The submitted datapoints, in the order they were given.
+        """
+        batched = [
+            index
+            for index, datapoint in enumerate(datapoints)
+            if not self._uploads_to_object_storage(datapoint)
+        ]
+        if self.data_server_url is None or len(batched) < 2:
+            return [
+                self.submit_datapoint(datapoint, timeout=timeout)
+                for datapoint in datapoints
+            ]
+
+        submitted: list[Optional[DataPoint]] = [None] * len(datapoints)
+        stored = self._submit_datapoint_batch(
+            [datapoints[index] for index in batched], timeout
+        )
+        for index, datapoint in zip(batched, stored, strict=True):
+            submitted[index] = datapoint
+        for index, datapoint in enumerate(datapoints):
+            if submitted[index] is None:
+                submitted[index] = self.submit_datapoint(datapoint, timeout=timeout)
+        return submitted
+
+    def _uploads_to_object_storage(self, datapoint: DataPoint) -> bool:
+        """Whether `submit_datapoint` uploads this datapoint's file to object storage itself."""
+        if self._minio_client is None:
+            return False
+        return datapoint.data_type == DataPointTypeEnum.FILE or (
+            datapoint.data_type == DataPointTypeEnum.OBJECT_STORAGE
+            and hasattr(datapoint, "path")
+        )
+
+    def get_stored_hashes(
+        self, sha256s: list[str], timeout: Optional[float] = None
+    ) -> set[str]:
+        """Ask the Data Manager which of the given SHA-256 hashes it stores the contents of.
+
+        A file datapoint whose contents are stored can be submitted without
+        uploading the file. Data Managers report none unless they have
+        content-addressed storage and allow blob references.
+
+        Args:
+            sha256s: Hex SHA-256 digests of file contents.
+            timeout: Optional timeout override in seconds. If None, uses config.timeout_default.
+
+        Returns:
+            The hashes whose contents are stored.
+        """
+        if self.data_server_url is None or not sha256s:
+            return set()
+        response = self.session.post(
+            f"{self.data_server_url}blobs/check",
+            json=sha256s,
+            timeout=timeout or self.config.timeout_default,
+        )
+        if response.status_code in BATCH_UNSUPPORTED:
+            return set()
+        response.raise_for_status()
+        return set(response.json())
+
+    def _stored_file_hashes(
+        self, datapoints: list[DataPoint], timeout: Optional[float] = None
+    ) -> dict[str, str]:
+        """Hash the files of file datapoints, returning the hashes the Data Manager already stores by datapoint ID.
+
+        Empty unless `deduplicate_uploads` is enabled.
+        """
+        if not self.config.deduplicate_uploads:
+            return {}
+        hashes = {
+            datapoint.datapoint_id: self._file_sha256(Path(datapoint.path).expanduser())
+            for datapoint in datapoints
+            if datapoint.data_type == DataPointTypeEnum.FILE
+        }
+        stored = self.get_stored_hashes(sorted(set(hashes.values())), timeout)
+        return {
+            datapoint_id: sha256
+            for datapoint_id, sha256 in hashes.items()
+            if sha256 in stored
+        }
+
+    def _submit_datapoint_batch(
+        self, datapoints: list[DataPoint], timeout: Optional[float] = None
+    ) -> list[DataPoint]:
+        """Send datapoints, and the files of file datapoints, to the Data Manager in one request.
+
+        Files whose contents the Data Manager already stores are left out,
+        and their datapoints reference the stored contents by ``sha256``.
+        """
+        stored = self._stored_file_hashes(datapoints, timeout)
+        datapoints = [
+            datapoint.model_copy(update={"sha256": stored.get(datapoint.datapoint_id)})
+            if datapoint.data_type == DataPointTypeEnum.FILE
+            else datapoint
+            for datapoint in datapoints
+        ]
+        with ExitStack() as stack:
+            files = [
+                (
+                    "files",
+                    (
+                        Path(datapoint.path).name,
+                        stack.enter_context(
+                            Path(datapoint.path).expanduser().open("rb")
+                        ),
+                    ),
+                )
+                for datapoint in datapoints
+                if datapoint.data_type == DataPointTypeEnum.FILE
+                and datapoint.datapoint_id not in stored
+            ]
+            response = self.session.post(
+                f"{self.data_server_url}datapoints/batch",
+                data={
+                    "datapoints": json.dumps(
+                        [datapoint.model_dump(mode="json") for datapoint in datapoints]
+                    )
+                },
+                files=files,
+                timeout=timeout or self.config.timeout_data_operations,
+            )
+        if response.status_code in BATCH_UNSUPPORTED:
+            return [
+                self.submit_datapoint(datapoint, timeout=timeout)
+                for datapoint in datapoints
+            ]
+        response.raise_for_status()
+        return [DataPoint.discriminate(datapoint) for datapoint in response.json()]
+
     def get_datapoint_metadata(self, datapoint_id: str) -> dict[str, Any]:
         """Get basic metadata for a datapoint without fetching the full data.
 
@@ -464,7 +915,29 @@ class DataClient:
         Returns:
             Dictionary with metadata fields like label, data_type, data_timestamp
         """
-        datapoint = self.get_datapoint(datapoint_id)
+        return self._datapoint_metadata(self.get_datapoint(datapoint_id))
+
+    def get_datapoints_metadata(
+        self, datapoint_ids: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Get metadata for multiple datapoints efficiently.
+
+        Args:
+            datapoint_ids: List of datapoint ULID strings
+
+        Returns:
+            Dictionary mapping datapoint IDs to metadata dictionaries
+        """
+        return {
+            datapoint_id: self._datapoint_metadata(datapoint)
+            for datapoint_id, datapoint in self.get_datapoints_by_ids(
+                datapoint_ids
+            ).items()
+        }
+
+    @staticmethod
+    def _datapoint_metadata(datapoint: DataPoint) -> dict[str, Any]:
+        """Extract the display metadata of a datapoint."""
         return {
             "datapoint_id": datapoint.datapoint_id,
             "label": getattr(datapoint, "label", None),
@@ -484,29 +957,6 @@ class DataClient:
             ),
         }
 
-    def get_datapoints_metadata(
-        self, datapoint_ids: list[str]
-    ) -> dict[str, dict[str, Any]]:
-        """Get metadata for multiple datapoints efficiently.
-
-        Args:
-            datapoint_ids: List of datapoint ULID strings
-
-        Returns:
-            Dictionary mapping datapoint IDs to metadata dictionaries
-        """
-        result = {}
-        for datapoint_id in datapoint_ids:
-            try:
-                metadata = self.get_datapoint_metadata(datapoint_id)
-                result[datapoint_id] = metadata
-            except Exception as e:
-                self.logger.warn(
-                    f"Failed to fetch metadata for datapoint {datapoint_id}: {e}"
-                )
-
-        return result
-
     def extract_datapoint_ids_from_action_result(self, action_result: Any) -> list[str]:
         """Extract all datapoint IDs from an ActionResult.
 
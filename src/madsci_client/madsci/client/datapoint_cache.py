@@ -0,0 +1,275 @@
+"""Local cache of datapoints and their values for DataClient.
+
+Datapoints never change once stored, so a cached datapoint or value is valid
+for as long as it is kept: entries are only ever removed to stay within the
+configured size limits, least recently used first. Datapoints are cached in
+memory; file values are cached on disk, with small values also kept in
+memory. Cached values can also be read as memory-mapped views of their cache
+file, which only loads the parts that are read.
+"""
+
+import contextlib
+import mmap
+import os
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Optional
+
+from madsci.common.sentry import SUBDIR_CACHE, get_global_madsci_subdir
+from madsci.common.types.client_types import DataClientConfig
+from madsci.common.types.datapoint_types import DataPoint
+from pydantic import BaseModel
+
+CACHE_FILE_SUFFIX = ".value"
+TEMP_FILE_SUFFIX = ".tmp"
+STALE_TEMP_FILE_SECONDS = 3600
+
+
+class DatapointCacheStats(BaseModel):
+    """Counters describing a DatapointCache's activity and size."""
+
+    metadata_hits: int = 0
+    """Number of datapoint lookups answered from the cache."""
+    metadata_misses: int = 0
+    """Number of datapoint lookups not found in the cache."""
+    value_hits: int = 0
+    """Number of value lookups answered from the cache."""
+    value_misses: int = 0
+    """Number of value lookups not found in the cache."""
+    metadata_evictions: int = 0
+    """Number of datapoints removed to stay within the metadata entry limit."""
+    memory_evictions: int = 0
+    """Number of values removed from memory to stay within the memory limit."""
+    disk_evictions: int = 0
+    """Number of values removed from disk to stay within the disk limit."""
+    metadata_entries: int = 0
+    """Number of datapoints currently cached."""
+    memory_bytes: int = 0
+    """Size of the values currently cached in memory."""
+    disk_bytes: int = 0
+    """Size of the values currently cached on disk."""
+
+
+class DatapointCache:
+    """Size-bounded LRU cache of datapoints and their values, keyed by datapoint ID.
+
+    Safe to use from several threads. Values cached on disk outlive the
+    process and are picked up again, oldest first for eviction, by the next
+    cache opened on the same directory.
+    """
+
+    def __init__(self, config: DataClientConfig) -> None:
+        """Open the cache, indexing any values already cached on disk.
+
+        Temporary files left behind by interrupted writes are removed once
+        they are old enough that no other process can still be writing them.
+
+        Args:
+            config: The data client configuration to take cache settings from.
+        """
+        self.config = config
+        self.cache_dir = (
+            Path(config.cache_dir).expanduser()
+            if config.cache_dir is not None
+            else get_global_madsci_subdir(SUBDIR_CACHE) / "datapoints"
+        )
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._stats = DatapointCacheStats()
+        self._metadata: OrderedDict[str, DataPoint] = OrderedDict()
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_bytes = 0
+        self._disk: OrderedDict[str, int] = OrderedDict()
+        self._disk_bytes = 0
+
+        stale_before = time.time() - STALE_TEMP_FILE_SECONDS
+        for entry in self.cache_dir.glob(f"*{TEMP_FILE_SUFFIX}"):
+            with contextlib.suppress(OSError):
+                if entry.stat().st_mtime < stale_before:
+                    entry.unlink()
+
+        # * Least recently used first, by the access time recorded on each hit
+        cached_files = sorted(
+            (entry.stat().st_mtime, entry)
+            for entry in self.cache_dir.glob(f"*{CACHE_FILE_SUFFIX}")
+        )
+        for _, entry in cached_files:
+            self._disk[entry.stem] = entry.stat().st_size
+            self._disk_bytes += self._disk[entry.stem]
+        with self._lock:
+            self._evict_disk()
+
+    @property
+    def stats(self) -> DatapointCacheStats:
+        """A snapshot of the cache's counters and size."""
+        with self._lock:
+            return self._stats.model_copy(
+                update={
+                    "metadata_entries": len(self._metadata),
+                    "memory_bytes": self._memory_bytes,
+                    "disk_bytes": self._disk_bytes,
+                }
+            )
+
+    def _path(self, datapoint_id: str) -> Path:
+        return self.cache_dir / f"{datapoint_id}{CACHE_FILE_SUFFIX}"
+
+    def get_datapoint(self, datapoint_id: str) -> Optional[DataPoint]:
+        """Return a cached datapoint, or None if it isn't cached."""
+        with self._lock:
+            datapoint = self._metadata.get(datapoint_id)
+            if datapoint is None:
+                self._stats.metadata_misses += 1
+                return None
+            self._metadata.move_to_end(datapoint_id)
+            self._stats.metadata_hits += 1
+            return datapoint
+
+    def put_datapoint(self, datapoint: DataPoint) -> None:
+        """Cache a datapoint."""
+        with self._lock:
+            self._metadata[datapoint.datapoint_id] = datapoint
+            self._metadata.move_to_end(datapoint.datapoint_id)
+            while len(self._metadata) > self.config.cache_max_metadata_entries:
+                self._metadata.popitem(last=False)
+                self._stats.metadata_evictions += 1
+
+    def get_value(self, datapoint_id: str) -> Optional[bytes]:
+        """Return a cached value, or None if it isn't cached.
+
+        Values of at least ``cache_memory_threshold_bytes`` are read from
+        their cache file on every hit rather than kept in memory. Use
+        ``get_value_view`` to read such values without loading them whole.
+        """
+        with self._lock:
+            if datapoint_id in self._memory:
+                self._memory.move_to_end(datapoint_id)
+                self._stats.value_hits += 1
+                return self._memory[datapoint_id]
+            path = self._touch(datapoint_id)
+            if path is None:
+                self._stats.value_misses += 1
+                return None
+        # * Read without the lock, so large values don't hold up other threads
+        try:
+            value = path.read_bytes()
+        except FileNotFoundError:
+            # * Evicted, here or by another process, since it was looked up
+            with self._lock:
+                self._stats.value_misses += 1
+            return None
+        with self._lock:
+            if len(value) < self.config.cache_memory_threshold_bytes:
+                self._remember(datapoint_id, value)
+            self._stats.value_hits += 1
+        return value
+
+    def get_value_view(self, datapoint_id: str) -> Optional[memoryview]:
+        """Return a read-only memoryview of a value's memory-mapped cache file, or None if it isn't cached on disk.
+
+        Only the parts of the view that are read are loaded into memory.
+        """
+        with self._lock:
+            path = self._touch(datapoint_id)
+            if path is None:
+                self._stats.value_misses += 1
+                return None
+            self._stats.value_hits += 1
+            if not self._disk[datapoint_id]:
+                # * Empty files can't be memory-mapped
+                return memoryview(b"")
+            return self._map(path)
+
+    def get_value_path(self, datapoint_id: str) -> Optional[Path]:
+        """Return the path of a value's cache file, or None if it isn't cached on disk."""
+        with self._lock:
+            path = self._touch(datapoint_id)
+            if path is None:
+                self._stats.value_misses += 1
+                return None
+            self._stats.value_hits += 1
+            return path
+
+    def put_value(self, datapoint_id: str, value: bytes) -> None:
+        """Cache a value, on disk and, if it is small enough, in memory."""
+        size = len(value)
+        if size <= self.config.cache_max_disk_bytes:
+            self._write(datapoint_id, lambda f: f.write(value))
+        with self._lock:
+            if size < self.config.cache_memory_threshold_bytes:
+                self._remember(datapoint_id, value)
+
+    def put_value_file(self, datapoint_id: str, path: Path) -> None:
+        """Cache a value from a file, such as a completed download, on disk."""
+        if path.stat().st_size > self.config.cache_max_disk_bytes:
+            return
+        with path.open("rb") as source:
+            self._write(datapoint_id, lambda f: shutil.copyfileobj(source, f))
+
+    def clear(self) -> None:
+        """Remove every cached datapoint and value."""
+        with self._lock:
+            self._metadata.clear()
+            self._memory.clear()
+            self._memory_bytes = 0
+            for datapoint_id in list(self._disk):
+                self._discard(datapoint_id)
+
+    def _write(self, datapoint_id: str, write: Callable[[BinaryIO], Any]) -> None:
+        """Write a value's cache file atomically, then evict to make room for it."""
+        with tempfile.NamedTemporaryFile(
+            dir=self.cache_dir, suffix=TEMP_FILE_SUFFIX, delete=False
+        ) as f:
+            write(f)
+            size = f.tell()
+        with self._lock:
+            Path(f.name).replace(self._path(datapoint_id))
+            self._disk_bytes += size - self._disk.pop(datapoint_id, 0)
+            self._disk[datapoint_id] = size
+            self._evict_disk()
+
+    def _touch(self, datapoint_id: str) -> Optional[Path]:
+        """Mark a value on disk as recently used, returning its path if it is still there."""
+        if datapoint_id not in self._disk:
+            return None
+        path = self._path(datapoint_id)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            # * Removed by another process sharing the cache directory
+            self._disk_bytes -= self._disk.pop(datapoint_id)
+            return None
+        self._disk.move_to_end(datapoint_id)
+        return path
+
+    @staticmethod
+    def _map(path: Path) -> memoryview:
+        with path.open("rb") as f:
+            return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def _remember(self, datapoint_id: str, value: bytes) -> None:
+        """Keep a value in memory, evicting the least recently used values to make room."""
+        if len(value) > self.config.cache_max_memory_bytes:
+            return
+        self._memory_bytes += len(value) - len(self._memory.pop(datapoint_id, b""))
+        self._memory[datapoint_id] = value
+        while self._memory_bytes > self.config.cache_max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            self._stats.memory_evictions += 1
+
+    def _evict_disk(self) -> None:
+        """Remove the least recently used values from disk until within the disk limit."""
+        while self._disk_bytes > self.config.cache_max_disk_bytes:
+            self._discard(next(iter(self._disk)))
+            self._stats.disk_evictions += 1
+
+    def _discard(self, datapoint_id: str) -> None:
+        self._disk_bytes -= self._disk.pop(datapoint_id)
+        # * Still memory-mapped on platforms that forbid deleting mapped files
+        with contextlib.suppress(OSError):
+            self._path(datapoint_id).unlink(missing_ok=True)
@@ -0,0 +1,172 @@
+"""Background batching sender for EventClient."""
+
+import queue
+import threading
+import time
+from typing import Callable, Optional
+
+from madsci.common.types.event_types import Event, EventClientConfig
+from pydantic import BaseModel
+
+_STOP = object()
+
+
+class EventBatchStats(BaseModel):
+    """Counters describing an EventBatchSender's activity."""
+
+    queued: int = 0
+    """Number of events currently waiting to be sent."""
+    sent: int = 0
+    """Number of events sent to the event server."""
+    batches: int = 0
+    """Number of batches sent to the event server."""
+    failed: int = 0
+    """Number of events in batches that could not be sent."""
+    dropped: int = 0
+    """Number of events discarded because the queue was full or the sender was closed."""
+    blocked: int = 0
+    """Number of times a caller waited for room in the queue."""
+
+
+class EventBatchSender:
+    """Queues events and sends them in batches from a single background worker.
+
+    A batch is sent once it holds `batch_max_size` events, or once its oldest
+    event has waited `batch_max_age` seconds. When the queue is full, new events
+    are handled according to `batch_overflow_policy`. Closing the sender sends
+    everything still queued before returning.
+    """
+
+    def __init__(
+        self,
+        config: EventClientConfig,
+        send_batch: Callable[[list[Event]], bool],
+        name: str = "event_batch_sender",
+    ) -> None:
+        """Start the background worker.
+
+        Args:
+            config: The event client configuration to take batch settings from.
+            send_batch: Sends a batch to the event server, returning whether it succeeded.
+            name: The name of the worker thread.
+        """
+        self.config = config
+        self._send_batch = send_batch
+        self._queue: queue.Queue = queue.Queue(maxsize=config.batch_queue_size)
+        self._stats = EventBatchStats()
+        self._stats_lock = threading.Lock()
+        self._closed = threading.Event()
+        # * Held while queueing, so nothing can be queued behind the stop sentinel
+        self._submit_lock = threading.Lock()
+        self._worker = threading.Thread(target=self._run, name=name, daemon=True)
+        self._worker.start()
+
+    @property
+    def stats(self) -> EventBatchStats:
+        """A snapshot of the sender's counters."""
+        with self._stats_lock:
+            return self._stats.model_copy(update={"queued": self._queue.qsize()})
+
+    def _count(self, counter: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            setattr(self._stats, counter, getattr(self._stats, counter) + amount)
+
+    def submit(self, event: Event) -> bool:
+        """Queue an event to be sent, returning False if it was dropped."""
+        with self._submit_lock:
+            if self._closed.is_set():
+                self._count("dropped")
+                return False
+            return self._put(event)
+
+    def _put(self, event: Event) -> bool:
+        """Queue an event, applying the overflow policy if the queue is full."""
+        policy = self.config.batch_overflow_policy
+        try:
+            self._queue.put_nowait(event)
+            return True
+        except queue.Full:
+            if policy == "drop_newest":
+                self._count("dropped")
+                return False
+        if policy == "block":
+            self._count("blocked")
+            self._queue.put(event)
+            return True
+        # * drop_oldest: make room by discarding from the head of the queue
+        while True:
+            try:
+                self._queue.get_nowait()
+                self._queue.task_done()
+                self._count("dropped")
+            except queue.Empty:
+                pass
+            try:
+                self._queue.put_nowait(event)
+                return True
+            except queue.Full:
+                continue
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued event has been sent (or failed), returning False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Stop accepting events, send everything still queued, and stop the worker."""
+        with self._submit_lock:
+            if self._closed.is_set():
+                return
+            self._closed.set()
+            self._queue.put(_STOP)
+        self._worker.join(timeout)
+
+    def _run(self) -> None:
+        """Collect and send batches until closed."""
+        stopping = False
+        while not stopping:
+            batch, stopping = self._next_batch()
+            if batch:
+                self._send(batch)
+            for _ in range(len(batch) + int(stopping)):
+                self._queue.task_done()
+
+    def _next_batch(self) -> tuple[list[Event], bool]:
+        """Wait for the next batch, returning it and whether the sender is stopping."""
+        first = self._queue.get()
+        if first is _STOP:
+            return [], True
+        batch = [first]
+        deadline = time.monotonic() + self.config.batch_max_age
+        while len(batch) < self.config.batch_max_size:
+            remaining = deadline - time.monotonic()
+            try:
+                event = (
+                    self._queue.get(timeout=remaining)
+                    if remaining > 0
+                    else self._queue.get_nowait()
+                )
+            except queue.Empty:
+                break
+            if event is _STOP:
+                return batch, True
+            batch.append(event)
+        return batch, False
+
+    def _send(self, batch: list[Event]) -> None:
+        """Send a batch, counting the outcome."""
+        try:
+            sent = self._send_batch(batch)
+        except Exception:
+            sent = False
+        if sent:
+            self._count("sent", len(batch))
+            self._count("batches")
+        else:
+            self._count("failed", len(batch))
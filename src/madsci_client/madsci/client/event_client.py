@@ -16,9 +16,10 @@ from collections import OrderedDict
 from importlib.metadata import PackageNotFoundError, version
 from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, Iterator, Optional, Union
 
 import requests
+from madsci.client.event_batch_sender import EventBatchSender, EventBatchStats
 from madsci.client.structlog_config import (
     AnsiStrippingFormatter,
     create_instance_logger,
@@ -31,6 +32,7 @@ from madsci.common.otel import (
     current_trace_context,
     inject_headers,
 )
+from madsci.common.pagination import NEXT_CURSOR_HEADER
 from madsci.common.types.event_types import (
     Event,
     EventClientConfig,
@@ -144,6 +146,16 @@ class EventClient:
         # Create HTTP session for requests to event server
         self.session = create_http_session(config=self.config)
 
+        # Queue events for a single background worker to send in batches
+        self._batch_sender: Optional[EventBatchSender] = None
+        self._batch_endpoint_supported = True
+        if self.config.batch_enabled and self.event_server:
+            self._batch_sender = EventBatchSender(
+                self.config,
+                self._send_events_to_event_server,
+                name=f"{self.name}.event_batch_sender",
+            )
+
         self._otel_runtime = None
         self._otel_event_counter = None
         self._otel_send_latency_histogram = None
@@ -363,6 +375,11 @@ class EventClient:
                     handler.close()
                     self.logger.removeHandler(handler)
 
+        # Send any queued events before closing the session they're sent on
+        if getattr(self, "_batch_sender", None) is not None:
+            with contextlib.suppress(Exception):
+                self._batch_sender.close(timeout=self.config.timeout_long_operations)
+
         # Close HTTP session
         if hasattr(self, "session") and self.session:
             with contextlib.suppress(Exception):
@@ -686,7 +703,7 @@ class EventClient:
             )
 
             self._record_otel_event(level=level, event_type=event_type)
-            self._send_event_to_event_server_task(event)
+            self._dispatch_event(event)
         except Exception as e:
             self._handle_error(e, "Failed to send event to server")
 
@@ -760,6 +777,58 @@ class EventClient:
                 break
         return selected_events
 
+    def iter_events(
+        self,
+        page_size: int = 100,
+        level: int = -1,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Event]:
+        """
+        Iterate over events, newest first, fetching pages from the event server as needed.
+
+        Pages are requested lazily with the cursor the server returns for the
+        next page, so stopping early doesn't fetch the rest. If no event server
+        is configured, iterate over the log file instead.
+
+        Args:
+            page_size: Number of events to request per page.
+            level: Log level filter. -1 uses effective log level.
+            start_time: ISO format start time.
+            end_time: ISO format end time.
+            timeout: Optional timeout override in seconds. If None, uses config.timeout_default.
+        """
+        if level == -1:
+            level = int(self.logger.getEffectiveLevel())
+        if not self.event_server:
+            yield from (
+                event
+                for event in reversed(list(self.get_log().values()))
+                if event.log_level >= level
+            )
+            return
+
+        params: dict[str, Any] = {"number": page_size, "level": level}
+        if start_time:
+            params["start_time"] = start_time
+        if end_time:
+            params["end_time"] = end_time
+        while True:
+            response = self.session.get(
+                str(self.event_server) + "events",
+                timeout=timeout or self.config.timeout_default,
+                params=params,
+            )
+            if not response.ok:
+                response.raise_for_status()
+            for value in response.json().values():
+                yield Event.model_validate(value)
+            cursor = response.headers.get(NEXT_CURSOR_HEADER)
+            if not cursor:
+                return
+            params = {**params, "cursor": cursor}
+
     def query_events(
         self, selector: dict, timeout: Optional[float] = None
     ) -> dict[str, Event]:
@@ -787,6 +856,80 @@ class EventClient:
         self.logger.warning("No event server configured. Cannot query events.")
         return {}
 
+    def export_events(
+        self,
+        output_path: Union[str, Path],
+        export_format: str = "ndjson",
+        *,
+        compress: bool = False,
+        event_types: Optional[list[Union[EventType, str]]] = None,
+        level: int = 0,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        include_archived: bool = False,
+    ) -> Optional[Path]:
+        """
+        Download events from the event server to a file, oldest first.
+
+        The export is streamed to disk as it arrives, so exports larger than
+        memory are supported. Requires an event server be configured.
+
+        Args:
+            output_path: File to write the export to.
+            export_format: "ndjson" (one JSON event per line) or "csv".
+            compress: If True, the server gzips the export.
+            event_types: Only export events of these types.
+            level: Minimum log level to export.
+            start_time: ISO format start time.
+            end_time: ISO format end time.
+            include_archived: Whether to include archived events.
+
+        Returns:
+            The path written to, or None if no event server is configured or the request failed.
+        """
+        if not self.event_server:
+            self.logger.warning("No event server configured. Cannot export events.")
+            return None
+
+        params: dict[str, Any] = {
+            "format": export_format,
+            "gzip": str(compress).lower(),
+            "level": level,
+            "include_archived": str(include_archived).lower(),
+        }
+        if event_types:
+            params["event_type"] = [
+                event_type.value if isinstance(event_type, EventType) else event_type
+                for event_type in event_types
+            ]
+        if start_time:
+            params["start_time"] = start_time
+        if end_time:
+            params["end_time"] = end_time
+
+        output_path = Path(output_path)
+        try:
+            with self.session.get(
+                str(self.event_server) + "events/export",
+                params=params,
+                timeout=self.config.timeout_long_operations,
+                stream=True,
+            ) as response:
+                if not response.ok:
+                    self.logger.error(
+                        "Error exporting events",
+                        extra={"http_status_code": response.status_code},
+                    )
+                    response.raise_for_status()
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                with output_path.open("wb") as file:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        file.write(chunk)
+        except requests.RequestException:
+            self.logger.error("Error exporting events", exc_info=True)
+            return None
+        return output_path
+
     def log(
         self,
         event: Union[Event, Any],
@@ -847,7 +990,7 @@ class EventClient:
         # * Log the event to the event server if configured
         # * Only log if the event is at the same level or higher than the logger
         if self.logger.getEffectiveLevel() <= event.log_level and self.event_server:
-            self._send_event_to_event_server_task(event)
+            self._dispatch_event(event)
 
     # ==================== Utilization Methods ====================
 
@@ -1058,14 +1201,43 @@ class EventClient:
             )
             return None
 
+    @property
+    def batch_stats(self) -> Optional[EventBatchStats]:
+        """Counters for batched sending, or None if batching is disabled."""
+        if self._batch_sender is None:
+            return None
+        return self._batch_sender.stats
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued event has been sent to the event server.
+
+        Only has an effect when batching is enabled.
+
+        Args:
+            timeout: Maximum time in seconds to wait, or None to wait indefinitely
+
+        Returns:
+            False if the timeout elapsed before the queue was empty, True otherwise
+        """
+        if self._batch_sender is None:
+            return True
+        return self._batch_sender.flush(timeout=timeout)
+
     # ==================== Internal Methods ====================
 
+    def _dispatch_event(self, event: Event) -> None:
+        """Send an event to the event server, via the batch queue if batching is enabled."""
+        if self._batch_sender is not None:
+            self._batch_sender.submit(event)
+        else:
+            self._send_event_to_event_server_task(event)
+
     @threaded_task
     def _send_event_to_event_server_task(self, event: Event) -> None:
         """Send an event to the event manager (fire-and-forget)."""
         self._send_event_to_event_server(event)
 
-    def _send_event_to_event_server(self, event: Event) -> None:
+    def _send_event_to_event_server(self, event: Event) -> bool:
         """Send an event to the event manager.
 
         This is fire-and-forget: on failure, a warning is logged and
@@ -1093,17 +1265,67 @@ class EventClient:
                 latency_ms=elapsed_ms,
                 event_type=event.event_type or EventType.UNKNOWN,
             )
+            return True
 
         except Exception:
             self._record_otel_send_failure(
                 event_type=event.event_type or EventType.UNKNOWN,
             )
             self.logger.error(
-                "Failed to send event to event server; event persisted locally only",
-                event_type=str(event.event_type),
-                event_id=event.event_id,
+                "Failed to send event %s (%s) to event server; event persisted locally only",
+                event.event_id,
+                event.event_type,
+                exc_info=True,
+            )
+            return False
+
+    def _send_events_to_event_server(self, events: list[Event]) -> bool:
+        """Send a batch of events to the event manager, returning whether it succeeded.
+
+        Falls back to sending events one at a time if the event manager
+        predates the batch endpoint. Like single sends, failed batches are
+        logged and dropped; the events are already in the local log files.
+        """
+        if not self._batch_endpoint_supported:
+            results = [self._send_event_to_event_server(event) for event in events]
+            return all(results)
+        try:
+            start = time.perf_counter()
+            headers: dict[str, str] = {}
+            if self._otel_runtime and self._otel_runtime.enabled:
+                with contextlib.suppress(Exception):
+                    inject_headers(headers)
+            response = self.session.post(
+                url=f"{self.event_server}events/batch",
+                json=[event.model_dump(mode="json") for event in events],
+                headers=headers,
+                timeout=self.config.timeout_default,
+            )
+            if response.status_code in (404, 405):
+                self._batch_endpoint_supported = False
+                return self._send_events_to_event_server(events)
+            if not response.ok:
+                response.raise_for_status()
+
+            elapsed_ms = (time.perf_counter() - start) * 1000.0
+            for event in events:
+                self._record_otel_send_latency(
+                    latency_ms=elapsed_ms,
+                    event_type=event.event_type or EventType.UNKNOWN,
+                )
+            return True
+
+        except Exception:
+            for event in events:
+                self._record_otel_send_failure(
+                    event_type=event.event_type or EventType.UNKNOWN,
+                )
+            self.logger.error(
+                "Failed to send a batch of %d events to event server; events persisted locally only",
+                len(events),
                 exc_info=True,
             )
+            return False
 
     def _new_event_for_log(self, event_data: Any, level: int) -> Event:
         """Create a new log event from arbitrary data"""
@@ -14,6 +14,7 @@ from madsci.common.types.node_types import (
     NodeClientCapabilities,
     NodeInfo,
     NodeSetConfigResponse,
+    NodeSnapshot,
     NodeStatus,
 )
 from madsci.common.types.resource_types import ResourceDataModels
@@ -56,6 +57,15 @@ class AbstractNodeClient:
         """Get the result of an action on the node."""
         raise NotImplementedError("get_action_result is not implemented by this client")
 
+    def wait_for_action(
+        self,
+        action_id: str,
+        status: Optional[ActionStatus] = None,
+        timeout: float = 30.0,
+    ) -> ActionResult:
+        """Wait until an action's status differs from `status` (or, if no status is given, until the action is terminal), or until the timeout elapses, and return its result."""
+        raise NotImplementedError("wait_for_action is not implemented by this client")
+
     def await_action_result(
         self, action_id: str, timeout: Optional[float] = None
     ) -> ActionResult:
@@ -64,18 +74,24 @@ class AbstractNodeClient:
             "await_action_result is not implemented by this client"
         )
 
-    def get_status(self) -> NodeStatus:
+    def get_status(self, timeout: Optional[float] = None) -> NodeStatus:
         """Get the status of the node."""
         raise NotImplementedError("get_status is not implemented by this client")
 
-    def get_state(self) -> dict[str, Any]:
+    def get_state(self, timeout: Optional[float] = None) -> dict[str, Any]:
         """Get the state of the node."""
         raise NotImplementedError("get_state is not implemented by this client")
 
-    def get_info(self) -> NodeInfo:
+    def get_info(self, timeout: Optional[float] = None) -> NodeInfo:
         """Get information about the node."""
         raise NotImplementedError("get_info is not implemented by this client")
 
+    def get_snapshot(
+        self, include_info: bool = False, timeout: Optional[float] = None
+    ) -> NodeSnapshot:
+        """Get the status, state, and optionally info of the node in a single request."""
+        raise NotImplementedError("get_snapshot is not implemented by this client")
+
     def set_config(self, config_dict: dict[str, Any]) -> NodeSetConfigResponse:
         """Set configuration values of the node."""
         raise NotImplementedError("set_config is not implemented by this client")
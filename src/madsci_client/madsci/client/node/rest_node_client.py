@@ -27,6 +27,7 @@ from madsci.common.types.node_types import (
     NodeClientCapabilities,
     NodeInfo,
     NodeSetConfigResponse,
+    NodeSnapshot,
     NodeStatus,
 )
 from madsci.common.types.resource_types import ResourceDataModels
@@ -68,9 +69,11 @@ class RestNodeClient(AbstractNodeClient):
         get_info=True,
         get_state=True,
         get_status=True,
+        get_snapshot=True,
         send_action=True,
         get_action_status=True,
         get_action_result=True,
+        wait_for_action=True,
         get_action_history=True,
         action_files=True,
         send_admin_commands=True,
@@ -109,6 +112,7 @@ class RestNodeClient(AbstractNodeClient):
 
         self.config = config if config is not None else RestNodeClientConfig()
         self.session = create_http_session(config=self.config)
+        self._snapshots: dict[bool, tuple[str, NodeSnapshot]] = {}
 
     def send_action(
         self,
@@ -538,6 +542,38 @@ class RestNodeClient(AbstractNodeClient):
             response_data, "action_name", action_id, timeout=timeout
         )
 
+    def wait_for_action(
+        self,
+        action_id: str,
+        status: Optional[ActionStatus] = None,
+        timeout: float = 30.0,
+        request_timeout: Optional[float] = None,
+    ) -> ActionResult:
+        """
+        Wait for an action's status to change, using a single long-poll request to the node.
+
+        Note: Like get_action_result, this cannot fetch files.
+
+        Args:
+            action_id: The ID of the action.
+            status: The last known status of the action. The node responds as soon as the action's status differs from it, or, if not given, as soon as the action is terminal.
+            timeout: How long, in seconds, the node may wait for a change before responding with the action's current result.
+            request_timeout: Optional allowance in seconds for the request itself, on top of the wait. If None, uses config.timeout_default.
+        """
+        params = {"timeout": timeout}
+        if status is not None:
+            params["status"] = status.value
+        rest_response = self.session.get(
+            f"{self.url}/action/{action_id}/wait",
+            params=params,
+            timeout=timeout + (request_timeout or self.config.timeout_default),
+        )
+        rest_response.raise_for_status()
+
+        return self._convert_rest_result_to_action_result(
+            rest_response.json(), "action_name", action_id, timeout=request_timeout
+        )
+
     def await_action_result(
         self,
         action_id: str,
@@ -645,6 +681,35 @@ class RestNodeClient(AbstractNodeClient):
         response.raise_for_status()
         return NodeInfo.model_validate(response.json())
 
+    def get_snapshot(
+        self, include_info: bool = False, timeout: Optional[float] = None
+    ) -> NodeSnapshot:
+        """
+        Get the status, state, and optionally info of the node in a single request.
+
+        The last snapshot is kept, and sent back to the node as a conditional request, so
+        an unchanged node responds with an empty 304 and the kept snapshot is returned. The
+        same object is returned for as long as the node is unchanged, so treat it as read-only.
+
+        Args:
+            include_info: Whether to include the node's info.
+            timeout: Optional timeout override in seconds. If None, uses config.timeout_default.
+        """
+        etag, snapshot = self._snapshots.get(include_info, (None, None))
+        response = self.session.get(
+            f"{self.url}/snapshot",
+            params={"include_info": include_info},
+            headers={"If-None-Match": etag} if etag else None,
+            timeout=timeout or self.config.timeout_default,
+        )
+        if response.status_code == 304 and snapshot is not None:
+            return snapshot
+        response.raise_for_status()
+        snapshot = NodeSnapshot.model_validate(response.json())
+        if response.headers.get("ETag"):
+            self._snapshots[include_info] = (response.headers["ETag"], snapshot)
+        return snapshot
+
     def set_config(
         self, new_config: dict[str, Any], timeout: Optional[float] = None
     ) -> NodeSetConfigResponse:
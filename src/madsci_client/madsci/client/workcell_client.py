@@ -2,6 +2,7 @@
 
 import json
 import time
+from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional, Union
 
@@ -193,6 +194,9 @@ class WorkcellClient:
         raise_on_failed: bool = True,
         raise_on_cancelled: bool = True,
         timeout: Optional[float] = None,
+        *,
+        priority: Optional[int] = None,
+        deadline: Optional[datetime] = None,
     ) -> Workflow:
         """
         Submit a workflow to the Workcell Manager.
@@ -215,6 +219,10 @@ class WorkcellClient:
             If True, raise an exception if the workflow is cancelled, by default True.
         timeout : Optional[float]
             Timeout in seconds for this request. If not provided, uses the default timeout from config.
+        priority : Optional[int]
+            Priority for the workflow run, used by priority-aware schedulers. Higher is more important.
+        deadline : Optional[datetime]
+            Time by which the workflow run should finish, used by deadline-aware schedulers.
 
         Returns
         -------
@@ -243,6 +251,8 @@ class WorkcellClient:
             "json_inputs": json.dumps(json_inputs) if json_inputs else None,
             "ownership_info": get_current_ownership_info().model_dump_json(),
             "file_input_paths": json.dumps(file_inputs) if file_inputs else None,
+            "priority": priority,
+            "deadline": deadline.isoformat() if deadline else None,
         }
         files = {
             (
@@ -53,3 +53,63 @@ class TestLogsCommand:
         result = runner.invoke(madsci, ["logs", "--no-timestamps", "--tail", "10"])
 
         assert result.exit_code == 0
+
+
+class TestEventStreamDecoding:
+    """Tests for decoding the Event Manager's live event stream."""
+
+    def test_decodes_messages_and_tracks_last_id(self) -> None:
+        """Test that complete messages become events and their IDs are remembered."""
+        from madsci.client.cli.utils.event_stream import SSEDecoder
+
+        decoder = SSEDecoder()
+        lines = [
+            ": keepalive",
+            "",
+            "id: 01A",
+            "event: event",
+            'data: {"event_id": "01A"}',
+            "",
+            "id: 01B",
+            'data: {"event_id": "01B"}',
+        ]
+        events = [event for line in lines if (event := decoder.feed(line))]
+
+        assert events == [{"event_id": "01A"}]
+        assert decoder.headers() == {"Last-Event-ID": "01A"}
+        assert decoder.feed("") == {"event_id": "01B"}
+        assert decoder.headers() == {"Last-Event-ID": "01B"}
+
+    def test_message_without_blank_line_is_completed_by_next_id(self) -> None:
+        """Test that a new message ID completes an unterminated message."""
+        from madsci.client.cli.utils.event_stream import SSEDecoder
+
+        decoder = SSEDecoder()
+        decoder.feed("id: 01A")
+        decoder.feed('data: {"event_id": "01A"}')
+        assert decoder.feed("id: 01B") == {"event_id": "01A"}
+
+    def test_stream_params(self) -> None:
+        """Test that level names are sent as numeric levels."""
+        from madsci.client.cli.utils.event_stream import event_stream_params
+
+        assert event_stream_params("error", "node1") == {
+            "level": 40,
+            "source": "node1",
+        }
+        assert event_stream_params() == {}
+
+    def test_follow_falls_back_without_stream(self) -> None:
+        """Test that following reports when the Event Manager has no live stream."""
+        from unittest.mock import MagicMock, patch
+
+        from madsci.client.cli.commands.logs import follow_event_stream
+
+        response = MagicMock(status_code=404)
+        client = MagicMock()
+        client.__enter__.return_value = client
+        client.stream.return_value.__enter__.return_value = response
+        with patch("httpx.Client", return_value=client):
+            assert (
+                follow_event_stream("http://localhost:8001/", on_entry=print) is False
+            )
@@ -0,0 +1,179 @@
+"""Tests for the DataClient's local datapoint cache."""
+
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from madsci.client.datapoint_cache import DatapointCache
+from madsci.common.types.client_types import DataClientConfig
+from madsci.common.types.datapoint_types import ValueDataPoint
+from madsci.common.utils import new_ulid_str
+
+
+def make_cache(tmp_path: Path, **settings: int) -> DatapointCache:
+    """Create a cache in a temporary directory with the given size settings."""
+    return DatapointCache(
+        DataClientConfig(cache_enabled=True, cache_dir=tmp_path, **settings)
+    )
+
+
+def test_datapoint_hits_and_misses(tmp_path: Path) -> None:
+    """Datapoints are cached in memory, with hits and misses counted."""
+    cache = make_cache(tmp_path)
+    datapoint = ValueDataPoint(label="calibration", value={"offset": 0.5})
+
+    assert cache.get_datapoint(datapoint.datapoint_id) is None
+    cache.put_datapoint(datapoint)
+    assert cache.get_datapoint(datapoint.datapoint_id) is datapoint
+
+    stats = cache.stats
+    assert stats.metadata_hits == 1
+    assert stats.metadata_misses == 1
+    assert stats.metadata_entries == 1
+
+
+def test_datapoints_evicted_least_recently_used_first(tmp_path: Path) -> None:
+    """The least recently used datapoint is evicted beyond the entry limit."""
+    cache = make_cache(tmp_path, cache_max_metadata_entries=2)
+    first, second, third = (ValueDataPoint(label="dp", value=i) for i in range(3))
+    cache.put_datapoint(first)
+    cache.put_datapoint(second)
+    cache.get_datapoint(first.datapoint_id)
+    cache.put_datapoint(third)
+
+    assert cache.get_datapoint(second.datapoint_id) is None
+    assert cache.get_datapoint(first.datapoint_id) is first
+    assert cache.stats.metadata_evictions == 1
+
+
+def test_small_values_cached_in_memory_and_on_disk(tmp_path: Path) -> None:
+    """Small values are kept in memory and written to disk."""
+    cache = make_cache(tmp_path)
+    datapoint_id = new_ulid_str()
+
+    assert cache.get_value(datapoint_id) is None
+    cache.put_value(datapoint_id, b"small value")
+
+    assert cache.get_value(datapoint_id) == b"small value"
+    assert cache.get_value_path(datapoint_id).read_bytes() == b"small value"
+    stats = cache.stats
+    assert stats.value_hits == 2
+    assert stats.value_misses == 1
+    assert stats.memory_bytes == len(b"small value")
+    assert stats.disk_bytes == len(b"small value")
+
+
+def test_large_values_read_from_disk(tmp_path: Path) -> None:
+    """Values over the memory threshold are read from the cache file, not kept in memory."""
+    cache = make_cache(tmp_path, cache_memory_threshold_bytes=1024)
+    datapoint_id = new_ulid_str()
+    value = os.urandom(4096)
+    cache.put_value(datapoint_id, value)
+
+    for _ in range(2):
+        cached = cache.get_value(datapoint_id)
+        assert isinstance(cached, bytes)
+        assert cached == value
+    assert cache.stats.memory_bytes == 0
+
+
+def test_values_read_without_holding_the_lock(tmp_path: Path) -> None:
+    """Reading a value from its cache file doesn't block other cache operations."""
+    cache = make_cache(tmp_path, cache_memory_threshold_bytes=1024)
+    datapoint_id = new_ulid_str()
+    value = os.urandom(4096)
+    cache.put_value(datapoint_id, value)
+    read_bytes = Path.read_bytes
+
+    def unlocked_read_bytes(path: Path) -> bytes:
+        assert not cache._lock.locked()
+        return read_bytes(path)
+
+    with patch.object(
+        Path, "read_bytes", autospec=True, side_effect=unlocked_read_bytes
+    ):
+        assert cache.get_value(datapoint_id) == value
+
+    # * A value evicted after it was looked up is a miss
+    with patch.object(Path, "read_bytes", side_effect=FileNotFoundError):
+        assert cache.get_value(datapoint_id) is None
+    assert cache.stats.value_misses == 1
+
+
+def test_value_views_memory_mapped(tmp_path: Path) -> None:
+    """Value views map the cache file, regardless of the value's size."""
+    cache = make_cache(tmp_path)
+    datapoint_id, empty_id = new_ulid_str(), new_ulid_str()
+    value = os.urandom(4096)
+    assert cache.get_value_view(datapoint_id) is None
+    cache.put_value(datapoint_id, value)
+    cache.put_value(empty_id, b"")
+
+    view = cache.get_value_view(datapoint_id)
+    assert isinstance(view, memoryview)
+    assert view.readonly
+    assert view[100:200] == value[100:200]
+    assert cache.get_value_view(empty_id) == b""
+    assert cache.stats.value_hits == 2
+    assert cache.stats.value_misses == 1
+
+
+def test_stale_temp_files_removed(tmp_path: Path) -> None:
+    """Temporary files left by interrupted writes are removed once stale."""
+    stale = tmp_path / "interrupted.tmp"
+    recent = tmp_path / "in_progress.tmp"
+    stale.write_bytes(b"partial")
+    recent.write_bytes(b"partial")
+    past = time.time() - 2 * 3600
+    os.utime(stale, (past, past))
+
+    cache = make_cache(tmp_path)
+    assert not stale.exists()
+    assert recent.exists()
+    assert cache.stats.disk_bytes == 0
+
+
+def test_values_evicted_to_stay_within_limits(tmp_path: Path) -> None:
+    """The least recently used values are evicted from memory and disk."""
+    cache = make_cache(tmp_path, cache_max_memory_bytes=250, cache_max_disk_bytes=250)
+    ids = [new_ulid_str() for _ in range(3)]
+    for datapoint_id in ids:
+        cache.put_value(datapoint_id, b"x" * 100)
+
+    stats = cache.stats
+    assert stats.memory_evictions == 1
+    assert stats.disk_evictions == 1
+    assert stats.disk_bytes == 200
+    assert cache.get_value(ids[0]) is None
+    assert cache.get_value(ids[2]) == b"x" * 100
+
+
+def test_disk_cache_reused_by_new_cache(tmp_path: Path) -> None:
+    """Values cached on disk are found again, least recently used first, by a new cache."""
+    cache = make_cache(tmp_path)
+    old_id, new_id = new_ulid_str(), new_ulid_str()
+    cache.put_value(old_id, b"a" * 100)
+    cache.put_value(new_id, b"b" * 100)
+    past = time.time() - 60
+    os.utime(cache.get_value_path(old_id), (past, past))
+
+    reopened = make_cache(tmp_path, cache_max_disk_bytes=150)
+    assert reopened.stats.disk_evictions == 1
+    assert reopened.get_value(old_id) is None
+    assert reopened.get_value(new_id) == b"b" * 100
+
+
+def test_put_value_file_and_clear(tmp_path: Path) -> None:
+    """A downloaded file can be cached, and clearing removes everything."""
+    cache = make_cache(tmp_path / "cache")
+    download = tmp_path / "download.bin"
+    download.write_bytes(b"downloaded")
+    datapoint_id = new_ulid_str()
+    cache.put_value_file(datapoint_id, download)
+    assert cache.get_value_path(datapoint_id).read_bytes() == b"downloaded"
+
+    cache.clear()
+    assert cache.get_value(datapoint_id) is None
+    assert cache.stats.disk_bytes == 0
+    assert not list((tmp_path / "cache").iterdir())
@@ -3,13 +3,15 @@
 import gzip
 import logging
 import tempfile
+import threading
 import time
 from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 import requests
+from madsci.client.event_batch_sender import EventBatchSender
 from madsci.client.event_client import EventClient
 from madsci.common.types.event_types import (
     Event,
@@ -284,6 +286,178 @@ class TestEventClientLogging:
         assert client.logfile.exists()
 
 
+class TestEventClientBatching:
+    """Test EventClient batched sending."""
+
+    @pytest.fixture
+    def batch_config(self, config_with_server, temp_log_dir):
+        """EventClientConfig with batching enabled."""
+        return config_with_server.model_copy(
+            update={
+                "log_dir": temp_log_dir,
+                "batch_enabled": True,
+                "batch_max_size": 3,
+                "batch_max_age": 60.0,
+            }
+        )
+
+    @patch("madsci.client.event_client.create_http_session")
+    def test_events_sent_in_batches(self, mock_create_session, batch_config):
+        """Test that events are sent in one request per full batch, and the rest on close."""
+        mock_session = Mock()
+        mock_session.post.return_value = Mock(ok=True, status_code=200)
+        mock_create_session.return_value = mock_session
+        client = EventClient(config=batch_config)
+        assert client.flush(timeout=5)
+        mock_session.post.reset_mock()
+
+        for i in range(4):
+            client.info(f"Message {i}")
+        deadline = time.monotonic() + 5
+        while not mock_session.post.called and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.1)
+
+        mock_session.post.assert_called_once()
+        call_args = mock_session.post.call_args
+        assert call_args[1]["url"] == "http://localhost:8001/events/batch"
+        assert [event["event_data"]["message"] for event in call_args[1]["json"]] == [
+            "Message 0",
+            "Message 1",
+            "Message 2",
+        ]
+
+        client.close()
+        assert mock_session.post.call_count == 2
+        assert mock_session.post.call_args[1]["json"][0]["event_data"]["message"] == (
+            "Message 3"
+        )
+        assert client.batch_stats.sent >= 4
+        assert client.batch_stats.queued == 0
+
+    @patch("madsci.client.event_client.create_http_session")
+    def test_batch_sent_when_max_age_reached(self, mock_create_session, batch_config):
+        """Test that a partial batch is sent once its oldest event reaches batch_max_age."""
+        mock_session = Mock()
+        mock_session.post.return_value = Mock(ok=True, status_code=200)
+        mock_create_session.return_value = mock_session
+        client = EventClient(
+            config=batch_config.model_copy(update={"batch_max_age": 0.1})
+        )
+        assert client.flush(timeout=5)
+        mock_session.post.reset_mock()
+
+        client.info("Lonely message")
+        assert client.flush(timeout=5)
+
+        mock_session.post.assert_called_once()
+        assert len(mock_session.post.call_args[1]["json"]) == 1
+        client.close()
+
+    @patch("madsci.client.event_client.create_http_session")
+    def test_falls_back_to_single_events(self, mock_create_session, batch_config):
+        """Test that batches are sent one event at a time to event servers without the batch endpoint."""
+        mock_session = Mock()
+
+        def post(url, **_kwargs):
+            if url.endswith("events/batch"):
+                return Mock(ok=False, status_code=404)
+            return Mock(ok=True, status_code=200)
+
+        mock_session.post.side_effect = post
+        mock_create_session.return_value = mock_session
+        client = EventClient(config=batch_config)
+        assert client.flush(timeout=5)
+        mock_session.post.reset_mock()
+
+        client.info("Message 0")
+        client.info("Message 1")
+        client.close()
+
+        urls = [call[1]["url"] for call in mock_session.post.call_args_list]
+        assert urls == [
+            "http://localhost:8001/events/batch",
+            "http://localhost:8001/event",
+            "http://localhost:8001/event",
+        ]
+        assert client.batch_stats.failed == 0
+
+    def test_overflow_policies(self, config_with_server, sample_event):
+        """Test that a full queue drops or blocks according to batch_overflow_policy."""
+        for policy, expected in [
+            ("drop_newest", {"dropped": 1, "blocked": 0}),
+            ("drop_oldest", {"dropped": 1, "blocked": 0}),
+            ("block", {"dropped": 0, "blocked": 1}),
+        ]:
+            release = threading.Event()
+            sent: list[list[Event]] = []
+
+            def send_batch(batch, release=release, sent=sent):
+                release.wait(5)
+                sent.append(batch)
+                return True
+
+            config = config_with_server.model_copy(
+                update={
+                    "batch_queue_size": 1,
+                    "batch_max_size": 1,
+                    "batch_overflow_policy": policy,
+                }
+            )
+            sender = EventBatchSender(config, send_batch)
+            events = [
+                sample_event.model_copy(update={"event_id": str(i)}) for i in "abc"
+            ]
+            # * The worker takes the first event and blocks sending it, the second fills the queue
+            sender.submit(events[0])
+            while sender.stats.queued:
+                time.sleep(0.01)
+            sender.submit(events[1])
+            if policy == "block":
+                threading.Timer(0.2, release.set).start()
+            sender.submit(events[2])
+            release.set()
+            sender.close(timeout=5)
+
+            stats = sender.stats
+            assert stats.dropped == expected["dropped"]
+            assert stats.blocked == expected["blocked"]
+            sent_ids = [event.event_id for batch in sent for event in batch]
+            if policy == "drop_newest":
+                assert sent_ids == ["a", "b"]
+            elif policy == "drop_oldest":
+                assert sent_ids == ["a", "c"]
+            else:
+                assert sent_ids == ["a", "b", "c"]
+            assert stats.sent == len(sent_ids)
+
+    def test_submit_racing_close(self, config_with_server, sample_event):
+        """Test that events submitted while closing are either sent or dropped, never stranded."""
+        sender = EventBatchSender(
+            config_with_server.model_copy(update={"batch_max_size": 5}),
+            lambda _batch: True,
+        )
+        start = threading.Barrier(5)
+
+        def submit_many():
+            start.wait(5)
+            for _ in range(200):
+                sender.submit(sample_event)
+
+        threads = [threading.Thread(target=submit_many) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        start.wait(5)
+        sender.close(timeout=5)
+        for thread in threads:
+            thread.join(5)
+
+        assert sender.flush(timeout=1)
+        stats = sender.stats
+        assert stats.queued == 0
+        assert stats.sent + stats.dropped == 800
+
+
 class TestEventClientEventRetrieval:
     """Test EventClient event retrieval methods."""
 
@@ -462,6 +636,64 @@ class TestEventClientEventRetrieval:
             client.get_events()
 
 
+class TestEventClientIterEvents:
+    """Test EventClient iter_events method."""
+
+    @patch("madsci.client.event_client.create_http_session")
+    def test_iter_events_follows_cursors(
+        self, mock_create_session, config_with_server, temp_log_dir
+    ):
+        """Test iter_events requests the next page with the returned cursor."""
+        config_with_server.log_dir = temp_log_dir
+        events = [
+            Event(event_type=EventType.TEST, event_data={"i": i}) for i in range(3)
+        ]
+
+        first_page = Mock(ok=True, headers={"X-Next-Cursor": "next"})
+        first_page.json.return_value = {
+            event.event_id: event.model_dump(mode="json") for event in events[:2]
+        }
+        last_page = Mock(ok=True, headers={})
+        last_page.json.return_value = {
+            events[2].event_id: events[2].model_dump(mode="json")
+        }
+
+        mock_session = Mock()
+        mock_session.get.side_effect = [first_page, last_page]
+        mock_create_session.return_value = mock_session
+
+        client = EventClient(config=config_with_server)
+        iterated = list(client.iter_events(page_size=2, level=0))
+
+        assert [event.event_id for event in iterated] == [
+            event.event_id for event in events
+        ]
+        first_params = mock_session.get.call_args_list[0].kwargs["params"]
+        last_params = mock_session.get.call_args_list[1].kwargs["params"]
+        assert "cursor" not in first_params
+        assert last_params["cursor"] == "next"
+
+    @patch("madsci.client.event_client.create_http_session")
+    def test_iter_events_is_lazy(
+        self, mock_create_session, config_with_server, temp_log_dir
+    ):
+        """Test iter_events doesn't fetch pages that aren't consumed."""
+        config_with_server.log_dir = temp_log_dir
+        event = Event(event_type=EventType.TEST)
+
+        page = Mock(ok=True, headers={"X-Next-Cursor": "next"})
+        page.json.return_value = {event.event_id: event.model_dump(mode="json")}
+
+        mock_session = Mock()
+        mock_session.get.return_value = page
+        mock_create_session.return_value = mock_session
+
+        client = EventClient(config=config_with_server)
+        mock_session.get.reset_mock()
+        assert next(client.iter_events(page_size=1, level=0)).event_id == event.event_id
+        assert mock_session.get.call_count == 1
+
+
 class TestEventClientQueryEvents:
     """Test EventClient query_events method."""
 
@@ -534,6 +766,45 @@ class TestEventClientQueryEvents:
             client.query_events({"event_type": "test"})
 
 
+class TestEventClientExportEvents:
+    """Test EventClient export_events method."""
+
+    @patch("madsci.client.event_client.create_http_session")
+    def test_export_events_streams_to_file(
+        self, mock_create_session, config_with_server, temp_log_dir, tmp_path
+    ):
+        """Test export_events writes the streamed response to a file."""
+        config_with_server.log_dir = temp_log_dir
+
+        mock_response = MagicMock()
+        mock_response.ok = True
+        mock_response.__enter__.return_value = mock_response
+        mock_response.iter_content.return_value = [b'{"event_id": "a"}\n', b""]
+
+        mock_session = Mock()
+        mock_session.get.return_value = mock_response
+        mock_create_session.return_value = mock_session
+
+        client = EventClient(config=config_with_server)
+        output_path = tmp_path / "exports" / "events.ndjson"
+        result = client.export_events(
+            output_path, event_types=[EventType.TEST], start_time="2025-01-01"
+        )
+
+        assert result == output_path
+        assert output_path.read_bytes() == b'{"event_id": "a"}\n'
+        _, kwargs = mock_session.get.call_args
+        assert kwargs["stream"] is True
+        assert kwargs["params"]["event_type"] == [EventType.TEST.value]
+        assert kwargs["params"]["start_time"] == "2025-01-01"
+
+    def test_export_events_without_server(self, config_without_server, tmp_path):
+        """Test export_events without event server returns None."""
+        client = EventClient(config=config_without_server)
+
+        assert client.export_events(tmp_path / "events.ndjson") is None
+
+
 class TestEventClientStartupLogging:
     """Test EventClient startup logging behavior."""
 
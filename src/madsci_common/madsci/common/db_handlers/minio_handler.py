@@ -7,10 +7,19 @@ Provides an ABC for object storage access and two implementations:
 
 from __future__ import annotations
 
+import hashlib
 import mimetypes
+import shutil
+import tempfile
 from abc import ABC, abstractmethod
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, BinaryIO, Iterator, Optional, Union
+
+MULTIPART_PART_SIZE = 16 * 1024 * 1024
+"""Part size for streamed multipart uploads; at most one part is held in memory."""
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+"""Default chunk size for streamed downloads."""
 
 
 class MinioHandler(ABC):
@@ -43,6 +52,44 @@ class MinioHandler(ABC):
             object_name, etag, size_bytes, and content_type.
         """
 
+    def upload_stream(
+        self,
+        bucket: str,
+        object_name: str,
+        stream: BinaryIO,
+        length: int = -1,  # noqa: ARG002
+        *,
+        content_type: Optional[str] = None,
+        metadata: Optional[dict[str, str]] = None,
+    ) -> dict[str, Any]:
+        """Upload the contents of a binary stream to object storage.
+
+        The stream is read in chunks, so its size is not limited by memory.
+        This default implementation spools the stream to a temporary file
+        and calls ``upload_file``; implementations that can upload straight
+        from the stream should override it.
+
+        Args:
+            bucket: Bucket name.
+            object_name: Name/key for the object.
+            stream: Readable binary stream, consumed to its end.
+            length: Number of bytes in the stream, or -1 if unknown.
+            content_type: MIME type (guessed from ``object_name`` if not provided).
+            metadata: Additional metadata to attach.
+
+        Returns:
+            Dictionary with storage information including bucket_name,
+            object_name, etag, size_bytes, and content_type.
+        """
+        content_type = content_type or _guess_content_type(Path(object_name))
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir) / "upload"
+            with temp_path.open("wb") as temp_file:
+                shutil.copyfileobj(stream, temp_file, MULTIPART_PART_SIZE)
+            return self.upload_file(
+                bucket, object_name, temp_path, content_type, metadata
+            )
+
     @abstractmethod
     def download_file(
         self,
@@ -70,6 +117,56 @@ class MinioHandler(ABC):
             The object contents as bytes.
         """
 
+    def stat_object(self, bucket: str, object_name: str) -> dict[str, Any]:
+        """Get an object's size and version information without reading it.
+
+        This default implementation reads the whole object with
+        ``get_object_data``; implementations should override it.
+
+        Args:
+            bucket: Bucket name.
+            object_name: Name/key of the object.
+
+        Returns:
+            Dictionary with size_bytes, etag, last_modified (a UTC datetime,
+            or None if unknown), and content_type.
+
+        Raises:
+            FileNotFoundError: If the object does not exist.
+        """
+        data = self.get_object_data(bucket, object_name)
+        return {
+            "size_bytes": len(data),
+            "etag": hashlib.md5(data, usedforsecurity=False).hexdigest(),
+            "last_modified": None,
+            "content_type": _guess_content_type(Path(object_name)),
+        }
+
+    def iter_object(
+        self,
+        bucket: str,
+        object_name: str,
+        offset: int = 0,
+        length: Optional[int] = None,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """Read an object, or a byte range of it, in chunks.
+
+        This default implementation slices the result of ``get_object_data``;
+        implementations should override it to read only what is requested.
+
+        Args:
+            bucket: Bucket name.
+            object_name: Name/key of the object.
+            offset: Position of the first byte to read.
+            length: Number of bytes to read, or None to read to the end.
+            chunk_size: Maximum size of each chunk.
+        """
+        data = self.get_object_data(bucket, object_name)
+        end = len(data) if length is None else offset + length
+        for start in range(offset, end, chunk_size):
+            yield data[start : min(start + chunk_size, end)]
+
     @abstractmethod
     def bucket_exists(self, bucket: str) -> bool:
         """Check if a bucket exists.
@@ -180,6 +277,37 @@ class RealMinioHandler(MinioHandler):
             "content_type": content_type,
         }
 
+    def upload_stream(
+        self,
+        bucket: str,
+        object_name: str,
+        stream: BinaryIO,
+        length: int = -1,
+        *,
+        content_type: Optional[str] = None,
+        metadata: Optional[dict[str, str]] = None,
+    ) -> dict[str, Any]:
+        """Upload a stream to MinIO, as a multipart upload if it is large or of unknown length."""
+        content_type = content_type or _guess_content_type(Path(object_name))
+
+        result = self._client.put_object(
+            bucket_name=bucket,
+            object_name=object_name,
+            data=stream,
+            length=length,
+            content_type=content_type,
+            metadata=metadata or {},
+            part_size=MULTIPART_PART_SIZE,
+        )
+
+        return {
+            "bucket_name": bucket,
+            "object_name": object_name,
+            "etag": result.etag,
+            "size_bytes": length if length >= 0 else None,
+            "content_type": content_type,
+        }
+
     def download_file(
         self,
         bucket: str,
@@ -200,6 +328,43 @@ class RealMinioHandler(MinioHandler):
             response.close()
             response.release_conn()
 
+    def stat_object(self, bucket: str, object_name: str) -> dict[str, Any]:
+        """Get an object's size and version information from MinIO."""
+        from minio.error import S3Error  # noqa: PLC0415
+
+        try:
+            stat = self._client.stat_object(bucket, object_name)
+        except S3Error as e:
+            if e.code == "NoSuchKey":
+                raise FileNotFoundError(
+                    f"Object not found: bucket={bucket}, object_name={object_name}"
+                ) from e
+            raise
+        return {
+            "size_bytes": stat.size,
+            "etag": stat.etag,
+            "last_modified": stat.last_modified,
+            "content_type": stat.content_type,
+        }
+
+    def iter_object(
+        self,
+        bucket: str,
+        object_name: str,
+        offset: int = 0,
+        length: Optional[int] = None,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """Stream an object, or a byte range of it, from MinIO."""
+        response = self._client.get_object(
+            bucket, object_name, offset=offset, length=length or 0
+        )
+        try:
+            yield from response.stream(chunk_size)
+        finally:
+            response.close()
+            response.release_conn()
+
     def bucket_exists(self, bucket: str) -> bool:
         """Check if a bucket exists in MinIO."""
         return self._client.bucket_exists(bucket)
@@ -254,25 +419,54 @@ class InMemoryMinioHandler(MinioHandler):
         """Upload a file to in-memory storage."""
         file_path = Path(file_path).expanduser().resolve()
         content_type = content_type or _guess_content_type(file_path)
-        data = file_path.read_bytes()
+        return self._store(
+            bucket, object_name, file_path.read_bytes(), content_type, metadata
+        )
+
+    def _store(
+        self,
+        bucket: str,
+        object_name: str,
+        data: bytes,
+        content_type: str,
+        metadata: Optional[dict[str, str]],
+    ) -> dict[str, Any]:
+        """Store an object's bytes and return its storage information."""
         size_bytes = len(data)
 
         key = (bucket, object_name)
         self._objects[key] = data
+        etag = f"inmemory-{hash(data) & 0xFFFFFFFF:08x}"
         self._metadata[key] = {
             "content_type": content_type,
             "custom_metadata": metadata or {},
+            "etag": etag,
+            "last_modified": datetime.now(timezone.utc).replace(microsecond=0),
         }
         self._buckets.add(bucket)
 
         return {
             "bucket_name": bucket,
             "object_name": object_name,
-            "etag": f"inmemory-{hash(data) & 0xFFFFFFFF:08x}",
+            "etag": etag,
             "size_bytes": size_bytes,
             "content_type": content_type,
         }
 
+    def upload_stream(
+        self,
+        bucket: str,
+        object_name: str,
+        stream: BinaryIO,
+        length: int = -1,  # noqa: ARG002
+        *,
+        content_type: Optional[str] = None,
+        metadata: Optional[dict[str, str]] = None,
+    ) -> dict[str, Any]:
+        """Upload a stream to in-memory storage."""
+        content_type = content_type or _guess_content_type(Path(object_name))
+        return self._store(bucket, object_name, stream.read(), content_type, metadata)
+
     def download_file(
         self,
         bucket: str,
@@ -298,6 +492,17 @@ class InMemoryMinioHandler(MinioHandler):
             )
         return self._objects[key]
 
+    def stat_object(self, bucket: str, object_name: str) -> dict[str, Any]:
+        """Get an object's size and version information from in-memory storage."""
+        data = self.get_object_data(bucket, object_name)
+        metadata = self._metadata[(bucket, object_name)]
+        return {
+            "size_bytes": len(data),
+            "etag": metadata["etag"],
+            "last_modified": metadata["last_modified"],
+            "content_type": metadata["content_type"],
+        }
+
     def bucket_exists(self, bucket: str) -> bool:
         """Check if a bucket exists in in-memory storage."""
         return bucket in self._buckets
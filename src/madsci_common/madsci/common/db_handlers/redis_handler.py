@@ -10,7 +10,7 @@ from __future__ import annotations
 import contextlib
 from abc import ABC, abstractmethod
 from collections.abc import MutableMapping
-from typing import Any, ContextManager, Optional
+from typing import Any, Callable, ContextManager, Optional
 
 
 class RedisHandler(ABC):
@@ -33,6 +33,52 @@ class RedisHandler(ABC):
     def set(self, key: str, value: Any) -> None:
         """Set *key* to *value*."""
 
+    @abstractmethod
+    def delete(self, *keys: str) -> int:
+        """Delete *keys*, returning the number of keys that existed."""
+
+    @abstractmethod
+    def hget(self, key: str, field: str) -> Optional[str]:
+        """Return *field* of the hash at *key*, or ``None`` if missing."""
+
+    @abstractmethod
+    def hgetall(self, key: str) -> dict[str, str]:
+        """Return all fields of the hash at *key* (empty if the key is missing)."""
+
+    @abstractmethod
+    def hgetall_many(self, keys: list[str]) -> list[dict[str, str]]:
+        """Return all fields of each hash in *keys*, in order, in one round trip."""
+
+    @abstractmethod
+    def hset(self, key: str, mapping: dict[str, Any]) -> int:
+        """Set the fields in *mapping* on the hash at *key*.
+
+        Returns:
+            The number of fields that were added (not updated).
+        """
+
+    @abstractmethod
+    def hdel(self, key: str, *fields: str) -> int:
+        """Delete *fields* from the hash at *key*, returning how many existed."""
+
+    @abstractmethod
+    def replace_hash(self, key: str, mapping: dict[str, Any]) -> None:
+        """Atomically replace the contents of the hash at *key* with *mapping*."""
+
+    @abstractmethod
+    def transaction(self, func: Callable[[Any], Any], *keys: str) -> Any:
+        """Run an optimistic read-modify-write transaction over *keys*.
+
+        *func* receives a pipeline with *keys* watched. Commands it calls
+        before ``pipeline.multi()`` run immediately (use them to read), and
+        commands after are queued and run atomically once *func* returns. If
+        a watched key changes before then, *func* is called again. Because
+        of that, *func* should have no side effects beyond the pipeline.
+
+        Returns:
+            The value returned by *func*.
+        """
+
     @abstractmethod
     def ping(self) -> bool:
         """Check connectivity to Redis.
@@ -59,7 +105,7 @@ class RedisHandler(ABC):
         """Create a list-like object backed by Redis.
 
         Returns an object supporting ``append``, ``remove``,
-        ``__iter__``, ``__len__``, ``__contains__``.
+        ``__iter__``, ``__len__``, ``__contains__``, ``to_list``.
         """
 
     @abstractmethod
@@ -74,6 +120,24 @@ class RedisHandler(ABC):
             auto_release_time: Seconds before auto-release.
         """
 
+    @abstractmethod
+    def publish(self, channel: str, message: Any) -> int:
+        """Publish *message* on a pub/sub *channel*.
+
+        Returns:
+            The number of subscribers that received the message.
+        """
+
+    @abstractmethod
+    def create_pubsub(self, *channels: str) -> Any:
+        """Create a pub/sub subscription to one or more channels.
+
+        Returns an object mirroring ``redis.client.PubSub``, supporting
+        ``get_message(ignore_subscribe_messages=..., timeout=...)`` and
+        ``close``. Messages published before the subscription is created
+        are not delivered.
+        """
+
 
 class PyRedisHandler(RedisHandler):
     """Redis handler backed by a real Redis server.
@@ -136,6 +200,45 @@ class PyRedisHandler(RedisHandler):
         """Set a value in Redis."""
         self._client.set(key, value)
 
+    def delete(self, *keys: str) -> int:
+        """Delete keys from Redis."""
+        return self._client.delete(*keys)
+
+    def hget(self, key: str, field: str) -> Optional[str]:
+        """Get a hash field from Redis."""
+        return self._client.hget(key, field)
+
+    def hgetall(self, key: str) -> dict[str, str]:
+        """Get all fields of a hash from Redis."""
+        return self._client.hgetall(key)
+
+    def hgetall_many(self, keys: list[str]) -> list[dict[str, str]]:
+        """Get several hashes from Redis in a single pipelined round trip."""
+        pipeline = self._client.pipeline(transaction=False)
+        for key in keys:
+            pipeline.hgetall(key)
+        return pipeline.execute()
+
+    def hset(self, key: str, mapping: dict[str, Any]) -> int:
+        """Set hash fields in Redis."""
+        return self._client.hset(key, mapping=mapping)
+
+    def hdel(self, key: str, *fields: str) -> int:
+        """Delete hash fields from Redis."""
+        return self._client.hdel(key, *fields)
+
+    def replace_hash(self, key: str, mapping: dict[str, Any]) -> None:
+        """Replace a hash in Redis in a single MULTI/EXEC transaction."""
+        pipeline = self._client.pipeline(transaction=True)
+        pipeline.delete(key)
+        if mapping:
+            pipeline.hset(key, mapping=mapping)
+        pipeline.execute()
+
+    def transaction(self, func: Callable[[Any], Any], *keys: str) -> Any:
+        """Run a WATCH/MULTI/EXEC transaction, retrying when a watched key changes."""
+        return self._client.transaction(func, *keys, value_from_callable=True)
+
     def ping(self) -> bool:
         """Ping the Redis server."""
         try:
@@ -170,6 +273,16 @@ class PyRedisHandler(RedisHandler):
             auto_release_time=auto_release_time,
         )
 
+    def publish(self, channel: str, message: Any) -> int:
+        """Publish a message on a Redis pub/sub channel."""
+        return self._client.publish(channel, message)
+
+    def create_pubsub(self, *channels: str) -> Any:
+        """Create a redis-py PubSub subscribed to *channels*."""
+        pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(*channels)
+        return pubsub
+
 
 class InMemoryRedisHandler(RedisHandler):
     """Redis handler backed by in-memory data structures for testing.
@@ -213,6 +326,45 @@ class InMemoryRedisHandler(RedisHandler):
         """Set a value in the in-memory store."""
         self._client.set(key, value)
 
+    def delete(self, *keys: str) -> int:
+        """Delete keys from the in-memory store."""
+        return self._client.delete(*keys)
+
+    def hget(self, key: str, field: str) -> Optional[str]:
+        """Get a hash field from the in-memory store."""
+        return self._client.hget(key, field)
+
+    def hgetall(self, key: str) -> dict[str, str]:
+        """Get all fields of a hash from the in-memory store."""
+        return self._client.hgetall(key)
+
+    def hgetall_many(self, keys: list[str]) -> list[dict[str, str]]:
+        """Get several hashes from the in-memory store."""
+        with self._client.pipeline(transaction=False) as pipeline:
+            for key in keys:
+                pipeline.hgetall(key)
+            return pipeline.execute()
+
+    def hset(self, key: str, mapping: dict[str, Any]) -> int:
+        """Set hash fields in the in-memory store."""
+        return self._client.hset(key, mapping=mapping)
+
+    def hdel(self, key: str, *fields: str) -> int:
+        """Delete hash fields from the in-memory store."""
+        return self._client.hdel(key, *fields)
+
+    def replace_hash(self, key: str, mapping: dict[str, Any]) -> None:
+        """Replace a hash in the in-memory store atomically."""
+        pipeline = self._client.pipeline(transaction=True)
+        pipeline.delete(key)
+        if mapping:
+            pipeline.hset(key, mapping=mapping)
+        pipeline.execute()
+
+    def transaction(self, func: Callable[[Any], Any], *keys: str) -> Any:
+        """Run a transaction while holding the in-memory store's lock."""
+        return self._client.transaction(func, *keys, value_from_callable=True)
+
     def ping(self) -> bool:
         """Always returns True for in-memory Redis."""
         return True
@@ -247,3 +399,13 @@ class InMemoryRedisHandler(RedisHandler):
             masters={self._client},
             auto_release_time=auto_release_time,
         )
+
+    def publish(self, channel: str, message: Any) -> int:
+        """Publish a message to in-memory subscribers."""
+        return self._client.publish(channel, message)
+
+    def create_pubsub(self, *channels: str) -> Any:
+        """Create an InMemoryPubSub subscribed to *channels*."""
+        pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(*channels)
+        return pubsub
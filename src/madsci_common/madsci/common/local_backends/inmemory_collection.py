@@ -32,13 +32,27 @@ class InMemoryInsertResult:
         self.inserted_id = inserted_id
 
 
+class InMemoryInsertManyResult:
+    """Mimics ``pymongo.results.InsertManyResult``."""
+
+    def __init__(self, inserted_ids: list[Any]) -> None:
+        """Initialize with the inserted documents' IDs."""
+        self.inserted_ids = inserted_ids
+
+
 class InMemoryUpdateResult:
     """Mimics ``pymongo.results.UpdateResult``."""
 
-    def __init__(self, matched_count: int = 0, modified_count: int = 0) -> None:
+    def __init__(
+        self,
+        matched_count: int = 0,
+        modified_count: int = 0,
+        upserted_id: Any = None,
+    ) -> None:
         """Initialize with match and modification counts."""
         self.matched_count = matched_count
         self.modified_count = modified_count
+        self.upserted_id = upserted_id
 
 
 class InMemoryDeleteResult:
@@ -65,18 +79,13 @@ class InMemoryCursor:
         """Initialize with a list of documents to iterate over."""
         self._documents = documents
         self._projection = projection
-        self._sort_key: Optional[str] = None
-        self._sort_direction: int = 1
+        self._sort_keys: list[tuple[str, int]] = []
         self._skip_count: int = 0
         self._limit_count: int = 0
 
     def sort(self, key: Any, direction: int = 1) -> InMemoryCursor:
         """Sort results.  Accepts a string key or list of (key, direction) tuples."""
-        if isinstance(key, list):
-            # pymongo accepts [(field, direction), ...] — use the first one.
-            key, direction = key[0]
-        self._sort_key = key
-        self._sort_direction = direction
+        self._sort_keys = key if isinstance(key, list) else [(key, direction)]
         return self
 
     def skip(self, count: int) -> InMemoryCursor:
@@ -91,10 +100,11 @@ class InMemoryCursor:
 
     def _resolve(self) -> list[dict[str, Any]]:
         docs = list(self._documents)
-        if self._sort_key is not None:
+        # Stable sorts applied from the least to the most significant key
+        for sort_key, sort_direction in reversed(self._sort_keys):
             docs.sort(
-                key=lambda d: _nested_get(d, self._sort_key, ""),
-                reverse=(self._sort_direction == -1),
+                key=lambda d, k=sort_key: _nested_get(d, k, ""),
+                reverse=(sort_direction == -1),
             )
         if self._skip_count:
             docs = docs[self._skip_count :]
@@ -115,6 +125,9 @@ class InMemoryCursor:
         """Iterate over resolved documents."""
         return iter(self._resolve())
 
+    def close(self) -> None:
+        """Close the cursor; a no-op for in-memory results."""
+
     def __next__(self) -> dict[str, Any]:
         """Not supported directly; use ``iter()`` or ``to_list()``."""
         raise NotImplementedError("Use iter() or to_list()")
@@ -128,7 +141,7 @@ class InMemoryCursor:
 class InMemoryCollection:
     """Drop-in replacement for ``pymongo.collection.Collection``.
 
-    Supports: ``insert_one``, ``find_one``, ``find``, ``update_one``,
+    Supports: ``insert_one``, ``insert_many``, ``find_one``, ``find``, ``update_one``,
     ``update_many``, ``replace_one``, ``delete_one``, ``delete_many``,
     ``count_documents``, ``create_index``, ``drop_index``, ``index_information``.
     """
@@ -149,15 +162,47 @@ class InMemoryCollection:
             self._documents.append(doc)
         return InMemoryInsertResult(doc.get("_id"))
 
+    def insert_many(
+        self,
+        documents: list[dict[str, Any]],
+        ordered: bool = True,  # noqa: ARG002
+    ) -> InMemoryInsertManyResult:
+        """Insert several documents and return the result.
+
+        *ordered* is accepted for pymongo compatibility; in-memory inserts
+        cannot partially fail, so it has no effect.
+        """
+        docs = [copy.deepcopy(document) for document in documents]
+        with self._lock:
+            self._documents.extend(docs)
+        return InMemoryInsertManyResult([doc.get("_id") for doc in docs])
+
     def update_one(
-        self, filter_query: dict[str, Any], update: dict[str, Any]
+        self,
+        filter_query: dict[str, Any],
+        update: dict[str, Any],
+        upsert: bool = False,
     ) -> InMemoryUpdateResult:
-        """Update the first document matching the filter."""
+        """Update the first document matching the filter.
+
+        With *upsert*, a new document is built from the filter's equality
+        conditions (plus any ``$setOnInsert`` fields) when nothing matches.
+        """
         with self._lock:
             for doc in self._documents:
                 if _matches(doc, filter_query):
                     _apply_update(doc, update)
                     return InMemoryUpdateResult(matched_count=1, modified_count=1)
+            if upsert:
+                doc = {}
+                for key, condition in filter_query.items():
+                    if not key.startswith("$") and not isinstance(condition, dict):
+                        _nested_set(doc, key, copy.deepcopy(condition))
+                for key, value in update.get("$setOnInsert", {}).items():
+                    _nested_set(doc, key, copy.deepcopy(value))
+                _apply_update(doc, update)
+                self._documents.append(doc)
+                return InMemoryUpdateResult(upserted_id=doc.get("_id"))
         return InMemoryUpdateResult()
 
     def update_many(
@@ -397,9 +442,16 @@ def _nested_set(doc: dict[str, Any], key: str, value: Any) -> None:
     current[parts[-1]] = value
 
 
+_LOGICAL_OPS: dict[str, Any] = {"$or": any, "$and": all}
+
+
 def _matches(doc: dict[str, Any], query: dict[str, Any]) -> bool:
     """Check if a document matches a MongoDB-style query filter."""
     for key, condition in query.items():
+        if key in _LOGICAL_OPS:
+            if not _LOGICAL_OPS[key](_matches(doc, clause) for clause in condition):
+                return False
+            continue
         doc_val = _nested_get(doc, key)
         if isinstance(condition, dict):
             # Operator query: {"field": {"$gte": 10, "$lt": 20}}
@@ -448,6 +500,10 @@ def _apply_update(doc: dict[str, Any], update: dict[str, Any]) -> None:
         for key, value in update["$inc"].items():
             current = _nested_get(doc, key, 0)
             _nested_set(doc, key, current + value)
+    if "$min" in update:
+        _apply_bound(doc, update["$min"], lambda new, current: new < current)
+    if "$max" in update:
+        _apply_bound(doc, update["$max"], lambda new, current: new > current)
     # If no operators, treat as a full replacement (keeping _id).
     if not any(k.startswith("$") for k in update):
         doc_id = doc.get("_id")
@@ -457,6 +513,14 @@ def _apply_update(doc: dict[str, Any], update: dict[str, Any]) -> None:
             doc["_id"] = doc_id
 
 
+def _apply_bound(doc: dict[str, Any], fields: dict[str, Any], replaces: Any) -> None:
+    """Set fields for ``$min``/``$max`` where missing or where *replaces* holds."""
+    for key, value in fields.items():
+        current = _nested_get(doc, key)
+        if current is None or replaces(value, current):
+            _nested_set(doc, key, value)
+
+
 def _apply_unset(doc: dict[str, Any], fields: Any) -> None:
     """Remove fields specified by ``$unset``."""
     for key in fields:
@@ -479,7 +543,8 @@ def _apply_projection(
 
     Supports inclusion (``{"field": 1}``) and exclusion (``{"field": 0}``)
     projections.  ``_id`` is included by default in inclusion projections
-    unless explicitly excluded.
+    unless explicitly excluded.  Included dot-separated fields are nested in
+    the result, as in MongoDB.
     """
     if not projection:
         return doc
@@ -502,7 +567,7 @@ def _apply_projection(
         for field in include_fields:
             val = _nested_get(doc, field)
             if val is not None:
-                result[field] = val
+                _nested_set(result, field, val)
         return result
 
     # Exclusion projection: keep everything except specified fields
@@ -13,9 +13,11 @@ Usage::
 
 from __future__ import annotations
 
+import queue
 import threading
+import time
 from collections.abc import Iterator, MutableMapping
-from typing import Any, ClassVar, Optional
+from typing import Any, Callable, ClassVar, Optional
 
 # ---------------------------------------------------------------------------
 # Module-level registries keyed by (client_id, key) so that multiple
@@ -46,13 +48,17 @@ def clear_all_registries() -> None:
 
 class InMemoryRedisClient:
     """Drop-in replacement for ``redis.Redis`` supporting the subset of
-    methods used by MADSci state handlers: ``incr``, ``get``, and ``ping``.
+    methods used by MADSci state handlers: ``incr``, ``get``, ``set``,
+    ``delete``, hash commands (``hget``, ``hgetall``, ``hset``, ``hdel``),
+    ``ping``, ``pipeline``, ``transaction``, ``publish``, and ``pubsub``.
     """
 
     def __init__(self, **_kwargs: Any) -> None:
         """Initialize the in-memory Redis client."""
         self._data: dict[str, Any] = {}
-        self._lock = threading.Lock()
+        self._hashes: dict[str, dict[str, str]] = {}
+        self._lock = threading.RLock()
+        self._subscribers: dict[str, list[InMemoryPubSub]] = {}
 
     def incr(self, key: str, amount: int = 1) -> int:
         """Increment a key by *amount* and return the new value."""
@@ -71,10 +77,217 @@ class InMemoryRedisClient:
         with self._lock:
             self._data[key] = str(value)
 
+    def delete(self, *keys: str) -> int:
+        """Delete *keys* and return how many existed."""
+        with self._lock:
+            deleted = 0
+            for key in keys:
+                existed = key in self._data or key in self._hashes
+                self._data.pop(key, None)
+                self._hashes.pop(key, None)
+                deleted += existed
+            return deleted
+
+    def hget(self, name: str, key: str) -> Optional[str]:
+        """Return field *key* of hash *name*, or ``None`` if missing."""
+        with self._lock:
+            return self._hashes.get(name, {}).get(key)
+
+    def hgetall(self, name: str) -> dict[str, str]:
+        """Return a copy of all fields of hash *name*."""
+        with self._lock:
+            return dict(self._hashes.get(name, {}))
+
+    def hset(
+        self,
+        name: str,
+        key: Optional[str] = None,
+        value: Any = None,
+        mapping: Optional[dict[str, Any]] = None,
+    ) -> int:
+        """Set one field (*key*/*value*) and/or every field in *mapping* on hash *name*."""
+        items = dict(mapping or {})
+        if key is not None:
+            items[key] = value
+        with self._lock:
+            fields = self._hashes.setdefault(name, {})
+            added = sum(1 for field in items if field not in fields)
+            fields.update({field: str(val) for field, val in items.items()})
+            return added
+
+    def hdel(self, name: str, *keys: str) -> int:
+        """Delete fields from hash *name* and return how many existed."""
+        with self._lock:
+            fields = self._hashes.get(name, {})
+            deleted = sum(1 for key in keys if fields.pop(key, None) is not None)
+            if name in self._hashes and not fields:
+                del self._hashes[name]
+            return deleted
+
     def ping(self) -> bool:
         """Return ``True`` (always healthy)."""
         return True
 
+    def pipeline(self, transaction: bool = True) -> InMemoryPipeline:  # noqa: ARG002
+        """Return a pipeline that runs its queued commands atomically on ``execute()``."""
+        return InMemoryPipeline(self)
+
+    def transaction(
+        self,
+        func: Callable[[InMemoryPipeline], Any],
+        *watches: str,
+        value_from_callable: bool = False,
+        **_kwargs: Any,
+    ) -> Any:
+        """Run *func* as a transaction, mirroring ``redis.Redis.transaction``.
+
+        The whole transaction runs while holding the client's lock, so
+        watched keys can't change underneath it and it never needs a retry.
+        """
+        with self._lock, self.pipeline() as pipeline:
+            if watches:
+                pipeline.watch(*watches)
+            func_value = func(pipeline)
+            exec_value = pipeline.execute()
+            return func_value if value_from_callable else exec_value
+
+    def publish(self, channel: str, message: Any) -> int:
+        """Deliver *message* to every subscriber of *channel*."""
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, []))
+        for subscriber in subscribers:
+            subscriber._deliver(channel, str(message))
+        return len(subscribers)
+
+    def pubsub(self, ignore_subscribe_messages: bool = False) -> InMemoryPubSub:
+        """Return a new, unsubscribed ``InMemoryPubSub``."""
+        return InMemoryPubSub(self, ignore_subscribe_messages=ignore_subscribe_messages)
+
+
+class InMemoryPipeline:
+    """Drop-in replacement for ``redis.client.Pipeline``.
+
+    Client methods called on the pipeline are queued and return the pipeline,
+    so calls can be chained. ``execute()`` runs them while holding the
+    client's lock and returns their results in order. After ``watch()``,
+    commands run immediately until ``multi()`` is called, as in redis-py.
+    """
+
+    def __init__(self, client: InMemoryRedisClient) -> None:
+        """Initialize an empty pipeline bound to *client*."""
+        self._client = client
+        self._commands: list[tuple[Any, tuple[Any, ...], dict[str, Any]]] = []
+        self._immediate = False
+
+    def watch(self, *_names: str) -> bool:
+        """Switch to immediate execution, so values can be read before ``multi()``."""
+        self._immediate = True
+        return True
+
+    def unwatch(self) -> bool:
+        """Switch back to queueing commands."""
+        self._immediate = False
+        return True
+
+    def multi(self) -> None:
+        """Start queueing commands for ``execute()``."""
+        self._immediate = False
+
+    def __getattr__(self, name: str) -> Any:
+        """Return a function that queues the client method *name*."""
+        method = getattr(self._client, name)
+        if self._immediate:
+            return method
+
+        def queue_command(*args: Any, **kwargs: Any) -> InMemoryPipeline:
+            self._commands.append((method, args, kwargs))
+            return self
+
+        return queue_command
+
+    def execute(self) -> list[Any]:
+        """Run all queued commands atomically and return their results."""
+        commands, self._commands = self._commands, []
+        with self._client._lock:
+            return [method(*args, **kwargs) for method, args, kwargs in commands]
+
+    def __enter__(self) -> InMemoryPipeline:
+        """Enter the pipeline context."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Discard any commands that were not executed."""
+        self._commands = []
+
+
+class InMemoryPubSub:
+    """Drop-in replacement for ``redis.client.PubSub``.
+
+    Supports: ``subscribe()``, ``unsubscribe()``, ``get_message()``, ``close()``.
+    Each subscriber buffers its own messages, so a slow reader never drops
+    messages published after it subscribed.
+    """
+
+    def __init__(
+        self, client: InMemoryRedisClient, ignore_subscribe_messages: bool = False
+    ) -> None:
+        """Initialize a subscriber bound to *client*."""
+        self._client = client
+        self._ignore_subscribe_messages = ignore_subscribe_messages
+        self._channels: set[str] = set()
+        self._messages: queue.Queue[dict[str, Any]] = queue.Queue()
+
+    def subscribe(self, *channels: str) -> None:
+        """Subscribe to one or more channels."""
+        with self._client._lock:
+            for channel in channels:
+                if channel in self._channels:
+                    continue
+                self._channels.add(channel)
+                self._client._subscribers.setdefault(channel, []).append(self)
+                if not self._ignore_subscribe_messages:
+                    self._deliver(channel, len(self._channels), "subscribe")
+
+    def unsubscribe(self, *channels: str) -> None:
+        """Unsubscribe from *channels*, or from all channels if none are given."""
+        with self._client._lock:
+            for channel in channels or tuple(self._channels):
+                if channel not in self._channels:
+                    continue
+                self._channels.discard(channel)
+                subscribers = self._client._subscribers.get(channel, [])
+                if self in subscribers:
+                    subscribers.remove(self)
+
+    def get_message(
+        self, ignore_subscribe_messages: bool = False, timeout: float = 0.0
+    ) -> Optional[dict[str, Any]]:
+        """Return the next message, waiting up to *timeout* seconds, or ``None``."""
+        deadline = time.monotonic() + max(timeout or 0.0, 0.0)
+        while True:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining > 0:
+                    message = self._messages.get(timeout=remaining)
+                else:
+                    message = self._messages.get_nowait()
+            except queue.Empty:
+                return None
+            if message["type"] == "message" or not (
+                ignore_subscribe_messages or self._ignore_subscribe_messages
+            ):
+                return message
+
+    def close(self) -> None:
+        """Unsubscribe from all channels."""
+        self.unsubscribe()
+
+    def _deliver(self, channel: str, data: Any, message_type: str = "message") -> None:
+        """Queue a message for this subscriber."""
+        self._messages.put(
+            {"type": message_type, "pattern": None, "channel": channel, "data": data}
+        )
+
 
 class InMemoryRedisDict(MutableMapping):
     """Drop-in replacement for ``pottery.RedisDict``.
@@ -160,7 +373,7 @@ class InMemoryRedisDict(MutableMapping):
 class InMemoryRedisList:
     """Drop-in replacement for ``pottery.RedisList``.
 
-    Supports: ``append()``, ``remove()``, ``iter()``, ``len()``.
+    Supports: ``append()``, ``remove()``, ``iter()``, ``len()``, ``to_list()``.
 
     Multiple instances created with the same *key* and *redis* client share
     the same underlying storage.
@@ -199,6 +412,11 @@ class InMemoryRedisList:
         with self._lock:
             return len(self._store)
 
+    def to_list(self) -> list[Any]:
+        """Return a plain ``list`` copy."""
+        with self._lock:
+            return list(self._store)
+
     def __contains__(self, value: object) -> bool:
         """Check if a value is in the list."""
         with self._lock:
@@ -1,6 +1,7 @@
 """MongoDB migration tool for MADSci databases with backup, schema management, and CLI."""
 
 import sys
+from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -11,12 +12,16 @@ from madsci.common.backup_tools.mongodb_backup import (
 )
 from madsci.common.mongodb_version_checker import MongoDBVersionChecker
 from madsci.common.types.mongodb_migration_types import (
+    DatetimeFieldDefinition,
     IndexDefinition,
     MongoDBMigrationSettings,
     MongoDBSchema,
 )
+from madsci.common.utils import to_naive_utc
 from pydantic import AnyUrl
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateOne
+
+BACKFILL_BATCH_SIZE = 1000
 
 
 class MongoDBMigrator:
@@ -148,6 +153,9 @@ class MongoDBMigrator:
             for collection_name, collection_def in expected_schema.collections.items():
                 self._ensure_collection_exists(collection_name)
                 self._ensure_indexes_exist(collection_name, collection_def.indexes)
+                self._backfill_datetime_fields(
+                    collection_name, collection_def.datetime_fields
+                )
 
             self.version_checker.create_schema_versions_collection()
 
@@ -226,6 +234,71 @@ class MongoDBMigrator:
             )
             raise
 
+    def _backfill_datetime_fields(
+        self,
+        collection_name: str,
+        datetime_fields: List[DatetimeFieldDefinition],
+    ) -> None:
+        """Backfill native datetime fields from their ISO-string source fields.
+
+        Documents are converted in batches, so large collections are never
+        loaded into memory at once, and an interrupted backfill resumes where
+        it stopped. Unparseable source values are stored as null.
+        """
+        try:
+            collection = self.database[collection_name]
+
+            for datetime_field in datetime_fields:
+                query = {
+                    datetime_field.field: {"$exists": False},
+                    datetime_field.source: {"$exists": True},
+                }
+                backfilled = 0
+
+                while True:
+                    batch = list(
+                        collection.find(query, {datetime_field.source: 1}).limit(
+                            BACKFILL_BATCH_SIZE
+                        )
+                    )
+                    if not batch:
+                        break
+
+                    collection.bulk_write(
+                        [
+                            UpdateOne(
+                                {"_id": document["_id"]},
+                                {
+                                    "$set": {
+                                        datetime_field.field: _parse_iso_datetime(
+                                            document.get(datetime_field.source)
+                                        )
+                                    }
+                                },
+                            )
+                            for document in batch
+                        ],
+                        ordered=False,
+                    )
+                    backfilled += len(batch)
+
+                self.logger.info(
+                    "Backfilled datetime field",
+                    collection_name=collection_name,
+                    field=datetime_field.field,
+                    source=datetime_field.source,
+                    documents=backfilled,
+                )
+
+        except Exception as e:
+            self.logger.error(
+                "Error backfilling datetime fields for collection",
+                collection_name=collection_name,
+                error=str(e),
+                exc_info=True,
+            )
+            raise
+
     def validate_schema(self) -> Dict[str, Any]:
         """
         Validate current database schema against expected schema.
@@ -340,6 +413,21 @@ class MongoDBMigrator:
             raise
 
 
+def _parse_iso_datetime(value: Any) -> Optional[datetime]:
+    """Parse an ISO-8601 timestamp to a naive UTC datetime, or None if it can't be parsed.
+
+    Timestamps without a UTC offset were written by ``datetime.now()``, so they are taken to be in local time.
+    """
+    if isinstance(value, datetime):
+        return to_naive_utc(value)
+    if isinstance(value, str):
+        try:
+            return to_naive_utc(datetime.fromisoformat(value.replace("Z", "+00:00")))
+        except ValueError:
+            return None
+    return None
+
+
 def handle_migration_commands(
     settings: MongoDBMigrationSettings,
     version_checker: MongoDBVersionChecker,
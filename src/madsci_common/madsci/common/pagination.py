@@ -0,0 +1,86 @@
+"""Keyset (cursor) pagination over MongoDB collections.
+
+Pages are ordered by a sort field, newest first unless asked otherwise, with
+the document ``_id`` as a tie-breaker. A page's cursor token encodes the sort
+value and ``_id`` of its last document, and the next page is read with a range
+query that starts just past it, so reading any page costs the same no matter
+how deep it is.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Optional
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+"""Response header carrying the cursor token for the next page."""
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor token cannot be decoded."""
+
+
+def encode_cursor(sort_value: Any, document_id: Any) -> str:
+    """Encode the sort value and ``_id`` of a page's last document as an opaque token."""
+    is_datetime = isinstance(sort_value, datetime)
+    payload = {
+        "v": sort_value.isoformat() if is_datetime else sort_value,
+        "d": is_datetime,
+        "id": document_id,
+    }
+    token = base64.urlsafe_b64encode(
+        json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    )
+    return token.decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str) -> tuple[Any, Any]:
+    """Decode a cursor token into the sort value and ``_id`` it was created from."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        sort_value = payload["v"]
+        if payload["d"]:
+            sort_value = datetime.fromisoformat(sort_value)
+        return sort_value, payload["id"]
+    except (
+        binascii.Error,
+        UnicodeError,
+        TypeError,
+        ValueError,
+        KeyError,
+    ) as e:
+        raise InvalidCursorError(f"Invalid cursor: {token}") from e
+
+
+def keyset_query(
+    query: dict[str, Any], sort_field: str, cursor: Optional[str], direction: int = -1
+) -> dict[str, Any]:
+    """Restrict a query to documents after a cursor, in newest-first order (or oldest-first with ``direction=1``)."""
+    if not cursor:
+        return query
+    sort_value, document_id = decode_cursor(cursor)
+    after = "$gt" if direction == 1 else "$lt"
+    after_cursor = {
+        "$or": [
+            {sort_field: {after: sort_value}},
+            {sort_field: sort_value, "_id": {after: document_id}},
+        ]
+    }
+    return {"$and": [query, after_cursor]} if query else after_cursor
+
+
+def keyset_sort(sort_field: str, direction: int = -1) -> list[tuple[str, int]]:
+    """Return the sort specification matching ``keyset_query``."""
+    return [(sort_field, direction), ("_id", direction)]
+
+
+def next_cursor(
+    documents: list[dict[str, Any]], sort_field: str, page_size: int
+) -> Optional[str]:
+    """Return the cursor for the page after ``documents``, or None if it was the last page."""
+    if not documents or len(documents) < page_size:
+        return None
+    last = documents[-1]
+    return encode_cursor(last.get(sort_field), last["_id"])
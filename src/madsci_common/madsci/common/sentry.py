@@ -44,6 +44,7 @@ SUBDIR_BACKUPS: str = "backups"
 SUBDIR_TEMPLATES: str = "templates"
 SUBDIR_DATAPOINTS: str = "datapoints"
 SUBDIR_WORKCELLS: str = "workcells"
+SUBDIR_CACHE: str = "cache"
 
 REGISTRY_FILE: str = "registry.json"
 """Default registry filename inside ``.madsci/``."""
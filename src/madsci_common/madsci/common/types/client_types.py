@@ -8,7 +8,7 @@ and backoff algorithms.
 
 from typing import Optional
 
-from madsci.common.types.base_types import MadsciBaseSettings
+from madsci.common.types.base_types import MadsciBaseSettings, PathLike
 from pydantic import Field
 from pydantic_settings import SettingsConfigDict
 
@@ -157,6 +157,40 @@ class DataClientConfig(MadsciClientConfig):
         env_file_encoding="utf-8",
     )
 
+    # Local datapoint cache configuration
+    cache_enabled: bool = Field(
+        default=False,
+        description="Whether to cache datapoints and file values locally. Datapoints never change once stored, so cached entries are only removed to stay within the size limits",
+    )
+    cache_dir: Optional[PathLike] = Field(
+        default=None,
+        description="Directory for cached datapoint values (None uses ~/.madsci/cache/datapoints)",
+    )
+    cache_max_disk_bytes: int = Field(
+        default=1024 * 1024 * 1024,
+        ge=0,
+        description="Maximum total size in bytes of the values cached on disk",
+    )
+    cache_max_memory_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        ge=0,
+        description="Maximum total size in bytes of the values cached in memory",
+    )
+    cache_memory_threshold_bytes: int = Field(
+        default=1024 * 1024,
+        ge=0,
+        description="Cached values at least this large are kept only on disk and read from their cache file on each hit, instead of being held in memory",
+    )
+    cache_max_metadata_entries: int = Field(
+        default=10_000,
+        ge=0,
+        description="Maximum number of datapoints cached in memory",
+    )
+    deduplicate_uploads: bool = Field(
+        default=False,
+        description="Before uploading a file, ask the Data Manager whether it already stores the same contents (by SHA-256), and if so reference them instead of uploading the file. Only Data Managers with content-addressed storage and blob references allowed report stored contents",
+    )
+
 
 class LocationClientConfig(MadsciClientConfig):
     """Configuration for the Location Manager client."""
@@ -117,12 +117,18 @@ class FileDataPoint(DataPoint):
     Attributes:
         data_type: The type of the data point, in this case a file.
         path: The path to the file.
+        sha256: The SHA-256 digest of the file's contents, recorded when it is stored.
+        size_bytes: The size of the file in bytes, recorded when it is stored.
     """
 
     data_type: Literal[DataPointTypeEnum.FILE] = DataPointTypeEnum.FILE
     """The type of the data point, in this case a file"""
     path: PathLike
     """Path to the file"""
+    sha256: Optional[str] = None
+    """SHA-256 digest of the file's contents, recorded when it is stored"""
+    size_bytes: Optional[int] = None
+    """Size of the file in bytes, recorded when it is stored"""
 
 
 class ValueDataPoint(DataPoint):
@@ -153,6 +159,7 @@ class ObjectStorageDataPoint(DataPoint):
         content_type: The MIME type of the stored object.
         size_bytes: The size of the object in bytes.
         etag: The entity tag (typically MD5) of the object.
+        sha256: The SHA-256 digest of the object's contents, recorded when it is stored.
         custom_metadata: Additional user-defined metadata for the object.
     """
 
@@ -185,6 +192,9 @@ class ObjectStorageDataPoint(DataPoint):
     etag: Optional[str] = Field(
         None, description="Entity tag (typically MD5) of the object"
     )
+    sha256: Optional[str] = Field(
+        None, description="SHA-256 digest of the object's contents"
+    )
     custom_metadata: dict[str, str] = Field(
         default_factory=dict, description="User-defined metadata for the object"
     )
@@ -298,6 +308,21 @@ class DataManagerSettings(
         description="The path where files are stored on the server.",
         default=".madsci/datapoints",
     )
+    content_addressed_storage: bool = Field(
+        default=False,
+        title="Content-Addressed Storage",
+        description="Whether to store each distinct uploaded file once, keyed by its SHA-256 and shared by every datapoint with the same contents.",
+    )
+    allow_blob_references: bool = Field(
+        default=False,
+        title="Allow Blob References",
+        description="Whether, with content-addressed storage, POST /blobs/check reports stored contents and file datapoints may be submitted with just the SHA-256 of stored contents instead of the file. Anyone who can submit datapoints and knows a file's hash can then read its contents, so only enable this if every client may read every stored file.",
+    )
+    blob_collection_name: str = Field(
+        default="blobs",
+        title="Blob Collection Name",
+        description="The name of the MongoDB collection tracking content-addressed files and how many datapoints reference each.",
+    )
 
 
 class DataManagerHealth(ManagerHealth):
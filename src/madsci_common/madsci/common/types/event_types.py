@@ -25,7 +25,7 @@ from madsci.common.types.manager_types import (
     ManagerSettings,
     ManagerType,
 )
-from madsci.common.utils import new_ulid_str
+from madsci.common.utils import new_ulid_str, to_naive_utc, utcnow
 from pydantic import AliasChoices, AnyUrl, Field
 from pydantic.functional_validators import field_validator
 from pydantic_settings import SettingsConfigDict
@@ -117,6 +117,44 @@ class EventManagerSettings(
         title="Email Alerts Configuration",
         description="The configuration for sending email alerts.",
     )
+    alert_queue_size: int = Field(
+        default=1000,
+        title="Alert Queue Size",
+        description="Maximum number of alerts waiting to be sent. Alerts raised while the queue is full are dropped, so alert storms never slow down event ingestion.",
+        ge=1,
+    )
+    alert_coalesce_seconds: float = Field(
+        default=300.0,
+        title="Alert Coalesce Seconds",
+        description="After an alert is sent, identical alerts (same event type, level, source, and message) raised within this many seconds are summarized in one follow-up email instead of sent individually. 0 sends every alert.",
+        ge=0,
+    )
+    alert_rate_limit: int = Field(
+        default=30,
+        title="Alert Rate Limit",
+        description="Maximum number of alert emails sent to each recipient per alert_rate_limit_period_seconds. 0 means unlimited.",
+        ge=0,
+    )
+    alert_rate_limit_period_seconds: float = Field(
+        default=3600.0,
+        title="Alert Rate Limit Period Seconds",
+        description="The period over which alert_rate_limit is counted (in seconds).",
+        gt=0,
+    )
+
+    # Database worker settings
+    db_workers: int = Field(
+        default=8,
+        title="Database Workers",
+        description="Number of threads for short database operations (event ingestion and lookups), so blocking MongoDB calls don't stall the server's event loop.",
+        ge=1,
+    )
+    report_workers: int = Field(
+        default=2,
+        title="Report Workers",
+        description="Number of threads for long-running database work (raw queries, utilization reports, archiving, retention, and backups), kept separate from the database workers so it can't delay ingestion.",
+        ge=1,
+    )
 
     # Retention settings
     retention_enabled: bool = Field(
@@ -157,6 +195,50 @@ class EventManagerSettings(
         ge=0,
     )
 
+    # Utilization rollup settings
+    rollups_enabled: bool = Field(
+        default=False,
+        title="Rollups Enabled",
+        description="Whether to maintain hourly utilization rollups and build utilization reports from them instead of scanning raw events.",
+    )
+    rollup_collection_name: str = Field(
+        default="utilization_rollups",
+        title="Rollup Collection Name",
+        description="The name of the MongoDB collection where utilization rollups are stored.",
+    )
+    rollup_interval_seconds: float = Field(
+        default=60.0,
+        title="Rollup Interval Seconds",
+        description="How often the rollup catch-up job folds new events into the rollups (in seconds).",
+        gt=0,
+    )
+    rollup_lag_seconds: float = Field(
+        default=300.0,
+        title="Rollup Lag Seconds",
+        description="How far behind the current time the rollup watermark stays, so late-arriving events are still included (in seconds).",
+        ge=0,
+    )
+    rollup_batch_size: int = Field(
+        default=5000,
+        title="Rollup Batch Size",
+        description="Maximum number of events folded into the rollups per batch.",
+        ge=1,
+    )
+
+    # Live event stream settings
+    stream_queue_size: int = Field(
+        default=1000,
+        title="Stream Queue Size",
+        description="Maximum number of events buffered for each /events/stream subscriber. Subscribers that fall further behind are disconnected, and can resume from the last event they received.",
+        ge=1,
+    )
+    stream_keepalive_seconds: float = Field(
+        default=15.0,
+        title="Stream Keepalive Seconds",
+        description="How often an idle /events/stream connection is sent a keepalive comment (in seconds).",
+        gt=0,
+    )
+
     # Backup settings
     backup_enabled: bool = Field(
         default=False,
@@ -204,7 +286,11 @@ class EventManagerHealth(ManagerHealth):
 
 
 class Event(MadsciBaseModel):
-    """An event in the MADSci system."""
+    """An event in the MADSci system.
+
+    In MongoDB, ``event_timestamp`` is stored as an ISO string, with a native
+    datetime copy in UTC under ``event_time`` for indexed time-range queries.
+    """
 
     event_id: str = Field(
         title="Event ID",
@@ -230,8 +316,8 @@ class Event(MadsciBaseModel):
     )
     event_timestamp: datetime = Field(
         title="Event Timestamp",
-        description="The timestamp of the event.",
-        default_factory=datetime.now,
+        description="The timestamp of the event. Naive timestamps are taken to be in local time.",
+        default_factory=utcnow,
     )
     source: OwnershipInfo = Field(
         title="Source",
@@ -273,6 +359,22 @@ class Event(MadsciBaseModel):
         """Cast ObjectID to string."""
         return str(v)
 
+    @field_validator("event_timestamp")
+    @classmethod
+    def assume_local_time(cls, v: datetime) -> datetime:
+        """Attach the local timezone to naive timestamps, so they are stored with their UTC offset."""
+        if v.tzinfo is None:
+            return v.astimezone()
+        return v
+
+    def to_mongo(self) -> dict[str, Any]:
+        """
+        Convert the event to a MongoDB-compatible dictionary, including the native datetime ``event_time``.
+        """
+        mongo_data = super().to_mongo()
+        mongo_data["event_time"] = to_naive_utc(self.event_timestamp)
+        return mongo_data
+
 
 LogRotationType = Literal["size", "time", "none"]
 
@@ -375,6 +477,36 @@ class EventClientConfig(MadsciClientConfig):
         description="If True, raise exceptions on logging/sending failures. If False, log errors silently and continue.",
     )
 
+    # Batched sending configuration
+    batch_enabled: bool = Field(
+        default=False,
+        title="Batch Sending Enabled",
+        description="If True, queue events and send them to the event server in batches from a single background worker, instead of one request per event.",
+    )
+    batch_max_size: int = Field(
+        default=100,
+        title="Batch Max Size",
+        description="Maximum number of events to send in a single batch.",
+        ge=1,
+    )
+    batch_max_age: float = Field(
+        default=1.0,
+        title="Batch Max Age",
+        description="Maximum time in seconds an event waits in a partial batch before the batch is sent.",
+        gt=0,
+    )
+    batch_queue_size: int = Field(
+        default=10_000,
+        title="Batch Queue Size",
+        description="Maximum number of events waiting to be sent. Further events are handled according to batch_overflow_policy.",
+        ge=1,
+    )
+    batch_overflow_policy: Literal["drop_newest", "drop_oldest", "block"] = Field(
+        default="drop_oldest",
+        title="Batch Overflow Policy",
+        description="What to do with a new event when the queue is full: 'drop_newest' discards it, 'drop_oldest' discards the oldest queued event to make room, and 'block' waits for room. Dropped events are still written to the local log.",
+    )
+
     # OpenTelemetry configuration
     otel_enabled: bool = Field(
         default=False,
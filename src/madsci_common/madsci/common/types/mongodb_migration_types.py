@@ -232,6 +232,27 @@ class IndexDefinition(BaseModel):
         return [key.to_tuple() for key in self.keys]
 
 
+class DatetimeFieldDefinition(BaseModel):
+    """A native datetime field derived from an ISO-string field.
+
+    Documents missing the field are backfilled from the source field when
+    schema migrations are applied.
+    """
+
+    field: str = Field(description="Name of the native datetime field")
+    source: str = Field(description="Name of the ISO-string field it is parsed from")
+    description: Optional[str] = Field(
+        default=None, description="Human-readable description of the field"
+    )
+
+    def to_schema_dict(self) -> Dict[str, Any]:
+        """Convert to schema.json format."""
+        result = {"field": self.field, "source": self.source}
+        if self.description:
+            result["description"] = self.description
+        return result
+
+
 class CollectionDefinition(BaseModel):
     """MongoDB collection definition."""
 
@@ -241,6 +262,10 @@ class CollectionDefinition(BaseModel):
     indexes: List[IndexDefinition] = Field(
         default_factory=list, description="List of indexes for this collection"
     )
+    datetime_fields: List[DatetimeFieldDefinition] = Field(
+        default_factory=list,
+        description="Native datetime fields to backfill from ISO-string fields",
+    )
 
     @field_validator("indexes", mode="before")
     @classmethod
@@ -269,6 +294,10 @@ class CollectionDefinition(BaseModel):
             result["description"] = self.description
         if self.indexes:
             result["indexes"] = [idx.to_schema_dict() for idx in self.indexes]
+        if self.datetime_fields:
+            result["datetime_fields"] = [
+                field.to_schema_dict() for field in self.datetime_fields
+            ]
         return result
 
 
@@ -184,6 +184,11 @@ class NodeClientCapabilities(MadsciBaseModel):
         title="Node Send Action",
         description="Whether the node supports sending actions.",
     )
+    get_snapshot: Optional[bool] = Field(
+        default=None,
+        title="Node Get Snapshot",
+        description="Whether the node supports querying its status, state, and info in a single request.",
+    )
     get_action_status: Optional[bool] = Field(
         default=None,
         title="Node Get Action Status",
@@ -194,6 +199,11 @@ class NodeClientCapabilities(MadsciBaseModel):
         title="Node Get Action Result",
         description="Whether the node supports querying the result of an action.",
     )
+    wait_for_action: Optional[bool] = Field(
+        default=None,
+        title="Node Wait For Action",
+        description="Whether the node supports waiting (long-polling) for the status of an action to change.",
+    )
     get_action_history: Optional[bool] = Field(
         default=None,
         title="Node Get Actions",
@@ -567,6 +577,25 @@ class NodeStatus(MadsciBaseModel):
         return "Node is ready"
 
 
+class NodeSnapshot(MadsciBaseModel):
+    """The status, state, and optionally info of a MADSci Node, as returned by a single request."""
+
+    status: NodeStatus = Field(
+        title="Node Status",
+        description="The status of the node.",
+    )
+    state: dict[str, Any] = Field(
+        default_factory=dict,
+        title="Node State",
+        description="The state of the node.",
+    )
+    info: Optional[NodeInfo] = Field(
+        default=None,
+        title="Node Info",
+        description="Information about the node, if requested.",
+    )
+
+
 class NodeReservation(MadsciBaseModel):
     """Reservation of a MADSci Node."""
 
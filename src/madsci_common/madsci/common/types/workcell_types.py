@@ -257,6 +257,16 @@ class WorkcellManagerSettings(
         title="Node Update Interval",
         description="The interval at which the workcell queries its node's states and status, in seconds. Must be <= scheduler_update_interval",
     )
+    engine_mode: Literal["polling", "event_driven"] = Field(
+        default="polling",
+        title="Engine Mode",
+        description="How the workcell engine decides when to run the scheduler. 'polling' runs it every scheduler_update_interval seconds. 'event_driven' blocks on state change notifications (workflow submission, step completion, node updates) and runs the scheduler as soon as the state changes, with scheduler_update_interval as a fallback timer.",
+    )
+    dispatch_mode: Literal["single", "concurrent"] = Field(
+        default="single",
+        title="Dispatch Mode",
+        description="How many steps the workcell engine dispatches per scheduler iteration. 'single' dispatches the highest-priority ready workflow. 'concurrent' dispatches every ready workflow whose target node is free (not locked, reserved, or already targeted in the same iteration).",
+    )
     reconnect_attempt_interval: float = Field(
         default=30.0,
         title="Reconnect Attempt Interval",
@@ -267,6 +277,16 @@ class WorkcellManagerSettings(
         title="Node Info Update Interval",
         description="The interval at which the workcell queries its node's info, in seconds. Node info changes infrequently, so this can be much larger than node_update_interval to reduce network overhead.",
     )
+    node_update_concurrency: int = Field(
+        default=16,
+        title="Node Update Concurrency",
+        description="The maximum number of requests the workcell makes to its nodes at once when querying their status, state, and info",
+    )
+    node_update_timeout: float = Field(
+        default=10.0,
+        title="Node Update Timeout",
+        description="How long, in seconds, the workcell waits for each request to its nodes for their status, state, and info, timed from when the request is sent, before marking the nodes that haven't responded as disconnected",
+    )
     cold_start_delay: int = Field(
         default=0,
         title="Cold Start Delay",
@@ -277,6 +297,16 @@ class WorkcellManagerSettings(
         title="scheduler",
         description="Scheduler module that contains a Scheduler class that inherits from AbstractScheduler to use",
     )
+    fair_share_weights: dict[str, float] = Field(
+        default_factory=dict,
+        title="Fair-Share Weights",
+        description="Relative share of the workcell for each workflow owner, keyed by experiment ID (or user ID for workflows outside an experiment), as a JSON dict. Owners not listed have a weight of 1.0. Used by the priority scheduler.",
+    )
+    deadline_urgency_window: float = Field(
+        default=300.0,
+        title="Deadline Urgency Window",
+        description="Ready workflows whose slack (time to their deadline, less the estimated time to run their remaining steps) is less than this many seconds are run ahead of all others, earliest deadline first. Used by the priority scheduler.",
+    )
     mongo_db_url: Optional[AnyUrl] = Field(
         default=AnyUrl("mongodb://localhost:27017"),
         title="MongoDB URL",
@@ -301,6 +331,11 @@ class WorkcellManagerSettings(
         title="Get Action Result Retries",
         description="Number of times to retry getting an action result",
     )
+    action_wait_timeout: float = Field(
+        default=30.0,
+        title="Action Wait Timeout",
+        description="Seconds each long-poll request to a node may wait for an action's status to change before the engine re-issues it",
+    )
 
 
 class WorkcellManagerHealth(ManagerHealth):
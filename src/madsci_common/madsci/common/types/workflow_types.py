@@ -396,6 +396,10 @@ class Workflow(WorkflowDefinition):
     """Whether or not this workflow is being simulated"""
     submitted_time: Optional[datetime] = None
     """Time workflow was submitted to the scheduler"""
+    priority: int = 0
+    """User-supplied priority for the workflow run, used by priority-aware schedulers. Higher is more important"""
+    deadline: Optional[datetime] = None
+    """Time by which the workflow run should finish, used by deadline-aware schedulers"""
     start_time: Optional[datetime] = None
     """Time the workflow started running"""
     end_time: Optional[datetime] = None
@@ -34,6 +34,15 @@ def utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def to_naive_utc(timestamp: datetime) -> datetime:
+    """Convert a datetime to naive UTC, as MongoDB stores datetimes.
+
+    Naive datetimes are taken to be in local time, as returned by ``datetime.now()``.
+    """
+
+    return timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+
+
 def localnow() -> datetime:
     """Return the current local time."""
 
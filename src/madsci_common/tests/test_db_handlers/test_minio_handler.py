@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import io
+
 import pytest
 from madsci.common.db_handlers.minio_handler import MinioHandler
 
@@ -81,6 +83,31 @@ class TestMinioHandlerInterface:
         minio_handler.download_file("upload-test", "test.txt", output_path)
         assert output_path.read_text() == "Hello, MinIO!"
 
+    def test_upload_stream(self, minio_handler):
+        """Upload the contents of a stream."""
+        minio_handler.make_bucket("stream-test")
+        data = b"streamed " * 1000
+
+        result = minio_handler.upload_stream(
+            "stream-test", "stream.bin", io.BytesIO(data), length=len(data)
+        )
+        assert result["bucket_name"] == "stream-test"
+        assert result["object_name"] == "stream.bin"
+        assert result["content_type"] == "application/octet-stream"
+        assert minio_handler.get_object_data("stream-test", "stream.bin") == data
+
+    def test_default_upload_stream_uses_upload_file(self, minio_handler):
+        """Handlers without their own upload_stream spool the stream to a file for upload_file."""
+        minio_handler.make_bucket("spool-test")
+        data = b"spooled data"
+
+        result = MinioHandler.upload_stream(
+            minio_handler, "spool-test", "spooled.txt", io.BytesIO(data)
+        )
+        assert result["size_bytes"] == len(data)
+        assert result["content_type"] == "text/plain"
+        assert minio_handler.get_object_data("spool-test", "spooled.txt") == data
+
     def test_get_object_data(self, minio_handler, tmp_path):
         """get_object_data should return raw bytes."""
         minio_handler.make_bucket("data-test")
@@ -94,6 +121,41 @@ class TestMinioHandlerInterface:
         data = minio_handler.get_object_data("data-test", "binary.bin")
         assert data == test_data
 
+    def test_stat_object(self, minio_handler):
+        """stat_object should report the size and validators of an object."""
+        minio_handler.make_bucket("stat-test")
+        data = b"stat me"
+        minio_handler.upload_stream("stat-test", "stat.txt", io.BytesIO(data))
+
+        stat = minio_handler.stat_object("stat-test", "stat.txt")
+        assert stat["size_bytes"] == len(data)
+        assert stat["etag"]
+        assert stat["last_modified"] is not None
+        with pytest.raises(FileNotFoundError):
+            minio_handler.stat_object("stat-test", "missing.txt")
+
+    def test_iter_object(self, minio_handler):
+        """iter_object should stream an object, or a byte range of it, in chunks."""
+        minio_handler.make_bucket("iter-test")
+        data = bytes(range(256))
+        minio_handler.upload_stream("iter-test", "range.bin", io.BytesIO(data))
+
+        chunks = list(
+            minio_handler.iter_object("iter-test", "range.bin", chunk_size=100)
+        )
+        assert [len(chunk) for chunk in chunks] == [100, 100, 56]
+        assert b"".join(chunks) == data
+        assert (
+            b"".join(
+                minio_handler.iter_object("iter-test", "range.bin", offset=10, length=5)
+            )
+            == data[10:15]
+        )
+        assert (
+            b"".join(minio_handler.iter_object("iter-test", "range.bin", offset=250))
+            == data[250:]
+        )
+
     def test_upload_with_metadata(self, minio_handler, tmp_path):
         """Upload should accept custom metadata."""
         minio_handler.make_bucket("meta-test")
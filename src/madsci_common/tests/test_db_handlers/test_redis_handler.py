@@ -143,6 +143,61 @@ class TestRedisHandlerInterface:
         d1["shared_key"] = "shared_value"
         assert d2["shared_key"] == "shared_value"
 
+    def test_publish_and_pubsub(self, redis_handler):
+        """Subscribers should receive messages published after they subscribe."""
+        pubsub = redis_handler.create_pubsub("test:channel")
+
+        assert redis_handler.publish("test:channel", "hello") == 1
+        message = pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+        assert message["data"] == "hello"
+        assert pubsub.get_message(ignore_subscribe_messages=True) is None
+
+        pubsub.close()
+        assert redis_handler.publish("test:channel", "ignored") == 0
+
+    def test_hash_set_get(self, redis_handler):
+        """hset/hget/hgetall should store and retrieve hash fields."""
+        assert redis_handler.hgetall("test:hash") == {}
+        redis_handler.hset("test:hash", {"a": "1", "b": "2"})
+        assert redis_handler.hget("test:hash", "a") == "1"
+        assert redis_handler.hget("test:hash", "missing") is None
+        assert redis_handler.hgetall("test:hash") == {"a": "1", "b": "2"}
+
+    def test_hash_delete_fields(self, redis_handler):
+        """hdel should remove fields, and delete should remove the whole hash."""
+        redis_handler.hset("test:hash", {"a": "1", "b": "2", "c": "3"})
+        assert redis_handler.hdel("test:hash", "a", "missing") == 1
+        assert redis_handler.hgetall("test:hash") == {"b": "2", "c": "3"}
+        assert redis_handler.delete("test:hash") == 1
+        assert redis_handler.hgetall("test:hash") == {}
+
+    def test_hgetall_many(self, redis_handler):
+        """hgetall_many should return each hash in order, empty for missing keys."""
+        redis_handler.hset("test:hash1", {"a": "1"})
+        redis_handler.hset("test:hash2", {"b": "2"})
+        assert redis_handler.hgetall_many(
+            ["test:hash2", "test:missing", "test:hash1"]
+        ) == [{"b": "2"}, {}, {"a": "1"}]
+
+    def test_transaction(self, redis_handler):
+        """transaction should read before multi(), then apply queued writes."""
+        redis_handler.hset("test:hash", {"count": "1"})
+
+        def double(pipeline):
+            count = int(pipeline.hget("test:hash", "count"))
+            pipeline.multi()
+            pipeline.hset("test:hash", mapping={"count": str(count * 2)})
+            return count
+
+        assert redis_handler.transaction(double, "test:hash") == 1
+        assert redis_handler.hget("test:hash", "count") == "2"
+
+    def test_replace_hash(self, redis_handler):
+        """replace_hash should drop fields missing from the new mapping."""
+        redis_handler.hset("test:hash", {"a": "1", "b": "2"})
+        redis_handler.replace_hash("test:hash", {"b": "3", "c": "4"})
+        assert redis_handler.hgetall("test:hash") == {"b": "3", "c": "4"}
+
 
 # ---------------------------------------------------------------------------
 # Integration tests (require Docker)
@@ -34,6 +34,12 @@ class TestInsertAndFindOne:
         result = col.insert_one({"_id": "abc", "data": True})
         assert result.inserted_id == "abc"
 
+    def test_insert_many(self):
+        col = InMemoryCollection("test")
+        result = col.insert_many([{"_id": "1"}, {"_id": "2"}], ordered=False)
+        assert result.inserted_ids == ["1", "2"]
+        assert col.count_documents({}) == 2
+
     def test_deep_copy_isolation(self):
         """Inserted documents should be copies, not references."""
         col = InMemoryCollection("test")
@@ -66,6 +72,12 @@ class TestFind:
         results = col.find({"status": "deleted"}).to_list()
         assert len(results) == 0
 
+    def test_find_nested_projection(self):
+        col = InMemoryCollection("test")
+        col.insert_one({"_id": "1", "data": {"a": 1, "b": {"c": 2, "d": 3}}})
+        results = col.find({}, {"_id": 0, "data.a": 1, "data.b.c": 1}).to_list()
+        assert results == [{"data": {"a": 1, "b": {"c": 2}}}]
+
 
 class TestCursorChaining:
     def test_sort_ascending(self):
@@ -92,6 +104,15 @@ class TestCursorChaining:
         results = col.find().sort([("ts", -1)]).to_list()
         assert results[0]["ts"] == 3
 
+    def test_sort_multiple_keys(self):
+        """Later sort keys break ties in earlier ones."""
+        col = InMemoryCollection("test")
+        col.insert_one({"_id": "a", "ts": 1})
+        col.insert_one({"_id": "c", "ts": 2})
+        col.insert_one({"_id": "b", "ts": 2})
+        results = col.find().sort([("ts", -1), ("_id", 1)]).to_list()
+        assert [d["_id"] for d in results] == ["b", "c", "a"]
+
     def test_skip(self):
         col = InMemoryCollection("test")
         for i in range(5):
@@ -182,6 +203,24 @@ class TestQueryOperators:
         results = col.find({"data.level": 1}).to_list()
         assert len(results) == 1
 
+    def test_or(self):
+        col = InMemoryCollection("test")
+        col.insert_one({"_id": "1", "val": 5})
+        col.insert_one({"_id": "2", "val": 10})
+        col.insert_one({"_id": "3", "val": 15})
+        results = col.find({"$or": [{"val": 5}, {"val": {"$gt": 10}}]}).to_list()
+        assert sorted(d["_id"] for d in results) == ["1", "3"]
+
+    def test_and(self):
+        col = InMemoryCollection("test")
+        col.insert_one({"_id": "1", "val": 5, "kind": "a"})
+        col.insert_one({"_id": "2", "val": 10, "kind": "a"})
+        col.insert_one({"_id": "3", "val": 10, "kind": "b"})
+        results = col.find(
+            {"$and": [{"kind": "a"}, {"$or": [{"val": 10}, {"_id": "3"}]}]}
+        ).to_list()
+        assert [d["_id"] for d in results] == ["2"]
+
 
 class TestUpdateOperations:
     def test_update_one_set(self):
@@ -231,6 +270,28 @@ class TestUpdateOperations:
         assert result.matched_count == 2
         assert col.find_one({"_id": "c"})["archived"] is False
 
+    def test_update_one_upsert(self):
+        col = InMemoryCollection("test")
+        result = col.update_one(
+            {"_id": "1", "scope": "node"},
+            {"$inc": {"busy": 5}, "$setOnInsert": {"key": "n1"}},
+            upsert=True,
+        )
+        assert result.upserted_id == "1"
+        col.update_one({"_id": "1"}, {"$inc": {"busy": 2}}, upsert=True)
+        doc = col.find_one({"_id": "1"})
+        assert doc == {"_id": "1", "scope": "node", "key": "n1", "busy": 7}
+        assert col.count_documents({}) == 1
+
+    def test_update_min_max(self):
+        col = InMemoryCollection("test")
+        col.insert_one({"_id": "1", "low": 5})
+        col.update_one({"_id": "1"}, {"$min": {"low": 3}, "$max": {"high": 9}})
+        col.update_one({"_id": "1"}, {"$min": {"low": 4}, "$max": {"high": 8}})
+        doc = col.find_one({"_id": "1"})
+        assert doc["low"] == 3
+        assert doc["high"] == 9
+
 
 class TestDeleteOperations:
     def test_delete_one(self):
@@ -6,6 +6,7 @@ import threading
 
 import pytest
 from madsci.common.local_backends.inmemory_redis import (
+    InMemoryPubSub,
     InMemoryRedisClient,
     InMemoryRedisDict,
     InMemoryRedisList,
@@ -61,6 +62,55 @@ class TestInMemoryRedisClient:
             t.join()
         assert int(client.get("x")) == n_threads * n_increments
 
+    def test_hash_roundtrip(self):
+        client = InMemoryRedisClient()
+        assert client.hset("h", "a", "1") == 1
+        assert client.hset("h", mapping={"a": "2", "b": "3"}) == 1
+        assert client.hget("h", "a") == "2"
+        assert client.hgetall("h") == {"a": "2", "b": "3"}
+        assert client.hdel("h", "a") == 1
+        assert client.hgetall("h") == {"b": "3"}
+
+    def test_delete_removes_hashes_and_values(self):
+        client = InMemoryRedisClient()
+        client.set("k", "v")
+        client.hset("h", "a", "1")
+        assert client.delete("k", "h", "missing") == 2
+        assert client.get("k") is None
+        assert client.hgetall("h") == {}
+
+    def test_pipeline_queues_until_execute(self):
+        client = InMemoryRedisClient()
+        with client.pipeline() as pipe:
+            pipe.hset("h", mapping={"a": "1"})
+            pipe.hgetall("h")
+            assert client.hgetall("h") == {}
+            assert pipe.execute() == [1, {"a": "1"}]
+        assert client.hgetall("h") == {"a": "1"}
+
+    def test_pipeline_watch_runs_commands_immediately(self):
+        client = InMemoryRedisClient()
+        client.set("k", "1")
+        with client.pipeline() as pipe:
+            pipe.watch("k")
+            assert pipe.get("k") == "1"
+            pipe.multi()
+            pipe.set("k", "2")
+            assert client.get("k") == "1"
+            pipe.execute()
+        assert client.get("k") == "2"
+
+    def test_transaction_returns_callable_value(self):
+        client = InMemoryRedisClient()
+
+        def write(pipe):
+            pipe.multi()
+            pipe.set("k", "v")
+            return "done"
+
+        assert client.transaction(write, "k") == [None]
+        assert client.transaction(write, "k", value_from_callable=True) == "done"
+
 
 # ── InMemoryRedisDict ────────────────────────────────────────────────────
 
@@ -205,6 +255,15 @@ class TestInMemoryRedisList:
         assert "a" in lst
         assert "b" not in lst
 
+    def test_to_list(self):
+        client = InMemoryRedisClient()
+        lst = InMemoryRedisList(key="test:list", redis=client)
+        lst.append("a")
+        lst.append("b")
+        snapshot = lst.to_list()
+        lst.append("c")
+        assert snapshot == ["a", "b"]
+
     def test_shared_storage(self):
         """Same key and client → shared list."""
         client = InMemoryRedisClient()
@@ -214,6 +273,55 @@ class TestInMemoryRedisList:
         assert "x" in l2
 
 
+# ── InMemoryPubSub ───────────────────────────────────────────────────────
+
+
+class TestInMemoryPubSub:
+    def test_publish_without_subscribers(self):
+        client = InMemoryRedisClient()
+        assert client.publish("test:channel", "msg") == 0
+
+    def test_subscribe_and_receive(self):
+        client = InMemoryRedisClient()
+        pubsub = client.pubsub()
+        assert isinstance(pubsub, InMemoryPubSub)
+        pubsub.subscribe("test:channel")
+        assert pubsub.get_message()["type"] == "subscribe"
+
+        assert client.publish("test:channel", 42) == 1
+        message = pubsub.get_message()
+        assert message["type"] == "message"
+        assert message["channel"] == "test:channel"
+        assert message["data"] == "42"
+
+    def test_get_message_timeout(self):
+        client = InMemoryRedisClient()
+        pubsub = client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe("test:channel")
+        assert pubsub.get_message(timeout=0.05) is None
+
+    def test_get_message_wakes_on_publish(self):
+        """A blocked reader is woken as soon as a message is published."""
+        client = InMemoryRedisClient()
+        pubsub = client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe("test:channel")
+        timer = threading.Timer(0.05, client.publish, args=("test:channel", "x"))
+        timer.start()
+        message = pubsub.get_message(timeout=5.0)
+        timer.join()
+        assert message["data"] == "x"
+
+    def test_unsubscribe(self):
+        client = InMemoryRedisClient()
+        pubsub = client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe("a", "b")
+        pubsub.unsubscribe("a")
+        assert client.publish("a", "x") == 0
+        assert client.publish("b", "y") == 1
+        pubsub.close()
+        assert client.publish("b", "z") == 0
+
+
 # ── InMemoryRedlock ──────────────────────────────────────────────────────
 
 
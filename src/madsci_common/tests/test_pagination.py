@@ -0,0 +1,90 @@
+"""Unit tests for madsci.common.pagination module."""
+
+from datetime import datetime
+
+import pytest
+from madsci.common.local_backends.inmemory_collection import InMemoryCollection
+from madsci.common.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    keyset_query,
+    keyset_sort,
+    next_cursor,
+)
+
+
+class TestCursorTokens:
+    """Test encoding and decoding cursor tokens."""
+
+    def test_datetime_roundtrip(self):
+        """A datetime sort value decodes back to an equal datetime."""
+        timestamp = datetime(2025, 1, 2, 3, 4, 5, 678000)
+        assert decode_cursor(encode_cursor(timestamp, "01ABC")) == (timestamp, "01ABC")
+
+    def test_string_roundtrip(self):
+        """A string sort value decodes back to the same string."""
+        token = encode_cursor("2025-01-02T03:04:05", "01ABC")
+        assert decode_cursor(token) == ("2025-01-02T03:04:05", "01ABC")
+
+    def test_token_is_url_safe(self):
+        """Tokens can be passed as query parameters without escaping."""
+        token = encode_cursor("??>>", "~~")
+        assert all(character.isalnum() or character in "-_" for character in token)
+
+    @pytest.mark.parametrize("token", ["not-a-cursor", "", "e30", "!!!"])
+    def test_invalid_token(self, token):
+        """Malformed tokens raise InvalidCursorError."""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(token)
+
+
+class TestKeysetPagination:
+    """Test paging through a collection with cursors."""
+
+    def test_pages_cover_collection_once(self):
+        """Walking every page returns each document once, newest first."""
+        collection = InMemoryCollection("test")
+        for i, minute in enumerate([0, 1, 1, 1, 2, 3, 3]):
+            collection.insert_one(
+                {"_id": f"doc{i}", "kind": "a", "time": datetime(2025, 1, 1, 0, minute)}
+            )
+        collection.insert_one(
+            {"_id": "other", "kind": "b", "time": datetime(2025, 1, 1)}
+        )
+
+        seen = []
+        cursor = None
+        while True:
+            page = (
+                collection.find(keyset_query({"kind": "a"}, "time", cursor))
+                .sort(keyset_sort("time"))
+                .limit(3)
+                .to_list()
+            )
+            seen.extend(document["_id"] for document in page)
+            cursor = next_cursor(page, "time", 3)
+            if cursor is None:
+                break
+
+        assert seen == ["doc6", "doc5", "doc4", "doc3", "doc2", "doc1", "doc0"]
+
+    def test_oldest_first(self):
+        """With direction=1, pages continue toward newer documents."""
+        collection = InMemoryCollection("test")
+        for i, minute in enumerate([0, 1, 1, 2]):
+            collection.insert_one(
+                {"_id": f"doc{i}", "time": datetime(2025, 1, 1, 0, minute)}
+            )
+        cursor = encode_cursor(datetime(2025, 1, 1, 0, 1), "doc1")
+        page = (
+            collection.find(keyset_query({}, "time", cursor, direction=1))
+            .sort(keyset_sort("time", direction=1))
+            .to_list()
+        )
+        assert [document["_id"] for document in page] == ["doc2", "doc3"]
+
+    def test_no_cursor_after_short_page(self):
+        """A page smaller than the page size is the last page."""
+        assert next_cursor([{"_id": "a", "time": 1}], "time", 2) is None
+        assert next_cursor([], "time", 2) is None
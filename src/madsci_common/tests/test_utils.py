@@ -5,7 +5,7 @@ import tempfile
 import threading
 import time
 from argparse import ArgumentTypeError
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Annotated, List, Optional, Union
 from unittest.mock import patch
@@ -36,6 +36,7 @@ from madsci.common.utils import (
     string_to_bool,
     threaded_daemon,
     threaded_task,
+    to_naive_utc,
     to_snake_case,
     utcnow,
 )
@@ -67,6 +68,19 @@ def test_localnow():
     assert now.tzinfo is not None
 
 
+def test_to_naive_utc(monkeypatch: pytest.MonkeyPatch):
+    """Test that aware datetimes are converted to UTC and naive ones are taken as local time."""
+    monkeypatch.setenv("TZ", "EST+05")
+    time.tzset()
+    try:
+        aware = datetime(2025, 1, 1, 12, tzinfo=timezone(timedelta(hours=5)))
+        assert to_naive_utc(aware) == datetime(2025, 1, 1, 7)
+        assert to_naive_utc(datetime(2025, 1, 1, 12)) == datetime(2025, 1, 1, 17)
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+
+
 def test_to_snake_case():
     """Test conversion to snake case."""
     assert to_snake_case("camelCase") == "camel_case"
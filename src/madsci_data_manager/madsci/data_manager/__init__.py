@@ -21,6 +21,7 @@ Storage Backends
 Components
 ----------
 - :mod:`data_server`: Main FastAPI server for DataPoint operations
+- :mod:`file_storage`: Streaming storage of uploaded files
 
 Usage Example
 -------------
@@ -1,29 +1,52 @@
 """Data Manager implementation using the new AbstractManagerBase class."""
 
 import json
+import mimetypes
 import tempfile
 import warnings
-from datetime import datetime
+from collections import Counter
+from datetime import datetime, timezone
+from email.utils import format_datetime
 from pathlib import Path
-from typing import Annotated, Any, Dict, Optional
+from typing import Annotated, Any, BinaryIO, Dict, Optional, Tuple
 
 from classy_fastapi import get, post
-from fastapi import Form, Response, UploadFile
+from fastapi import Form, Request, Response, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.params import Body
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from madsci.common.db_handlers.minio_handler import MinioHandler, RealMinioHandler
 from madsci.common.db_handlers.mongo_handler import MongoHandler, PyMongoHandler
 from madsci.common.manager_base import AbstractManagerBase
 from madsci.common.mongodb_version_checker import MongoDBVersionChecker
 from madsci.common.object_storage_helpers import create_minio_client
+from madsci.common.pagination import (
+    NEXT_CURSOR_HEADER,
+    InvalidCursorError,
+    keyset_query,
+    keyset_sort,
+    next_cursor,
+)
 from madsci.common.types.datapoint_types import (
     DataManagerHealth,
     DataManagerSettings,
     DataPoint,
+    ObjectStorageDataPoint,
     ObjectStorageSettings,
 )
 from madsci.common.types.event_types import EventType
+from madsci.data_manager.file_storage import (
+    BLOB_DIRECTORY,
+    HashingReader,
+    RangeNotSatisfiableError,
+    blob_object_name,
+    blob_path,
+    parse_range,
+    save_stream,
+)
 from pymongo import MongoClient
+from pymongo.errors import BulkWriteError
+from starlette.datastructures import Headers
 
 
 class DataManager(AbstractManagerBase[DataManagerSettings]):
@@ -112,6 +135,10 @@ class DataManager(AbstractManagerBase[DataManagerSettings]):
         self.datapoints = self._mongo_handler.get_collection(
             self.settings.collection_name
         )
+        self.datapoints.create_index([("data_timestamp", 1), ("_id", 1)])
+        self.blobs = self._mongo_handler.get_collection(
+            self.settings.blob_collection_name
+        )
 
     def _setup_object_storage(self) -> None:
         """Setup MinIO object storage handler."""
@@ -161,27 +188,36 @@ class DataManager(AbstractManagerBase[DataManagerSettings]):
 
         return health
 
-    def _upload_file_to_minio(
+    def _upload_stream_to_minio(
         self,
-        file_path: Path,
+        stream: BinaryIO,
         filename: str,
         label: Optional[str] = None,
         metadata: Optional[Dict[str, str]] = None,
+        length: int = -1,
+        *,
+        object_name: Optional[str] = None,
     ) -> Optional[Dict[str, Any]]:
-        """Upload a file to object storage via the handler and return storage info."""
+        """Stream an upload to object storage via the handler and return storage info, including its SHA-256."""
         if self._minio_handler is None:
             return None
 
         oss = self._object_storage_settings or ObjectStorageSettings()
         bucket_name = oss.default_bucket
         self._minio_handler.ensure_bucket(bucket_name)
-        object_name = label or filename
-        result = self._minio_handler.upload_file(
+        object_name = object_name or label or filename
+        reader = HashingReader(stream)
+        result = self._minio_handler.upload_stream(
             bucket=bucket_name,
             object_name=object_name,
-            file_path=file_path,
+            stream=reader,
+            length=length,
+            content_type=mimetypes.guess_type(filename)[0]
+            or "application/octet-stream",
             metadata=metadata,
         )
+        result["sha256"] = reader.sha256
+        result["size_bytes"] = reader.size_bytes
 
         # Add application-level fields expected by ObjectStorageDataPoint
         endpoint = oss.endpoint or ""
@@ -198,11 +234,6 @@ class DataManager(AbstractManagerBase[DataManagerSettings]):
 
         return result
 
-    @staticmethod
-    def _cleanup_temp_file(path: Path) -> None:
-        """Remove a temporary file (sync helper for async methods)."""
-        path.unlink()
-
     @staticmethod
     def _get_storage_path(base_path: str, time: datetime) -> Path:
         """Resolve and create the date-based storage path (sync helper for async methods)."""
@@ -215,6 +246,173 @@ class DataManager(AbstractManagerBase[DataManagerSettings]):
         path.mkdir(parents=True, exist_ok=True)
         return path
 
+    async def _store_upload(
+        self, datapoint_obj: DataPoint, file: UploadFile
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """Store a datapoint's uploaded file and return the document to insert for it, with the hash of the blob it references.
+
+        File datapoints go to object storage when it is configured; otherwise,
+        or if that upload fails, the file is stored locally. With
+        content-addressed storage, the datapoint references the stored copy
+        of the file's contents, which is only stored if it is new.
+        """
+        if (
+            self.settings.content_addressed_storage
+            and datapoint_obj.data_type.value == "file"
+        ):
+            blob = await run_in_threadpool(self._store_blob, file.file, file.filename)
+            return self._link_blob(datapoint_obj, blob), blob["_id"]
+        # Check if this is a file datapoint and object storage is configured
+        if datapoint_obj.data_type.value == "file" and self._minio_handler is not None:
+            # Stream the upload straight into object storage
+            object_storage_info = await run_in_threadpool(
+                self._upload_stream_to_minio,
+                file.file,
+                file.filename,
+                datapoint_obj.label,
+                {"original_datapoint_id": datapoint_obj.datapoint_id},
+                file.size if file.size is not None else -1,
+            )
+
+            # If upload was successful, store object storage information in database
+            if object_storage_info:
+                # Create a combined dictionary with both datapoint and object storage info
+                datapoint_dict = datapoint_obj.to_mongo()
+                datapoint_dict.update(object_storage_info)
+                # Update data_type to indicate this is now an object storage datapoint
+                datapoint_dict["data_type"] = "object_storage"
+                return datapoint_dict, None
+            # If MinIO upload failed, fall back to local storage
+            warnings.warn(
+                "MinIO upload failed, falling back to local file storage",
+                UserWarning,
+                stacklevel=2,
+            )
+        # Fallback to local storage
+        time = datetime.now()
+        path = self._get_storage_path(self.settings.file_storage_path, time)
+        final_path = path / (datapoint_obj.datapoint_id + "_" + file.filename)
+
+        # Reset file position and stream the upload to its final path
+        file.file.seek(0)
+        reader = await run_in_threadpool(save_stream, file.file, final_path)
+        datapoint_obj.path = str(final_path)
+        datapoint_obj.sha256 = reader.sha256
+        datapoint_obj.size_bytes = reader.size_bytes
+        return datapoint_obj.to_mongo(), None
+
+    def _store_blob(self, stream: BinaryIO, filename: str) -> Dict[str, Any]:
+        """Store an upload's contents unless they are already stored, and return their blob document.
+
+        The upload is spooled to a temporary file to learn its SHA-256. If a
+        blob with that hash exists the copy is discarded; otherwise it is
+        uploaded to object storage or moved into the local blob directory.
+        Blobs are never deleted, so one whose datapoint fails to insert is
+        kept, unreferenced, for later uploads of the same contents.
+        """
+        storage_path = Path(self.settings.file_storage_path).expanduser()
+        (storage_path / BLOB_DIRECTORY).mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=storage_path / BLOB_DIRECTORY) as temp_dir:
+            temp_path = Path(temp_dir) / "upload"
+            reader = save_stream(stream, temp_path)
+            blob = self.blobs.find_one({"_id": reader.sha256})
+            if blob is not None:
+                return blob
+            location = self._save_blob(temp_path, filename, reader)
+        # * Concurrent uploads of the same new contents store identical copies
+        # * in the same place, and only the first one's document is inserted
+        self.blobs.update_one(
+            {"_id": reader.sha256},
+            {
+                "$setOnInsert": {
+                    "size_bytes": reader.size_bytes,
+                    "location": location,
+                    "created_at": datetime.now(),
+                    "refcount": 0,
+                }
+            },
+            upsert=True,
+        )
+        return self.blobs.find_one({"_id": reader.sha256})
+
+    def _save_blob(
+        self, temp_path: Path, filename: str, reader: HashingReader
+    ) -> Dict[str, Any]:
+        """Move a new blob's spooled contents to their storage, and return the fields locating them."""
+        if self._minio_handler is not None:
+            with temp_path.open("rb") as stream:
+                object_storage_info = self._upload_stream_to_minio(
+                    stream,
+                    filename,
+                    length=reader.size_bytes,
+                    object_name=blob_object_name(reader.sha256),
+                )
+            if object_storage_info:
+                return {**object_storage_info, "data_type": "object_storage"}
+            warnings.warn(
+                "MinIO upload failed, falling back to local file storage",
+                UserWarning,
+                stacklevel=2,
+            )
+        final_path = blob_path(
+            Path(self.settings.file_storage_path).expanduser(), reader.sha256
+        )
+        final_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path.replace(final_path)
+        return {
+            "data_type": "file",
+            "path": str(final_path),
+            "sha256": reader.sha256,
+            "size_bytes": reader.size_bytes,
+        }
+
+    def _link_blob(
+        self, datapoint_obj: DataPoint, blob: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Return the document to insert for a datapoint pointing to a blob."""
+        datapoint_dict = datapoint_obj.to_mongo()
+        datapoint_dict.update(blob["location"])
+        return datapoint_dict
+
+    def _add_blob_references(self, blob_ids: list[Optional[str]]) -> None:
+        """Count a reference to each given blob from a datapoint that has been inserted."""
+        for blob_id, references in Counter(filter(None, blob_ids)).items():
+            self.blobs.update_one({"_id": blob_id}, {"$inc": {"refcount": references}})
+
+    def _find_blobs(self, sha256s: list[str]) -> Dict[str, Dict[str, Any]]:
+        """Return the stored blobs with the given hashes that may be referenced, by hash.
+
+        Always empty unless content-addressed storage and blob references
+        are both enabled, since anyone who knows a hash can read the
+        contents it references.
+        """
+        if (
+            not self.settings.content_addressed_storage
+            or not self.settings.allow_blob_references
+            or not sha256s
+        ):
+            return {}
+        return {
+            blob["_id"]: blob
+            for blob in self.blobs.find({"_id": {"$in": sha256s}}).to_list()
+        }
+
+    def _referenced_blobs(
+        self, datapoint_objs: list[DataPoint]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Return the stored blobs that file datapoints reference by ``sha256``, by datapoint ID."""
+        file_objs = [
+            datapoint_obj
+            for datapoint_obj in datapoint_objs
+            if datapoint_obj.data_type.value == "file" and datapoint_obj.sha256
+        ]
+        blobs = self._find_blobs([datapoint_obj.sha256 for datapoint_obj in file_objs])
+        return {
+            datapoint_obj.datapoint_id: blobs[datapoint_obj.sha256]
+            for datapoint_obj in file_objs
+            if datapoint_obj.sha256 in blobs
+        }
+
     @post("/datapoint")
     async def create_datapoint(
         self, datapoint: Annotated[str, Form()], files: list[UploadFile] = []
@@ -232,73 +430,101 @@ class DataManager(AbstractManagerBase[DataManagerSettings]):
         ):
             # Handle file uploads if present
             if files:
-                for file in files:
-                    # Check if this is a file datapoint and object storage is configured
-                    if (
-                        datapoint_obj.data_type.value == "file"
-                        and self._minio_handler is not None
-                    ):
-                        # Use MinIO object storage instead of local storage
-                        # First, save file temporarily to upload to MinIO
-
-                        with tempfile.NamedTemporaryFile(
-                            delete=False, suffix=f"_{file.filename}"
-                        ) as temp_file:
-                            contents = file.file.read()
-                            temp_file.write(contents)
-                            temp_file.flush()
-                            temp_path = Path(temp_file.name)
-
-                        # Upload to object storage
-                        object_storage_info = self._upload_file_to_minio(
-                            file_path=temp_path,
-                            filename=file.filename,
-                            label=datapoint_obj.label,
-                            metadata={
-                                "original_datapoint_id": datapoint_obj.datapoint_id
-                            },
-                        )
-
-                        # Clean up temporary file
-                        self._cleanup_temp_file(temp_path)
-
-                        # If upload was successful, store object storage information in database
-                        if object_storage_info:
-                            # Create a combined dictionary with both datapoint and object storage info
-                            datapoint_dict = datapoint_obj.to_mongo()
-                            datapoint_dict.update(object_storage_info)
-                            # Update data_type to indicate this is now an object storage datapoint
-                            datapoint_dict["data_type"] = "object_storage"
-                            self.datapoints.insert_one(datapoint_dict)
-                            # Return the transformed datapoint
-                            return DataPoint.discriminate(datapoint_dict)
-                        # If MinIO upload failed, fall back to local storage
-                        warnings.warn(
-                            "MinIO upload failed, falling back to local file storage",
-                            UserWarning,
-                            stacklevel=2,
-                        )
-                    # Fallback to local storage
-                    time = datetime.now()
-                    path = self._get_storage_path(self.settings.file_storage_path, time)
-                    final_path = path / (
-                        datapoint_obj.datapoint_id + "_" + file.filename
-                    )
+                datapoint_dict, blob_id = await self._store_upload(
+                    datapoint_obj, files[0]
+                )
+                self.datapoints.insert_one(datapoint_dict)
+                self._add_blob_references([blob_id])
+                return DataPoint.discriminate(datapoint_dict)
+            # A file datapoint without a file may reference stored contents
+            if blob := self._referenced_blobs([datapoint_obj]).get(
+                datapoint_obj.datapoint_id
+            ):
+                datapoint_dict = self._link_blob(datapoint_obj, blob)
+                self.datapoints.insert_one(datapoint_dict)
+                self._add_blob_references([blob["_id"]])
+                return DataPoint.discriminate(datapoint_dict)
+            # No files - just insert the datapoint (for ValueDataPoint, etc.)
+            self.datapoints.insert_one(datapoint_obj.to_mongo())
+            return datapoint_obj
+
+    @post("/datapoints/batch")
+    async def create_datapoints(
+        self, datapoints: Annotated[str, Form()], files: list[UploadFile] = []
+    ) -> Any:
+        """Create many datapoints in one request, inserted together.
+
+        ``datapoints`` is a JSON list of datapoints. Uploaded files are matched,
+        in order, to the file datapoints in the list, one file each. With
+        content-addressed storage and blob references allowed, file
+        datapoints whose ``sha256`` matches stored contents may be sent
+        without their file, and reference the stored contents instead. Returns the stored datapoints in the order
+        they were given.
+        """
+        datapoint_objs = [
+            DataPoint.discriminate(datapoint) for datapoint in json.loads(datapoints)
+        ]
+        file_count = sum(
+            datapoint_obj.data_type.value == "file" for datapoint_obj in datapoint_objs
+        )
+        linked = {}
+        if len(files) != file_count:
+            linked = self._referenced_blobs(datapoint_objs)
+            file_count -= len(linked)
+        if len(files) != file_count:
+            return JSONResponse(
+                status_code=400,
+                content={
+                    "message": f"Expected {file_count} files for the file datapoints in the batch, got {len(files)}."
+                },
+            )
 
-                    # Reset file position and save locally
-                    file.file.seek(0)
-                    with Path.open(final_path, "wb") as f:
-                        contents = file.file.read()
-                        f.write(contents)
-                    datapoint_obj.path = str(final_path)
-                    self.datapoints.insert_one(datapoint_obj.to_mongo())
-                    return datapoint_obj
-            else:
-                # No files - just insert the datapoint (for ValueDataPoint, etc.)
-                self.datapoints.insert_one(datapoint_obj.to_mongo())
-                return datapoint_obj
+        with self.span(
+            "data.save_batch",
+            attributes={
+                "datapoint.count": len(datapoint_objs),
+                "datapoint.file_count": len(files),
+            },
+        ):
+            uploads = iter(files)
+            documents = []
+            blob_ids: list[Optional[str]] = []
+            for datapoint_obj in datapoint_objs:
+                if blob := linked.get(datapoint_obj.datapoint_id):
+                    documents.append(self._link_blob(datapoint_obj, blob))
+                    blob_ids.append(blob["_id"])
+                elif datapoint_obj.data_type.value == "file":
+                    document, blob_id = await self._store_upload(
+                        datapoint_obj, next(uploads)
+                    )
+                    documents.append(document)
+                    blob_ids.append(blob_id)
+                else:
+                    documents.append(datapoint_obj.to_mongo())
+                    blob_ids.append(None)
+            if documents:
+                try:
+                    self.datapoints.insert_many(documents)
+                except BulkWriteError as e:
+                    # * An ordered insert stops at the first failure
+                    self._add_blob_references(blob_ids[: e.details.get("nInserted", 0)])
+                    raise
+                self._add_blob_references(blob_ids)
+            return [DataPoint.discriminate(document) for document in documents]
+
+    @post("/blobs/check")
+    async def check_blobs(
+        self,
+        sha256s: list[str] = Body(),  # noqa: B008
+    ) -> list[str]:
+        """Return which of the given SHA-256 hashes have their contents stored.
 
-            return None
+        A file datapoint whose ``sha256`` is one of them can be submitted
+        without its file. Always empty unless content-addressed storage and
+        blob references are both enabled.
+        """
+        with self.span("data.check_blobs", attributes={"blob.count": len(sha256s)}):
+            return list(self._find_blobs(sha256s))
 
     @get("/datapoint/{datapoint_id}")
     async def get_datapoint(self, datapoint_id: str) -> Any:
@@ -312,26 +538,128 @@ class DataManager(AbstractManagerBase[DataManagerSettings]):
                 )
             return DataPoint.discriminate(datapoint)
 
+    @post("/datapoints/batch_get")
+    async def get_datapoints_batch(
+        self,
+        datapoint_ids: list[str] = Body(),  # noqa: B008
+    ) -> Dict[str, Any]:
+        """Look up many datapoints by ID with a single query. Unknown IDs are left out."""
+        with self.span(
+            "data.get_batch", attributes={"datapoint.count": len(datapoint_ids)}
+        ):
+            datapoint_list = self.datapoints.find(
+                {"_id": {"$in": datapoint_ids}}
+            ).to_list()
+            return {
+                datapoint["_id"]: DataPoint.discriminate(datapoint)
+                for datapoint in datapoint_list
+            }
+
     @get("/datapoint/{datapoint_id}/value")
-    async def get_datapoint_value(self, datapoint_id: str) -> Response:
-        """Returns a specific data point's value. If this is a file, it will return the file."""
+    async def get_datapoint_value(
+        self, datapoint_id: str, request: Request
+    ) -> Response:
+        """Returns a specific data point's value.
+
+        Files and objects in object storage are streamed, with ``ETag`` and
+        ``Last-Modified`` headers, and a ``Range`` header (optionally
+        conditioned by ``If-Range``) gets just that part of the content.
+        """
         with self.span("data.value", attributes={"datapoint.id": datapoint_id}):
             datapoint = self.datapoints.find_one({"_id": datapoint_id})
+            if not datapoint:
+                return JSONResponse(
+                    status_code=404,
+                    content={"message": f"Datapoint with id {datapoint_id} not found."},
+                )
             datapoint = DataPoint.discriminate(datapoint)
             if datapoint.data_type == "file":
                 return FileResponse(datapoint.path)
+            if datapoint.data_type == "object_storage":
+                return await run_in_threadpool(
+                    self._object_value_response, datapoint, request.headers
+                )
             return JSONResponse(datapoint.value)
 
+    def _object_value_response(
+        self, datapoint: ObjectStorageDataPoint, request_headers: Headers
+    ) -> Response:
+        """Stream an object storage datapoint's object, or the byte range requested."""
+        if self._minio_handler is None:
+            return JSONResponse(
+                status_code=503,
+                content={"message": "Object storage is not configured."},
+            )
+        try:
+            stat = self._minio_handler.stat_object(
+                datapoint.bucket_name, datapoint.object_name
+            )
+        except FileNotFoundError:
+            return JSONResponse(
+                status_code=404,
+                content={
+                    "message": f"Object for datapoint {datapoint.datapoint_id} not found."
+                },
+            )
+        size = stat["size_bytes"]
+        headers = {"Accept-Ranges": "bytes", "ETag": f'"{stat["etag"]}"'}
+        if stat["last_modified"] is not None:
+            headers["Last-Modified"] = format_datetime(
+                stat["last_modified"].astimezone(timezone.utc), usegmt=True
+            )
+
+        # * A Range is only honored if the object still matches If-Range
+        byte_range = None
+        if_range = request_headers.get("if-range")
+        if if_range is None or if_range in (
+            headers["ETag"],
+            headers.get("Last-Modified"),
+        ):
+            try:
+                byte_range = parse_range(request_headers.get("range"), size)
+            except RangeNotSatisfiableError:
+                return Response(
+                    status_code=416, headers={"Content-Range": f"bytes */{size}"}
+                )
+        start, end = byte_range or (0, size)
+        if byte_range is not None:
+            headers["Content-Range"] = f"bytes {start}-{end - 1}/{size}"
+        headers["Content-Length"] = str(end - start)
+        return StreamingResponse(
+            self._minio_handler.iter_object(
+                datapoint.bucket_name,
+                datapoint.object_name,
+                offset=start,
+                length=end - start,
+            ),
+            status_code=206 if byte_range is not None else 200,
+            media_type=stat["content_type"] or "application/octet-stream",
+            headers=headers,
+        )
+
     @get("/datapoints")
-    async def get_datapoints(self, number: int = 100) -> Dict[str, Any]:
-        """Get the latest datapoints"""
+    async def get_datapoints(
+        self, response: Response, number: int = 100, cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Get the latest datapoints, newest first.
+
+        When a full page is returned, the cursor for the next page is set in
+        the ``X-Next-Cursor`` response header; pass it back as ``cursor`` to
+        get the next page.
+        """
         with self.span("data.list", attributes={"datapoint.limit": number}):
+            try:
+                query = keyset_query({}, "data_timestamp", cursor)
+            except InvalidCursorError as e:
+                return JSONResponse(status_code=400, content={"message": str(e)})
             datapoint_list = (
-                self.datapoints.find({})
-                .sort("data_timestamp", -1)
+                self.datapoints.find(query)
+                .sort(keyset_sort("data_timestamp"))
                 .limit(number)
                 .to_list()
             )
+            if page_cursor := next_cursor(datapoint_list, "data_timestamp", number):
+                response.headers[NEXT_CURSOR_HEADER] = page_cursor
             return {
                 datapoint["_id"]: DataPoint.discriminate(datapoint)
                 for datapoint in datapoint_list
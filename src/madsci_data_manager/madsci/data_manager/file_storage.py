@@ -0,0 +1,93 @@
+"""Streaming storage and retrieval of datapoint files.
+
+Uploads are read in fixed-size chunks and written straight to their final
+location (a local path or an object storage upload), hashing them on the way
+through, so the Data Manager's memory use per upload is bounded no matter how
+large the file is. Downloads are likewise sent in chunks, and can be limited to
+a byte range of the file.
+"""
+
+import hashlib
+import shutil
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+BLOB_DIRECTORY = "blobs"
+
+
+class HashingReader:
+    """Wraps a binary stream, computing the SHA-256 and size of everything read through it."""
+
+    def __init__(self, stream: BinaryIO) -> None:
+        """Wrap a stream, starting from its current position."""
+        self._stream = stream
+        self._hash = hashlib.sha256()
+        self.size_bytes = 0
+
+    def read(self, size: int = -1) -> bytes:
+        """Read from the wrapped stream, adding the data to the hash."""
+        data = self._stream.read(size)
+        self._hash.update(data)
+        self.size_bytes += len(data)
+        return data
+
+    @property
+    def sha256(self) -> str:
+        """Hex digest of the data read so far."""
+        return self._hash.hexdigest()
+
+
+def save_stream(stream: BinaryIO, path: Path) -> HashingReader:
+    """Copy a stream to a file in chunks, returning the reader with its hash and size."""
+    reader = HashingReader(stream)
+    with path.open("wb") as file:
+        shutil.copyfileobj(reader, file, UPLOAD_CHUNK_SIZE)
+    return reader
+
+
+def blob_path(storage_path: Path, sha256: str) -> Path:
+    """Return where the content-addressed file with the given SHA-256 is stored locally.
+
+    Files are spread over subdirectories named for the first two hex digits
+    of their hash, to keep directories small.
+    """
+    return storage_path / BLOB_DIRECTORY / sha256[:2] / sha256
+
+
+def blob_object_name(sha256: str) -> str:
+    """Return the object storage name of the content-addressed file with the given SHA-256."""
+    return f"{BLOB_DIRECTORY}/{sha256}"
+
+
+class RangeNotSatisfiableError(ValueError):
+    """Raised when a requested byte range lies outside the content."""
+
+
+def parse_range(range_header: Optional[str], size: int) -> Optional[tuple[int, int]]:
+    """Parse a single-range ``Range`` header into a ``(start, end)`` byte range, end exclusive.
+
+    Returns None when the whole content should be sent: no header, a header
+    that isn't a single byte range, or a malformed one.
+    """
+    if not range_header or not range_header.startswith("bytes=") or "," in range_header:
+        return None
+    spec = range_header.removeprefix("bytes=").strip()
+    first, _, last = spec.partition("-")
+    try:
+        start = int(first) if first else None
+        end = int(last) if last else None
+    except ValueError:
+        return None
+    if start is None:
+        if end is None:
+            return None
+        # * Suffix range: the last `end` bytes
+        if end <= 0 or size == 0:
+            raise RangeNotSatisfiableError(range_header)
+        return max(size - end, 0), size
+    if end is not None and end < start:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiableError(range_header)
+    return start, size if end is None else min(end + 1, size)
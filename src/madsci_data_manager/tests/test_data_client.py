@@ -1,6 +1,8 @@
 """Automated pytest unit tests for the madsci data client."""
 # flake8: noqa
 
+import json
+import os
 import time
 from collections.abc import Generator
 from pathlib import Path
@@ -15,6 +17,7 @@ from madsci.common.warnings import MadsciLocalOnlyWarning
 import pytest
 import requests
 from madsci.client.data_client import DataClient
+from madsci.common.types.client_types import DataClientConfig
 from madsci.common.types.datapoint_types import (
     DataManagerSettings,
     DataPointTypeEnum,
@@ -37,10 +40,12 @@ def mongo_handler():
 
 
 @pytest.fixture
-def test_client(mongo_handler) -> TestClient:
-    """Data Server Test Client Fixture"""
+def test_client(mongo_handler, request: pytest.FixtureRequest) -> TestClient:
+    """Data Server Test Client Fixture, with any settings passed as an indirect parameter"""
     settings = DataManagerSettings(
-        manager_name="Test Data Manager", enable_registry_resolution=False
+        manager_name="Test Data Manager",
+        enable_registry_resolution=False,
+        **getattr(request, "param", {}),
     )
     manager = DataManager(
         settings=settings,
@@ -58,6 +63,8 @@ def client(test_client: TestClient) -> Generator[DataClient, None, None]:
         def add_ok_property(resp: Any) -> Any:
             if not hasattr(resp, "ok"):
                 resp.ok = resp.status_code < 400
+            if not hasattr(resp, "iter_content"):
+                resp.iter_content = lambda chunk_size=1: resp.iter_bytes(chunk_size)
             return resp
 
         def post_no_timeout(*args: Any, **kwargs: Any) -> Any:
@@ -67,6 +74,7 @@ def client(test_client: TestClient) -> Generator[DataClient, None, None]:
 
         def get_no_timeout(*args: Any, **kwargs: Any) -> Any:
             kwargs.pop("timeout", None)
+            kwargs.pop("stream", None)
             resp = test_client.get(*args, **kwargs)
             return add_ok_property(resp)
 
@@ -103,6 +111,17 @@ def test_get_datapoint_value(client: DataClient) -> None:
     assert fetched_value == "test_value"
 
 
+def test_iter_datapoints(client: DataClient) -> None:
+    """Test iterating over datapoints across several pages using DataClient"""
+    datapoints = [ValueDataPoint(label="Test", value=i) for i in range(5)]
+    for datapoint in datapoints:
+        client.submit_datapoint(datapoint)
+    iterated = list(client.iter_datapoints(page_size=2))
+    assert sorted(datapoint.datapoint_id for datapoint in iterated) == sorted(
+        datapoint.datapoint_id for datapoint in datapoints
+    )
+
+
 def test_query_datapoints(client: DataClient) -> None:
     """Test querying datapoints using DataClient"""
     datapoint = ValueDataPoint(label="Test", value="test_value")
@@ -138,6 +157,164 @@ def test_file_datapoint(client: DataClient, tmp_path: str) -> None:
     assert fetched_file_path.read_text() == "test_file"
 
 
+def test_submit_and_get_datapoints_in_batch(client: DataClient, tmp_path: Path) -> None:
+    """Test submitting and fetching several datapoints, including files, in one request each"""
+    file_path = tmp_path / "batch.txt"
+    file_path.write_text("batch_file")
+    datapoints = [
+        ValueDataPoint(label="first", value=1),
+        FileDataPoint(label="file", path=file_path),
+        ValueDataPoint(label="second", value=2),
+    ]
+    submitted = client.submit_datapoints(datapoints)
+    assert [datapoint.datapoint_id for datapoint in submitted] == [
+        datapoint.datapoint_id for datapoint in datapoints
+    ]
+    assert submitted[1].sha256 is not None
+
+    fetched = client.get_datapoints_by_ids(
+        [datapoint.datapoint_id for datapoint in datapoints] + ["missing"]
+    )
+    assert set(fetched) == {datapoint.datapoint_id for datapoint in datapoints}
+    assert client.get_datapoint_value(datapoints[1].datapoint_id) == b"batch_file"
+
+
+@pytest.mark.parametrize(
+    "test_client",
+    [{"content_addressed_storage": True, "allow_blob_references": True}],
+    indirect=True,
+)
+def test_deduplicated_uploads(client: DataClient, tmp_path: Path) -> None:
+    """Test that files whose contents the Data Manager already stores are not uploaded again"""
+    client.config.deduplicate_uploads = True
+    file_path = tmp_path / "protocol.json"
+    file_path.write_text('{"steps": []}')
+    first = client.submit_datapoint(FileDataPoint(label="protocol", path=file_path))
+    assert client.get_stored_hashes([first.sha256, "0" * 64]) == {first.sha256}
+
+    server_post = client.session.post
+    uploaded = []
+
+    def recording_post(url: str, *args: Any, **kwargs: Any) -> Any:
+        uploaded.extend(name for _, (name, _) in kwargs.get("files") or [])
+        return server_post(url, *args, **kwargs)
+
+    client.session.post = recording_post
+    second = client.submit_datapoint(FileDataPoint(label="protocol", path=file_path))
+    assert second.path == first.path
+    assert uploaded == []
+
+    other_path = tmp_path / "image.png"
+    other_path.write_bytes(b"image")
+    batch = client.submit_datapoints(
+        [
+            FileDataPoint(label="protocol", path=file_path),
+            FileDataPoint(label="image", path=other_path),
+        ]
+    )
+    assert batch[0].path == first.path
+    assert client.get_datapoint_value(batch[1].datapoint_id) == b"image"
+    assert uploaded == ["image.png"]
+
+
+def test_cached_datapoint_reads(client: DataClient, tmp_path: Path) -> None:
+    """Test that a caching DataClient reads datapoints and file values from the server only once"""
+    file_path = tmp_path / "calibration.bin"
+    content = os.urandom(2048)
+    file_path.write_bytes(content)
+    datapoint = client.submit_datapoint(
+        FileDataPoint(label="calibration", path=file_path)
+    )
+
+    caching_client = DataClient(
+        data_server_url="http://testserver",
+        config=DataClientConfig(
+            cache_enabled=True,
+            cache_dir=tmp_path / "cache",
+            cache_memory_threshold_bytes=1024,
+        ),
+    )
+    server_get = caching_client.session.get
+    requested = []
+
+    def counting_get(url: str, *args: Any, **kwargs: Any) -> Any:
+        requested.append(url)
+        return server_get(url, *args, **kwargs)
+
+    caching_client.session.get = counting_get
+    for _ in range(3):
+        value = caching_client.get_datapoint_value(datapoint.datapoint_id)
+        assert isinstance(value, bytes)
+        assert value == content
+    view = caching_client.get_datapoint_value_view(datapoint.datapoint_id)
+    assert isinstance(view, memoryview)
+    assert view[1000:1100] == content[1000:1100]
+    output = tmp_path / "saved.bin"
+    caching_client.save_datapoint_value(datapoint.datapoint_id, output)
+    assert output.read_bytes() == content
+    assert (
+        b"".join(
+            caching_client.stream_datapoint_value(datapoint.datapoint_id, offset=1000)
+        )
+        == content[1000:]
+    )
+
+    assert requested == [f"http://testserver/datapoint/{datapoint.datapoint_id}"]
+    stats = caching_client.cache_stats
+    assert stats.metadata_hits == 4
+    assert stats.value_hits == 5
+    assert stats.disk_bytes == len(content)
+    assert client.cache_stats is None
+
+
+def test_save_datapoint_value_resumes(client: DataClient, tmp_path: Path) -> None:
+    """Test that save_datapoint_value continues a partial download of a file datapoint"""
+    content = os.urandom(3 * 1024 * 1024 + 5)
+    file_path = tmp_path / "stack.bin"
+    file_path.write_bytes(content)
+    datapoint = FileDataPoint(label="Stack", path=file_path)
+    client.submit_datapoint(datapoint)
+
+    output_path = tmp_path / "downloaded.bin"
+    output_path.write_bytes(content[:1000])
+    client.save_datapoint_value(datapoint.datapoint_id, output_path, resume=True)
+    assert output_path.read_bytes() == content
+
+    # * Resuming a complete download leaves it as is
+    client.save_datapoint_value(datapoint.datapoint_id, output_path, resume=True)
+    assert output_path.read_bytes() == content
+
+    # * Without resume, the file is downloaded again from the start
+    output_path.write_bytes(b"stale")
+    client.save_datapoint_value(datapoint.datapoint_id, output_path)
+    assert output_path.read_bytes() == content
+
+
+def test_stream_datapoint_value(client: DataClient, tmp_path: Path) -> None:
+    """Test streaming a datapoint's value in chunks, from an offset"""
+    content = b"0123456789" * 100
+    file_path = tmp_path / "digits.txt"
+    file_path.write_bytes(content)
+    datapoint = FileDataPoint(label="Digits", path=file_path)
+    client.submit_datapoint(datapoint)
+
+    chunks = list(client.stream_datapoint_value(datapoint.datapoint_id, chunk_size=64))
+    assert b"".join(chunks) == content
+    assert max(len(chunk) for chunk in chunks) <= 64
+    assert (
+        b"".join(client.stream_datapoint_value(datapoint.datapoint_id, offset=995))
+        == content[995:]
+    )
+    assert not list(
+        client.stream_datapoint_value(datapoint.datapoint_id, offset=len(content))
+    )
+
+    value_datapoint = ValueDataPoint(label="Value", value={"a": 1})
+    client.submit_datapoint(value_datapoint)
+    streamed = b"".join(client.stream_datapoint_value(value_datapoint.datapoint_id))
+    assert json.loads(streamed) == {"a": 1}
+
+
 def test_local_only_dataclient(tmp_path: str) -> None:
     """Test a dataclient without a URL (i.e. local only)"""
     client = None
@@ -671,12 +848,16 @@ class TestDataClientBatchOperations:
         return client
 
     def test_get_datapoints_by_ids_success(self, mock_data_client):
-        """Test successful batch fetching of datapoints."""
+        """Test that batch fetching uses a single batch request."""
         # Setup test data
         dp1 = ValueDataPoint(value="test1", label="result1")
         dp2 = FileDataPoint(path="/test/file.txt", label="result2")
 
-        mock_data_client.get_datapoint.side_effect = [dp1, dp2]
+        mock_data_client.session = MagicMock()
+        mock_data_client.session.post.return_value.status_code = 200
+        mock_data_client.session.post.return_value.json.return_value = {
+            dp.datapoint_id: dp.model_dump(mode="json") for dp in (dp1, dp2)
+        }
 
         # Test batch fetching
         result = mock_data_client.get_datapoints_by_ids(
@@ -685,8 +866,29 @@ class TestDataClientBatchOperations:
 
         # Verify results
         assert len(result) == 2
-        assert result[dp1.datapoint_id] == dp1
-        assert result[dp2.datapoint_id] == dp2
+        assert result[dp1.datapoint_id].value == "test1"
+        assert isinstance(result[dp2.datapoint_id], FileDataPoint)
+        mock_data_client.session.post.assert_called_once()
+        assert mock_data_client.session.post.call_args.kwargs["json"] == [
+            dp1.datapoint_id,
+            dp2.datapoint_id,
+        ]
+        mock_data_client.get_datapoint.assert_not_called()
+
+    def test_get_datapoints_by_ids_without_batch_endpoint(self, mock_data_client):
+        """Test that batch fetching falls back to one request per datapoint."""
+        dp1 = ValueDataPoint(value="test1", label="result1")
+        dp2 = FileDataPoint(path="/test/file.txt", label="result2")
+
+        mock_data_client.session = MagicMock()
+        mock_data_client.session.post.return_value.status_code = 404
+        mock_data_client.get_datapoint.side_effect = [dp1, dp2]
+
+        result = mock_data_client.get_datapoints_by_ids(
+            [dp1.datapoint_id, dp2.datapoint_id]
+        )
+
+        assert result == {dp1.datapoint_id: dp1, dp2.datapoint_id: dp2}
         assert mock_data_client.get_datapoint.call_count == 2
 
     def test_get_datapoints_by_ids_empty_list(self, mock_data_client):
@@ -5,25 +5,33 @@ Uses in-memory MongoDB handler for fast, Docker-free tests.
 """
 # ruff: noqa: T201, S603, S607, S106, PLC0415, RET504
 
+import hashlib
+import io
+import json
+import os
 import shutil
 import socket
 import subprocess
 import tempfile
 import time
+from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 import requests
 from fastapi.testclient import TestClient
+from madsci.common.db_handlers.minio_handler import InMemoryMinioHandler
 from madsci.common.db_handlers.mongo_handler import InMemoryMongoHandler
 from madsci.common.types.datapoint_types import (
     DataManagerSettings,
+    DataPoint,
     FileDataPoint,
     ObjectStorageSettings,
     ValueDataPoint,
 )
 from madsci.data_manager.data_server import DataManager
+from madsci.data_manager.file_storage import UPLOAD_CHUNK_SIZE, save_stream
 
 
 @pytest.fixture()
@@ -110,6 +118,330 @@ def test_roundtrip_file_datapoint(test_client: TestClient, tmp_path: Path) -> No
     assert value.content == b"test"
 
 
+def test_file_datapoint_records_hash_and_size(
+    test_client: TestClient, tmp_path: Path
+) -> None:
+    """
+    Test that a stored file's SHA-256 and size are recorded as it is streamed to disk.
+    """
+    content = os.urandom(3 * UPLOAD_CHUNK_SIZE + 17)
+    test_file = tmp_path / "stack.tiff"
+    test_file.write_bytes(content)
+    test_datapoint = FileDataPoint(label="stack", path=test_file)
+    with test_file.open("rb") as f:
+        result = test_client.post(
+            "/datapoint",
+            data={"datapoint": test_datapoint.model_dump_json()},
+            files={("files", ("stack.tiff", f))},
+        ).json()
+
+    stored = FileDataPoint.model_validate(result)
+    assert stored.sha256 == hashlib.sha256(content).hexdigest()
+    assert stored.size_bytes == len(content)
+    assert Path(stored.path).read_bytes() == content
+    value = test_client.get(f"/datapoint/{test_datapoint.datapoint_id}/value")
+    assert value.content == content
+
+
+def test_file_datapoint_value_range(test_client: TestClient, tmp_path: Path) -> None:
+    """
+    Test that a file datapoint's value honors Range requests and sends validators.
+    """
+    test_file = tmp_path / "digits.txt"
+    test_file.write_bytes(b"0123456789")
+    test_datapoint = FileDataPoint(label="digits", path=test_file)
+    with test_file.open("rb") as f:
+        test_client.post(
+            "/datapoint",
+            data={"datapoint": test_datapoint.model_dump_json()},
+            files={("files", ("digits.txt", f))},
+        )
+
+    url = f"/datapoint/{test_datapoint.datapoint_id}/value"
+    full = test_client.get(url)
+    assert "etag" in full.headers
+    assert "last-modified" in full.headers
+    partial = test_client.get(url, headers={"Range": "bytes=4-"})
+    assert partial.status_code == 206
+    assert partial.content == b"456789"
+
+
+def test_object_storage_datapoint_value_range(mongo_handler, tmp_path: Path) -> None:
+    """
+    Test that object storage datapoint values are streamed from storage, honoring Range and If-Range.
+    """
+    manager = DataManager(
+        settings=DataManagerSettings(
+            manager_name="test_data_manager_with_storage",
+            enable_registry_resolution=False,
+        ),
+        mongo_handler=mongo_handler,
+        minio_handler=InMemoryMinioHandler(),
+    )
+    test_client = TestClient(manager.create_server())
+    content = bytes(range(256)) * 4
+    test_file = tmp_path / "stack.bin"
+    test_file.write_bytes(content)
+    test_datapoint = FileDataPoint(label="stack", path=test_file)
+    with test_file.open("rb") as f:
+        result = test_client.post(
+            "/datapoint",
+            data={"datapoint": test_datapoint.model_dump_json()},
+            files={("files", ("stack.bin", f))},
+        ).json()
+    assert result["data_type"] == "object_storage"
+    assert result["sha256"] == hashlib.sha256(content).hexdigest()
+
+    url = f"/datapoint/{test_datapoint.datapoint_id}/value"
+    full = test_client.get(url)
+    assert full.status_code == 200
+    assert full.content == content
+    assert full.headers["accept-ranges"] == "bytes"
+    etag = full.headers["etag"]
+    assert "last-modified" in full.headers
+
+    partial = test_client.get(url, headers={"Range": "bytes=100-199"})
+    assert partial.status_code == 206
+    assert partial.content == content[100:200]
+    assert partial.headers["content-range"] == f"bytes 100-199/{len(content)}"
+
+    suffix = test_client.get(url, headers={"Range": "bytes=-10", "If-Range": etag})
+    assert suffix.status_code == 206
+    assert suffix.content == content[-10:]
+
+    changed = test_client.get(url, headers={"Range": "bytes=0-9", "If-Range": '"old"'})
+    assert changed.status_code == 200
+    assert changed.content == content
+
+    unsatisfiable = test_client.get(url, headers={"Range": f"bytes={len(content)}-"})
+    assert unsatisfiable.status_code == 416
+    assert unsatisfiable.headers["content-range"] == f"bytes */{len(content)}"
+
+    assert test_client.get("/datapoint/missing/value").status_code == 404
+
+
+def test_save_stream_reads_in_chunks(tmp_path: Path) -> None:
+    """
+    Test that save_stream never reads more than one chunk at a time.
+    """
+    content = b"x" * (2 * UPLOAD_CHUNK_SIZE + 1)
+    source = io.BytesIO(content)
+    read_sizes = []
+    original_read = source.read
+
+    def read(size: int = -1) -> bytes:
+        read_sizes.append(size)
+        return original_read(size)
+
+    source.read = read
+    reader = save_stream(source, tmp_path / "out.bin")
+    assert (tmp_path / "out.bin").read_bytes() == content
+    assert reader.size_bytes == len(content)
+    assert all(0 < size <= UPLOAD_CHUNK_SIZE for size in read_sizes)
+
+
+def test_batch_datapoints(test_client: TestClient, tmp_path: Path) -> None:
+    """
+    Test creating several datapoints, with files, in one request, and fetching them back in one request.
+    """
+    test_file = tmp_path / "batch.txt"
+    test_file.write_text("batch contents")
+    value_datapoint = ValueDataPoint(label="value", value={"reading": 3})
+    file_datapoint = FileDataPoint(label="file", path=test_file)
+    datapoints = json.dumps(
+        [
+            value_datapoint.model_dump(mode="json"),
+            file_datapoint.model_dump(mode="json"),
+        ]
+    )
+
+    # * Every file datapoint needs a file
+    result = test_client.post("/datapoints/batch", data={"datapoints": datapoints})
+    assert result.status_code == 400
+
+    with test_file.open("rb") as f:
+        result = test_client.post(
+            "/datapoints/batch",
+            data={"datapoints": datapoints},
+            files=[("files", ("batch.txt", f))],
+        )
+    assert result.status_code == 200
+    stored = [DataPoint.discriminate(datapoint) for datapoint in result.json()]
+    assert [datapoint.datapoint_id for datapoint in stored] == [
+        value_datapoint.datapoint_id,
+        file_datapoint.datapoint_id,
+    ]
+    assert Path(stored[1].path).read_text() == "batch contents"
+
+    result = test_client.post(
+        "/datapoints/batch_get",
+        json=[value_datapoint.datapoint_id, file_datapoint.datapoint_id, "missing"],
+    )
+    assert result.status_code == 200
+    fetched = result.json()
+    assert set(fetched) == {value_datapoint.datapoint_id, file_datapoint.datapoint_id}
+    assert fetched[value_datapoint.datapoint_id]["value"] == {"reading": 3}
+
+
+def test_content_addressed_storage(mongo_handler, tmp_path: Path) -> None:
+    """
+    Test that identical uploads share one stored file, and that stored contents can be referenced by hash instead of uploaded.
+    """
+    manager = DataManager(
+        settings=DataManagerSettings(
+            manager_name="test_data_manager_content_addressed",
+            enable_registry_resolution=False,
+            file_storage_path=tmp_path / "storage",
+            content_addressed_storage=True,
+            allow_blob_references=True,
+        ),
+        mongo_handler=mongo_handler,
+    )
+    test_client = TestClient(manager.create_server())
+    content = b"reference image" * 100
+    sha256 = hashlib.sha256(content).hexdigest()
+    test_file = tmp_path / "reference.png"
+    test_file.write_bytes(content)
+
+    assert test_client.post("/blobs/check", json=[sha256]).json() == []
+    stored = []
+    for _ in range(2):
+        test_datapoint = FileDataPoint(label="reference", path=test_file)
+        with test_file.open("rb") as f:
+            result = test_client.post(
+                "/datapoint",
+                data={"datapoint": test_datapoint.model_dump_json()},
+                files={("files", ("reference.png", f))},
+            )
+        assert result.status_code == 200
+        stored.append(DataPoint.discriminate(result.json()))
+    assert stored[0].path == stored[1].path
+    assert stored[0].sha256 == sha256
+    assert test_client.post("/blobs/check", json=[sha256, "0" * 64]).json() == [sha256]
+
+    # * Datapoints sent without their file reference the stored contents
+    linked = FileDataPoint(label="reference", path=test_file, sha256=sha256)
+    result = test_client.post(
+        "/datapoint", data={"datapoint": linked.model_dump_json()}
+    )
+    assert result.json()["path"] == stored[0].path
+    other_file = tmp_path / "other.txt"
+    other_file.write_text("other contents")
+    batch_linked = FileDataPoint(label="reference", path=test_file, sha256=sha256)
+    batch_uploaded = FileDataPoint(label="other", path=other_file)
+    with other_file.open("rb") as f:
+        result = test_client.post(
+            "/datapoints/batch",
+            data={
+                "datapoints": json.dumps(
+                    [
+                        batch_linked.model_dump(mode="json"),
+                        batch_uploaded.model_dump(mode="json"),
+                    ]
+                )
+            },
+            files=[("files", ("other.txt", f))],
+        )
+    assert result.status_code == 200
+    batch = [DataPoint.discriminate(datapoint) for datapoint in result.json()]
+    assert batch[0].path == stored[0].path
+    assert Path(batch[1].path).read_text() == "other contents"
+
+    value = test_client.get(f"/datapoint/{linked.datapoint_id}/value")
+    assert value.content == content
+    assert manager.blobs.find_one({"_id": sha256})["refcount"] == 4
+    blob_files = [path for path in (tmp_path / "storage").rglob("*") if path.is_file()]
+    assert len(blob_files) == 2
+
+    # * References are only counted once the datapoint is inserted
+    failing = FileDataPoint(label="reference", path=test_file, sha256=sha256)
+    with (
+        patch.object(
+            manager.datapoints, "insert_one", side_effect=RuntimeError("db down")
+        ),
+        pytest.raises(RuntimeError),
+    ):
+        test_client.post("/datapoint", data={"datapoint": failing.model_dump_json()})
+    assert manager.blobs.find_one({"_id": sha256})["refcount"] == 4
+
+
+def test_blob_references_disabled(mongo_handler, tmp_path: Path) -> None:
+    """
+    Test that stored contents can't be found or referenced by hash unless blob references are allowed.
+    """
+    manager = DataManager(
+        settings=DataManagerSettings(
+            manager_name="test_data_manager_blob_references",
+            enable_registry_resolution=False,
+            file_storage_path=tmp_path / "storage",
+            content_addressed_storage=True,
+        ),
+        mongo_handler=mongo_handler,
+    )
+    test_client = TestClient(manager.create_server())
+    secret = tmp_path / "secret.bin"
+    secret.write_bytes(b"secret contents")
+    sha256 = hashlib.sha256(b"secret contents").hexdigest()
+    with secret.open("rb") as f:
+        stored = test_client.post(
+            "/datapoint",
+            data={
+                "datapoint": FileDataPoint(
+                    label="secret", path=secret
+                ).model_dump_json()
+            },
+            files={("files", ("secret.bin", f))},
+        ).json()
+
+    assert test_client.post("/blobs/check", json=[sha256]).json() == []
+    guessed = FileDataPoint(label="guess", path=tmp_path / "guess.bin", sha256=sha256)
+    result = test_client.post(
+        "/datapoint", data={"datapoint": guessed.model_dump_json()}
+    )
+    assert result.json()["path"] != stored["path"]
+    assert manager.blobs.find_one({"_id": sha256})["refcount"] == 1
+
+
+def test_content_addressed_object_storage(mongo_handler, tmp_path: Path) -> None:
+    """
+    Test that identical uploads to object storage are stored once, under their hash.
+    """
+    minio_handler = InMemoryMinioHandler()
+    manager = DataManager(
+        settings=DataManagerSettings(
+            manager_name="test_data_manager_content_addressed_storage",
+            enable_registry_resolution=False,
+            file_storage_path=tmp_path / "storage",
+            content_addressed_storage=True,
+        ),
+        mongo_handler=mongo_handler,
+        minio_handler=minio_handler,
+    )
+    test_client = TestClient(manager.create_server())
+    content = os.urandom(4096)
+    sha256 = hashlib.sha256(content).hexdigest()
+    test_file = tmp_path / "protocol.bin"
+    test_file.write_bytes(content)
+
+    stored = []
+    for label in ("first", "second"):
+        test_datapoint = FileDataPoint(label=label, path=test_file)
+        with test_file.open("rb") as f:
+            stored.append(
+                test_client.post(
+                    "/datapoint",
+                    data={"datapoint": test_datapoint.model_dump_json()},
+                    files={("files", ("protocol.bin", f))},
+                ).json()
+            )
+    assert [datapoint["data_type"] for datapoint in stored] == ["object_storage"] * 2
+    assert {datapoint["object_name"] for datapoint in stored} == {f"blobs/{sha256}"}
+    assert [datapoint["label"] for datapoint in stored] == ["first", "second"]
+    assert len(minio_handler._objects) == 1
+    value = test_client.get(f"/datapoint/{test_datapoint.datapoint_id}/value")
+    assert value.content == content
+
+
 def test_get_datapoints(test_client: TestClient) -> None:
     """
     Test that we can retrieve all datapoints and they are returned as a dictionary in reverse-chronological order, with the correct number of datapoints.
@@ -135,6 +467,51 @@ def test_get_datapoints(test_client: TestClient) -> None:
         previous_timestamp = datapoint.data_timestamp.timestamp()
 
 
+def test_get_datapoints_cursor_pagination(test_client: TestClient) -> None:
+    """
+    Test that following next-page cursors returns every datapoint once, newest first.
+    """
+    start = datetime(2025, 1, 1, 12)
+    created = []
+    # * Three datapoints share a timestamp, so a page boundary falls between them
+    for i, minutes in enumerate([0, 1, 2, 2, 2, 3, 4]):
+        datapoint = ValueDataPoint(
+            label="test_" + str(i),
+            value=i,
+            data_timestamp=start + timedelta(minutes=minutes),
+        )
+        test_client.post("/datapoint", data={"datapoint": datapoint.model_dump_json()})
+        created.append(datapoint)
+
+    pages = []
+    params = {"number": 3}
+    while True:
+        response = test_client.get("/datapoints", params=params)
+        assert response.status_code == 200
+        pages.append(list(response.json()))
+        if "X-Next-Cursor" not in response.headers:
+            break
+        params["cursor"] = response.headers["X-Next-Cursor"]
+
+    expected = sorted(
+        created,
+        key=lambda datapoint: (datapoint.data_timestamp, datapoint.datapoint_id),
+        reverse=True,
+    )
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert [datapoint_id for page in pages for datapoint_id in page] == [
+        datapoint.datapoint_id for datapoint in expected
+    ]
+
+
+def test_get_datapoints_invalid_cursor(test_client: TestClient) -> None:
+    """
+    Test that a malformed cursor is rejected.
+    """
+    response = test_client.get("/datapoints", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
 def test_query_datapoints(test_client: TestClient, test_manager: DataManager) -> None:
     """
     Test querying events based on a selector.
@@ -441,7 +818,7 @@ def test_file_datapoint_with_minio(mongo_handler, tmp_path: Path) -> None:
     # Create mock objects
     mock_minio_client = MagicMock()
     mock_minio_client.bucket_exists.return_value = True
-    mock_minio_client.fput_object.return_value = MagicMock(etag="test-etag-123")
+    mock_minio_client.put_object.return_value = MagicMock(etag="test-etag-123")
 
     # Mock the Minio class where it's imported in your server code
     with patch(
@@ -494,13 +871,15 @@ def test_file_datapoint_with_minio(mongo_handler, tmp_path: Path) -> None:
 
         # Verify MinIO client methods were called via the RealMinioHandler
         mock_minio_client.bucket_exists.assert_called_with("madsci-test")
-        mock_minio_client.fput_object.assert_called_once()
+        mock_minio_client.put_object.assert_called_once()
 
-        # Verify the fput_object call arguments
-        call_args = mock_minio_client.fput_object.call_args
+        # Verify the upload was streamed, not staged in a temporary file
+        call_args = mock_minio_client.put_object.call_args
         assert call_args[1]["bucket_name"] == "madsci-test"
         assert call_args[1]["object_name"] == "test_minio_file"
         assert call_args[1]["content_type"] == "text/plain"
+        assert call_args[1]["length"] == len("test content for minio")
+        mock_minio_client.fput_object.assert_not_called()
 
         # Verify the returned datapoint has object storage fields and correct data_type
         assert result["data_type"] == "object_storage"
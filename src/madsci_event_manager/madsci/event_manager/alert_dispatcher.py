@@ -0,0 +1,296 @@
+"""Background dispatch of email alerts, off the event ingestion path.
+
+Ingestion routes only queue alerts; a single worker thread sends them over a
+reused SMTP connection. Identical alerts raised in quick succession (a
+flapping node, say) are coalesced into one follow-up summary, and each
+recipient is rate-limited, so an alert storm costs a handful of emails and
+never an SMTP round trip inside a request.
+"""
+
+import json
+import queue
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from madsci.client.event_client import EventClient
+from madsci.common.types.auth_types import OwnershipInfo
+from madsci.common.types.event_types import (
+    EmailAlertsConfig,
+    Event,
+    EventManagerSettings,
+    EventType,
+)
+from madsci.event_manager.notifications import EmailAlerts
+from opentelemetry import metrics
+from pydantic import BaseModel
+
+_STOP = object()
+RECENT_ALERT_IDS = 10_000
+
+
+class AlertDispatcherStats(BaseModel):
+    """Counters describing an AlertDispatcher's activity."""
+
+    queued: int = 0
+    """Number of alerts currently waiting to be processed."""
+    sent: int = 0
+    """Number of alert emails sent, counting each recipient separately."""
+    failed: int = 0
+    """Number of alert emails that could not be sent."""
+    dropped: int = 0
+    """Number of alerts discarded because the queue was full or the dispatcher was closed."""
+    duplicates: int = 0
+    """Number of alerts skipped because an event with the same ID was already alerted on."""
+    coalesced: int = 0
+    """Number of alerts folded into a summary of identical alerts instead of sent individually."""
+    rate_limited: int = 0
+    """Number of alert emails skipped because the recipient's rate limit was reached."""
+
+
+@dataclass
+class _CoalesceWindow:
+    """Identical alerts held back since the last email for them."""
+
+    closes_at: float
+    suppressed: int = 0
+    latest: Optional[Event] = None
+
+
+def alert_key(event: Event) -> tuple[Any, ...]:
+    """Return the key under which identical alerts are coalesced."""
+    data = event.event_data
+    if isinstance(data, dict) and "message" in data:
+        data = data["message"]
+    source = tuple(getattr(event.source, field) for field in OwnershipInfo.model_fields)
+    return (
+        event.event_type,
+        int(event.log_level),
+        source,
+        json.dumps(data, sort_keys=True, default=str),
+    )
+
+
+class AlertDispatcher:
+    """Queues alert events and emails them from a single background worker.
+
+    The first alert for a given key is sent right away. Identical alerts
+    within the next ``alert_coalesce_seconds`` are counted, and when the
+    window closes one summary email reports how many there were, along with
+    the latest of them.
+    """
+
+    def __init__(
+        self,
+        settings: EventManagerSettings,
+        email_config: EmailAlertsConfig,
+        logger: Optional[EventClient] = None,
+        name: str = "alert_dispatcher",
+    ) -> None:
+        """Start the background worker.
+
+        Args:
+            settings: The event manager settings to take queue, coalescing, and rate limit settings from.
+            email_config: The email alert configuration, including recipients.
+            logger: The logger to report send failures to.
+            name: The name of the worker thread.
+        """
+        self.settings = settings
+        self.logger = logger or EventClient()
+        self._email = EmailAlerts(
+            config=email_config, logger=self.logger, reuse_connection=True
+        )
+        self._queue: queue.Queue = queue.Queue(maxsize=settings.alert_queue_size)
+        self._stats = AlertDispatcherStats()
+        self._stats_lock = threading.Lock()
+        self._closed = threading.Event()
+        # * Held while queueing, so nothing can be queued behind the stop sentinel
+        self._submit_lock = threading.Lock()
+        # * Only touched by the worker thread
+        self._recent_ids: OrderedDict[str, None] = OrderedDict()
+        self._windows: dict[tuple[Any, ...], _CoalesceWindow] = {}
+        self._recipient_sends: dict[str, deque[float]] = {}
+
+        meter = metrics.get_meter("madsci.event_manager")
+        self._dropped_counter = meter.create_counter(
+            name="madsci.event.alerts_dropped",
+            description="Number of alerts dropped because the alert queue was full",
+            unit="1",
+        )
+        meter.create_observable_gauge(
+            name="madsci.event.alert_queue_depth",
+            callbacks=[self._observe_queue_depth],
+            description="Number of alerts waiting to be sent",
+            unit="1",
+        )
+
+        if not email_config.email_addresses:
+            self.logger.warning(
+                "No email addresses configured for alerts",
+                event_type=EventType.MANAGER_ERROR,
+            )
+        self._worker = threading.Thread(target=self._run, name=name, daemon=True)
+        self._worker.start()
+
+    @property
+    def stats(self) -> AlertDispatcherStats:
+        """A snapshot of the dispatcher's counters."""
+        with self._stats_lock:
+            return self._stats.model_copy(update={"queued": self._queue.qsize()})
+
+    def _count(self, counter: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            setattr(self._stats, counter, getattr(self._stats, counter) + amount)
+
+    def _observe_queue_depth(self, _options: Any) -> list[metrics.Observation]:
+        return [metrics.Observation(self._queue.qsize())]
+
+    def submit(self, event: Event) -> bool:
+        """Queue an alert without waiting, returning False if it was dropped."""
+        with self._submit_lock:
+            if not self._closed.is_set():
+                try:
+                    self._queue.put_nowait(event)
+                    return True
+                except queue.Full:
+                    pass
+        self._count("dropped")
+        self._dropped_counter.add(1)
+        return False
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued alert has been processed, returning False on timeout.
+
+        Summaries of coalesced alerts are still sent when their windows close.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Stop accepting alerts, send everything queued or coalesced, and stop the worker."""
+        with self._submit_lock:
+            if self._closed.is_set():
+                return
+            self._closed.set()
+            self._queue.put(_STOP)
+        self._worker.join(timeout)
+
+    def _run(self) -> None:
+        """Process alerts and close coalescing windows until closed."""
+        while True:
+            item = self._next_alert()
+            try:
+                if item is _STOP:
+                    self._close_windows(force=True)
+                    self._email.close()
+                    return
+                if item is not None:
+                    self._handle(item)
+                self._close_windows()
+            except Exception as e:
+                self.logger.error(
+                    "Failed to dispatch alert",
+                    event_type=EventType.MANAGER_ERROR,
+                    error=str(e),
+                )
+            finally:
+                if item is not None:
+                    self._queue.task_done()
+
+    def _next_alert(self) -> Any:
+        """Wait for the next alert, or None once the earliest coalescing window closes."""
+        if not self._windows:
+            return self._queue.get()
+        closes_at = min(window.closes_at for window in self._windows.values())
+        try:
+            return self._queue.get(timeout=max(closes_at - time.monotonic(), 0))
+        except queue.Empty:
+            return None
+
+    def _handle(self, event: Event) -> None:
+        """Send an alert, or fold it into an open window of identical alerts."""
+        if event.event_id in self._recent_ids:
+            self._count("duplicates")
+            return
+        self._recent_ids[event.event_id] = None
+        if len(self._recent_ids) > RECENT_ALERT_IDS:
+            self._recent_ids.popitem(last=False)
+
+        key = alert_key(event)
+        window = self._windows.get(key)
+        if window is not None:
+            window.suppressed += 1
+            window.latest = event
+            self._count("coalesced")
+            return
+        self._send(event)
+        if self.settings.alert_coalesce_seconds > 0:
+            self._windows[key] = _CoalesceWindow(
+                closes_at=time.monotonic() + self.settings.alert_coalesce_seconds
+            )
+
+    def _close_windows(self, force: bool = False) -> None:
+        """Send a summary for each closed window that held back alerts.
+
+        A window that held back alerts is reopened after its summary, so a
+        sustained storm produces one summary per window.
+        """
+        now = time.monotonic()
+        for key, window in list(self._windows.items()):
+            if not force and window.closes_at > now:
+                continue
+            if window.suppressed and window.latest is not None:
+                self._send(window.latest, repeated=window.suppressed)
+            if window.suppressed and not force:
+                self._windows[key] = _CoalesceWindow(
+                    closes_at=now + self.settings.alert_coalesce_seconds
+                )
+            else:
+                del self._windows[key]
+
+    def _send(self, event: Event, repeated: int = 0) -> None:
+        """Email an alert to every configured recipient under their rate limit."""
+        subject = f"ALERT ({event.log_level}): {event.event_type}"
+        body = event.model_dump_json(indent=2)
+        if repeated:
+            subject += f" (repeated {repeated} times)"
+            body = (
+                f"This alert was raised {repeated} more times in the last "
+                f"{self.settings.alert_coalesce_seconds:g} seconds. "
+                f"The latest occurrence:\n\n{body}"
+            )
+        for email_address in self._email.config.email_addresses:
+            if not self._allow(email_address):
+                self._count("rate_limited")
+                continue
+            if self._email.send_email(
+                subject=subject,
+                email_address=email_address,
+                body=body,
+                headers={"X-MADSci-Event-ID": event.event_id},
+            ):
+                self._count("sent")
+            else:
+                self._count("failed")
+
+    def _allow(self, email_address: str) -> bool:
+        """Record a send to a recipient, unless it would exceed their rate limit."""
+        limit = self.settings.alert_rate_limit
+        if not limit:
+            return True
+        now = time.monotonic()
+        sends = self._recipient_sends.setdefault(email_address, deque())
+        while sends and sends[0] <= now - self.settings.alert_rate_limit_period_seconds:
+            sends.popleft()
+        if len(sends) >= limit:
+            return False
+        sends.append(now)
+        return True
@@ -0,0 +1,108 @@
+"""Streaming export of raw events as CSV or NDJSON."""
+
+import csv
+import io
+import json
+import zlib
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Literal
+
+EventExportFormat = Literal["csv", "ndjson"]
+
+EXPORT_BATCH_SIZE = 1000
+# Event fields included in exports; event_time and archive bookkeeping are left out
+EXPORT_FIELDS = [
+    "event_type",
+    "log_level",
+    "alert",
+    "event_timestamp",
+    "source",
+    "event_data",
+    "trace_id",
+    "span_id",
+]
+EXPORT_PROJECTION = dict.fromkeys(EXPORT_FIELDS, 1)
+CSV_COLUMNS = ["event_id", *EXPORT_FIELDS]
+EXPORT_MEDIA_TYPES = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+
+def export_filename(export_format: EventExportFormat, compress: bool) -> str:
+    """Return the download filename for an export."""
+    return f"events.{export_format}" + (".gz" if compress else "")
+
+
+def export_media_type(export_format: EventExportFormat, compress: bool) -> str:
+    """Return the media type of an export's body."""
+    return "application/gzip" if compress else EXPORT_MEDIA_TYPES[export_format]
+
+
+def next_batch(
+    documents: Iterator[Dict[str, Any]], size: int = EXPORT_BATCH_SIZE
+) -> List[Dict[str, Any]]:
+    """Read up to ``size`` documents from a cursor iterator."""
+    return list(islice(documents, size))
+
+
+class EventExportEncoder:
+    """Encodes batches of event documents as CSV or NDJSON, optionally gzipped.
+
+    Only one batch is held at a time, so an export of any size is encoded in
+    constant memory.
+    """
+
+    def __init__(
+        self, export_format: EventExportFormat, compress: bool = False
+    ) -> None:
+        """Create an encoder for one export."""
+        self.export_format = export_format
+        # * wbits=31 writes a gzip header and trailer rather than a raw zlib stream
+        self._compressor = zlib.compressobj(wbits=31) if compress else None
+        self._header_written = False
+
+    def encode(self, documents: List[Dict[str, Any]]) -> bytes:
+        """Encode a batch of event documents."""
+        if self.export_format == "csv":
+            text = self._encode_csv(documents)
+        else:
+            text = "".join(
+                json.dumps(self._record(document), default=str) + "\n"
+                for document in documents
+            )
+        data = text.encode("utf-8")
+        return self._compressor.compress(data) if self._compressor else data
+
+    def finish(self) -> bytes:
+        """Return any bytes still buffered once every batch has been encoded."""
+        if self.export_format == "csv" and not self._header_written:
+            # * An empty CSV export still gets its header row
+            data = self.encode([])
+        else:
+            data = b""
+        return data + self._compressor.flush() if self._compressor else data
+
+    def _encode_csv(self, documents: List[Dict[str, Any]]) -> str:
+        """Encode a batch as CSV rows, with the header before the first batch."""
+        output = io.StringIO()
+        writer = csv.writer(output)
+        if not self._header_written:
+            writer.writerow(CSV_COLUMNS)
+            self._header_written = True
+        for document in documents:
+            record = self._record(document)
+            writer.writerow(
+                [
+                    json.dumps(value, default=str)
+                    if isinstance(value, (dict, list))
+                    else ("" if value is None else value)
+                    for value in (record[column] for column in CSV_COLUMNS)
+                ]
+            )
+        return output.getvalue()
+
+    @staticmethod
+    def _record(document: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert an event document to an export record keyed by event_id."""
+        return {
+            "event_id": str(document.get("_id", "")),
+            **{field: document.get(field) for field in EXPORT_FIELDS},
+        }
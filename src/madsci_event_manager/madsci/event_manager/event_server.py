@@ -1,7 +1,9 @@
 """Example Event Manager implementation using the new AbstractManagerBase class."""
 
 import asyncio
+import functools
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager, suppress
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -9,23 +11,34 @@ from typing import (
     TYPE_CHECKING,
     Any,
     AsyncGenerator,
+    Callable,
     Dict,
     List,
     Optional,
+    Set,
     Tuple,
+    TypeVar,
     Union,
 )
 
 from classy_fastapi import delete, get, post
-from fastapi import FastAPI, Query
+from fastapi import FastAPI, Header, Query
 from fastapi.exceptions import HTTPException
 from fastapi.params import Body
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from madsci.client.event_client import EventClient
 from madsci.common.backup_tools import MongoDBBackupTool
 from madsci.common.db_handlers.mongo_handler import MongoHandler, PyMongoHandler
 from madsci.common.manager_base import AbstractManagerBase
 from madsci.common.mongodb_version_checker import MongoDBVersionChecker
+from madsci.common.pagination import (
+    NEXT_CURSOR_HEADER,
+    InvalidCursorError,
+    encode_cursor,
+    keyset_query,
+    keyset_sort,
+    next_cursor,
+)
 from madsci.common.types.backup_types import MongoDBBackupSettings
 from madsci.common.types.event_types import (
     Event,
@@ -35,15 +48,44 @@ from madsci.common.types.event_types import (
     EventType,
 )
 from madsci.common.types.mongodb_migration_types import MongoDBMigrationSettings
+from madsci.common.utils import to_naive_utc
+from madsci.event_manager.alert_dispatcher import (
+    AlertDispatcher,
+    AlertDispatcherStats,
+)
+from madsci.event_manager.event_export import (
+    EXPORT_PROJECTION,
+    EventExportEncoder,
+    EventExportFormat,
+    export_filename,
+    export_media_type,
+    next_batch,
+)
+from madsci.event_manager.event_stream import (
+    KEEPALIVE_COMMENT,
+    REPLAY_BATCH_SIZE,
+    EventBroadcaster,
+    EventSubscription,
+    format_sse,
+)
 from madsci.event_manager.events_csv_exporter import CSVExporter
-from madsci.event_manager.notifications import EmailAlerts
 from madsci.event_manager.time_series_analyzer import TimeSeriesAnalyzer
 from madsci.event_manager.utilization_analyzer import UtilizationAnalyzer
+from madsci.event_manager.utilization_rollups import (
+    UtilizationRollups,
+    mark_late_events,
+)
 from pydantic import BaseModel, model_validator
 
 if TYPE_CHECKING:
     from pymongo.synchronous.database import Database
 
+DUPLICATE_KEY_ERROR_CODE = 11000
+# Seconds to wait at shutdown for queued alerts to be sent
+ALERT_SHUTDOWN_TIMEOUT = 30.0
+
+T = TypeVar("T")
+
 # =============================================================================
 # Request/Response Models for new endpoints
 # =============================================================================
@@ -81,6 +123,13 @@ class PurgeEventsResponse(BaseModel):
     message: str
 
 
+class EventBatchResponse(BaseModel):
+    """Response model for batched event ingestion."""
+
+    inserted_count: int
+    duplicate_count: int
+
+
 class BackupRequest(BaseModel):
     """Request model for backup creation."""
 
@@ -126,6 +175,27 @@ class EventManager(AbstractManagerBase[EventManagerSettings]):
         self._db_connection = db_connection
         super().__init__(settings=settings, **kwargs)
 
+        # Blocking database calls run on these pools instead of the event loop.
+        # Long-running work gets its own pool so it can't hold up ingestion.
+        self._db_executor = ThreadPoolExecutor(
+            max_workers=self.settings.db_workers, thread_name_prefix="event_db"
+        )
+        self._report_executor = ThreadPoolExecutor(
+            max_workers=self.settings.report_workers,
+            thread_name_prefix="event_report",
+        )
+        # Newly stored events are pushed to /events/stream subscribers
+        self.event_stream = EventBroadcaster(self.settings.stream_queue_size)
+        # Alerts are emailed from a background worker, off the ingestion path
+        self.alert_dispatcher: Optional[AlertDispatcher] = None
+        if self.settings.email_alerts:
+            self.alert_dispatcher = AlertDispatcher(
+                self.settings,
+                self.settings.email_alerts,
+                logger=self.logger,
+                name=f"{self.settings.manager_name}.alert_dispatcher",
+            )
+
         # Initialize database connection and collections
         self._setup_database()
 
@@ -194,6 +264,9 @@ class EventManager(AbstractManagerBase[EventManagerSettings]):
                 self._mongo_handler = PyMongoHandler(self._db_connection)
 
         self.events = self._mongo_handler.get_collection(self.settings.collection_name)
+        self.rollups_collection = self._mongo_handler.get_collection(
+            self.settings.rollup_collection_name
+        )
 
         # Setup indexes for retention and query performance
         self._setup_indexes()
@@ -203,9 +276,15 @@ class EventManager(AbstractManagerBase[EventManagerSettings]):
         try:
             # Standard indexes for query performance
             self.events.create_index("event_timestamp")
+            self.events.create_index("event_time")
+            self.events.create_index([("event_time", 1), ("_id", 1)])
+            self.events.create_index([("event_type", 1), ("event_time", 1)])
+            self.events.create_index([("source.node_id", 1), ("event_time", 1)])
             self.events.create_index("log_level")
             self.events.create_index("archived")
             self.events.create_index([("archived", 1), ("archived_at", 1)])
+            if self.settings.rollups_enabled:
+                self.rollups_collection.create_index([("scope", 1), ("hour", 1)])
 
             # TTL index for automatic hard-deletion of archived events
             # MongoDB will automatically delete documents where archived_at
@@ -257,6 +336,18 @@ class EventManager(AbstractManagerBase[EventManagerSettings]):
                 exc_info=True,
             )
 
+    async def _run_db(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a short blocking database operation on the database workers."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._db_executor, functools.partial(func, *args)
+        )
+
+    async def _run_report(self, func: Callable[..., T], *args: Any) -> T:
+        """Run long-running blocking work (queries, reports, archiving, backups) on the report workers."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._report_executor, functools.partial(func, *args)
+        )
+
     # NOTE: OTEL instrumentation for event receipt lives in the existing /event
     # endpoint implementation further down in this file.
 
@@ -298,8 +389,9 @@ class EventManager(AbstractManagerBase[EventManagerSettings]):
         # Call parent configuration first (CORS, rate limiting, etc.)
         super().configure_app(app)
 
-        # Store reference to retention task for cleanup
+        # Store references to background tasks for cleanup
         self._retention_task: Optional[asyncio.Task[None]] = None
+        self._rollup_task: Optional[asyncio.Task[None]] = None
 
         @asynccontextmanager
         async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
@@ -315,7 +407,22 @@ class EventManager(AbstractManagerBase[EventManagerSettings]):
                     check_interval_hours=self.settings.retention_check_interval_hours,
                     soft_delete_after_days=self.settings.soft_delete_after_days,
                 )
+            # Startup: Start rollup catch-up task if enabled
+            if self.settings.rollups_enabled:
+                self._rollup_task = asyncio.create_task(self._run_rollup_loop())
+                self.logger.info(
+                    "Started utilization rollup task",
+                    event_type=EventType.MANAGER_START,
+                    interval_seconds=self.settings.rollup_interval_seconds,
+                )
             yield
+            # Shutdown: End live event streams
+            self.event_stream.close()
+            # Shutdown: Send alerts still queued or coalesced
+            if self.alert_dispatcher is not None:
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self.alert_dispatcher.close, ALERT_SHUTDOWN_TIMEOUT
+                )
             # Shutdown: Cancel retention task if running
             if self._retention_task is not None:
                 self._retention_task.cancel()
@@ -325,6 +432,20 @@ class EventManager(AbstractManagerBase[EventManagerSettings]):
                     "Stopped automatic retention task",
                     event_type=EventType.MANAGER_STOP,
                 )
+            # Shutdown: Cancel rollup task if running
+            if self._rollup_task is not None:
+                self._rollup_task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await self._rollup_task
+                self.logger.info(
+                    "Stopped utilization rollup task",
+                    event_type=EventType.MANAGER_STOP,
+                )
+            # Shutdown: Stop the database worker pools once nothing else uses them
+            for executor in (self._db_executor, self._report_executor):
+                await asyncio.get_running_loop().run_in_executor(
+                    None, executor.shutdown
+                )
 
         # Set the lifespan on the app
         app.router.lifespan_context = lifespan
@@ -368,6 +489,35 @@ class EventManager(AbstractManagerBase[EventManagerSettings]):
             # Wait for next check interval
             await asyncio.sleep(self.settings.retention_check_interval_hours * 3600)
 
+    async def _run_rollup_loop(self) -> None:
+        """Background task loop that folds new events into the utilization rollups."""
+        while True:
+            try:
+                processed = await self._run_report(self._catch_up_rollups)
+                self.logger.debug(
+                    "Utilization rollups caught up", processed_events=processed
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.warning(
+                    "Utilization rollup catch-up failed",
+                    event_type=EventType.MANAGER_ERROR,
+                    error=str(e),
+                    exc_info=True,
+                )
+
+            await asyncio.sleep(self.settings.rollup_interval_seconds)
+
+    def _catch_up_rollups(self) -> int:
+        """Fold all events older than the rollup lag into the rollups."""
+        return UtilizationRollups(
+            UtilizationAnalyzer(self.events),
+            self.rollups_collection,
+            lag_seconds=self.settings.rollup_lag_seconds,
+            batch_size=self.settings.rollup_batch_size,
+        ).catch_up()
+
     async def _archive_old_events(self) -> int:
         """Archive old events in batches to prevent performance impact.
 
@@ -377,8 +527,10 @@ class EventManager(AbstractManagerBase[EventManagerSettings]):
         soft_delete_cutoff = datetime.now(timezone.utc) - timedelta(
             days=self.settings.soft_delete_after_days
         )
-        # Convert to ISO string to match MongoDB storage format
-        soft_delete_cutoff_str = soft_delete_cutoff.isoformat()
+        query = {
+            "event_time": {"$lt": to_naive_utc(soft_delete_cutoff)},
+            "archived": {"$ne": True},
+        }
 
         total_archived = 0
         batches_processed = 0
@@ -396,34 +548,13 @@ class EventManager(AbstractManagerBase[EventManagerSettings]):
                 )
                 break
 
-            # Find batch of events to archive
-            events_to_archive = list(
-                self.events.find(
-                    {
-                        "event_timestamp": {"$lt": soft_delete_cutoff_str},
-                        "archived": {"$ne": True},
-                    },
-                    {"_id": 1},
-                ).limit(batch_size)
+            archived = await self._run_report(
+                self._archive_next_batch, query, batch_size
             )
-
-            if not events_to_archive:
+            if archived is None:
                 break  # No more events to archive
 
-            event_ids = [e["_id"] for e in events_to_archive]
-
-            # Archive this batch
-            result = self.events.update_many(
-                {"_id": {"$in": event_ids}},
-                {
-                    "$set": {
-                        "archived": True,
-                        "archived_at": datetime.now(timezone.utc),
-                    }
-                },
-            )
-
-            total_archived += result.modified_count
+            total_archived += archived
             batches_processed += 1
 
             # Small delay between batches to reduce database load
@@ -431,6 +562,30 @@ class EventManager(AbstractManagerBase[EventManagerSettings]):
 
         return total_archived
 
+    def _archive_next_batch(
+        self, query: Dict[str, Any], batch_size: int
+    ) -> Optional[int]:
+        """Archive the next batch of events matching a query.
+
+        Returns:
+            The number of events archived, or None if no events matched
+        """
+        events_to_archive = list(self.events.find(query, {"_id": 1}).limit(batch_size))
+        if not events_to_archive:
+            return None
+
+        event_ids = [e["_id"] for e in events_to_archive]
+        result = self.events.update_many(
+            {"_id": {"$in": event_ids}},
+            {
+                "$set": {
+                    "archived": True,
+                    "archived_at": datetime.now(timezone.utc),
+                }
+            },
+        )
+        return result.modified_count
+
     @post("/event")
     async def log_event(self, event: Event) -> Event:
         """Create a new event."""
@@ -444,7 +599,7 @@ class EventManager(AbstractManagerBase[EventManagerSettings]):
             try:
                 mongo_data = event.to_mongo()
                 try:
-                    self.events.insert_one(mongo_data)
+                    await self._run_db(self.events.insert_one, mongo_data)
                 except Exception as insert_err:
                     # Handle duplicate key errors gracefully
                     if "DuplicateKeyError" not in type(insert_err).__name__:
@@ -454,7 +609,9 @@ class EventManager(AbstractManagerBase[EventManagerSettings]):
                         event_type=EventType.DATA_STORE,
                         event_id=event.event_id,
                     )
-                    # Just continue - don't fail the request
+                    # * Already stored, published, and alerted on - don't fail the request
+                    return event
+                self.event_stream.publish([event])
             except Exception as e:
                 self.logger.error(
                     "Failed to log event",
@@ -464,20 +621,106 @@ class EventManager(AbstractManagerBase[EventManagerSettings]):
                 )
                 raise e
 
-        if (
-            event.alert or event.log_level >= self.settings.alert_level
-        ) and self.settings.email_alerts:
-            email_alerter = EmailAlerts(
-                config=self.settings.email_alerts,
-                logger=self.logger,
-            )
-            email_alerter.send_email_alerts(event)
+        self._send_alerts([event])
+        await self._mark_late_rollup_events([mongo_data])
         return event
 
+    @post("/events/batch")
+    async def log_events(self, events: List[Event]) -> EventBatchResponse:
+        """Create a batch of events with a single unordered bulk insert. Events whose IDs already exist are skipped."""
+        with self.span(
+            "event.receive_batch", attributes={"event.batch_size": len(events)}
+        ):
+            if not events:
+                return EventBatchResponse(inserted_count=0, duplicate_count=0)
+            documents = [event.to_mongo() for event in events]
+            try:
+                await self._run_db(
+                    functools.partial(self.events.insert_many, ordered=False),
+                    documents,
+                )
+                duplicates: set[int] = set()
+            except Exception as insert_err:
+                duplicates = self._duplicate_indexes(insert_err)
+            inserted = [
+                event for index, event in enumerate(events) if index not in duplicates
+            ]
+            inserted_count = len(inserted)
+            duplicate_count = len(events) - inserted_count
+            self.event_stream.publish(inserted)
+            if duplicate_count:
+                self.logger.warning(
+                    "Duplicate event IDs in batch - skipped",
+                    event_type=EventType.DATA_STORE,
+                    duplicate_count=duplicate_count,
+                )
+
+        self._send_alerts(inserted)
+        await self._mark_late_rollup_events(
+            [
+                document
+                for index, document in enumerate(documents)
+                if index not in duplicates
+            ]
+        )
+        return EventBatchResponse(
+            inserted_count=inserted_count, duplicate_count=duplicate_count
+        )
+
+    async def _mark_late_rollup_events(self, documents: List[Dict[str, Any]]) -> None:
+        """Flag stored events the rollup watermark has already passed, so the next catch-up folds them in.
+
+        This runs after the events are stored, published, and alerted on, so a failure is logged rather than
+        failing the request (a retry would be skipped as a duplicate, and never published or alerted on).
+        """
+        if not self.settings.rollups_enabled or not documents:
+            return
+        try:
+            await self._run_db(mark_late_events, self.rollups_collection, documents)
+        except Exception as e:
+            self.logger.warning(
+                "Failed to flag late events for utilization rollups",
+                event_type=EventType.DATA_STORE,
+                event_count=len(documents),
+                error=str(e),
+                exc_info=True,
+            )
+
+    def _duplicate_indexes(self, insert_err: Exception) -> set[int]:
+        """Return the positions of the documents an unordered bulk insert skipped as duplicates, re-raising the error unless every failure was a duplicate key."""
+        details = getattr(insert_err, "details", None) or {}
+        write_errors = details.get("writeErrors", [])
+        only_duplicates = "BulkWriteError" in type(insert_err).__name__ and all(
+            error.get("code") == DUPLICATE_KEY_ERROR_CODE for error in write_errors
+        )
+        if not only_duplicates:
+            self.logger.error(
+                "Failed to log event batch",
+                event_type=EventType.DATA_STORE,
+                error=str(insert_err),
+            )
+            raise insert_err
+        return {error["index"] for error in write_errors}
+
+    def _send_alerts(self, events: List[Event]) -> None:
+        """Queue email alerts for any events that are alerts or at or above the alert level."""
+        if self.alert_dispatcher is None:
+            return
+        for event in events:
+            if event.alert or event.log_level >= self.settings.alert_level:
+                self.alert_dispatcher.submit(event)
+
+    @get("/alerts/stats")
+    async def get_alert_stats(self) -> AlertDispatcherStats:
+        """Get counters for alert dispatch, including the queue depth and dropped alerts."""
+        if self.alert_dispatcher is None:
+            return AlertDispatcherStats()
+        return self.alert_dispatcher.stats
+
     @get("/event/{event_id}")
     async def get_event(self, event_id: str) -> Event:
         """Look up an event by event_id"""
-        event = self.events.find_one({"_id": event_id})
+        event = await self._run_db(self.events.find_one, {"_id": event_id})
         if not event:
             self.logger.error(
                 "Event not found",
@@ -493,7 +736,9 @@ class EventManager(AbstractManagerBase[EventManagerSettings]):
     async def get_events(
         self,
         number: int = Query(100, description="Maximum number of events to return"),
-        offset: int = Query(0, description="Offset for pagination"),
+        offset: int = Query(
+            0, description="Offset for pagination. Can't be combined with cursor"
+        ),
         level: Union[int, EventLogLevel] = Query(  # noqa: B008
             0, description="Minimum log level to include"
         ),
@@ -506,50 +751,238 @@ class EventManager(AbstractManagerBase[EventManagerSettings]):
         include_archived: bool = Query(
             False, description="Whether to include archived events"
         ),
+        *,
+        response: Response,
+        cursor: Optional[str] = Query(
+            None,
+            description=f"Cursor from a previous page's {NEXT_CURSOR_HEADER} header",
+        ),
     ) -> Dict[str, Event]:
         """Get events with enhanced filtering options.
 
+        Events are returned newest first. When a full page is returned, the
+        cursor for the next page is set in the ``X-Next-Cursor`` response
+        header; pass it back as ``cursor`` to read the next page with an index
+        range scan instead of skipping past ``offset`` events. A request may
+        page by ``cursor`` or by ``offset``, not both.
+
         Args:
             number: Maximum number of events to return
-            offset: Offset for pagination
+            offset: Offset for pagination, only without a cursor
             level: Minimum log level to include
             start_time: Filter events after this time
             end_time: Filter events before this time
             include_archived: Whether to include archived events (default False)
+            response: The response, used to set the next page's cursor header
+            cursor: Cursor for the page to return, from a previous page
 
         Returns:
             Dictionary of events keyed by event_id
         """
+        if cursor and offset > 0:
+            raise HTTPException(
+                status_code=400, detail="Use either cursor or offset, not both"
+            )
+        query = self._build_events_query(level, start_time, end_time, include_archived)
+        try:
+            query = keyset_query(query, "event_time", cursor)
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        event_list = await self._run_db(
+            lambda: (
+                self.events.find(query)
+                .sort(keyset_sort("event_time"))
+                .skip(offset)
+                .limit(number)
+                .to_list()
+            )
+        )
+        if page_cursor := next_cursor(event_list, "event_time", number):
+            response.headers[NEXT_CURSOR_HEADER] = page_cursor
+        return {str(event["_id"]): Event.model_validate(event) for event in event_list}
+
+    @get("/events/export")
+    async def export_events(
+        self,
+        *,
+        export_format: EventExportFormat = Query(  # noqa: B008
+            "ndjson", alias="format", description="Export format: csv or ndjson"
+        ),
+        compress: bool = Query(
+            False, alias="gzip", description="Whether to gzip the export"
+        ),
+        event_type: Optional[List[str]] = Query(  # noqa: B008
+            None, description="Only include events of these types"
+        ),
+        level: Union[int, EventLogLevel] = Query(  # noqa: B008
+            0, description="Minimum log level to include"
+        ),
+        start_time: Optional[datetime] = Query(  # noqa: B008
+            None, description="Only include events at or after this time (ISO format)"
+        ),
+        end_time: Optional[datetime] = Query(  # noqa: B008
+            None, description="Only include events at or before this time (ISO format)"
+        ),
+        include_archived: bool = Query(
+            False, description="Whether to include archived events"
+        ),
+    ) -> StreamingResponse:
+        """Stream matching events, oldest first, as CSV or NDJSON.
+
+        Events are read from a MongoDB cursor in batches and encoded as they
+        are sent, so exports of any size run in constant server memory.
+        """
+        query = self._build_events_query(level, start_time, end_time, include_archived)
+        if event_type:
+            query["event_type"] = {"$in": event_type}
+
+        cursor = await self._run_report(
+            lambda: self.events.find(query, EXPORT_PROJECTION).sort("event_time", 1)
+        )
+        return StreamingResponse(
+            self._stream_export(cursor, EventExportEncoder(export_format, compress)),
+            media_type=export_media_type(export_format, compress),
+            headers={
+                "Content-Disposition": "attachment; filename="
+                + export_filename(export_format, compress)
+            },
+        )
+
+    async def _stream_export(
+        self, cursor: Any, encoder: EventExportEncoder
+    ) -> AsyncGenerator[bytes, None]:
+        """Encode and yield a cursor's events one batch at a time."""
+        try:
+            documents = iter(cursor)
+            while batch := await self._run_report(next_batch, documents):
+                if chunk := encoder.encode(batch):
+                    yield chunk
+            if chunk := encoder.finish():
+                yield chunk
+        finally:
+            cursor.close()
+
+    def _build_events_query(
+        self,
+        level: Union[int, EventLogLevel],
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+        include_archived: bool,
+    ) -> Dict[str, Any]:
+        """Build the query shared by event listing and export."""
         query: Dict[str, Any] = {"log_level": {"$gte": int(level)}}
 
         # Exclude archived events by default
         if not include_archived:
             query["archived"] = {"$ne": True}
 
-        # Apply date range filters
-        # Convert datetime to ISO string format to match MongoDB storage format
-        # (Events are stored with ISO string timestamps via to_mongo())
+        # Apply date range filters on the native datetime copy of the timestamp
         if start_time or end_time:
-            query["event_timestamp"] = {}
+            query["event_time"] = {}
             if start_time:
-                query["event_timestamp"]["$gte"] = start_time.isoformat()
+                query["event_time"]["$gte"] = to_naive_utc(start_time)
             if end_time:
-                query["event_timestamp"]["$lte"] = end_time.isoformat()
-
-        event_list = (
-            self.events.find(query)
-            .sort("event_timestamp", -1)
-            .skip(offset)
-            .limit(number)
-            .to_list()
+                query["event_time"]["$lte"] = to_naive_utc(end_time)
+        return query
+
+    @get("/events/stream")
+    async def stream_events(
+        self,
+        level: Union[int, EventLogLevel] = Query(  # noqa: B008
+            0, description="Minimum log level to include"
+        ),
+        event_type: Optional[List[str]] = Query(  # noqa: B008
+            None, description="Only include events of these types"
+        ),
+        source: Optional[str] = Query(
+            None,
+            description="Only include events whose source has this ID (node, workcell, manager, experiment, ...)",
+        ),
+        last_event_id: Optional[str] = Query(
+            None,
+            description="Resume after this event, replaying any matching events stored since",
+        ),
+        last_event_id_header: Optional[str] = Header(None, alias="Last-Event-ID"),
+    ) -> StreamingResponse:
+        """Stream newly stored events as Server-Sent Events.
+
+        Each message's ID is the event ID. Reconnecting clients that send it
+        back (as the ``Last-Event-ID`` header, or ``last_event_id``) first
+        receive the matching events stored after it, then live events.
+        """
+        return StreamingResponse(
+            self._stream_live_events(
+                self.event_stream.subscribe(int(level), event_type, source),
+                last_event_id or last_event_id_header,
+            ),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
         )
-        return {str(event["_id"]): Event.model_validate(event) for event in event_list}
+
+    async def _stream_live_events(
+        self, subscription: EventSubscription, last_event_id: Optional[str]
+    ) -> AsyncGenerator[str, None]:
+        """Yield replayed and then live events for a subscription, with keepalives while idle."""
+        try:
+            replayed: Set[str] = set()
+            if last_event_id:
+                async for event in self._replay_events(subscription, last_event_id):
+                    replayed.add(event.event_id)
+                    yield format_sse(event)
+            # * Events stored during the replay may have been queued as well
+            pending_duplicates = subscription.queue.qsize() if replayed else 0
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        subscription.queue.get(),
+                        timeout=self.settings.stream_keepalive_seconds,
+                    )
+                except asyncio.TimeoutError:
+                    yield KEEPALIVE_COMMENT
+                    continue
+                if event is None:
+                    return
+                if pending_duplicates:
+                    pending_duplicates -= 1
+                    if event.event_id in replayed:
+                        continue
+                yield format_sse(event)
+                if subscription.overflowed and subscription.queue.empty():
+                    return
+        finally:
+            self.event_stream.unsubscribe(subscription)
+
+    async def _replay_events(
+        self, subscription: EventSubscription, last_event_id: str
+    ) -> AsyncGenerator[Event, None]:
+        """Yield the subscription's matching events stored after an event, oldest first."""
+        last_event = await self._run_db(
+            self.events.find_one, {"_id": last_event_id}, {"event_time": 1}
+        )
+        if not last_event:
+            return
+        cursor = encode_cursor(last_event.get("event_time"), last_event_id)
+        while cursor:
+            query = keyset_query(subscription.query(), "event_time", cursor, 1)
+            page = await self._run_report(
+                lambda query=query: (
+                    self.events.find(query)
+                    .sort(keyset_sort("event_time", 1))
+                    .limit(REPLAY_BATCH_SIZE)
+                    .to_list()
+                )
+            )
+            for document in page:
+                yield Event.model_validate(document)
+            cursor = next_cursor(page, "event_time", REPLAY_BATCH_SIZE)
 
     @post("/events/query")
     async def query_events(self, selector: Any = Body()) -> Dict[str, Event]:  # noqa: B008
         """Query events based on a selector. Note: this is a raw query, so be careful."""
         with self.span("event.query"):
-            event_list = self.events.find(selector).to_list()
+            event_list = await self._run_report(
+                lambda: self.events.find(selector).to_list()
+            )
             return {event["_id"]: event for event in event_list}
 
     # ==========================================================================
@@ -590,37 +1023,20 @@ class EventManager(AbstractManagerBase[EventManagerSettings]):
                 if request.event_ids:
                     query["_id"] = {"$in": request.event_ids}
                 elif request.before_date:
-                    # Convert datetime to ISO string format to match MongoDB storage format
-                    # (Events are stored with ISO string timestamps via to_mongo())
-                    query["event_timestamp"] = {"$lt": request.before_date.isoformat()}
+                    query["event_time"] = {"$lt": to_naive_utc(request.before_date)}
 
                 # Perform archive in batches to prevent performance impact
                 batch_size = request.batch_size or self.settings.archive_batch_size
                 total_archived = 0
 
                 while True:
-                    # Find batch of events to archive
-                    events_to_archive = list(
-                        self.events.find(query, {"_id": 1}).limit(batch_size)
+                    archived = await self._run_report(
+                        self._archive_next_batch, query, batch_size
                     )
-
-                    if not events_to_archive:
+                    if archived is None:
                         break
 
-                    event_ids = [e["_id"] for e in events_to_archive]
-
-                    # Archive this batch
-                    result = self.events.update_many(
-                        {"_id": {"$in": event_ids}},
-                        {
-                            "$set": {
-                                "archived": True,
-                                "archived_at": datetime.now(timezone.utc),
-                            }
-                        },
-                    )
-
-                    total_archived += result.modified_count
+                    total_archived += archived
 
                     # If archiving by IDs, we're done after one batch
                     if request.event_ids:
@@ -664,12 +1080,14 @@ class EventManager(AbstractManagerBase[EventManagerSettings]):
             attributes={"events.limit": number, "events.offset": offset},
         ):
             query = {"archived": True}
-            event_list = (
-                self.events.find(query)
-                .sort("archived_at", -1)
-                .skip(offset)
-                .limit(number)
-                .to_list()
+            event_list = await self._run_db(
+                lambda: (
+                    self.events.find(query)
+                    .sort("archived_at", -1)
+                    .skip(offset)
+                    .limit(number)
+                    .to_list()
+                )
             )
             return {
                 str(event["_id"]): Event.model_validate(event) for event in event_list
@@ -697,11 +1115,12 @@ class EventManager(AbstractManagerBase[EventManagerSettings]):
         try:
             cutoff_date = datetime.now(timezone.utc) - timedelta(days=older_than_days)
 
-            result = self.events.delete_many(
+            result = await self._run_report(
+                self.events.delete_many,
                 {
                     "archived": True,
                     "archived_at": {"$lt": cutoff_date},
-                }
+                },
             )
 
             return PurgeEventsResponse(
@@ -769,7 +1188,11 @@ class EventManager(AbstractManagerBase[EventManagerSettings]):
                 )
 
                 description = request.description or "manual_backup"
-                backup_path = backup_tool.create_backup(name_suffix=description)
+                backup_path = await self._run_report(
+                    functools.partial(
+                        backup_tool.create_backup, name_suffix=description
+                    )
+                )
 
                 self.logger.info(
                     "Created backup",
@@ -818,7 +1241,8 @@ class EventManager(AbstractManagerBase[EventManagerSettings]):
                         logger=self.logger,
                     )
 
-                    for backup_info in backup_tool.list_available_backups():
+                    backups = await self._run_report(backup_tool.list_available_backups)
+                    for backup_info in backups:
                         available_backups.append(
                             {
                                 "path": str(backup_info.backup_path),
@@ -859,7 +1283,7 @@ class EventManager(AbstractManagerBase[EventManagerSettings]):
         ),
     ) -> Union[Dict[str, Any], Response]:
         """Generate comprehensive session-based utilization report."""
-        analyzer = self._get_session_analyzer()
+        analyzer = await self._run_report(self._get_session_analyzer)
         if analyzer is None:
             return {"error": "Failed to create session analyzer"}
 
@@ -868,7 +1292,9 @@ class EventManager(AbstractManagerBase[EventManagerSettings]):
             parsed_start, parsed_end = self._parse_session_time_parameters(
                 start_time, end_time
             )
-            report = analyzer.generate_session_based_report(parsed_start, parsed_end)
+            report = await self._run_report(
+                analyzer.generate_session_based_report, parsed_start, parsed_end
+            )
 
             # Handle CSV export if requested
             if csv_format:
@@ -918,6 +1344,79 @@ class EventManager(AbstractManagerBase[EventManagerSettings]):
             )
             return None
 
+    def _get_rollups(
+        self, analyzer: UtilizationAnalyzer
+    ) -> Optional[UtilizationRollups]:
+        """Return the utilization rollups if they're enabled and have been built."""
+        if not self.settings.rollups_enabled:
+            return None
+        rollups = UtilizationRollups(
+            analyzer,
+            self.rollups_collection,
+            lag_seconds=self.settings.rollup_lag_seconds,
+            batch_size=self.settings.rollup_batch_size,
+        )
+        return rollups if rollups.get_watermark() is not None else None
+
+    def _generate_periods_report(
+        self,
+        analyzer: UtilizationAnalyzer,
+        start_time: Optional[str],
+        end_time: Optional[str],
+        analysis_type: str,
+        user_timezone: str,
+    ) -> Dict[str, Any]:
+        """Generate the periods report from rollups when available, else from raw events."""
+        time_series_analyzer = TimeSeriesAnalyzer(analyzer)
+        rollups = self._get_rollups(analyzer)
+        if rollups is None:
+            return time_series_analyzer.generate_utilization_report_with_times(
+                start_time, end_time, analysis_type, user_timezone
+            )
+
+        parsed_start, parsed_end = time_series_analyzer.parse_time_parameters(
+            start_time, end_time
+        )
+        if parsed_start is None or parsed_end is None:
+            return {
+                "error": "start_time and end_time are required",
+                "details": "Both parameters must be provided as ISO strings",
+            }
+        return rollups.generate_utilization_periods(
+            parsed_start, parsed_end, analysis_type, user_timezone
+        )
+
+    def _add_user_utilization(
+        self, analyzer: UtilizationAnalyzer, report: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Add the user summary to a periods report, from rollups when available."""
+        time_series_analyzer = TimeSeriesAnalyzer(analyzer)
+        rollups = self._get_rollups(analyzer)
+        if rollups is None:
+            return time_series_analyzer.add_user_utilization_to_report(report)
+
+        metadata = report["summary_metadata"]
+        user_report = rollups.generate_user_utilization_report(
+            datetime.fromisoformat(metadata["period_start"]),
+            datetime.fromisoformat(metadata["period_end"]),
+        )
+        report["user_utilization"] = (
+            time_series_analyzer.create_user_summary_from_report(user_report)
+        )
+        return report
+
+    def _generate_user_report(
+        self,
+        analyzer: UtilizationAnalyzer,
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+    ) -> Dict[str, Any]:
+        """Generate the user report from rollups when available, else from raw events."""
+        rollups = self._get_rollups(analyzer)
+        if rollups is None:
+            return analyzer.generate_user_utilization_report(start_time, end_time)
+        return rollups.generate_user_utilization_report(start_time, end_time)
+
     def _parse_session_time_parameters(
         self, start_time: Optional[str], end_time: Optional[str]
     ) -> Tuple[Optional[datetime], Optional[datetime]]:
@@ -953,21 +1452,26 @@ class EventManager(AbstractManagerBase[EventManagerSettings]):
         """Generate time-series utilization analysis with periodic breakdowns."""
         try:
             # Create analyzer and time-series analyzer
-            analyzer = self._get_session_analyzer()
+            analyzer = await self._run_report(self._get_session_analyzer)
             if analyzer is None:
                 return {"error": "Failed to create session analyzer"}
 
-            time_series_analyzer = TimeSeriesAnalyzer(analyzer)
-
             # Generate report
-            report = time_series_analyzer.generate_utilization_report_with_times(
-                start_time, end_time, analysis_type, user_timezone
+            report = await self._run_report(
+                self._generate_periods_report,
+                analyzer,
+                start_time,
+                end_time,
+                analysis_type,
+                user_timezone,
             )
 
             # Add user utilization if requested
             if include_users and report and "error" not in report:
                 try:
-                    time_series_analyzer.add_user_utilization_to_report(report)
+                    report = await self._run_report(
+                        self._add_user_utilization, analyzer, report
+                    )
                 except Exception as e:
                     self.logger.warning(
                         "Failed to add user utilization",
@@ -1025,7 +1529,7 @@ class EventManager(AbstractManagerBase[EventManagerSettings]):
         """Generate detailed user utilization report based on workflow authors."""
         try:
             # Create analyzer
-            analyzer = self._get_session_analyzer()
+            analyzer = await self._run_report(self._get_session_analyzer)
             if analyzer is None:
                 return {"error": "Failed to create session analyzer"}
 
@@ -1033,7 +1537,9 @@ class EventManager(AbstractManagerBase[EventManagerSettings]):
             parsed_start, parsed_end = self._parse_session_time_parameters(
                 start_time, end_time
             )
-            report = analyzer.generate_user_utilization_report(parsed_start, parsed_end)
+            report = await self._run_report(
+                self._generate_user_report, analyzer, parsed_start, parsed_end
+            )
 
             # Handle CSV export if requested
             if csv_format and report and "error" not in report:
@@ -0,0 +1,128 @@
+"""Live fan-out of newly ingested events to ``/events/stream`` subscribers.
+
+Events are published in-process as the ingestion routes store them, and each
+subscriber gets its own bounded queue. A subscriber that falls too far behind
+is disconnected rather than slowing ingestion down; it can reconnect with the
+ID of the last event it received and have the gap replayed from the database.
+"""
+
+import asyncio
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
+
+from madsci.common.types.auth_types import OwnershipInfo
+from madsci.common.types.event_types import Event
+
+RECENT_EVENT_IDS = 10_000
+REPLAY_BATCH_SIZE = 1000
+KEEPALIVE_COMMENT = ": keepalive\n\n"
+
+
+def format_sse(event: Event) -> str:
+    """Format an event as a Server-Sent Events message, with the event ID as the message ID."""
+    return f"id: {event.event_id}\nevent: event\ndata: {event.model_dump_json()}\n\n"
+
+
+class EventSubscription:
+    """One ``/events/stream`` subscriber's filters and queue of matching events."""
+
+    def __init__(
+        self,
+        queue_size: int,
+        level: int = 0,
+        event_types: Optional[List[str]] = None,
+        source: Optional[str] = None,
+    ) -> None:
+        """Create a subscription for events matching the given filters."""
+        self.level = level
+        self.event_types = set(event_types) if event_types else None
+        self.source = source
+        # * None is queued to end the stream
+        self.queue: asyncio.Queue[Optional[Event]] = asyncio.Queue(maxsize=queue_size)
+        self.overflowed = False
+
+    def matches(self, event: Event) -> bool:
+        """Whether an event passes this subscription's filters."""
+        if event.log_level < self.level:
+            return False
+        if self.event_types and event.event_type.value not in self.event_types:
+            return False
+        return not self.source or any(
+            getattr(event.source, field) == self.source
+            for field in OwnershipInfo.model_fields
+        )
+
+    def query(self) -> Dict[str, Any]:
+        """Return a MongoDB query equivalent to this subscription's filters."""
+        query: Dict[str, Any] = {"log_level": {"$gte": self.level}}
+        if self.event_types:
+            query["event_type"] = {"$in": list(self.event_types)}
+        if self.source:
+            query["$or"] = [
+                {f"source.{field}": self.source} for field in OwnershipInfo.model_fields
+            ]
+        return query
+
+    def offer(self, event: Optional[Event]) -> bool:
+        """Queue an event without waiting, returning False if the queue is full."""
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            return False
+        return True
+
+
+class EventBroadcaster:
+    """Publishes newly ingested events to every matching subscription.
+
+    All methods must be called from the server's event loop.
+    """
+
+    def __init__(self, queue_size: int) -> None:
+        """Create a broadcaster whose subscribers each buffer up to ``queue_size`` events."""
+        self.queue_size = queue_size
+        self._subscriptions: List[EventSubscription] = []
+        # * Events re-sent with an existing ID are only published once
+        self._recent_ids: OrderedDict[str, None] = OrderedDict()
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of active subscriptions."""
+        return len(self._subscriptions)
+
+    def subscribe(
+        self,
+        level: int = 0,
+        event_types: Optional[List[str]] = None,
+        source: Optional[str] = None,
+    ) -> EventSubscription:
+        """Start receiving events matching the given filters."""
+        subscription = EventSubscription(self.queue_size, level, event_types, source)
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: EventSubscription) -> None:
+        """Stop delivering events to a subscription."""
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+
+    def publish(self, events: Iterable[Event]) -> None:
+        """Deliver stored events to matching subscriptions, dropping subscribers that have fallen behind."""
+        if not self._subscriptions:
+            return
+        for event in events:
+            if event.event_id in self._recent_ids:
+                continue
+            self._recent_ids[event.event_id] = None
+            if len(self._recent_ids) > RECENT_EVENT_IDS:
+                self._recent_ids.popitem(last=False)
+            for subscription in list(self._subscriptions):
+                if subscription.matches(event) and not subscription.offer(event):
+                    self.unsubscribe(subscription)
+
+    def close(self) -> None:
+        """End every subscription's stream."""
+        for subscription in self._subscriptions:
+            subscription.offer(None)
+        self._subscriptions.clear()
@@ -4,6 +4,7 @@ Code for sending notifications and alerts based on events
 
 import smtplib
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from typing import Optional
@@ -16,11 +17,21 @@ class EmailAlerts:
     """Class for sending email alerts."""
 
     def __init__(
-        self, config: EmailAlertsConfig, logger: Optional[EventClient] = None
+        self,
+        config: EmailAlertsConfig,
+        logger: Optional[EventClient] = None,
+        reuse_connection: bool = False,
     ) -> None:
-        """Create an instance of EmailAlerts with the provided configuration."""
+        """Create an instance of EmailAlerts with the provided configuration.
+
+        With ``reuse_connection``, one SMTP connection is kept open across
+        ``send_email`` calls until ``close()``. Such instances must not be
+        shared between threads.
+        """
         self.config = config
         self.logger = logger or EventClient()
+        self.reuse_connection = reuse_connection
+        self._server: Optional[smtplib.SMTP] = None
 
     def send_email_alerts(
         self,
@@ -62,10 +73,6 @@ class EmailAlerts:
         importance: Optional[str] = None,
     ) -> bool:
         """Sends an email with the provided subject and body to the specified email address."""
-        smtp_server = self.config.smtp_server
-        smtp_port = self.config.smtp_port
-        smtp_username = self.config.smtp_username
-        smtp_password = self.config.smtp_password
         sender = sender or self.config.sender
 
         try:
@@ -94,16 +101,16 @@ class EmailAlerts:
             msg.attach(MIMEText(body, "plain"))
 
             # Send the email via the SMTP server
-            server = smtplib.SMTP(smtp_server, smtp_port)
-            try:
-                if self.config.use_tls:
-                    self.logger.debug("Starting TLS for secure connection")
-                    server.starttls()
-                if smtp_username and smtp_password:
-                    server.login(smtp_username, smtp_password)
-                server.sendmail(sender, email_address, msg.as_string())
-            finally:
-                server.quit()
+            if self.reuse_connection:
+                self._sendmail_reusing_connection(
+                    sender, email_address, msg.as_string()
+                )
+            else:
+                server = self._connect()
+                try:
+                    server.sendmail(sender, email_address, msg.as_string())
+                finally:
+                    server.quit()
 
             self.logger.info(
                 "Email alert sent",
@@ -120,3 +127,43 @@ class EmailAlerts:
                 exc_info=True,
             )
             return False
+
+    def close(self) -> None:
+        """Close the reused SMTP connection, if one is open."""
+        server, self._server = self._server, None
+        if server is not None:
+            with suppress(smtplib.SMTPException, OSError):
+                server.quit()
+
+    def _connect(self) -> smtplib.SMTP:
+        """Open an SMTP connection, starting TLS and logging in as configured."""
+        server = smtplib.SMTP(self.config.smtp_server, self.config.smtp_port)
+        try:
+            if self.config.use_tls:
+                self.logger.debug("Starting TLS for secure connection")
+                server.starttls()
+            if self.config.smtp_username and self.config.smtp_password:
+                server.login(self.config.smtp_username, self.config.smtp_password)
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    def _sendmail_reusing_connection(
+        self, sender: str, email_address: str, message: str
+    ) -> None:
+        """Send over the open connection, reconnecting once if the server dropped it."""
+        for attempt in range(2):
+            if self._server is None:
+                self._server = self._connect()
+            try:
+                self._server.sendmail(sender, email_address, message)
+                return
+            except smtplib.SMTPServerDisconnected:
+                # * Servers close idle connections, so retry once on a fresh one
+                self._server = None
+                if attempt:
+                    raise
+            except (smtplib.SMTPException, OSError):
+                self.close()
+                raise
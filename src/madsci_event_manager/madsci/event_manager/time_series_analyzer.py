@@ -1,10 +1,12 @@
 """Time-series analysis for MADSci utilization data with session attribution."""
 
+import heapq
 import logging
 import statistics
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 import pytz
 from madsci.event_manager.utilization_analyzer import UtilizationAnalyzer
@@ -365,13 +367,122 @@ class TimeSeriesAnalyzer:
             logger.error("Error creating bucket reports", exc_info=True)
             return {"error": f"Failed to create bucket reports: {e!s}"}
 
+    def _sweep_sessions_into_buckets(
+        self,
+        windows: List[Optional[Tuple[datetime, datetime]]],
+        sessions: List[Dict],
+    ) -> Dict[str, List[List]]:
+        """Assign sessions and experiments to every bucket in one sorted sweep.
+
+        Buckets are visited in start order while sessions, ordered by start,
+        enter a heap keyed on their end time and leave it once they end before
+        the current bucket. Each bucket therefore only sees the sessions that
+        overlap it, every session is analyzed once, and experiment starts are
+        queried once for the whole span rather than per bucket.
+
+        Returns per-bucket lists, aligned with ``windows``, of
+        ``(session, session_report, overlap_start, overlap_end)`` overlaps and
+        of the experiments that started inside the bucket. Buckets whose
+        window is None get empty lists.
+        """
+
+        valid_sessions = sorted(
+            (
+                (index, session)
+                for index, session in enumerate(sessions)
+                if isinstance(session, dict)
+                and isinstance(session.get("start_time"), datetime)
+                and isinstance(session.get("end_time"), datetime)
+            ),
+            key=lambda item: item[1]["start_time"],
+        )
+        bucket_order = sorted(
+            (index for index, window in enumerate(windows) if window),
+            key=lambda index: windows[index][0],
+        )
+
+        overlaps: List[List] = [[] for _ in windows]
+        session_reports: Dict[int, Dict[str, Any]] = {}
+        active: List[Tuple[datetime, int, Dict]] = []
+        next_session = 0
+        for bucket_index in bucket_order:
+            bucket_start, bucket_end = windows[bucket_index]
+            while (
+                next_session < len(valid_sessions)
+                and valid_sessions[next_session][1]["start_time"] < bucket_end
+            ):
+                index, session = valid_sessions[next_session]
+                heapq.heappush(active, (session["end_time"], index, session))
+                next_session += 1
+            while active and active[0][0] <= bucket_start:
+                heapq.heappop(active)
+
+            # * Keep the sessions' original order within each bucket
+            for _, index, session in sorted(active, key=lambda item: item[1]):
+                overlap_start = max(bucket_start, session["start_time"])
+                overlap_end = min(bucket_end, session["end_time"])
+                if overlap_start >= overlap_end:
+                    continue
+                if index not in session_reports:
+                    session_reports[index] = self._analyze_session_safely(session)
+                overlaps[bucket_index].append(
+                    (session, session_reports[index], overlap_start, overlap_end)
+                )
+
+        return {
+            "overlaps": overlaps,
+            "experiments": self._slice_experiments_into_buckets(windows),
+        }
+
+    def _analyze_session_safely(self, session: Dict) -> Dict[str, Any]:
+        """Analyze a session's utilization, returning an empty report on failure."""
+
+        try:
+            session_report = self.analyzer._analyze_session_utilization(session)
+        except Exception:
+            logger.error("Error analyzing session", exc_info=True)
+            return {}
+        return session_report if isinstance(session_report, dict) else {}
+
+    def _slice_experiments_into_buckets(
+        self, windows: List[Optional[Tuple[datetime, datetime]]]
+    ) -> List[List[Dict]]:
+        """Query experiment starts once and slice them into each bucket's window."""
+
+        spans = [window for window in windows if window]
+        if not spans:
+            return [[] for _ in windows]
+
+        try:
+            experiments = self._get_experiments_in_time_period(
+                min(start for start, _ in spans), max(end for _, end in spans)
+            )
+        except Exception:
+            logger.error("Error getting experiments for buckets", exc_info=True)
+            experiments = []
+
+        experiments = sorted(experiments or [], key=lambda exp: exp["event_timestamp"])
+        self.analyzer._prefetch_experiment_names(
+            exp["experiment_id"] for exp in experiments
+        )
+        timestamps = [exp["event_timestamp"] for exp in experiments]
+        return [
+            experiments[
+                bisect_left(timestamps, window[0]) : bisect_right(timestamps, window[1])
+            ]
+            if window
+            else []
+            for window in windows
+        ]
+
     def _create_weekly_bucket_reports(
         self, time_buckets: List, all_sessions: List[Dict]
     ) -> List[Dict]:
         """Create weekly bucket reports."""
 
-        bucket_reports = []
-        for i, bucket_info in enumerate(time_buckets):
+        windows = []
+        period_infos = []
+        for bucket_info in time_buckets:
             if isinstance(bucket_info, dict):
                 bucket_start, bucket_end = bucket_info["utc_times"]
                 period_info = bucket_info.get("period_info", {})
@@ -381,13 +492,16 @@ class TimeSeriesAnalyzer:
                     "type": "period",
                     "display": bucket_start.strftime("%Y-%m-%d"),
                 }
+            windows.append((bucket_start, bucket_end))
+            period_infos.append(period_info)
 
-            bucket_report = self._generate_weekly_bucket_report(
-                bucket_start, bucket_end, all_sessions, i, period_info
+        sweep = self._sweep_sessions_into_buckets(windows, all_sessions or [])
+        return [
+            self._generate_weekly_bucket_report(
+                bucket_start, bucket_end, sweep, i, period_infos[i]
             )
-            bucket_reports.append(bucket_report)
-
-        return bucket_reports
+            for i, (bucket_start, bucket_end) in enumerate(windows)
+        ]
 
     def _create_fallback_bucket_reports(self, time_buckets: List) -> List[Dict]:
         """Create fallback bucket reports for other analysis types."""
@@ -447,23 +561,16 @@ class TimeSeriesAnalyzer:
         self,
         bucket_start: datetime,
         bucket_end: datetime,
-        all_sessions: List[Dict],
+        sweep: Dict[str, List[List]],
         bucket_index: int,
         period_info: Dict,
     ) -> Dict[str, Any]:
         """Generate bucket report for weekly analysis with proper runtime calculation."""
 
         try:
-            # Get experiments and ensure we have valid session list
-            experiments = self._get_experiments_safely(
-                bucket_start, bucket_end, bucket_index
-            )
-            if not all_sessions:
-                all_sessions = []
-
-            # Process all sessions for this week
+            # Process the sessions the sweep assigned to this week
             week_data = self._process_all_sessions_for_week(
-                all_sessions, bucket_start, bucket_end, experiments
+                sweep["overlaps"][bucket_index], sweep["experiments"][bucket_index]
             )
 
             # Build and return final weekly report
@@ -478,11 +585,7 @@ class TimeSeriesAnalyzer:
             )
 
     def _process_all_sessions_for_week(
-        self,
-        all_sessions: List[Dict],
-        bucket_start: datetime,
-        bucket_end: datetime,
-        experiments: List[Dict],
+        self, overlaps: List[Tuple], experiments: List[Dict]
     ) -> Dict[str, Any]:
         """Process all sessions and accumulate data for the weekly bucket."""
 
@@ -492,12 +595,9 @@ class TimeSeriesAnalyzer:
         week_utilization = 0
         week_node_utilizations = {}
 
-        for session in all_sessions:
-            if not session or not isinstance(session, dict):
-                continue
-
+        for overlap in overlaps:
             session_result = self._process_weekly_session_overlap_and_analysis(
-                session, bucket_start, bucket_end, experiments
+                overlap, experiments
             )
 
             if session_result:
@@ -527,42 +627,18 @@ class TimeSeriesAnalyzer:
         }
 
     def _process_weekly_session_overlap_and_analysis(
-        self,
-        session: Dict,
-        bucket_start: datetime,
-        bucket_end: datetime,
-        experiments: List[Dict],
+        self, overlap: Tuple, experiments: List[Dict]
     ) -> Optional[Dict[str, Any]]:
-        """Process session overlap with weekly bucket and perform analysis."""
-
-        session_start = session.get("start_time")
-        session_end = session.get("end_time")
-
-        if not isinstance(session_start, datetime) or not isinstance(
-            session_end, datetime
-        ):
-            return None
-
-        if not isinstance(session_start, datetime) or not isinstance(
-            session_end, datetime
-        ):
-            return None
-
-        if not session_start or not session_end:
-            return None
-
-        # Calculate overlap
-        overlap_start = max(bucket_start, session_start)
-        overlap_end = min(bucket_end, session_end)
-
-        if overlap_start >= overlap_end:
-            return None  # No overlap
+        """Process a session's overlap with a weekly bucket using its analysis."""
 
+        session, session_report, overlap_start, overlap_end = overlap
         overlap_hours = (overlap_end - overlap_start).total_seconds() / 3600
         session_duration_seconds = session.get("duration_seconds", 0)
 
-        # Get session analysis and calculate metrics
-        session_report, session_util = self._get_weekly_session_analysis(session)
+        # Only sessions with a duration contribute their analysis
+        if session_duration_seconds <= 0:
+            session_report = {}
+        session_util = session_report.get("system_utilization_percent", 0) or 0
 
         # Calculate proportional active time and weighted utilization
         active_time_hours = overlap_hours * (session_util / 100)
@@ -622,22 +698,6 @@ class TimeSeriesAnalyzer:
             "proportion": proportion,
         }
 
-    def _get_weekly_session_analysis(
-        self, session: Dict
-    ) -> Tuple[Dict[str, Any], float]:
-        """Get session analysis for weekly processing with error handling."""
-
-        if session.get("duration_seconds", 0) > 0:
-            try:
-                session_report = self.analyzer._analyze_session_utilization(session)
-                if session_report and isinstance(session_report, dict):
-                    session_util = session_report.get("system_utilization_percent", 0)
-                    return session_report, session_util
-            except Exception:
-                logger.error("Error analyzing session for weekly report", exc_info=True)
-
-        return {}, 0
-
     def _accumulate_node_data_for_weekly(
         self, week_node_utilizations: Dict, session_nodes: Dict, proportion: float
     ) -> None:
@@ -783,32 +843,50 @@ class TimeSeriesAnalyzer:
             sessions, start_time, end_time
         )
 
-        # Process each time bucket
-        bucket_reports = []
-        for i, bucket_info in enumerate(time_buckets):
-            bucket_report = self._process_single_daily_bucket(
-                i, bucket_info, filtered_sessions, start_time, end_time
-            )
-            bucket_reports.append(bucket_report)
+        # Extract every bucket, then sweep the sessions into all of them at once
+        all_bucket_data = self._extract_all_bucket_data(
+            time_buckets,
+            start_time,
+            end_time,
+            self._extract_and_validate_daily_bucket_data,
+        )
+        sweep = self._sweep_sessions_into_buckets(
+            [data["times"] if data else None for data in all_bucket_data],
+            filtered_sessions,
+        )
 
-        return bucket_reports
+        return [
+            self._process_single_daily_bucket(i, bucket_data, sweep)
+            for i, bucket_data in enumerate(all_bucket_data)
+        ]
 
-    def _process_single_daily_bucket(
+    def _extract_all_bucket_data(
         self,
-        bucket_index: int,
-        bucket_info: Any,
-        filtered_sessions: List[Dict],
+        time_buckets: List,
         start_time: datetime,
         end_time: datetime,
+        extract: Callable[..., Optional[Dict[str, Any]]],
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Extract and validate each bucket, using None for buckets that fail."""
+
+        all_bucket_data = []
+        for i, bucket_info in enumerate(time_buckets):
+            try:
+                all_bucket_data.append(extract(bucket_info, i, start_time, end_time))
+            except Exception:
+                logger.error("Error extracting bucket %s", i, exc_info=True)
+                all_bucket_data.append(None)
+        return all_bucket_data
+
+    def _process_single_daily_bucket(
+        self,
+        bucket_index: int,
+        bucket_data: Optional[Dict[str, Any]],
+        sweep: Dict[str, List[List]],
     ) -> Dict[str, Any]:
         """Process a single daily bucket with comprehensive error handling."""
 
         try:
-            # Extract and validate bucket data
-            bucket_data = self._extract_and_validate_daily_bucket_data(
-                bucket_info, bucket_index, start_time, end_time
-            )
-
             if not bucket_data:
                 return self._create_error_daily_bucket_report(
                     bucket_index, "Invalid bucket data"
@@ -816,12 +894,11 @@ class TimeSeriesAnalyzer:
 
             bucket_start, bucket_end = bucket_data["times"]
 
-            # Get experiments and process sessions for this day
-            experiments = self._get_experiments_safely(
-                bucket_start, bucket_end, bucket_index
-            )
+            # Process the sessions the sweep assigned to this day
             day_data = self._process_all_sessions_for_day(
-                filtered_sessions, bucket_start, bucket_end, experiments, bucket_index
+                sweep["overlaps"][bucket_index],
+                sweep["experiments"][bucket_index],
+                bucket_index,
             )
 
             # Create and return final report
@@ -876,12 +953,7 @@ class TimeSeriesAnalyzer:
         }
 
     def _process_all_sessions_for_day(
-        self,
-        filtered_sessions: List[Dict],
-        bucket_start: datetime,
-        bucket_end: datetime,
-        experiments: List[Dict],
-        bucket_index: int,
+        self, overlaps: List[Tuple], experiments: List[Dict], bucket_index: int
     ) -> Dict[str, Any]:
         """Process all sessions and accumulate data for the daily bucket."""
 
@@ -890,10 +962,10 @@ class TimeSeriesAnalyzer:
         total_day_active_time = 0
         day_node_utilizations = {}
 
-        for session in filtered_sessions:
+        for overlap in overlaps:
             try:
                 session_result = self._process_daily_session_overlap_and_analysis(
-                    session, bucket_start, bucket_end, experiments
+                    overlap, experiments
                 )
 
                 if session_result:
@@ -923,38 +995,13 @@ class TimeSeriesAnalyzer:
         }
 
     def _process_daily_session_overlap_and_analysis(
-        self,
-        session: Dict,
-        bucket_start: datetime,
-        bucket_end: datetime,
-        experiments: List[Dict],
+        self, overlap: Tuple, experiments: List[Dict]
     ) -> Optional[Dict[str, Any]]:
-        """Process session overlap with daily bucket and perform analysis."""
-
-        session_start = session.get("start_time")
-        session_end = session.get("end_time")
-
-        if not session_start or not session_end:
-            return None
-
-        # Calculate overlap
-        overlap_start = max(bucket_start, session_start)
-        overlap_end = min(bucket_end, session_end)
-
-        if overlap_start >= overlap_end:
-            return None  # No overlap
+        """Process a session's overlap with a daily bucket using its analysis."""
 
+        session, session_report, overlap_start, overlap_end = overlap
         overlap_hours = (overlap_end - overlap_start).total_seconds() / 3600
 
-        # Get session analysis with error handling
-        try:
-            session_report = self.analyzer._analyze_session_utilization(session)
-            if not isinstance(session_report, dict):
-                session_report = {}
-        except Exception:
-            logger.error("Error analyzing session for daily bucket", exc_info=True)
-            session_report = {}
-
         # Extract session metrics with safety checks
         session_util = session_report.get("system_utilization_percent", 0) or 0
         session_active_time = session_report.get("active_time_hours", 0) or 0
@@ -1160,15 +1207,19 @@ class TimeSeriesAnalyzer:
             sessions, start_time, end_time
         )
 
-        # Process each time bucket
-        bucket_reports = []
-        for i, bucket_info in enumerate(time_buckets):
-            bucket_report = self._process_single_monthly_bucket(
-                i, bucket_info, filtered_sessions, start_time, end_time
-            )
-            bucket_reports.append(bucket_report)
+        # Extract every bucket, then sweep the sessions into all of them at once
+        all_bucket_data = self._extract_all_bucket_data(
+            time_buckets, start_time, end_time, self._extract_and_validate_bucket_data
+        )
+        sweep = self._sweep_sessions_into_buckets(
+            [data["times"] if data else None for data in all_bucket_data],
+            filtered_sessions,
+        )
 
-        return bucket_reports
+        return [
+            self._process_single_monthly_bucket(i, bucket_data, sweep)
+            for i, bucket_data in enumerate(all_bucket_data)
+        ]
 
     def _filter_sessions_to_analysis_period(
         self, sessions: List[Dict], start_time: datetime, end_time: datetime
@@ -1195,19 +1246,12 @@ class TimeSeriesAnalyzer:
     def _process_single_monthly_bucket(
         self,
         bucket_index: int,
-        bucket_info: Any,
-        filtered_sessions: List[Dict],
-        start_time: datetime,
-        end_time: datetime,
+        bucket_data: Optional[Dict[str, Any]],
+        sweep: Dict[str, List[List]],
     ) -> Dict[str, Any]:
         """Process a single monthly bucket with comprehensive error handling."""
 
         try:
-            # Extract and validate bucket data
-            bucket_data = self._extract_and_validate_bucket_data(
-                bucket_info, bucket_index, start_time, end_time
-            )
-
             if not bucket_data:
                 return self._create_error_bucket_report(
                     bucket_index, "Invalid bucket data"
@@ -1215,12 +1259,11 @@ class TimeSeriesAnalyzer:
 
             bucket_start, bucket_end = bucket_data["times"]
 
-            # Get experiments and process sessions for this month
-            experiments = self._get_experiments_safely(
-                bucket_start, bucket_end, bucket_index
-            )
+            # Process the sessions the sweep assigned to this month
             month_data = self._process_all_sessions_for_month(
-                filtered_sessions, bucket_start, bucket_end, experiments, bucket_index
+                sweep["overlaps"][bucket_index],
+                sweep["experiments"][bucket_index],
+                bucket_index,
             )
 
             # Create and return final report
@@ -1276,29 +1319,8 @@ class TimeSeriesAnalyzer:
             "period_info": period_info,
         }
 
-    def _get_experiments_safely(
-        self, bucket_start: datetime, bucket_end: datetime, bucket_index: int
-    ) -> List[Dict]:
-        """Get experiments for bucket with error handling."""
-
-        try:
-            experiments = self._get_experiments_in_time_period(bucket_start, bucket_end)
-            return experiments if experiments is not None else []
-        except Exception:
-            logger.error(
-                "Error getting experiments for bucket %s",
-                bucket_index,
-                exc_info=True,
-            )
-            return []
-
     def _process_all_sessions_for_month(
-        self,
-        filtered_sessions: List[Dict],
-        bucket_start: datetime,
-        bucket_end: datetime,
-        experiments: List[Dict],
-        bucket_index: int,
+        self, overlaps: List[Tuple], experiments: List[Dict], bucket_index: int
     ) -> Dict[str, Any]:
         """Process all sessions and accumulate data for the monthly bucket."""
 
@@ -1307,10 +1329,10 @@ class TimeSeriesAnalyzer:
         total_month_active_time = 0
         month_node_utilizations = {}
 
-        for session in filtered_sessions:
+        for overlap in overlaps:
             try:
                 session_result = self._process_session_overlap_and_analysis(
-                    session, bucket_start, bucket_end, experiments
+                    overlap, experiments
                 )
 
                 if session_result:
@@ -1340,40 +1362,13 @@ class TimeSeriesAnalyzer:
         }
 
     def _process_session_overlap_and_analysis(
-        self,
-        session: Dict,
-        bucket_start: datetime,
-        bucket_end: datetime,
-        experiments: List[Dict],
+        self, overlap: Tuple, experiments: List[Dict]
     ) -> Optional[Dict[str, Any]]:
-        """Process session overlap with bucket and perform analysis."""
-
-        session_start = session.get("start_time")
-        session_end = session.get("end_time")
-
-        if not isinstance(session_start, datetime) or not isinstance(
-            session_end, datetime
-        ):
-            return None
-
-        # Calculate overlap
-        overlap_start = max(bucket_start, session_start)
-        overlap_end = min(bucket_end, session_end)
-
-        if overlap_start >= overlap_end:
-            return None  # No overlap
+        """Process a session's overlap with a bucket using its analysis."""
 
+        session, session_report, overlap_start, overlap_end = overlap
         overlap_hours = (overlap_end - overlap_start).total_seconds() / 3600
 
-        # Get session analysis with error handling
-        try:
-            session_report = self.analyzer._analyze_session_utilization(session)
-            if not isinstance(session_report, dict):
-                session_report = {}
-        except Exception:
-            logger.error("Error analyzing session", exc_info=True)
-            session_report = {}
-
         # Extract session metrics with safety checks
         session_util = session_report.get("system_utilization_percent", 0) or 0
         session_active_time = session_report.get("active_time_hours", 0) or 0
@@ -1581,39 +1576,21 @@ class TimeSeriesAnalyzer:
     ) -> List[Dict]:
         """Get experiments that actually started within the given time period."""
 
-        experiment_events = []
-
         # Safety checks for input parameters
         if not start_time or not end_time:
             logger.warning("Invalid time parameters for experiment query")
             return []
 
         # Query for experiment start events in the specific time period
-        queries_to_try = [
-            {
-                "event_type": {"$in": ["experiment_start", "EXPERIMENT_START"]},
-                "event_timestamp": {"$gte": start_time, "$lte": end_time},
-            },
-            {
-                "event_type": {"$in": ["experiment_start", "EXPERIMENT_START"]},
-                "event_timestamp": {
-                    "$gte": start_time.isoformat(),
-                    "$lte": end_time.isoformat(),
-                },
-            },
-        ]
-
-        for query in queries_to_try:
-            try:
-                events = list(
-                    self.events_collection.find(query).sort("event_timestamp", 1)
-                )
-                if events:
-                    experiment_events = events
-                    break
-            except Exception as e:
-                logger.warning("Experiment query failed: %s", e)
-                continue
+        try:
+            experiment_events = self.analyzer._find_events_in_range(
+                start_time,
+                end_time,
+                {"event_type": {"$in": ["experiment_start", "EXPERIMENT_START"]}},
+            )
+        except Exception as e:
+            logger.warning("Experiment query failed: %s", e)
+            experiment_events = []
 
         # Parse and validate timestamps
         valid_experiments = []
@@ -2432,35 +2409,17 @@ class TimeSeriesAnalyzer:
             "EXPERIMENT_COMPLETE",
         ]
 
-        queries_to_try = [
-            {
-                "event_type": {"$in": experiment_event_types},
-                "event_timestamp": {"$gte": start_time, "$lte": end_time},
-            },
-            {
-                "event_type": {"$in": experiment_event_types},
-                "event_timestamp": {
-                    "$gte": start_time.isoformat(),
-                    "$lte": end_time.isoformat(),
-                },
-            },
-        ]
-
         experiment_events = {}
 
-        for query in queries_to_try:
-            try:
-                events = list(
-                    self.events_collection.find(query).sort("event_timestamp", 1)
-                )
-                if events:
-                    self._process_experiment_events(
-                        events, experiment_events, experiment_ids_filter
-                    )
-                    break
-            except Exception as e:
-                logger.warning("Error querying experiment events: %s", e)
-                continue
+        try:
+            events = self.analyzer._find_events_in_range(
+                start_time, end_time, {"event_type": {"$in": experiment_event_types}}
+            )
+            self._process_experiment_events(
+                events, experiment_events, experiment_ids_filter
+            )
+        except Exception as e:
+            logger.warning("Error querying experiment events: %s", e)
 
         return experiment_events
 
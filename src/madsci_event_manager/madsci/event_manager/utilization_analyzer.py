@@ -3,7 +3,7 @@
 import logging
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from madsci.common.types.event_types import (
     EventType,
@@ -14,6 +14,26 @@ from pymongo.synchronous.collection import Collection
 
 logger = logging.getLogger(__name__)
 
+WORKFLOW_EVENT_TYPES = [
+    "workflow_start",
+    "workflow_complete",
+    "WORKFLOW_START",
+    "WORKFLOW_COMPLETE",
+]
+# event_data fields read by the user report; everything else is left in MongoDB
+WORKFLOW_EVENT_DATA_FIELDS = [
+    "workflow_id",
+    "name",
+    "workflow_name",
+    "author",
+    "definition_metadata.author",
+    "workflow_definition_metadata.author",
+    "status",
+    "duration_seconds",
+    "start_time",
+    "end_time",
+]
+
 
 class UtilizationAnalyzer:
     """Analyzes system utilization based on session detection and event processing."""
@@ -39,7 +59,12 @@ class UtilizationAnalyzer:
             raise
 
         # Cache for name resolution to avoid repeated lookups
-        self.name_cache = {"nodes": {}, "experiments": {}, "workcells": {}}
+        self.name_cache = {
+            "nodes": {},
+            "experiments": {},
+            "workcells": {},
+            "workcell_ids": {},
+        }
 
     def generate_session_based_report(
         self, start_time: Optional[datetime] = None, end_time: Optional[datetime] = None
@@ -226,13 +251,18 @@ class UtilizationAnalyzer:
                     now = datetime.now(timezone.utc).replace(tzinfo=None)
                     return now - timedelta(days=1), now
 
+                timed_events = {"event_time": {"$ne": None}}
                 earliest_cursor = (
-                    self.events_collection.find().sort("event_timestamp", 1).limit(1)
+                    self.events_collection.find(timed_events)
+                    .sort("event_time", 1)
+                    .limit(1)
                 )
                 earliest_events = list(earliest_cursor)
 
                 latest_cursor = (
-                    self.events_collection.find().sort("event_timestamp", -1).limit(1)
+                    self.events_collection.find(timed_events)
+                    .sort("event_time", -1)
+                    .limit(1)
                 )
                 latest_events = list(latest_cursor)
 
@@ -343,64 +373,38 @@ class UtilizationAnalyzer:
             "workcell_start",
         ]
 
-        # Try multiple query strategies for timestamp format compatibility
-        queries_to_try = [
-            {
-                "event_type": {"$in": start_event_types},
-                "event_timestamp": {"$gte": start_time, "$lte": end_time},
-            },
-            {
-                "event_type": {"$in": start_event_types},
-                "event_timestamp": {
-                    "$gte": start_time.isoformat(),
-                    "$lte": end_time.isoformat(),
-                },
-            },
-            {"event_type": {"$in": start_event_types}},
-        ]
-
-        start_events = []
-
-        for i, query in enumerate(queries_to_try):
-            try:
-                events = list(
-                    self.events_collection.find(query).sort("event_timestamp", 1)
-                )
-
-                if events:
-                    start_events = self._filter_events_by_timeframe(
-                        events, i, start_time, end_time
-                    )
-                    break
-
-            except Exception:
-                logger.warning(
-                    "Query failed",
-                    event_type=EventType.LOG_WARNING,
-                    query_index=i + 1,
-                    exc_info=True,
-                )
-                continue
-
-        return start_events
+        try:
+            return self._find_events_in_range(
+                start_time, end_time, {"event_type": {"$in": start_event_types}}
+            )
+        except Exception:
+            logger.warning(
+                "Session start event query failed",
+                event_type=EventType.LOG_WARNING,
+                exc_info=True,
+            )
+            return []
 
-    def _filter_events_by_timeframe(
+    def _find_events_in_range(
         self,
-        events: List[Dict],
-        query_index: int,
         start_time: datetime,
         end_time: datetime,
+        query: Optional[Dict[str, Any]] = None,
     ) -> List[Dict]:
-        """Filter events by timeframe if needed (for fallback query)."""
+        """Find events matching a query within a timeframe, oldest first.
 
-        if query_index == 2:  # No time constraint query - manual filtering needed
-            filtered_events = []
-            for event in events:
-                event_time = self._parse_timestamp_utc(event["event_timestamp"])
-                if event_time and start_time <= event_time <= end_time:
-                    filtered_events.append(event)
-            return filtered_events
-        return events
+        Filters and sorts on the native datetime ``event_time`` field, so the
+        query is served by the ``event_time`` indexes and only reads events
+        inside the timeframe.
+        """
+        range_query = {
+            **(query or {}),
+            "event_time": {
+                "$gte": self._parse_timestamp_utc(start_time),
+                "$lte": self._parse_timestamp_utc(end_time),
+            },
+        }
+        return list(self.events_collection.find(range_query).sort("event_time", 1))
 
     def _create_session_from_event(
         self, start_event: Dict, all_start_events: List[Dict], end_time: datetime
@@ -537,8 +541,9 @@ class UtilizationAnalyzer:
                             {"source.manager_id": workcell_id},
                             {"event_data.workcell_id": workcell_id},
                         ],
+                        "event_time": {"$gt": start_after, "$lte": end_time},
                     }
-                ).sort("event_timestamp", 1)
+                ).sort("event_time", 1)
             )
 
             for stop_event in stop_events:
@@ -578,6 +583,7 @@ class UtilizationAnalyzer:
             session_name = self._resolve_session_name(session)
 
             # Build experiment details
+            self._prefetch_experiment_names(system_util.active_experiments)
             experiment_details = []
             for exp_id in system_util.active_experiments:
                 exp_name = self._resolve_experiment_name(exp_id)
@@ -702,54 +708,7 @@ class UtilizationAnalyzer:
     ) -> List[Dict]:
         """Get all events for a session timeframe."""
         try:
-            # Try multiple query approaches for timestamp formats
-            queries_to_try = [
-                {"event_timestamp": {"$gte": start_time, "$lte": end_time}},
-                {
-                    "event_timestamp": {
-                        "$gte": start_time.isoformat(),
-                        "$lte": end_time.isoformat(),
-                    }
-                },
-                {},  # Get all and filter manually
-            ]
-
-            events = []
-
-            for i, query in enumerate(queries_to_try):
-                try:
-                    if i == 2:  # Manual filtering for fallback query
-                        all_events = list(
-                            self.events_collection.find().sort("event_timestamp", 1)
-                        )
-                        events = [
-                            event
-                            for event in all_events
-                            if (
-                                event_time := self._parse_timestamp_utc(
-                                    event.get("event_timestamp")
-                                )
-                            )
-                            and start_time <= event_time <= end_time
-                        ]
-                    else:
-                        events = list(
-                            self.events_collection.find(query).sort(
-                                "event_timestamp", 1
-                            )
-                        )
-
-                    if events:
-                        break
-
-                except Exception:
-                    logger.warning(
-                        "Event query failed",
-                        event_type=EventType.LOG_WARNING,
-                        query_index=i + 1,
-                        exc_info=True,
-                    )
-                    continue
+            events = self._find_events_in_range(start_time, end_time)
 
             # Parse all timestamps to UTC and filter valid events
             valid_events = [
@@ -912,6 +871,10 @@ class UtilizationAnalyzer:
         if not entity_id:
             return False
 
+        # Node utilization checks every node event's ID, so cache the answer
+        if entity_id in self.name_cache["workcell_ids"]:
+            return self.name_cache["workcell_ids"][entity_id]
+
         try:
             # Check if this ID has workcell start/stop events or appears as workcell source
             workcell_events = list(
@@ -940,7 +903,9 @@ class UtilizationAnalyzer:
                 ).limit(1)
             )
 
-            return len(workcell_events) > 0
+            is_workcell = len(workcell_events) > 0
+            self.name_cache["workcell_ids"][entity_id] = is_workcell
+            return is_workcell
 
         except Exception:
             logger.warning(
@@ -1216,66 +1181,44 @@ class UtilizationAnalyzer:
     def _get_workflow_events_for_users(
         self, start_time: datetime, end_time: datetime
     ) -> List[Dict]:
-        """Get workflow start and complete events for user analysis."""
+        """Get workflow start and complete events for user analysis, oldest first.
 
-        workflow_event_types = [
-            "workflow_start",
-            "workflow_complete",
-            "WORKFLOW_START",
-            "WORKFLOW_COMPLETE",
-        ]
+        The query filters and sorts on the indexed ``event_type`` and
+        ``event_time`` fields and projects only the event_data fields the user
+        report reads, so MongoDB returns small rows instead of full event
+        documents.
+        """
 
-        # Use multi-strategy approach
-        queries_to_try = [
-            {
-                "event_type": {"$in": workflow_event_types},
-                "event_timestamp": {"$gte": start_time, "$lte": end_time},
-            },
-            {
-                "event_type": {"$in": workflow_event_types},
-                "event_timestamp": {
-                    "$gte": start_time.isoformat(),
-                    "$lte": end_time.isoformat(),
-                },
+        query = {
+            "event_type": {"$in": WORKFLOW_EVENT_TYPES},
+            "event_time": {
+                "$gte": self._parse_timestamp_utc(start_time),
+                "$lte": self._parse_timestamp_utc(end_time),
             },
-            {"event_type": {"$in": workflow_event_types}},
-        ]
-
-        events = []
-
-        for i, query in enumerate(queries_to_try):
-            try:
-                if i == 2:  # Filter manually
-                    all_events = list(
-                        self.events_collection.find(query).sort("event_timestamp", 1)
-                    )
-                    for event in all_events:
-                        event_time = self._parse_timestamp_utc(
-                            event.get("event_timestamp")
-                        )
-                        if event_time and start_time <= event_time <= end_time:
-                            events.append(event)
-                else:
-                    events = list(
-                        self.events_collection.find(query).sort("event_timestamp", 1)
-                    )
-
-                if events:
-                    break
-
-            except Exception:
-                logger.warning(
-                    "Workflow query failed",
-                    event_type=EventType.LOG_WARNING,
-                    query_index=i + 1,
-                    exc_info=True,
-                )
-                continue
+            "event_data.workflow_id": {"$nin": [None, ""]},
+        }
+        projection = {
+            "_id": 0,
+            "event_type": 1,
+            "event_time": 1,
+            **{f"event_data.{field}": 1 for field in WORKFLOW_EVENT_DATA_FIELDS},
+        }
+        try:
+            events = list(
+                self.events_collection.find(query, projection).sort("event_time", 1)
+            )
+        except Exception:
+            logger.warning(
+                "Workflow query failed",
+                event_type=EventType.LOG_WARNING,
+                exc_info=True,
+            )
+            events = []
 
         # Parse timestamps
         valid_events = []
         for event in events:
-            event_time = self._parse_timestamp_utc(event.get("event_timestamp"))
+            event_time = self._parse_timestamp_utc(event.get("event_time"))
             if event_time:
                 event["parsed_timestamp"] = event_time
                 valid_events.append(event)
@@ -1948,7 +1891,7 @@ class UtilizationAnalyzer:
                 start_events = list(
                     self.events_collection.find(
                         {
-                            "event_timestamp": session["start_time"],
+                            "event_time": session["start_time"],
                             "event_type": {
                                 "$in": [
                                     f"{session_type}_start",
@@ -2037,50 +1980,15 @@ class UtilizationAnalyzer:
 
             exp_start_events = list(
                 self.events_collection.find(
-                    {
-                        "event_type": {
-                            "$in": [
-                                "experiment_start",
-                                EventType.EXPERIMENT_START.value,
-                            ]
-                        },
-                        "$or": [
-                            {"source.experiment_id": experiment_id},
-                            {"event_data.experiment_id": experiment_id},
-                            {"event_data.experiment._id": experiment_id},
-                            {"event_data.experiment.experiment_id": experiment_id},
-                        ],
-                    }
+                    self._experiment_start_query({"$eq": experiment_id})
                 ).limit(5)
             )
 
             for event in exp_start_events:
-                event_data = event.get("event_data", {})
-
-                # Check nested experiment.experiment_design.experiment_name
-                name_candidates = [
-                    event_data.get("experiment_name"),
-                    event_data.get("name"),
-                    event_data.get("experiment", {}).get("name")
-                    if isinstance(event_data.get("experiment"), dict)
-                    else None,
-                    event_data.get("experiment", {})
-                    .get("experiment_design", {})
-                    .get("experiment_name")
-                    if isinstance(
-                        event_data.get("experiment", {}).get("experiment_design"), dict
-                    )
-                    else None,
-                    event_data.get("experiment", {}).get("run_name")
-                    if isinstance(event_data.get("experiment"), dict)
-                    else None,
-                ]
-
-                for name in name_candidates:
-                    if name and isinstance(name, str) and name.strip():
-                        clean_name = name.strip()
-                        self.name_cache["experiments"][experiment_id] = clean_name
-                        return clean_name
+                clean_name = self._experiment_name_from_event(event)
+                if clean_name:
+                    self.name_cache["experiments"][experiment_id] = clean_name
+                    return clean_name
 
             self.name_cache["experiments"][experiment_id] = None
             return None
@@ -2093,3 +2001,76 @@ class UtilizationAnalyzer:
                 exc_info=True,
             )
             return None
+
+    def _prefetch_experiment_names(self, experiment_ids: Iterable[str]) -> None:
+        """Resolve names for many experiments with one query, filling the name cache."""
+
+        missing = {
+            experiment_id
+            for experiment_id in experiment_ids
+            if experiment_id and experiment_id not in self.name_cache["experiments"]
+        }
+        if not missing:
+            return
+
+        try:
+            exp_start_events = self.events_collection.find(
+                self._experiment_start_query({"$in": list(missing)})
+            )
+            names: Dict[str, Optional[str]] = dict.fromkeys(missing)
+            for event in exp_start_events:
+                experiment_id = self._extract_experiment_id(event)
+                if experiment_id in names and not names[experiment_id]:
+                    names[experiment_id] = self._experiment_name_from_event(event)
+        except Exception:
+            logger.warning("Error prefetching experiment names", exc_info=True)
+            return
+
+        self.name_cache["experiments"].update(names)
+
+    def _experiment_start_query(self, id_condition: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a query for experiment start events whose ID matches a condition."""
+
+        return {
+            "event_type": {
+                "$in": [
+                    "experiment_start",
+                    EventType.EXPERIMENT_START.value,
+                ]
+            },
+            "$or": [
+                {"source.experiment_id": id_condition},
+                {"event_data.experiment_id": id_condition},
+                {"event_data.experiment._id": id_condition},
+                {"event_data.experiment.experiment_id": id_condition},
+            ],
+        }
+
+    def _experiment_name_from_event(self, event: Dict) -> Optional[str]:
+        """Extract an experiment's name from its start event, if it has one."""
+
+        event_data = event.get("event_data", {})
+
+        # Check nested experiment.experiment_design.experiment_name
+        name_candidates = [
+            event_data.get("experiment_name"),
+            event_data.get("name"),
+            event_data.get("experiment", {}).get("name")
+            if isinstance(event_data.get("experiment"), dict)
+            else None,
+            event_data.get("experiment", {})
+            .get("experiment_design", {})
+            .get("experiment_name")
+            if isinstance(
+                event_data.get("experiment", {}).get("experiment_design"), dict
+            )
+            else None,
+            event_data.get("experiment", {}).get("run_name")
+            if isinstance(event_data.get("experiment"), dict)
+            else None,
+        ]
+
+        for name in name_candidates:
+            if name and isinstance(name, str) and name.strip():
+                return name.strip()
+        return None
@@ -0,0 +1,1051 @@
+"""Incrementally maintained hourly utilization rollups for the Event Manager.
+
+Instead of replaying every raw event on each report request, a catch-up job
+folds new activity events into per-hour aggregates for nodes, workcells, users
+and the system as a whole. Reports are then assembled from those hourly
+documents, and only the partial hours at the edges of a report (and anything
+newer than the rollup watermark) are replayed from raw events.
+"""
+
+import bisect
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from madsci.common.utils import to_naive_utc
+from madsci.event_manager.time_series_analyzer import TimeSeriesAnalyzer
+from madsci.event_manager.utilization_analyzer import UtilizationAnalyzer
+from pymongo.synchronous.collection import Collection
+
+logger = logging.getLogger(__name__)
+
+HOUR = timedelta(hours=1)
+STATE_ID = "rollup_state"
+ROLLUP_SCOPES = ["node", "workcell", "user", "system"]
+
+ROLLUP_EVENT_TYPES = [
+    event_type
+    for name in (
+        "node_start",
+        "node_stop",
+        "action_status_change",
+        "workcell_start",
+        "workcell_stop",
+        "lab_start",
+        "lab_stop",
+        "experiment_start",
+        "experiment_complete",
+        "experiment_failed",
+        "experiment_cancelled",
+        "workflow_start",
+        "workflow_complete",
+    )
+    for event_type in (name, name.upper())
+]
+
+EXPERIMENT_END_TYPES = (
+    "experiment_complete",
+    "experiment_failed",
+    "experiment_cancelled",
+)
+
+WORKFLOW_STATUS_FIELDS = {
+    "completed": "completed_workflows",
+    "failed": "failed_workflows",
+    "cancelled": "cancelled_workflows",
+}
+
+# Rollup keys are (scope, key, slot start)
+RollupKey = Tuple[str, str, datetime]
+
+# Events are processed in this order, so batches can resume after a position
+# even when many events share a timestamp
+EVENT_ORDER = [("event_time", 1), ("_id", 1)]
+
+
+def _floor_hour(timestamp: datetime) -> datetime:
+    """Truncate a timestamp to the start of its hour."""
+    return timestamp.replace(minute=0, second=0, microsecond=0)
+
+
+def _stored_time(event_time: datetime) -> datetime:
+    """Normalize an ``event_time`` read back from MongoDB, which is naive UTC unless the client is timezone-aware."""
+    if event_time.tzinfo is not None:
+        return to_naive_utc(event_time)
+    return event_time
+
+
+def _events_after(
+    start: datetime, include_start: bool, after_id: Optional[Any] = None
+) -> Dict[str, Any]:
+    """Build a query for activity events after a position in ``EVENT_ORDER``.
+
+    Events at ``start`` are included if ``include_start`` is set, or else only
+    those whose ``_id`` comes after ``after_id``, if it is given.
+    """
+    query: Dict[str, Any] = {"event_type": {"$in": ROLLUP_EVENT_TYPES}}
+    if include_start or after_id is None:
+        query["event_time"] = {"$gte" if include_start else "$gt": start}
+    else:
+        query["event_time"] = {"$gte": start}
+        query["$or"] = [{"event_time": {"$gt": start}}, {"_id": {"$gt": after_id}}]
+    return query
+
+
+def mark_late_events(
+    rollups_collection: Collection, events: Iterable[Dict[str, Any]]
+) -> None:
+    """Flag newly stored activity events the rollups may already have passed.
+
+    That is any event at or before the watermark, or at or before the cutoff of
+    the batch being processed, which may have been queried before the event was
+    stored. The next catch-up rewinds the rollups to the hour of the earliest
+    flagged event and folds everything from there in again.
+    """
+    event_times = [
+        _stored_time(event["event_time"])
+        for event in events
+        if event.get("event_type") in ROLLUP_EVENT_TYPES
+        and event.get("event_time") is not None
+    ]
+    if not event_times:
+        return
+    earliest = min(event_times)
+    rollups_collection.update_one(
+        {
+            "_id": STATE_ID,
+            "$or": [
+                {"watermark": {"$gte": earliest}},
+                {"processing_until": {"$gte": earliest}},
+            ],
+        },
+        {"$min": {"late_event_time": earliest}},
+    )
+
+
+def _new_metrics() -> Dict[str, Dict[str, float]]:
+    """Create an empty metrics record with summed, minimum and maximum values."""
+    return {"inc": defaultdict(float), "min": {}, "max": {}}
+
+
+class RollupAccumulator:
+    """Replays activity events in time order and credits elapsed time to slots.
+
+    Slots are hours, optionally split further at extra ``cuts`` so a report can
+    attribute time to buckets that don't start on the hour. State carried
+    between events (busy nodes, running experiments, open workcell sessions and
+    in-flight workflows) can be snapshotted and restored, which is how the
+    catch-up job resumes and how partial hours are replayed from a checkpoint.
+    """
+
+    def __init__(
+        self,
+        analyzer: UtilizationAnalyzer,
+        clock: datetime,
+        state: Optional[Dict[str, Any]] = None,
+        cuts: Optional[Iterable[datetime]] = None,
+        record_checkpoints: bool = False,
+    ) -> None:
+        """Initialize the accumulator at ``clock`` from an optional snapshot."""
+        self.analyzer = analyzer
+        self.clock = clock
+        self.cuts = sorted(set(cuts or []))
+        self.record_checkpoints = record_checkpoints
+        self.metrics: Dict[RollupKey, Dict[str, Dict[str, float]]] = defaultdict(
+            _new_metrics
+        )
+        self.checkpoints: Dict[datetime, Dict[str, Any]] = {}
+
+        state = state or {}
+        self.busy_nodes: Dict[str, Set[str]] = {
+            node_id: set(actions) for node_id, actions in state.get("busy_nodes", [])
+        }
+        self.active_nodes: Set[str] = set(state.get("active_nodes", []))
+        self.experiments: Set[str] = set(state.get("experiments", []))
+        self.workcells: Set[str] = set(state.get("workcells", []))
+        self.workflows: Dict[str, Dict[str, Any]] = {
+            workflow["workflow_id"]: workflow for workflow in state.get("workflows", [])
+        }
+
+    # --- State ---
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the carried state as a MongoDB-safe document."""
+        return {
+            "busy_nodes": [
+                [node_id, sorted(actions)]
+                for node_id, actions in sorted(self.busy_nodes.items())
+            ],
+            "active_nodes": sorted(self.active_nodes),
+            "experiments": sorted(self.experiments),
+            "workcells": sorted(self.workcells),
+            "workflows": list(self.workflows.values()),
+        }
+
+    def _has_open_intervals(self) -> bool:
+        """Whether any time-based state is currently open."""
+        return bool(
+            self.busy_nodes
+            or self.active_nodes
+            or self.experiments
+            or self.workcells
+            or self.workflows
+        )
+
+    # --- Time ---
+
+    def slot_start(self, timestamp: datetime) -> datetime:
+        """Return the start of the slot containing ``timestamp``."""
+        hour = _floor_hour(timestamp)
+        index = bisect.bisect_right(self.cuts, timestamp)
+        if index and self.cuts[index - 1] > hour:
+            return self.cuts[index - 1]
+        return hour
+
+    def _next_boundary(self, timestamp: datetime) -> datetime:
+        """Return the first slot boundary strictly after ``timestamp``."""
+        next_hour = _floor_hour(timestamp) + HOUR
+        index = bisect.bisect_right(self.cuts, timestamp)
+        if index < len(self.cuts):
+            return min(next_hour, self.cuts[index])
+        return next_hour
+
+    def advance(self, until: datetime) -> None:
+        """Credit the open state to every slot between the clock and ``until``."""
+        if until <= self.clock:
+            return
+        if not self._has_open_intervals():
+            self.clock = until
+            return
+
+        while self.clock < until:
+            slot_end = min(self._next_boundary(self.clock), until)
+            self._credit(
+                self.slot_start(self.clock), (slot_end - self.clock).total_seconds()
+            )
+            self.clock = slot_end
+            if self.record_checkpoints and slot_end == _floor_hour(slot_end):
+                self.checkpoints[slot_end] = self.snapshot()
+
+    def _credit(self, slot: datetime, seconds: float) -> None:
+        """Credit ``seconds`` of the current state to ``slot``."""
+        for node_id in self.busy_nodes:
+            self._inc("node", node_id, slot, "busy_seconds", seconds)
+        for node_id in self.active_nodes:
+            self._inc("node", node_id, slot, "active_seconds", seconds)
+        if self.experiments:
+            self._inc("system", "", slot, "active_seconds", seconds)
+        if self.workcells:
+            self._inc("system", "", slot, "runtime_seconds", seconds)
+        for workcell_id in self.workcells:
+            self._inc("workcell", workcell_id, slot, "runtime_seconds", seconds)
+            if self.experiments:
+                self._inc("workcell", workcell_id, slot, "active_seconds", seconds)
+
+    def _inc(
+        self, scope: str, key: str, slot: datetime, field: str, amount: float
+    ) -> None:
+        self.metrics[(scope, key, slot)]["inc"][field] += amount
+
+    # --- Events ---
+
+    def process(self, event: Dict[str, Any]) -> None:
+        """Advance to an event's time and apply it to the carried state."""
+        event_time = _stored_time(event["event_time"])
+        self.advance(event_time)
+        slot = self.slot_start(event_time)
+        event_type = str(event.get("event_type", "")).lower()
+
+        if event_type in ("node_start", "node_stop", "action_status_change"):
+            self._process_node_event(event, event_type)
+        elif event_type in ("workcell_start", "lab_start"):
+            self.workcells.add(self._workcell_id(event, event_time))
+        elif event_type in ("workcell_stop", "lab_stop"):
+            self.workcells.discard(self._workcell_id(event, event_time))
+        elif event_type == "experiment_start":
+            self._process_experiment_start(event, slot)
+        elif event_type in EXPERIMENT_END_TYPES:
+            experiment_id = self.analyzer._extract_experiment_id(event)
+            self.experiments.discard(experiment_id)
+        elif event_type == "workflow_start":
+            self._process_workflow_start(event, event_time, slot)
+        elif event_type == "workflow_complete":
+            self._process_workflow_complete(event, event_time, slot)
+
+    def _process_node_event(self, event: Dict[str, Any], event_type: str) -> None:
+        node_id = self._node_id(event)
+        if not node_id:
+            return
+
+        if event_type == "node_start":
+            self.active_nodes.add(node_id)
+        elif event_type == "node_stop":
+            self.active_nodes.discard(node_id)
+            self.busy_nodes.pop(node_id, None)
+        else:
+            action_id = self.analyzer._extract_action_id(event)
+            status = self.analyzer._extract_status(event)
+            if not action_id:
+                return
+            if self.analyzer._is_action_starting_status(status):
+                self.busy_nodes.setdefault(node_id, set()).add(action_id)
+            elif self.analyzer._is_action_ending_status(status):
+                actions = self.busy_nodes.get(node_id, set())
+                actions.discard(action_id)
+                if not actions:
+                    self.busy_nodes.pop(node_id, None)
+
+    def _process_experiment_start(self, event: Dict[str, Any], slot: datetime) -> None:
+        experiment_id = self.analyzer._extract_experiment_id(event)
+        if not experiment_id:
+            return
+        self.experiments.add(experiment_id)
+        self._inc("system", "", slot, "experiments_started", 1)
+        for workcell_id in self.workcells:
+            self._inc("workcell", workcell_id, slot, "experiments_started", 1)
+
+    def _process_workflow_start(
+        self, event: Dict[str, Any], event_time: datetime, slot: datetime
+    ) -> None:
+        event_data = event.get("event_data") or {}
+        workflow_id = event_data.get("workflow_id")
+        if not workflow_id:
+            return
+        author = self.analyzer._normalize_author(
+            self.analyzer._extract_author(event_data)
+        )
+        self.workflows[str(workflow_id)] = {
+            "workflow_id": str(workflow_id),
+            "author": author,
+            "start_time": event_time,
+        }
+        self._inc("user", author, slot, "workflows", 1)
+
+    def _process_workflow_complete(
+        self, event: Dict[str, Any], event_time: datetime, slot: datetime
+    ) -> None:
+        event_data = event.get("event_data") or {}
+        workflow_id = event_data.get("workflow_id")
+        if not workflow_id:
+            return
+        started = self.workflows.pop(str(workflow_id), None)
+        author = self.analyzer._normalize_author(
+            self.analyzer._extract_author(event_data) or (started or {}).get("author")
+        )
+        if started is None:
+            # Completion without a recorded start still counts as a workflow
+            self._inc("user", author, slot, "workflows", 1)
+            started = {}
+
+        status = self.analyzer._extract_workflow_completion_status(event_data)
+        if status in WORKFLOW_STATUS_FIELDS:
+            self._inc("user", author, slot, WORKFLOW_STATUS_FIELDS[status], 1)
+
+        workflow = {"start_time": started.get("start_time"), "end_time": event_time}
+        self.analyzer._set_workflow_duration(workflow, event_data)
+        duration = workflow["duration_seconds"]
+        if duration is None:
+            return
+        metrics = self.metrics[("user", author, slot)]
+        metrics["inc"]["runtime_seconds"] += duration
+        metrics["inc"]["timed_workflows"] += 1
+        metrics["min"]["shortest_seconds"] = min(
+            duration, metrics["min"].get("shortest_seconds", duration)
+        )
+        metrics["max"]["longest_seconds"] = max(
+            duration, metrics["max"].get("longest_seconds", duration)
+        )
+
+    def _node_id(self, event: Dict[str, Any]) -> Optional[str]:
+        """Extract a node ID without falling back to the workcell ID."""
+        source = event.get("source") or {}
+        if isinstance(source, dict) and source.get("node_id"):
+            return str(source["node_id"])
+        event_data = event.get("event_data") or {}
+        if isinstance(event_data, dict):
+            node_id = (
+                event_data.get("node_id")
+                or event_data.get("node_name")
+                or event_data.get("node")
+            )
+            if node_id:
+                return str(node_id)
+        return None
+
+    def _workcell_id(self, event: Dict[str, Any], event_time: datetime) -> str:
+        return self.analyzer._extract_session_info(event, event_time)["workcell_id"]
+
+
+class UtilizationRollups:
+    """Maintains hourly utilization rollups and builds reports from them.
+
+    Rollup documents live in their own collection, keyed by scope (``node``,
+    ``workcell``, ``user`` or ``system``), entity key and hour. A single state
+    document holds the watermark (every activity event before it, and at it
+    up to the recorded ``watermark_id``, has been folded in) and the state
+    carried across it. Hourly checkpoint documents record the carried state at
+    each hour boundary so partial hours can be replayed exactly, and let the
+    catch-up rewind to the hour of an event that arrived after the watermark
+    had already passed it.
+    """
+
+    def __init__(
+        self,
+        analyzer: UtilizationAnalyzer,
+        rollups_collection: Collection,
+        lag_seconds: float = 300,
+        batch_size: int = 5000,
+    ) -> None:
+        """Initialize with an analyzer over the events collection."""
+        self.analyzer = analyzer
+        self.events_collection = analyzer.events_collection
+        self.rollups = rollups_collection
+        self.lag = timedelta(seconds=lag_seconds)
+        self.batch_size = batch_size
+
+    def ensure_indexes(self) -> None:
+        """Create the indexes used to read rollups by scope and hour."""
+        self.rollups.create_index([("scope", 1), ("hour", 1)])
+
+    def get_watermark(self) -> Optional[datetime]:
+        """Return the rollup watermark, or None if rollups were never built."""
+        state = self.rollups.find_one({"_id": STATE_ID})
+        return state.get("watermark") if state else None
+
+    def rebuild(self) -> None:
+        """Drop all rollups so the next catch-up rebuilds them from raw events."""
+        self.rollups.delete_many({})
+
+    # --- Catch-up ---
+
+    def catch_up(self, now: Optional[datetime] = None) -> int:
+        """Fold all activity events older than the configured lag into rollups.
+
+        Returns:
+            The number of events processed
+        """
+        cutoff = to_naive_utc(now or datetime.now(timezone.utc)) - self.lag
+        self._rewind_for_late_events()
+        total = 0
+        while True:
+            processed, done = self._process_next_batch(cutoff)
+            total += processed
+            if done:
+                logger.debug("Folded %s events into utilization rollups", total)
+                return total
+
+    def _rewind_for_late_events(self) -> None:
+        """Rewind the rollups to the hour of the earliest late event, if any.
+
+        A batch whose write was interrupted, leaving some of its increments
+        applied, rewinds them to the hour of the watermark it started from.
+        Rollups from that hour on are dropped and the watermark moves back to
+        the hour's checkpoint, so the next batches fold the late events in
+        alongside the ones already counted, and count each event exactly once.
+        """
+        state = self.rollups.find_one({"_id": STATE_ID})
+        if not state:
+            return
+        late_event_time = state.get("late_event_time")
+        watermark = state.get("watermark")
+        hours = []
+        if (
+            late_event_time is not None
+            and watermark is not None
+            and _floor_hour(late_event_time) <= watermark
+        ):
+            hours.append(_floor_hour(late_event_time))
+        if state.get("batch_in_progress"):
+            if watermark is None:
+                # * Nothing was committed yet, so start over from scratch
+                self.rollups.delete_many(
+                    {"scope": {"$in": [*ROLLUP_SCOPES, "checkpoint"]}}
+                )
+                self.rollups.update_one(
+                    {"_id": STATE_ID},
+                    {"$unset": {"batch_in_progress": "", "processing_until": ""}},
+                )
+            else:
+                hours.append(_floor_hour(watermark))
+        if hours:
+            hour = min(hours)
+            checkpoint = self.rollups.find_one(
+                {"_id": f"checkpoint|{hour.isoformat()}"}
+            )
+            self.rollups.delete_many(
+                {"scope": {"$in": ROLLUP_SCOPES}, "hour": {"$gte": hour}}
+            )
+            self.rollups.delete_many({"scope": "checkpoint", "hour": {"$gt": hour}})
+            self.rollups.update_one(
+                {"_id": STATE_ID},
+                {
+                    "$set": {
+                        "watermark": hour,
+                        # * Checkpoints hold the state before any events at their hour
+                        "watermark_inclusive": True,
+                        "watermark_id": None,
+                        "state": checkpoint["state"] if checkpoint else {},
+                        "updated_at": datetime.now(timezone.utc).replace(tzinfo=None),
+                    },
+                    # * The batches from the rewound watermark will see every event again
+                    "$unset": {"processing_until": "", "batch_in_progress": ""},
+                },
+            )
+            logger.info("Rewound utilization rollups to %s", hour)
+        if late_event_time is not None:
+            # * Keep the flag if an even earlier event was flagged in the meantime
+            self.rollups.update_one(
+                {"_id": STATE_ID, "late_event_time": late_event_time},
+                {"$unset": {"late_event_time": ""}},
+            )
+
+    def _process_next_batch(self, cutoff: datetime) -> Tuple[int, bool]:
+        """Process one batch of events after the watermark.
+
+        Returns:
+            The number of events processed and whether the cutoff was reached
+        """
+        state = self.rollups.find_one({"_id": STATE_ID})
+        include_watermark = False
+        watermark_id = None
+        if state is None or state.get("watermark") is None:
+            watermark = self._initial_watermark(cutoff)
+            accumulator = RollupAccumulator(
+                self.analyzer, watermark, record_checkpoints=True
+            )
+        else:
+            watermark = state["watermark"]
+            include_watermark = state.get("watermark_inclusive", False)
+            watermark_id = state.get("watermark_id")
+            accumulator = RollupAccumulator(
+                self.analyzer,
+                watermark,
+                state=state.get("state"),
+                record_checkpoints=True,
+            )
+        if watermark >= cutoff:
+            return 0, True
+
+        # * Recorded before querying, so events stored after the query are flagged as late
+        self.rollups.update_one(
+            {"_id": STATE_ID},
+            {
+                "$set": {
+                    "scope": "state",
+                    "processing_until": cutoff,
+                    "batch_in_progress": True,
+                }
+            },
+            upsert=True,
+        )
+        query = _events_after(watermark, include_watermark, watermark_id)
+        query["event_time"]["$lte"] = cutoff
+        events = list(
+            self.events_collection.find(query).sort(EVENT_ORDER).limit(self.batch_size)
+        )
+
+        for event in events:
+            accumulator.process(event)
+
+        done = len(events) < self.batch_size
+        if done:
+            accumulator.advance(cutoff)
+            self._write(accumulator)
+        else:
+            accumulator.advance(_stored_time(events[-1]["event_time"]))
+            self._write(accumulator, watermark_id=events[-1]["_id"])
+        return len(events), done
+
+    def _initial_watermark(self, cutoff: datetime) -> datetime:
+        """Start just before the earliest activity event, or at the cutoff."""
+        earliest = list(
+            self.events_collection.find(
+                {"event_type": {"$in": ROLLUP_EVENT_TYPES}, "event_time": {"$ne": None}}
+            )
+            .sort("event_time", 1)
+            .limit(1)
+        )
+        if not earliest:
+            return cutoff
+        return _stored_time(earliest[0]["event_time"]) - timedelta(microseconds=1)
+
+    def _write(
+        self, accumulator: RollupAccumulator, watermark_id: Optional[Any] = None
+    ) -> None:
+        """Persist an accumulator's increments, checkpoints and state.
+
+        ``watermark_id`` is the ``_id`` of the last event processed, when the
+        batch stopped partway through the events at the watermark's time.
+
+        The state document is written last and clears the batch's in-progress
+        flag. If the write is interrupted, the flag is still set on the next
+        run, which rewinds past the partly applied increments rather than
+        adding them again.
+        """
+        for (scope, key, hour), metrics in accumulator.metrics.items():
+            update: Dict[str, Any] = {
+                "$setOnInsert": {"scope": scope, "key": key, "hour": hour}
+            }
+            if metrics["inc"]:
+                update["$inc"] = dict(metrics["inc"])
+            if metrics["min"]:
+                update["$min"] = dict(metrics["min"])
+            if metrics["max"]:
+                update["$max"] = dict(metrics["max"])
+            self.rollups.update_one(
+                {"_id": f"{scope}|{key}|{hour.isoformat()}"}, update, upsert=True
+            )
+
+        for hour, snapshot in accumulator.checkpoints.items():
+            self.rollups.update_one(
+                {"_id": f"checkpoint|{hour.isoformat()}"},
+                {"$set": {"scope": "checkpoint", "hour": hour, "state": snapshot}},
+                upsert=True,
+            )
+
+        self.rollups.update_one(
+            {"_id": STATE_ID},
+            {
+                "$set": {
+                    "scope": "state",
+                    "watermark": accumulator.clock,
+                    "watermark_inclusive": False,
+                    "watermark_id": watermark_id,
+                    "state": accumulator.snapshot(),
+                    "updated_at": datetime.now(timezone.utc).replace(tzinfo=None),
+                },
+                "$unset": {"batch_in_progress": ""},
+            },
+            upsert=True,
+        )
+
+    # --- Reading ---
+
+    def _collect_metrics(
+        self, start: datetime, end: datetime, boundaries: List[datetime]
+    ) -> List[Tuple[datetime, str, str, Dict[str, Dict[str, float]]]]:
+        """Collect metrics for ``[start, end)`` as slots that never straddle a boundary.
+
+        Whole hours come straight from the rollup documents. Hours split by a
+        boundary are divided by replaying their raw events from the hour's
+        checkpoint, and everything after the watermark is replayed from the
+        saved state.
+        """
+        state = self.rollups.find_one({"_id": STATE_ID}) or {}
+        watermark = state.get("watermark", start)
+        rolled_end = min(end, watermark)
+
+        rolled: Dict[datetime, Dict[Tuple[str, str], Dict]] = defaultdict(dict)
+        if start < rolled_end:
+            for doc in self.rollups.find(
+                {
+                    "scope": {"$in": ROLLUP_SCOPES},
+                    "hour": {"$gte": _floor_hour(start), "$lt": rolled_end},
+                }
+            ):
+                rolled[doc["hour"]][(doc["scope"], doc["key"])] = _metrics_from_doc(doc)
+
+        slots = []
+        split_hours = defaultdict(list)
+        for boundary in boundaries:
+            if boundary != _floor_hour(boundary) and boundary <= rolled_end:
+                split_hours[_floor_hour(boundary)].append(boundary)
+
+        for hour, entries in rolled.items():
+            if hour not in split_hours:
+                slots.extend(
+                    (hour, scope, key, metrics)
+                    for (scope, key), metrics in entries.items()
+                )
+                continue
+            slots.extend(self._split_hour(hour, sorted(split_hours[hour]), entries))
+
+        if end > watermark and state:
+            accumulator = RollupAccumulator(
+                self.analyzer,
+                watermark,
+                state=state.get("state"),
+                cuts=[*boundaries, start, end],
+            )
+            self._replay(
+                accumulator,
+                watermark,
+                end,
+                include_start=state.get("watermark_inclusive", False),
+                after_id=state.get("watermark_id"),
+            )
+            slots.extend(
+                (slot, scope, key, metrics)
+                for (scope, key, slot), metrics in accumulator.metrics.items()
+            )
+
+        return [slot for slot in slots if start <= slot[0] < end]
+
+    def _split_hour(
+        self,
+        hour: datetime,
+        cuts: List[datetime],
+        entries: Dict[Tuple[str, str], Dict[str, Dict[str, float]]],
+    ) -> List[Tuple[datetime, str, str, Dict[str, Dict[str, float]]]]:
+        """Split a rolled-up hour at ``cuts`` by replaying its raw events."""
+        checkpoint = self.rollups.find_one({"_id": f"checkpoint|{hour.isoformat()}"})
+        accumulator = RollupAccumulator(
+            self.analyzer,
+            hour,
+            state=checkpoint["state"] if checkpoint else None,
+            cuts=cuts,
+        )
+        self._replay(accumulator, hour, cuts[-1], include_start=True)
+
+        slots = []
+        replayed = defaultdict(_new_metrics)
+        for (scope, key, slot), metrics in accumulator.metrics.items():
+            slots.append((slot, scope, key, metrics))
+            _merge_metrics(replayed[(scope, key)], metrics)
+
+        # Whatever the replay didn't account for happened after the last cut
+        for (scope, key), metrics in entries.items():
+            remainder = _new_metrics()
+            before = replayed.get((scope, key), _new_metrics())
+            for field, value in metrics["inc"].items():
+                remaining = value - before["inc"].get(field, 0)
+                if remaining > 1e-9:
+                    remainder["inc"][field] = remaining
+            if remainder["inc"].get("timed_workflows"):
+                remainder["min"] = dict(metrics["min"])
+                remainder["max"] = dict(metrics["max"])
+            if remainder["inc"]:
+                slots.append((cuts[-1], scope, key, remainder))
+        return slots
+
+    def _replay(
+        self,
+        accumulator: RollupAccumulator,
+        start: datetime,
+        end: datetime,
+        include_start: bool,
+        after_id: Optional[Any] = None,
+    ) -> None:
+        """Replay raw activity events from ``start`` until ``end`` and advance to ``end``.
+
+        Checkpoints hold the state before any events at their hour, so a replay
+        from a checkpoint includes events at ``start``; the watermark state
+        already includes them, or those up to ``after_id`` if it is given.
+        """
+        query = _events_after(start, include_start, after_id)
+        query["event_time"]["$lt"] = end
+        events = self.events_collection.find(query).sort(EVENT_ORDER)
+        for event in events:
+            accumulator.process(event)
+        accumulator.advance(end)
+
+    def _sum_by_bucket(
+        self, start: datetime, end: datetime, bucket_starts: List[datetime]
+    ) -> List[Dict[Tuple[str, str], Dict[str, Dict[str, float]]]]:
+        """Sum rollup metrics per entity for buckets starting at ``bucket_starts``."""
+        totals = [defaultdict(_new_metrics) for _ in bucket_starts]
+        for slot, scope, key, metrics in self._collect_metrics(
+            start, end, [*bucket_starts, end]
+        ):
+            index = bisect.bisect_right(bucket_starts, slot) - 1
+            if index >= 0:
+                _merge_metrics(totals[index][(scope, key)], metrics)
+        return totals
+
+    # --- Reports ---
+
+    def generate_utilization_periods(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        analysis_type: str = "daily",
+        user_timezone: str = "America/Chicago",
+    ) -> Dict[str, Any]:
+        """Build the time-series utilization report from rollups.
+
+        Produces the same structure as
+        ``TimeSeriesAnalyzer.generate_summary_report``.
+        """
+        time_series = TimeSeriesAnalyzer(self.analyzer)
+        time_series._current_analysis_type = analysis_type
+
+        period = time_series._validate_and_determine_analysis_period(
+            start_time, end_time
+        )
+        if "error" in period:
+            return period
+        analysis_start, analysis_end = period["period"]
+
+        windows = []
+        for bucket in time_series._create_time_buckets_user_timezone(
+            analysis_start,
+            analysis_end,
+            time_series._get_time_bucket_hours(analysis_type),
+            user_timezone,
+        ):
+            bucket_start, bucket_end = bucket["utc_times"]
+            bucket_start = max(bucket_start, analysis_start)
+            bucket_end = min(bucket_end, analysis_end)
+            if bucket_start < bucket_end:
+                windows.append((bucket_start, bucket_end, bucket))
+
+        totals = self._sum_by_bucket(
+            analysis_start, analysis_end, [window[0] for window in windows]
+        )
+        experiments = time_series._get_experiments_in_time_period(
+            analysis_start, analysis_end
+        )
+
+        bucket_reports = []
+        for index, window in enumerate(windows):
+            bucket_start, bucket_end, _ = window
+            is_last = index == len(windows) - 1
+            bucket_experiments = [
+                experiment
+                for experiment in experiments
+                if bucket_start <= experiment["event_timestamp"] < bucket_end
+                or (is_last and experiment["event_timestamp"] == bucket_end)
+            ]
+            bucket_reports.append(
+                self._build_bucket_report(
+                    index, window, totals[index], bucket_experiments
+                )
+            )
+
+        report = time_series._create_summary_report(
+            bucket_reports, analysis_start, analysis_end, analysis_type, user_timezone
+        )
+        if "summary_metadata" in report:
+            report["summary_metadata"]["method"] = "hourly_rollups"
+        return report
+
+    def _build_bucket_report(
+        self,
+        index: int,
+        window: Tuple[datetime, datetime, Dict[str, Any]],
+        totals: Dict[Tuple[str, str], Dict[str, Dict[str, float]]],
+        experiments: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Build one bucket report in the shape the summary report aggregates."""
+        bucket_start, bucket_end, bucket = window
+        duration_seconds = (bucket_end - bucket_start).total_seconds()
+        system = totals.get(("system", ""), _new_metrics())["inc"]
+        runtime_seconds = system.get("runtime_seconds", 0)
+        active_seconds = system.get("active_seconds", 0)
+
+        nodes = {
+            key: metrics["inc"]
+            for (scope, key), metrics in totals.items()
+            if scope == "node"
+        }
+        # Without workcell sessions the whole bucket counts as runtime, like
+        # the raw analyzer's default analysis session.
+        if not runtime_seconds and (
+            active_seconds or any(node.get("busy_seconds") for node in nodes.values())
+        ):
+            runtime_seconds = duration_seconds
+
+        experiment_details = [
+            {
+                "experiment_id": experiment["experiment_id"],
+                "experiment_name": self.analyzer._resolve_experiment_name(
+                    experiment["experiment_id"]
+                ),
+                "display_name": f"Experiment {experiment['experiment_id'][-8:]}",
+            }
+            for experiment in experiments
+        ]
+
+        session_details = []
+        for (scope, key), metrics in sorted(totals.items()):
+            workcell = metrics["inc"]
+            if scope != "workcell" or not workcell.get("runtime_seconds"):
+                continue
+            workcell_runtime = workcell["runtime_seconds"]
+            workcell_active = workcell.get("active_seconds", 0)
+            session_details.append(
+                {
+                    "session_type": "workcell",
+                    "session_id": key,
+                    "session_name": f"Workcell {key[-8:]}",
+                    "start_time": bucket_start.isoformat(),
+                    "end_time": bucket_end.isoformat(),
+                    "duration_hours": workcell_runtime / 3600,
+                    "active_time_hours": workcell_active / 3600,
+                    "total_experiments": int(workcell.get("experiments_started", 0)),
+                    "system_utilization_percent": workcell_active
+                    / workcell_runtime
+                    * 100,
+                    "node_utilizations": {},
+                    "experiment_details": experiment_details,
+                    "attribution_method": "hourly_rollups",
+                }
+            )
+
+        node_summary = {}
+        for node_id, node in nodes.items():
+            busy_seconds = node.get("busy_seconds", 0)
+            available_seconds = (
+                node.get("active_seconds") or runtime_seconds or duration_seconds
+            )
+            node_summary[node_id] = {
+                "average_utilization_percent": round(
+                    min(busy_seconds / available_seconds * 100, 100.0), 1
+                ),
+                "total_busy_time_hours": round(busy_seconds / 3600, 3),
+                "sessions_active": 1,
+            }
+
+        user_start = bucket["user_times"][0]
+        return {
+            "session_details": session_details,
+            "overall_summary": {
+                "total_sessions": len(session_details),
+                "total_system_runtime_hours": runtime_seconds / 3600,
+                "total_active_time_hours": active_seconds / 3600,
+                "average_system_utilization_percent": (
+                    min(active_seconds / runtime_seconds * 100, 100.0)
+                    if runtime_seconds
+                    else 0
+                ),
+                "total_experiments": len(experiments),
+                "nodes_tracked": len(node_summary),
+                "node_summary": node_summary,
+                "method": "hourly_rollups",
+            },
+            "time_bucket": {
+                "bucket_index": index,
+                "start_time": bucket_start.isoformat(),
+                "end_time": bucket_end.isoformat(),
+                "user_start_time": user_start.strftime("%Y-%m-%dT%H:%M:%S"),
+                "user_date": user_start.strftime("%Y-%m-%d"),
+                "duration_hours": duration_seconds / 3600,
+                "period_info": bucket["period_info"],
+            },
+        }
+
+    def generate_user_utilization_report(
+        self, start_time: Optional[datetime] = None, end_time: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """Build the user utilization report from rollups.
+
+        Produces the same structure as
+        ``UtilizationAnalyzer.generate_user_utilization_report``, except that
+        the per-user ``workflows`` lists are left empty: rollups keep counts
+        and durations, not individual workflows. Workflows are counted in the
+        hour they were first seen and outcomes in the hour they completed.
+        """
+        analysis_start, analysis_end = self.analyzer._determine_analysis_period(
+            start_time, end_time
+        )
+        totals = self._sum_by_bucket(analysis_start, analysis_end, [analysis_start])[0]
+
+        users = {}
+        for (scope, author), metrics in totals.items():
+            if scope == "user":
+                users[author] = self._build_user_statistics(author, metrics)
+
+        total_workflows = sum(user["total_workflows"] for user in users.values())
+        unattributed = users.get("Unknown Author", {}).get("total_workflows", 0)
+        completed = sum(user["completed_workflows"] for user in users.values())
+        runtime_seconds = sum(
+            metrics["inc"].get("runtime_seconds", 0)
+            for (scope, _), metrics in totals.items()
+            if scope == "user"
+        )
+        timed_workflows = sum(
+            metrics["inc"].get("timed_workflows", 0)
+            for (scope, _), metrics in totals.items()
+            if scope == "user"
+        )
+        with_authors = total_workflows - unattributed
+
+        return {
+            "report_metadata": {
+                "generated_at": datetime.now(timezone.utc).isoformat(),
+                "analysis_start": analysis_start.isoformat(),
+                "analysis_end": analysis_end.isoformat(),
+                "total_workflows": total_workflows,
+                "total_users": len(users),
+                "workflows_with_authors": with_authors,
+                "workflows_without_authors": unattributed,
+                "method": "hourly_rollups",
+            },
+            "system_summary": {
+                "total_workflows": total_workflows,
+                "total_runtime_hours": round(runtime_seconds / 3600, 2),
+                "average_workflow_duration_hours": round(
+                    runtime_seconds / timed_workflows / 3600 if timed_workflows else 0,
+                    3,
+                ),
+                "completion_rate_percent": round(
+                    completed / total_workflows * 100 if total_workflows else 0, 2
+                ),
+                "workflows_with_known_authors": with_authors,
+                "author_attribution_rate_percent": round(
+                    with_authors / total_workflows * 100 if total_workflows else 0, 2
+                ),
+            },
+            "user_utilization": users,
+        }
+
+    def _build_user_statistics(
+        self, author: str, metrics: Dict[str, Dict[str, float]]
+    ) -> Dict[str, Any]:
+        """Convert summed user metrics into the analyzer's per-user statistics."""
+        counts = metrics["inc"]
+        total_workflows = int(counts.get("workflows", 0))
+        completed = int(counts.get("completed_workflows", 0))
+        timed = counts.get("timed_workflows", 0)
+        runtime_hours = counts.get("runtime_seconds", 0) / 3600
+        shortest = metrics["min"].get("shortest_seconds")
+        longest = metrics["max"].get("longest_seconds")
+        return {
+            "author": author,
+            "total_workflows": total_workflows,
+            "completed_workflows": completed,
+            "failed_workflows": int(counts.get("failed_workflows", 0)),
+            "cancelled_workflows": int(counts.get("cancelled_workflows", 0)),
+            "total_runtime_hours": round(runtime_hours, 2),
+            "average_workflow_duration_hours": round(runtime_hours / timed, 3)
+            if timed
+            else 0,
+            "shortest_workflow_hours": round(shortest / 3600, 3)
+            if shortest is not None
+            else None,
+            "longest_workflow_hours": round(longest / 3600, 3)
+            if longest is not None
+            else None,
+            "completion_rate_percent": round(completed / total_workflows * 100, 2)
+            if total_workflows
+            else 0,
+            "workflows": [],
+        }
+
+
+def _metrics_from_doc(doc: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
+    """Split a rollup document into summed, minimum and maximum values."""
+    metrics = _new_metrics()
+    for field, value in doc.items():
+        if field in ("_id", "scope", "key", "hour"):
+            continue
+        if field == "shortest_seconds":
+            metrics["min"][field] = value
+        elif field == "longest_seconds":
+            metrics["max"][field] = value
+        else:
+            metrics["inc"][field] = value
+    return metrics
+
+
+def _merge_metrics(
+    target: Dict[str, Dict[str, float]], source: Dict[str, Dict[str, float]]
+) -> None:
+    """Merge ``source`` metrics into ``target`` in place."""
+    for field, value in source["inc"].items():
+        target["inc"][field] += value
+    for field, value in source["min"].items():
+        target["min"][field] = min(value, target["min"].get(field, value))
+    for field, value in source["max"].items():
+        target["max"][field] = max(value, target["max"].get(field, value))
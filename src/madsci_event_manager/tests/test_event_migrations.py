@@ -3,6 +3,8 @@
 import json
 import os
 import tempfile
+import time
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -13,6 +15,7 @@ from madsci.common.mongodb_migration_tool import (
     main,
 )
 from madsci.common.mongodb_version_checker import MongoDBVersionChecker
+from madsci.common.types.mongodb_migration_types import DatetimeFieldDefinition
 from pydantic_extra_types.semantic_version import SemanticVersion
 
 
@@ -294,6 +297,56 @@ def test_event_collection_creation(mock_mongo_client_events):  # noqa
         schema_file.unlink()
 
 
+@patch("sys.argv", ["test"])
+def test_event_timestamp_backfill(mock_mongo_client_events, monkeypatch):  # noqa
+    """Test that migration backfills native event times from ISO-string timestamps, taking ones without an offset as local time"""
+    schema_file = Path("event_schema.json")
+    schema_file.write_text(json.dumps({"schema_version": "1.1.0"}))
+    monkeypatch.setenv("TZ", "EST+05")
+    time.tzset()
+
+    try:
+        settings = MongoDBMigrationSettings(
+            mongo_db_url="mongodb://localhost:27017",
+            database="madsci_events",
+            schema_file=str(schema_file),
+        )
+        migrator = MongoDBMigrator(settings)
+
+        events_collection = Mock()
+        events_collection.find.return_value.limit.side_effect = [
+            [
+                {"_id": "a", "event_timestamp": "2025-01-01T12:00:00+02:00"},
+                {"_id": "b", "event_timestamp": "2025-01-01T12:00:00Z"},
+                {"_id": "c", "event_timestamp": "not a timestamp"},
+                {"_id": "d", "event_timestamp": "2025-01-01T12:00:00"},
+            ],
+            [],
+        ]
+        migrator.database.__getitem__ = Mock(return_value=events_collection)
+
+        migrator._backfill_datetime_fields(
+            "events",
+            [DatetimeFieldDefinition(field="event_time", source="event_timestamp")],
+        )
+
+        # Only documents still missing the field are read, a batch at a time
+        query = events_collection.find.call_args[0][0]
+        assert query["event_time"] == {"$exists": False}
+        events_collection.bulk_write.assert_called_once()
+        updates = events_collection.bulk_write.call_args[0][0]
+        assert [update._doc["$set"]["event_time"] for update in updates] == [
+            datetime(2025, 1, 1, 10),
+            datetime(2025, 1, 1, 12),
+            None,
+            datetime(2025, 1, 1, 17),
+        ]
+    finally:
+        schema_file.unlink()
+        monkeypatch.undo()
+        time.tzset()
+
+
 @patch("madsci.common.mongodb_migration_tool.MongoDBMigrator")
 @patch(
     "sys.argv",
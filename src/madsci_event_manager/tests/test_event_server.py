@@ -5,20 +5,39 @@ Uses in-memory MongoDB handler for fast, Docker-free tests.
 """
 
 import asyncio
-from datetime import datetime, timedelta
+import csv
+import gzip
+import io
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
 from madsci.common.db_handlers.mongo_handler import InMemoryMongoHandler
+from madsci.common.types.auth_types import OwnershipInfo
 from madsci.common.types.event_types import (
     EmailAlertsConfig,
     Event,
+    EventLogLevel,
     EventManagerSettings,
     EventType,
 )
+from madsci.common.utils import new_ulid_str
+from madsci.event_manager.event_export import CSV_COLUMNS
 from madsci.event_manager.event_server import EventManager
+from madsci.event_manager.event_stream import EventBroadcaster
+from madsci.event_manager.time_series_analyzer import TimeSeriesAnalyzer
+from madsci.event_manager.utilization_analyzer import UtilizationAnalyzer
+from madsci.event_manager.utilization_rollups import (
+    ROLLUP_SCOPES,
+    STATE_ID,
+    UtilizationRollups,
+    mark_late_events,
+)
 
 event_manager_settings = EventManagerSettings(
     manager_name="test_event_manager",
@@ -136,12 +155,205 @@ def test_event_alert(test_client: TestClient) -> None:
         test_client.post("/event", json=alert_event.model_dump(mode="json"))
 
         # Assert that the email alert was sent
+        wait_for_alerts_sent(
+            test_client, len(event_manager_settings.email_alerts.email_addresses)
+        )
         mock_send_email.assert_called()
         assert mock_send_email.call_count == len(
             event_manager_settings.email_alerts.email_addresses
         )
 
 
+def wait_for_alerts_sent(test_client: TestClient, count: int) -> None:
+    """Wait for the alert dispatcher to report having sent this many emails."""
+    deadline = time.monotonic() + 5
+    while test_client.get("/alerts/stats").json()["sent"] < count:
+        assert time.monotonic() < deadline, "Timed out waiting for alerts"
+        time.sleep(0.01)
+
+
+def test_alert_dispatch_does_not_block_ingestion(test_client: TestClient) -> None:
+    """
+    Test that events are stored while alert emails are still being sent, and that repeated alerts are coalesced.
+    """
+    release_smtp = threading.Event()
+    with patch(
+        "madsci.event_manager.notifications.EmailAlerts.send_email",
+        side_effect=lambda **_: release_smtp.wait(5),
+    ) as mock_send_email:
+        events = [
+            Event(
+                event_type=EventType.NODE_ERROR,
+                alert=True,
+                event_data={"message": "down"},
+            )
+            for _ in range(3)
+        ]
+        for event in events:
+            assert (
+                test_client.post(
+                    "/event", json=event.model_dump(mode="json")
+                ).status_code
+                == 200
+            )
+        for event in events:
+            assert test_client.get(f"/event/{event.event_id}").status_code == 200
+
+        release_smtp.set()
+        wait_for_alerts_sent(test_client, 1)
+        stats = test_client.get("/alerts/stats").json()
+        assert stats["coalesced"] == 2
+        assert stats["dropped"] == 0
+        assert mock_send_email.call_count == 1
+
+
+def test_log_events_batch(test_client: TestClient) -> None:
+    """
+    Test that a batch of events is stored in one request, and that resent events are skipped as duplicates.
+    """
+    events = [
+        Event(event_type=EventType.TEST, event_data={"index": i}) for i in range(3)
+    ]
+    result = test_client.post(
+        "/events/batch", json=[event.model_dump(mode="json") for event in events]
+    )
+    assert result.status_code == 200
+    assert result.json() == {"inserted_count": 3, "duplicate_count": 0}
+    for event in events:
+        stored = test_client.get(f"/event/{event.event_id}").json()
+        assert Event.model_validate(stored) == event
+
+    assert test_client.post("/events/batch", json=[]).json() == {
+        "inserted_count": 0,
+        "duplicate_count": 0,
+    }
+
+
+def test_log_events_batch_skips_duplicates(test_client: TestClient) -> None:
+    """
+    Test that duplicate key errors from an unordered bulk insert don't fail the batch.
+    """
+
+    class BulkWriteError(Exception):
+        """Stand-in for pymongo.errors.BulkWriteError"""
+
+        details = {  # noqa: RUF012
+            "nInserted": 1,
+            "writeErrors": [{"index": 0, "code": 11000}],
+        }
+
+    events = [Event(event_type=EventType.TEST, alert=True) for _ in range(2)]
+    with (
+        patch(
+            "madsci.common.local_backends.inmemory_collection.InMemoryCollection.insert_many",
+            side_effect=BulkWriteError(),
+        ),
+        patch.object(EventBroadcaster, "publish") as mock_publish,
+        patch.object(EventManager, "_send_alerts") as mock_send_alerts,
+    ):
+        result = test_client.post(
+            "/events/batch", json=[event.model_dump(mode="json") for event in events]
+        )
+    assert result.status_code == 200
+    assert result.json() == {"inserted_count": 1, "duplicate_count": 1}
+    # * Only the event that was actually inserted is published and alerted on
+    mock_publish.assert_called_once_with([events[1]])
+    mock_send_alerts.assert_called_once_with([events[1]])
+
+
+def test_log_event_duplicate_is_not_republished(test_client: TestClient) -> None:
+    """
+    Test that a resent event isn't published or alerted on again.
+    """
+
+    class DuplicateKeyError(Exception):
+        """Stand-in for pymongo.errors.DuplicateKeyError"""
+
+    event = Event(event_type=EventType.TEST, alert=True)
+    with (
+        patch(
+            "madsci.common.local_backends.inmemory_collection.InMemoryCollection.insert_one",
+            side_effect=DuplicateKeyError(),
+        ),
+        patch.object(EventBroadcaster, "publish") as mock_publish,
+        patch.object(EventManager, "_send_alerts") as mock_send_alerts,
+    ):
+        result = test_client.post("/event", json=event.model_dump(mode="json"))
+    assert result.status_code == 200
+    mock_publish.assert_not_called()
+    mock_send_alerts.assert_not_called()
+
+
+def test_log_events_batch_alerts(test_client: TestClient) -> None:
+    """
+    Test that alerts are sent for the alerting events in a batch.
+    """
+    events = [
+        Event(event_type=EventType.TEST, alert=True),
+        Event(event_type=EventType.TEST),
+    ]
+    with patch(
+        "madsci.event_manager.notifications.EmailAlerts.send_email"
+    ) as mock_send_email:
+        test_client.post(
+            "/events/batch", json=[event.model_dump(mode="json") for event in events]
+        )
+        wait_for_alerts_sent(
+            test_client, len(event_manager_settings.email_alerts.email_addresses)
+        )
+        assert mock_send_email.call_count == len(
+            event_manager_settings.email_alerts.email_addresses
+        )
+
+
+def test_report_does_not_block_ingestion(mongo_handler) -> None:
+    """
+    Test that events are still ingested while a utilization report is running.
+    """
+    manager = EventManager(settings=event_manager_settings, mongo_handler=mongo_handler)
+    report_started = threading.Event()
+    release_report = threading.Event()
+
+    def slow_report(*_args):
+        report_started.set()
+        release_report.wait(10)
+        return {"users": {}}
+
+    # * Entering the client runs every request on one shared event loop, as in a real server
+    with (
+        TestClient(manager.create_server()) as client,
+        patch(
+            "madsci.event_manager.utilization_analyzer.UtilizationAnalyzer.generate_user_utilization_report",
+            side_effect=slow_report,
+        ),
+    ):
+        report = threading.Thread(
+            target=client.get, args=("/utilization/user",), daemon=True
+        )
+        report.start()
+        assert report_started.wait(5)
+
+        test_event = Event(event_type=EventType.TEST)
+        start = time.monotonic()
+        result = client.post("/event", json=test_event.model_dump(mode="json"))
+        assert result.status_code == 200
+        assert time.monotonic() - start < 5
+
+        release_report.set()
+        report.join(5)
+        assert not report.is_alive()
+
+
+def test_worker_pools_shut_down_with_server(mongo_handler) -> None:
+    """Test that the database worker pools are stopped when the server shuts down."""
+    manager = EventManager(settings=event_manager_settings, mongo_handler=mongo_handler)
+    with TestClient(manager.create_server()) as client:
+        assert client.get("/events").status_code == 200
+    for executor in (manager._db_executor, manager._report_executor):
+        with pytest.raises(RuntimeError):
+            executor.submit(time.sleep, 0)
+
+
 def test_health_endpoint(test_client: TestClient) -> None:
     """Test the health endpoint of the Event Manager."""
     response = test_client.get("/health")
@@ -513,6 +725,119 @@ class TestEventQueryImprovements:
         assert very_old_event.event_id not in result
         assert new_event.event_id not in result
 
+    def test_query_with_date_range_across_utc_offsets(
+        self, test_client: TestClient
+    ) -> None:
+        """Test that date range filtering compares instants, not timestamp strings."""
+        # 07:00 UTC, but its ISO string sorts after "08:00+00:00"
+        early_event = Event(
+            event_type=EventType.TEST,
+            event_data={"test": "early_offset"},
+            event_timestamp=datetime(
+                2025, 1, 1, 12, tzinfo=timezone(timedelta(hours=5))
+            ),
+        )
+        test_client.post("/event", json=early_event.model_dump(mode="json"))
+
+        late_event = Event(
+            event_type=EventType.TEST,
+            event_data={"test": "late_offset"},
+            event_timestamp=datetime(2025, 1, 1, 9, tzinfo=timezone.utc),
+        )
+        test_client.post("/event", json=late_event.model_dump(mode="json"))
+
+        response = test_client.get(
+            "/events",
+            params={
+                "start_time": "2025-01-01T08:00:00+00:00",
+                "end_time": "2025-01-01T10:00:00+00:00",
+            },
+        )
+        result = response.json()
+
+        assert late_event.event_id in result
+        assert early_event.event_id not in result
+
+    def test_naive_timestamps_are_local_time(
+        self, test_client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that naive timestamps are stored as local time on hosts that aren't in UTC."""
+        monkeypatch.setenv("TZ", "EST+05")
+        time.tzset()
+        try:
+            assert Event().event_timestamp.tzinfo is not None
+            # * 12:00 local is 17:00 UTC
+            local_event = Event(
+                event_type=EventType.TEST,
+                event_timestamp=datetime(2025, 1, 1, 12),
+            )
+            assert local_event.to_mongo()["event_time"] == datetime(2025, 1, 1, 17)
+            test_client.post("/event", json=local_event.model_dump(mode="json"))
+
+            response = test_client.get(
+                "/events",
+                params={
+                    "start_time": "2025-01-01T16:00:00+00:00",
+                    "end_time": "2025-01-01T18:00:00+00:00",
+                },
+            )
+            assert local_event.event_id in response.json()
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+
+    def test_cursor_pagination(self, test_client: TestClient) -> None:
+        """Test that following next-page cursors returns every event once, newest first."""
+        base_time = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        created_events = []
+        # * Three events share a timestamp, so a page boundary falls between them
+        for i, minutes in enumerate([0, 1, 2, 2, 2, 3, 4]):
+            event = Event(
+                event_type=EventType.TEST,
+                event_data={"index": i},
+                event_timestamp=base_time + timedelta(minutes=minutes),
+            )
+            test_client.post("/event", json=event.model_dump(mode="json"))
+            created_events.append(event)
+
+        pages = []
+        params = {"number": 3}
+        while True:
+            response = test_client.get("/events", params=params)
+            assert response.status_code == 200
+            pages.append(list(response.json()))
+            if "X-Next-Cursor" not in response.headers:
+                break
+            params["cursor"] = response.headers["X-Next-Cursor"]
+
+        expected = sorted(
+            created_events,
+            key=lambda event: (event.event_timestamp, event.event_id),
+            reverse=True,
+        )
+        assert [len(page) for page in pages] == [3, 3, 1]
+        assert [event_id for page in pages for event_id in page] == [
+            event.event_id for event in expected
+        ]
+
+    def test_invalid_cursor(self, test_client: TestClient) -> None:
+        """Test that a malformed cursor is rejected."""
+        response = test_client.get("/events", params={"cursor": "not-a-cursor"})
+        assert response.status_code == 400
+
+    def test_cursor_with_offset_rejected(self, test_client: TestClient) -> None:
+        """Test that a cursor can't be combined with an offset."""
+        for i in range(3):
+            event = Event(event_type=EventType.TEST, event_data={"index": i})
+            test_client.post("/event", json=event.model_dump(mode="json"))
+        response = test_client.get("/events", params={"number": 1})
+        cursor = response.headers["X-Next-Cursor"]
+
+        response = test_client.get("/events", params={"cursor": cursor, "offset": 1})
+        assert response.status_code == 400
+        response = test_client.get("/events", params={"cursor": cursor, "offset": 0})
+        assert response.status_code == 200
+
 
 class TestTTLIndex:
     """Test MongoDB TTL index configuration."""
@@ -693,3 +1018,527 @@ class TestRetentionErrorHandling:
         assert settings.archive_batch_size == 500
         assert settings.max_batches_per_run == 50
         assert settings.fail_on_retention_error is True
+
+
+class TestUtilizationRollups:
+    """Test utilization reports built from hourly rollups."""
+
+    @pytest.fixture()
+    def rollup_manager(self, mongo_handler) -> EventManager:
+        """Event Manager with rollups enabled and a day of workcell activity."""
+        settings = EventManagerSettings(
+            manager_name="test_event_manager",
+            rollups_enabled=True,
+            rollup_lag_seconds=0,
+            enable_registry_resolution=False,
+        )
+        manager = EventManager(settings=settings, mongo_handler=mongo_handler)
+
+        self.day = (datetime.now(timezone.utc) - timedelta(days=2)).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        activity = [
+            (8, EventType.WORKCELL_START, {"workcell_id": "wc1"}),
+            (8, EventType.NODE_START, {"node_id": "node1"}),
+            (9.5, EventType.EXPERIMENT_START, {"experiment_id": "exp1"}),
+            (
+                9.5,
+                EventType.ACTION_STATUS_CHANGE,
+                {"node_id": "node1", "action_id": "act1", "status": "running"},
+            ),
+            (9.75, EventType.WORKFLOW_START, {"workflow_id": "wf1", "author": "ada"}),
+            (
+                11.25,
+                EventType.WORKFLOW_COMPLETE,
+                {
+                    "workflow_id": "wf1",
+                    "author": "ada",
+                    "status": "completed",
+                    "duration_seconds": 5400,
+                },
+            ),
+            (
+                11.5,
+                EventType.ACTION_STATUS_CHANGE,
+                {"node_id": "node1", "action_id": "act1", "status": "completed"},
+            ),
+            (12.5, EventType.EXPERIMENT_COMPLETE, {"experiment_id": "exp1"}),
+            (17, EventType.NODE_STOP, {"node_id": "node1"}),
+            (17, EventType.WORKCELL_STOP, {"workcell_id": "wc1"}),
+        ]
+        for hours, event_type, event_data in activity:
+            event = Event(
+                event_type=event_type,
+                event_data=event_data,
+                event_timestamp=self.day + timedelta(hours=hours),
+                source=OwnershipInfo(),
+            )
+            manager.events.insert_one(event.to_mongo())
+        self.activity_count = len(activity)
+        return manager
+
+    def test_reports_use_rollups_once_built(self, rollup_manager) -> None:
+        """Test that reports switch to rollups after the first catch-up."""
+        client = TestClient(rollup_manager.create_server())
+        params = {
+            "start_time": (self.day + timedelta(hours=9, minutes=15)).isoformat(),
+            "end_time": (self.day + timedelta(hours=12)).isoformat(),
+            "analysis_type": "hourly",
+            "user_timezone": "UTC",
+            "include_users": False,
+        }
+        report = client.get("/utilization/periods", params=params).json()
+        assert report["summary_metadata"]["method"] != "hourly_rollups"
+
+        assert rollup_manager._catch_up_rollups() == self.activity_count
+        assert rollup_manager._catch_up_rollups() == 0
+
+        report = client.get("/utilization/periods", params=params).json()
+        assert report["summary_metadata"]["method"] == "hourly_rollups"
+        # Partial edge hours are split by replaying their raw events
+        assert report["key_metrics"]["total_runtime_hours"] == 2.75
+        assert report["key_metrics"]["total_active_time_hours"] == 2.5
+        assert report["node_summary"]["node1"]["total_busy_hours"] == 2.0
+        assert report["workcell_summary"]["wc1"]["total_experiments"] == 1
+
+    def test_late_events_are_rolled_up(self, rollup_manager) -> None:
+        """Test that events stored after the watermark passed them are folded in."""
+        client = TestClient(rollup_manager.create_server())
+        params = {
+            "start_time": self.day.isoformat(),
+            "end_time": (self.day + timedelta(days=1)).isoformat(),
+            "analysis_type": "hourly",
+            "user_timezone": "UTC",
+            "include_users": False,
+        }
+        rollup_manager._catch_up_rollups()
+
+        late_events = [
+            Event(
+                event_type=event_type,
+                event_data={"experiment_id": "exp2"},
+                event_timestamp=self.day + timedelta(hours=hours),
+                source=OwnershipInfo(),
+            )
+            for hours, event_type in (
+                (13.25, EventType.EXPERIMENT_START),
+                (14.75, EventType.EXPERIMENT_COMPLETE),
+            )
+        ]
+        client.post(
+            "/events/batch",
+            json=[event.model_dump(mode="json") for event in late_events],
+        )
+        rollup_manager._catch_up_rollups()
+        report = client.get("/utilization/periods", params=params).json()
+
+        assert report["summary_metadata"]["method"] == "hourly_rollups"
+        assert report["workcell_summary"]["wc1"]["total_experiments"] == 2
+        assert report["key_metrics"]["total_active_time_hours"] == 4.5
+
+        # * Matches rollups rebuilt from scratch
+        rollup_manager.rollups_collection.delete_many({})
+        rollup_manager._catch_up_rollups()
+        rebuilt = client.get("/utilization/periods", params=params).json()
+        for generated in (report, rebuilt):
+            generated["summary_metadata"].pop("generated_at")
+        assert rebuilt == report
+
+    def _catch_up(self, manager: EventManager, hours: float, **kwargs) -> None:
+        """Run a rollup catch-up as of ``hours`` into the test day."""
+        UtilizationRollups(
+            UtilizationAnalyzer(manager.events),
+            manager.rollups_collection,
+            lag_seconds=0,
+            **kwargs,
+        ).catch_up(now=self.day + timedelta(hours=hours))
+
+    def _stored_rollups(self, manager: EventManager) -> list:
+        """Return the stored hourly rollup documents, sorted by ID."""
+        return sorted(
+            manager.rollups_collection.find({"scope": {"$in": ROLLUP_SCOPES}}),
+            key=lambda rollup: rollup["_id"],
+        )
+
+    def test_events_stored_during_a_batch_are_rolled_up(self, rollup_manager) -> None:
+        """Test that an event stored after a batch's query, but before its write, is flagged as late."""
+        self._catch_up(rollup_manager, 18)
+        racing_event = Event(
+            event_type=EventType.EXPERIMENT_START,
+            event_data={"experiment_id": "exp2"},
+            event_timestamp=self.day + timedelta(hours=19),
+            source=OwnershipInfo(),
+        ).to_mongo()
+        write = UtilizationRollups._write
+
+        def store_event_then_write(rollups, accumulator):
+            rollup_manager.events.insert_one(racing_event)
+            mark_late_events(rollup_manager.rollups_collection, [racing_event])
+            write(rollups, accumulator)
+
+        with patch.object(
+            UtilizationRollups,
+            "_write",
+            autospec=True,
+            side_effect=store_event_then_write,
+        ):
+            self._catch_up(rollup_manager, 20)
+        self._catch_up(rollup_manager, 20)
+        incremental = self._stored_rollups(rollup_manager)
+
+        rollup_manager.rollups_collection.delete_many({})
+        self._catch_up(rollup_manager, 20)
+        assert incremental == self._stored_rollups(rollup_manager)
+
+    def test_batches_split_events_sharing_a_timestamp(self, rollup_manager) -> None:
+        """Test that batches ending partway through a timestamp's events resume after the last one processed."""
+        self._catch_up(rollup_manager, 20, batch_size=1)
+        batched = self._stored_rollups(rollup_manager)
+
+        rollup_manager.rollups_collection.delete_many({})
+        self._catch_up(rollup_manager, 20)
+        assert batched == self._stored_rollups(rollup_manager)
+
+    def test_interrupted_write_is_not_counted_twice(self, rollup_manager) -> None:
+        """Test that a batch whose write was interrupted is rolled back, not applied again."""
+        rollups_collection = rollup_manager.rollups_collection
+        self._catch_up(rollup_manager, 10)
+        update_one = rollups_collection.update_one
+
+        def fail_state_write(filter_query, update, **kwargs):
+            is_state_write = filter_query.get("_id") == STATE_ID
+            if is_state_write and "watermark" in update.get("$set", {}):
+                raise RuntimeError("Interrupted")
+            return update_one(filter_query, update, **kwargs)
+
+        with (
+            patch.object(
+                rollups_collection, "update_one", side_effect=fail_state_write
+            ),
+            pytest.raises(RuntimeError),
+        ):
+            self._catch_up(rollup_manager, 20)
+        self._catch_up(rollup_manager, 20)
+        incremental = self._stored_rollups(rollup_manager)
+
+        rollups_collection.delete_many({})
+        self._catch_up(rollup_manager, 20)
+        assert incremental == self._stored_rollups(rollup_manager)
+
+    def test_late_event_marking_failure_does_not_fail_ingestion(
+        self, rollup_manager
+    ) -> None:
+        """Test that stored events are published even if flagging them as late fails."""
+        rollup_manager._catch_up_rollups()
+        client = TestClient(rollup_manager.create_server())
+        late_event = Event(
+            event_type=EventType.EXPERIMENT_START,
+            event_data={"experiment_id": "exp2"},
+            event_timestamp=self.day + timedelta(hours=13),
+            source=OwnershipInfo(),
+        )
+        with (
+            patch(
+                "madsci.event_manager.event_server.mark_late_events",
+                side_effect=RuntimeError("rollups unavailable"),
+            ),
+            patch.object(rollup_manager.event_stream, "publish") as publish,
+        ):
+            response = client.post("/event", json=late_event.model_dump(mode="json"))
+            assert response.status_code == 200
+            response = client.post(
+                "/events/batch",
+                json=[Event(event_type=EventType.TEST).model_dump(mode="json")],
+            )
+            assert response.status_code == 200
+        assert publish.call_count == 2
+        assert rollup_manager.events.find_one({"_id": late_event.event_id})
+
+    def test_user_report_from_rollups(self, rollup_manager) -> None:
+        """Test that the user report is assembled from user rollups."""
+        rollup_manager._catch_up_rollups()
+        client = TestClient(rollup_manager.create_server())
+
+        report = client.get(
+            "/utilization/user",
+            params={
+                "start_time": self.day.isoformat(),
+                "end_time": (self.day + timedelta(days=1)).isoformat(),
+            },
+        ).json()
+
+        assert report["report_metadata"]["method"] == "hourly_rollups"
+        user = report["user_utilization"]["ada"]
+        assert user["total_workflows"] == 1
+        assert user["completed_workflows"] == 1
+        assert user["total_runtime_hours"] == 1.5
+        assert report["system_summary"]["completion_rate_percent"] == 100.0
+
+    def test_reports_include_events_newer_than_watermark(self, rollup_manager) -> None:
+        """Test that events after the rollup watermark are replayed, not dropped."""
+        rollups = UtilizationRollups(
+            UtilizationAnalyzer(rollup_manager.events),
+            rollup_manager.rollups_collection,
+            lag_seconds=0,
+        )
+        rollups.catch_up(now=self.day + timedelta(hours=10))
+        assert rollups.get_watermark() == (self.day + timedelta(hours=10)).replace(
+            tzinfo=None
+        )
+
+        report = rollups.generate_utilization_periods(
+            (self.day + timedelta(hours=9)).replace(tzinfo=None),
+            (self.day + timedelta(hours=13)).replace(tzinfo=None),
+            "hourly",
+            "UTC",
+        )
+        assert report["key_metrics"]["total_active_time_hours"] == 3.0
+        assert report["node_summary"]["node1"]["total_busy_hours"] == 2.0
+
+
+class TestTimeSeriesBuckets:
+    """Test that sessions are swept into time buckets in a single pass."""
+
+    def test_multi_day_session_analyzed_once(self, mongo_handler) -> None:
+        """Test that a session spanning several days is split across them."""
+        manager = EventManager(
+            settings=EventManagerSettings(
+                manager_name="test_event_manager", enable_registry_resolution=False
+            ),
+            mongo_handler=mongo_handler,
+        )
+        day = datetime(2025, 3, 1, tzinfo=timezone.utc)
+        activity = [
+            (12, EventType.WORKCELL_START, {"workcell_id": "wc1"}),
+            (34, EventType.EXPERIMENT_START, {"experiment_id": "exp1"}),
+            (60, EventType.WORKCELL_STOP, {"workcell_id": "wc1"}),
+        ]
+        for hours, event_type, event_data in activity:
+            event = Event(
+                event_type=event_type,
+                event_data=event_data,
+                event_timestamp=day + timedelta(hours=hours),
+            )
+            manager.events.insert_one(event.to_mongo())
+
+        analyzer = UtilizationAnalyzer(manager.events)
+        with patch.object(
+            analyzer,
+            "_analyze_session_utilization",
+            wraps=analyzer._analyze_session_utilization,
+        ) as analyze:
+            report = TimeSeriesAnalyzer(analyzer).generate_summary_report(
+                day.replace(tzinfo=None),
+                (day + timedelta(hours=60)).replace(tzinfo=None),
+                "daily",
+                "UTC",
+            )
+
+        assert analyze.call_count == 1
+        periods = report["time_series"]["system"]
+        assert [period["runtime_hours"] for period in periods] == [12.0, 24.0, 12.0]
+        assert [period["experiments"] for period in periods] == [0, 1, 0]
+
+
+class TestUserReportQuery:
+    """Test the projected query behind the user utilization report."""
+
+    def test_user_report_from_projected_events(self, mongo_handler) -> None:
+        """Test that workflow events read with a projection produce the expected user statistics."""
+        events = mongo_handler.get_collection("events")
+        start = datetime(2025, 3, 1, 9, tzinfo=timezone.utc)
+        for hours, event_type, event_data in [
+            (0, EventType.WORKFLOW_START, {"workflow_id": "wf1", "name": "prep"}),
+            (
+                1,
+                EventType.WORKFLOW_START,
+                {"workflow_id": "wf2", "definition_metadata": {"author": "ada"}},
+            ),
+            (
+                2,
+                EventType.WORKFLOW_COMPLETE,
+                {
+                    "workflow_id": "wf1",
+                    "author": "ada",
+                    "status": "completed",
+                    "duration_seconds": 7200,
+                },
+            ),
+        ]:
+            event = Event(
+                event_type=event_type,
+                event_data=event_data,
+                event_timestamp=start + timedelta(hours=hours),
+            )
+            events.insert_one(event.to_mongo())
+        collection = MagicMock(wraps=events)
+
+        report = UtilizationAnalyzer(collection).generate_user_utilization_report(
+            start.replace(tzinfo=None), (start + timedelta(days=1)).replace(tzinfo=None)
+        )
+
+        query, projection = collection.find.call_args.args
+        assert set(query) >= {"event_type", "event_time"}
+        assert projection["_id"] == 0
+        assert "event_data.definition_metadata.author" in projection
+        collection.aggregate.assert_not_called()
+        user = report["user_utilization"]["ada"]
+        assert user["total_workflows"] == 2
+        assert user["completed_workflows"] == 1
+        assert user["total_runtime_hours"] == 2.0
+        assert [workflow["status"] for workflow in user["workflows"]] == [
+            "completed",
+            "started",
+        ]
+        assert report["system_summary"]["completion_rate_percent"] == 50.0
+
+
+class TestEventExport:
+    """Test streaming event exports."""
+
+    @pytest.fixture()
+    def exported_events(self, test_client: TestClient) -> list[Event]:
+        """Log a mix of events to export."""
+        events = [
+            Event(
+                event_type=EventType.TEST if i % 2 == 0 else EventType.LOG_INFO,
+                event_data={"index": i},
+                event_timestamp=datetime(2025, 1, 1, tzinfo=timezone.utc)
+                + timedelta(hours=i),
+            )
+            for i in range(6)
+        ]
+        for event in events:
+            test_client.post("/event", json=event.model_dump(mode="json"))
+        return events
+
+    def test_export_ndjson(
+        self, test_client: TestClient, exported_events: list[Event]
+    ) -> None:
+        """Test that events export as NDJSON, oldest first."""
+        response = test_client.get("/events/export", params={"format": "ndjson"})
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        assert "events.ndjson" in response.headers["content-disposition"]
+
+        records = [json.loads(line) for line in response.text.splitlines()]
+        assert [record["event_id"] for record in records] == [
+            event.event_id for event in exported_events
+        ]
+        assert records[0]["event_data"] == {"index": 0}
+
+    def test_export_csv_with_filters(
+        self, test_client: TestClient, exported_events: list[Event]
+    ) -> None:
+        """Test that CSV exports honor the event type and time range filters."""
+        response = test_client.get(
+            "/events/export",
+            params={
+                "format": "csv",
+                "event_type": EventType.TEST.value,
+                "start_time": "2025-01-01T01:00:00+00:00",
+                "end_time": "2025-01-01T04:00:00+00:00",
+            },
+        )
+        assert response.status_code == 200
+
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert [row["event_id"] for row in rows] == [
+            exported_events[2].event_id,
+            exported_events[4].event_id,
+        ]
+        assert json.loads(rows[0]["event_data"]) == {"index": 2}
+
+    def test_export_gzip(
+        self, test_client: TestClient, exported_events: list[Event]
+    ) -> None:
+        """Test that gzipped exports decompress to the plain export."""
+        plain = test_client.get("/events/export", params={"format": "csv"})
+        compressed = test_client.get(
+            "/events/export", params={"format": "csv", "gzip": "true"}
+        )
+        assert compressed.headers["content-type"] == "application/gzip"
+        assert "events.csv.gz" in compressed.headers["content-disposition"]
+        # * The test client does not decode gzip without a Content-Encoding header
+        assert gzip.decompress(compressed.content) == plain.content
+        assert len(plain.text.splitlines()) == len(exported_events) + 1
+
+    def test_export_empty_csv_has_header(self, test_client: TestClient) -> None:
+        """Test that an empty CSV export still has its header row."""
+        response = test_client.get("/events/export", params={"format": "csv"})
+        assert response.status_code == 200
+        assert response.text.splitlines() == [",".join(CSV_COLUMNS)]
+
+
+class TestEventStream:
+    """Test the live event stream."""
+
+    def test_broadcaster_filters_events(self) -> None:
+        """Test that subscribers only receive events matching their filters."""
+        broadcaster = EventBroadcaster(queue_size=10)
+        errors = broadcaster.subscribe(level=EventLogLevel.ERROR)
+        tests = broadcaster.subscribe(event_types=[EventType.TEST.value])
+        node_id = new_ulid_str()
+        node = broadcaster.subscribe(source=node_id)
+
+        info = Event(event_type=EventType.TEST, source=OwnershipInfo(node_id=node_id))
+        error = Event(event_type=EventType.LOG_ERROR, log_level=EventLogLevel.ERROR)
+        broadcaster.publish([info, error, info])
+
+        assert [errors.queue.get_nowait()] == [error]
+        assert [tests.queue.get_nowait()] == [info]
+        assert tests.queue.empty()
+        assert [node.queue.get_nowait()] == [info]
+
+    def test_broadcaster_drops_subscribers_that_fall_behind(self) -> None:
+        """Test that a full subscriber is dropped instead of blocking publishing."""
+        broadcaster = EventBroadcaster(queue_size=1)
+        subscription = broadcaster.subscribe()
+        broadcaster.publish([Event(event_type=EventType.TEST) for _ in range(2)])
+
+        assert subscription.overflowed
+        assert broadcaster.subscriber_count == 0
+        assert subscription.queue.qsize() == 1
+
+    def test_stream_replays_then_pushes_live_events(self, mongo_handler) -> None:
+        """Test that a resumed stream replays missed events, then streams new ones."""
+        manager = EventManager(
+            settings=event_manager_settings, mongo_handler=mongo_handler
+        )
+        first = Event(event_type=EventType.TEST, event_data={"index": 0})
+        missed = Event(event_type=EventType.TEST, event_data={"index": 1})
+        live = Event(event_type=EventType.TEST, event_data={"index": 2})
+        other_type = Event(event_type=EventType.LOG_INFO)
+        body = {}
+
+        with TestClient(manager.create_server()) as client:
+            for event in (first, missed, other_type):
+                client.post("/event", json=event.model_dump(mode="json"))
+
+            def read_stream() -> None:
+                body["text"] = client.get(
+                    "/events/stream",
+                    params={"event_type": EventType.TEST.value},
+                    headers={"Last-Event-ID": first.event_id},
+                ).text
+
+            reader = threading.Thread(target=read_stream, daemon=True)
+            reader.start()
+            deadline = time.monotonic() + 5
+            while manager.event_stream.subscriber_count == 0:
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+
+            for event in (live, other_type, Event(event_type=EventType.LOG_INFO)):
+                client.post("/event", json=event.model_dump(mode="json"))
+            # * Ending the streams lets the test client finish reading the response
+            client.portal.call(manager.event_stream.close)
+            reader.join(5)
+            assert not reader.is_alive()
+
+        event_ids = [
+            line.removeprefix("id: ")
+            for line in body["text"].splitlines()
+            if line.startswith("id: ")
+        ]
+        assert event_ids == [missed.event_id, live.event_id]
@@ -1,10 +1,20 @@
-"""Unit tests for the EmailAlerts class in the madsci.event_manager.notifications module."""
+"""Unit tests for email alerts: EmailAlerts in madsci.event_manager.notifications and AlertDispatcher in madsci.event_manager.alert_dispatcher."""
 
-from collections.abc import Generator
+import socketserver
+import threading
+import time
+from collections.abc import Callable, Generator
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
-from madsci.common.types.event_types import EmailAlertsConfig
+from madsci.common.types.event_types import (
+    EmailAlertsConfig,
+    Event,
+    EventManagerSettings,
+    EventType,
+)
+from madsci.event_manager.alert_dispatcher import AlertDispatcher
 from madsci.event_manager.notifications import EmailAlerts
 
 
@@ -149,3 +159,222 @@ def test_send_email_alerts(mock_executor: MagicMock, email_alerts: EmailAlerts)
     mock_executor_instance.map.assert_called_once()
     args, _ = mock_executor_instance.map.call_args
     assert len(args[1]) == 3  # Ensure all email addresses are passed
+
+
+class FakeSMTPServer(socketserver.ThreadingTCPServer):
+    """A minimal local SMTP server that records connections and messages."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self) -> None:
+        """Listen on a free local port."""
+        super().__init__(("127.0.0.1", 0), FakeSMTPHandler)
+        self.connections = 0
+        self.messages: list[tuple[str, str]] = []
+        self.disconnect_after_message = False
+
+
+class FakeSMTPHandler(socketserver.StreamRequestHandler):
+    """Speaks just enough SMTP for smtplib to send plain messages."""
+
+    server: FakeSMTPServer
+
+    def handle(self) -> None:
+        """Handle one SMTP session."""
+        self.server.connections += 1
+        self.reply("220 localhost")
+        recipient = ""
+        while line := self.rfile.readline().decode().strip():
+            command = line.split(" ", 1)[0].upper()
+            if command == "RCPT":
+                recipient = line.split(":", 1)[1].strip("<> ")
+            if command == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                body = []
+                while (data := self.rfile.readline().decode()) != ".\r\n":
+                    body.append(data)
+                self.server.messages.append((recipient, "".join(body)))
+                self.reply("250 OK")
+                if self.server.disconnect_after_message:
+                    return
+            elif command == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("250 OK")
+
+    def reply(self, line: str) -> None:
+        """Send a reply line."""
+        self.wfile.write(f"{line}\r\n".encode())
+
+
+@pytest.fixture
+def smtp_server() -> Generator[FakeSMTPServer, None, None]:
+    """Fixture to run a fake SMTP server on a local port."""
+    server = FakeSMTPServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def local_config(server: FakeSMTPServer, *addresses: str) -> EmailAlertsConfig:
+    """Return an email alerts config that sends to the fake SMTP server."""
+    return EmailAlertsConfig(
+        smtp_server="127.0.0.1",
+        smtp_port=server.server_address[1],
+        use_tls=False,
+        email_addresses=list(addresses),
+    )
+
+
+def wait_until(condition: Callable[[], bool], timeout: float = 5.0) -> bool:
+    """Poll until a condition holds, returning whether it did before the timeout."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_send_email_reuses_connection(smtp_server: FakeSMTPServer) -> None:
+    """
+    Test that emails are sent over one SMTP connection when reuse_connection is set,
+    and that a connection dropped by the server is reopened.
+    """
+    email_alerts = EmailAlerts(
+        config=local_config(smtp_server), logger=MagicMock(), reuse_connection=True
+    )
+    for i in range(3):
+        assert email_alerts.send_email(f"Alert {i}", "ops@test.com", "body")
+    assert smtp_server.connections == 1
+    assert len(smtp_server.messages) == 3
+
+    smtp_server.disconnect_after_message = True
+    assert email_alerts.send_email("Alert 3", "ops@test.com", "body")
+    assert email_alerts.send_email("Alert 4", "ops@test.com", "body")
+    assert len(smtp_server.messages) == 5
+    assert smtp_server.connections == 2
+    email_alerts.close()
+
+
+def dispatcher_settings(**kwargs: Any) -> EventManagerSettings:
+    """Return event manager settings for testing an AlertDispatcher."""
+    return EventManagerSettings(enable_registry_resolution=False, **kwargs)
+
+
+def test_dispatcher_coalesces_identical_alerts(smtp_server: FakeSMTPServer) -> None:
+    """
+    Test that identical alerts within the coalesce window are summarized in one follow-up email,
+    and that resent events are only alerted on once.
+    """
+    dispatcher = AlertDispatcher(
+        dispatcher_settings(alert_coalesce_seconds=0.5),
+        local_config(smtp_server, "ops@test.com"),
+        logger=MagicMock(),
+    )
+    flapping = [
+        Event(event_type=EventType.NODE_ERROR, event_data={"message": "down"})
+        for _ in range(5)
+    ]
+    other = Event(event_type=EventType.TEST, event_data={"message": "other"})
+    for event in [*flapping, flapping[0], other]:
+        assert dispatcher.submit(event)
+    assert dispatcher.flush(timeout=5)
+
+    stats = dispatcher.stats
+    assert stats.sent == 2
+    assert stats.coalesced == 4
+    assert stats.duplicates == 1
+
+    assert wait_until(lambda: dispatcher.stats.sent == 3)
+    assert "raised 4 more times" in smtp_server.messages[-1][1]
+    assert smtp_server.connections == 1
+    dispatcher.close(timeout=5)
+
+
+def test_dispatcher_rate_limits_recipients(smtp_server: FakeSMTPServer) -> None:
+    """
+    Test that each recipient is sent at most alert_rate_limit emails per period.
+    """
+    dispatcher = AlertDispatcher(
+        dispatcher_settings(alert_coalesce_seconds=0, alert_rate_limit=2),
+        local_config(smtp_server, "a@test.com", "b@test.com"),
+        logger=MagicMock(),
+    )
+    for i in range(3):
+        dispatcher.submit(Event(event_type=EventType.TEST, event_data={"index": i}))
+    dispatcher.close(timeout=5)
+
+    assert dispatcher.stats.sent == 4
+    assert dispatcher.stats.rate_limited == 2
+    assert sorted(recipient for recipient, _ in smtp_server.messages) == [
+        "a@test.com",
+        "a@test.com",
+        "b@test.com",
+        "b@test.com",
+    ]
+
+
+def test_dispatcher_drops_alerts_when_full() -> None:
+    """
+    Test that submitting never blocks, and that alerts beyond the queue size are dropped and counted.
+    """
+    dispatcher = AlertDispatcher(
+        dispatcher_settings(alert_queue_size=1),
+        EmailAlertsConfig(email_addresses=["ops@test.com"]),
+        logger=MagicMock(),
+    )
+    release = threading.Event()
+    with patch.object(
+        EmailAlerts, "send_email", side_effect=lambda **_: release.wait(5)
+    ):
+        results = [
+            dispatcher.submit(Event(event_type=EventType.TEST, event_data={"i": i}))
+            for i in range(5)
+        ]
+        assert results.count(False) >= 3
+        assert dispatcher.stats.dropped == results.count(False)
+        release.set()
+        dispatcher.close(timeout=5)
+    assert not dispatcher.submit(Event(event_type=EventType.TEST))
+
+
+def test_dispatcher_submit_racing_close() -> None:
+    """
+    Test that alerts submitted while closing are either processed or dropped, never stranded behind the stop sentinel.
+    """
+    dispatcher = AlertDispatcher(
+        dispatcher_settings(
+            alert_coalesce_seconds=0, alert_rate_limit=0, alert_queue_size=1000
+        ),
+        EmailAlertsConfig(email_addresses=["ops@test.com"]),
+        logger=MagicMock(),
+    )
+    start = threading.Barrier(5)
+    accepted = []
+
+    def submit_many() -> None:
+        start.wait(5)
+        for i in range(200):
+            event = Event(event_type=EventType.TEST, event_data={"i": i})
+            if dispatcher.submit(event):
+                accepted.append(event)
+
+    threads = [threading.Thread(target=submit_many) for _ in range(4)]
+    with patch.object(EmailAlerts, "send_email", return_value=True):
+        for thread in threads:
+            thread.start()
+        start.wait(5)
+        dispatcher.close(timeout=5)
+        for thread in threads:
+            thread.join(5)
+
+    assert dispatcher.flush(timeout=1)
+    stats = dispatcher.stats
+    assert stats.queued == 0
+    assert stats.sent == len(accepted)
+    assert stats.sent + stats.dropped == 800
@@ -98,6 +98,8 @@ class AbstractNode(MadsciClientMixin):
     """The node config model class. This is the class that will be used to instantiate self.config."""
     _action_lock: ClassVar[threading.Lock] = threading.Lock()
     """Ensures only one blocking action can run at a time."""
+    _action_history_changed: ClassVar[threading.Condition] = threading.Condition()
+    """Notified whenever a result is added to the action history."""
 
     def __init__(
         self,
@@ -352,6 +354,24 @@ class AbstractNode(MadsciClientMixin):
             ),
         )
 
+    def wait_for_action(
+        self,
+        action_id: str,
+        status: Optional[ActionStatus] = None,
+        timeout: float = 30.0,
+    ) -> ActionResult:
+        """Wait until an action's status differs from `status` (or, if no status is given, until the action is terminal), or until the timeout elapses, then return its most up-to-date result."""
+
+        def changed() -> bool:
+            current = self.get_action_status(action_id)
+            if current.is_terminal:
+                return True
+            return status is not None and current != status
+
+        with self._action_history_changed:
+            self._action_history_changed.wait_for(changed, timeout=timeout)
+        return self.get_action_result(action_id)
+
     def get_status(self) -> NodeStatus:
         """Get the status of the node."""
         return self.node_status
@@ -1373,11 +1393,13 @@ class AbstractNode(MadsciClientMixin):
 
     def _extend_action_history(self, action_result: ActionResult) -> None:
         """Extend the action history with a new action result."""
-        existing_history = self.action_history.get(action_result.action_id, None)
-        if existing_history is None:
-            self.action_history[action_result.action_id] = [action_result]
-        else:
-            self.action_history[action_result.action_id].append(action_result)
+        with self._action_history_changed:
+            existing_history = self.action_history.get(action_result.action_id, None)
+            if existing_history is None:
+                self.action_history[action_result.action_id] = [action_result]
+            else:
+                self.action_history[action_result.action_id].append(action_result)
+            self._action_history_changed.notify_all()
         self.logger.info(
             "Action status changed",
             event_type=EventType.ACTION_STATUS_CHANGE,
@@ -1,5 +1,6 @@
 """REST-based Node Module helper classes."""
 
+import hashlib
 import inspect
 import os
 import signal
@@ -46,6 +47,7 @@ from madsci.common.types.node_types import (
     NodeClientCapabilities,
     NodeInfo,
     NodeSetConfigResponse,
+    NodeSnapshot,
     NodeStatus,
     RestNodeConfig,
 )
@@ -70,6 +72,8 @@ class RestNode(AbstractNode):
     """The configuration for the node."""
     config_model = RestNodeConfig
     """The node config model class. This is the class that will be used to instantiate self.config."""
+    max_action_wait_timeout: float = 60.0
+    """The longest, in seconds, a single `/action/{action_id}/wait` request may wait. Each wait holds a server worker thread, so longer requested timeouts are clamped to this."""
 
     def __init__(self, *args: Any, **kwargs: Any) -> "RestNode":
         """Initialize the node class."""
@@ -165,6 +169,20 @@ class RestNode(AbstractNode):
             return self._process_dict_response(action_response)
         return self._process_action_result_response(action_response)
 
+    def wait_for_action_dict(
+        self,
+        action_id: str,
+        status: Optional[ActionStatus] = None,
+        timeout: float = 30.0,
+    ) -> dict[str, Any]:
+        """Wait for an action's status to change from `status` (or to become terminal), then return its result as a dictionary for API responses. The timeout is capped at `max_action_wait_timeout`."""
+        timeout = min(timeout, self.max_action_wait_timeout)
+        action_response = super().wait_for_action(action_id, status, timeout)
+
+        if isinstance(action_response, dict):
+            return self._process_dict_response(action_response)
+        return self._process_action_result_response(action_response)
+
     def _process_dict_response(self, response: dict) -> dict[str, Any]:
         """Process a response that's already a dictionary."""
         result_dict = response.copy()
@@ -241,6 +259,21 @@ class RestNode(AbstractNode):
         """Get the state of the node."""
         return super().get_state()
 
+    def get_snapshot(self, request: Request, include_info: bool = False) -> Response:
+        """Get the status, state, and optionally info of the node in one response. The response carries an ETag, and requests whose If-None-Match matches it get an empty 304 response instead."""
+        snapshot = NodeSnapshot(
+            status=self.get_status(),
+            state=self.get_state(),
+            info=self.get_info() if include_info else None,
+        )
+        body = snapshot.model_dump_json()
+        etag = f'"{hashlib.sha256(body.encode()).hexdigest()[:32]}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        return Response(
+            content=body, media_type="application/json", headers={"ETag": etag}
+        )
+
     def get_log(self) -> dict[str, Event]:
         """Get the log of the node"""
         return super().get_log()
@@ -542,6 +575,13 @@ class RestNode(AbstractNode):
         self.router.add_api_route("/status", self.get_status, methods=["GET"])
         self.router.add_api_route("/info", self.get_info, methods=["GET"])
         self.router.add_api_route("/state", self.get_state, methods=["GET"])
+        self.router.add_api_route(
+            "/snapshot",
+            self.get_snapshot,
+            methods=["GET"],
+            response_model=NodeSnapshot,
+            responses={304: {"description": "The snapshot matches If-None-Match"}},
+        )
         self.router.add_api_route("/config", self.set_config, methods=["POST"])
         self.router.add_api_route("/log", self.get_log, methods=["GET"])
 
@@ -585,6 +625,9 @@ class RestNode(AbstractNode):
         self.router.add_api_route(
             "/action/{action_id}/result", self.get_action_result_dict, methods=["GET"]
         )
+        self.router.add_api_route(
+            "/action/{action_id}/wait", self.wait_for_action_dict, methods=["GET"]
+        )
         self.router.add_api_route(
             "/action/{action_id}/download",
             self.get_action_files_zip_by_id,
@@ -18,7 +18,12 @@ from madsci.common.types.action_types import (
     ActionSucceeded,
 )
 from madsci.common.types.admin_command_types import AdminCommandResponse
-from madsci.common.types.node_types import NodeInfo, NodeSetConfigResponse, NodeStatus
+from madsci.common.types.node_types import (
+    NodeInfo,
+    NodeSetConfigResponse,
+    NodeSnapshot,
+    NodeStatus,
+)
 from madsci.common.utils import new_ulid_str
 
 
@@ -242,6 +247,66 @@ def test_get_action_result(mock_create_session: MagicMock) -> None:
     )
 
 
+@patch("madsci.client.node.rest_node_client.create_http_session")
+def test_wait_for_action(mock_create_session: MagicMock) -> None:
+    """Test the wait_for_action method."""
+    action_id = new_ulid_str()
+    mock_response = MagicMock()
+    mock_response.ok = True
+    mock_response.json.return_value = convert_to_rest_format(
+        ActionSucceeded(action_id=action_id)
+    )
+    mock_response.raise_for_status.return_value = None
+
+    mock_session = MagicMock()
+    mock_session.get.return_value = mock_response
+    mock_create_session.return_value = mock_session
+
+    client = RestNodeClient(url="http://localhost:2000")
+
+    result = client.wait_for_action(action_id, status=ActionStatus.RUNNING, timeout=5)
+    assert result.status == ActionStatus.SUCCEEDED
+    assert result.action_id == action_id
+    mock_session.get.assert_called_once_with(
+        f"http://localhost:2000/action/{action_id}/wait",
+        params={"timeout": 5, "status": "running"},
+        timeout=15,
+    )
+
+
+@patch("madsci.client.node.rest_node_client.create_http_session")
+def test_get_snapshot(mock_create_session: MagicMock) -> None:
+    """Test that get_snapshot sends conditional requests and reuses unchanged snapshots."""
+    snapshot = NodeSnapshot(status=NodeStatus(), state={"temperature": 25})
+    ok_response = MagicMock()
+    ok_response.status_code = 200
+    ok_response.headers = {"ETag": '"abc"'}
+    ok_response.json.return_value = snapshot.model_dump(mode="json")
+    not_modified_response = MagicMock()
+    not_modified_response.status_code = 304
+    not_modified_response.headers = {"ETag": '"abc"'}
+
+    mock_session = MagicMock()
+    mock_session.get.side_effect = [ok_response, not_modified_response]
+    mock_create_session.return_value = mock_session
+
+    client = RestNodeClient(url="http://localhost:2000")
+
+    first = client.get_snapshot()
+    assert first.state == {"temperature": 25}
+    assert mock_session.get.call_args.kwargs["headers"] is None
+
+    second = client.get_snapshot()
+    assert second is first
+    mock_session.get.assert_called_with(
+        "http://localhost:2000/snapshot",
+        params={"include_info": False},
+        headers={"If-None-Match": '"abc"'},
+        timeout=10,
+    )
+    not_modified_response.json.assert_not_called()
+
+
 @patch("madsci.client.node.rest_node_client.create_http_session")
 def test_set_config(mock_create_session: MagicMock) -> None:
     """Test the set_config method."""
@@ -740,8 +805,10 @@ def test_client_capabilities():
     assert capabilities.get_info is True
     assert capabilities.get_state is True
     assert capabilities.get_status is True
+    assert capabilities.get_snapshot is True
     assert capabilities.send_action is True
     assert capabilities.get_action_result is True
+    assert capabilities.wait_for_action is True
     assert capabilities.get_action_history is True
     assert capabilities.action_files is True
     assert capabilities.send_admin_commands is True
@@ -6,6 +6,7 @@ import time
 import zipfile
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -20,7 +21,7 @@ from madsci.common.types.action_types import (
 )
 from madsci.common.types.admin_command_types import AdminCommandResponse
 from madsci.common.types.event_types import Event
-from madsci.common.types.node_types import NodeInfo, NodeStatus
+from madsci.common.types.node_types import NodeInfo, NodeSnapshot, NodeStatus
 from madsci.node_module.abstract_node_module import AbstractNode
 from madsci.node_module.helpers import action
 from madsci.node_module.rest_node_module import RestNode
@@ -217,6 +218,36 @@ def test_get_state(test_client: TestClient) -> None:
         assert response.json() == {"test_status_code": 0}
 
 
+def test_get_snapshot(test_client: TestClient) -> None:
+    """Test the snapshot endpoint, including conditional requests."""
+    with test_client as client:
+        time.sleep(0.1)
+        response = client.get("/snapshot")
+        assert response.status_code == 200
+        snapshot = NodeSnapshot.model_validate(response.json())
+        assert snapshot.status.ready is True
+        assert snapshot.state == {"test_status_code": 0}
+        assert snapshot.info is None
+        etag = response.headers["ETag"]
+
+        # * Unchanged, so the node answers with an empty 304
+        response = client.get("/snapshot", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+        # * Including the info is a different snapshot
+        response = client.get("/snapshot", params={"include_info": True})
+        assert response.status_code == 200
+        assert NodeSnapshot.model_validate(response.json()).info is not None
+        assert response.headers["ETag"] != etag
+
+        # * A status change invalidates the ETag
+        client.post("/admin/lock")
+        response = client.get("/snapshot", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert NodeSnapshot.model_validate(response.json()).status.locked is True
+
+
 def test_get_info(test_client: TestClient) -> None:
     """Test the get_info command."""
     with test_client as client:
@@ -346,6 +377,54 @@ def test_get_action_result(test_client: TestClient) -> None:
         assert result.status == ActionStatus.SUCCEEDED
 
 
+def test_wait_for_action(test_client: TestClient) -> None:
+    """Test long-polling for an action's status to change."""
+    with test_client as client:
+        time.sleep(0.1)
+
+        response = client.post("/action/test_action", json={"args": {"test_param": 1}})
+        action_id = response.json()["action_id"]
+
+        # * The action has no history until it is started, so the wait times out
+        start = time.time()
+        response = client.get(
+            f"/action/{action_id}/wait",
+            params={"status": ActionStatus.UNKNOWN.value, "timeout": 0.2},
+        )
+        assert response.status_code == 200
+        assert time.time() - start >= 0.2
+        assert response.json()["status"] == ActionStatus.UNKNOWN.value
+
+        response = client.post(f"/action/test_action/{action_id}/start")
+        assert response.status_code == 200
+
+        # * Without a status, waits for the action to be terminal
+        response = client.get(f"/action/{action_id}/wait", params={"timeout": 5})
+        assert response.status_code == 200
+        result = ActionResult.model_validate(response.json())
+        assert result.action_id == action_id
+        assert result.status == ActionStatus.SUCCEEDED
+
+
+def test_wait_for_action_timeout_is_capped(test_client: TestClient) -> None:
+    """Test that the node caps how long a single wait request may hold a worker."""
+    with test_client as client:
+        time.sleep(0.1)
+
+        response = client.post("/action/test_action", json={"args": {"test_param": 1}})
+        action_id = response.json()["action_id"]
+
+        with patch.object(RestNode, "max_action_wait_timeout", 0.2):
+            start = time.time()
+            response = client.get(
+                f"/action/{action_id}/wait",
+                params={"status": ActionStatus.UNKNOWN.value, "timeout": 3600},
+            )
+        assert response.status_code == 200
+        assert time.time() - start < 5
+        assert response.json()["status"] == ActionStatus.UNKNOWN.value
+
+
 def test_get_nonexistent_action(test_client: TestClient) -> None:
     """Test getting status of a nonexistent action."""
     with test_client as client:
@@ -48,20 +48,13 @@ def _get_location_from_condition(
 ) -> Optional[Location]:
     """Helper function to get location from LocationManager using condition."""
     try:
-        if scheduler.location_client is None:
-            return None
-        if condition.location_id:
-            return scheduler.location_client.get_location(condition.location_id)
-        if condition.location_name:
-            locations = scheduler.location_client.get_locations()
-            return next(
-                (loc for loc in locations if loc.name == condition.location_name),
-                None,
-            )
+        return scheduler.get_location(
+            location_id=condition.location_id,
+            location_name=condition.location_name,
+        )
     except Exception:
         # If LocationManager is not available, return None
         return None
-    return None
 
 
 def evaluate_resource_in_location_condition(
@@ -85,7 +78,7 @@ def evaluate_resource_in_location_condition(
         metadata.ready_to_run = False
         metadata.reasons.append("Resource client is not available.")
     else:
-        container = scheduler.resource_client.get_resource(location.resource_id)
+        container = scheduler.get_resource(location.resource_id)
         try:
             ContainerTypeEnum(container.base_type)
         except ValueError:
@@ -126,7 +119,7 @@ def evaluate_no_resource_in_location_condition(
         metadata.ready_to_run = False
         metadata.reasons.append("Resource client is not available.")
     else:
-        container = scheduler.resource_client.get_resource(location.resource_id)
+        container = scheduler.get_resource(location.resource_id)
         try:
             ContainerTypeEnum(container.base_type)
         except ValueError:
@@ -152,7 +145,7 @@ def get_resource_from_condition(
     """gets a resource by the identifiers provided in the condition"""
     resource = None
     if condition.resource_id:
-        resource = scheduler.resource_client.get_resource(condition.resource_id)
+        resource = scheduler.get_resource(condition.resource_id)
     elif condition.resource_name:
         resource = scheduler.resource_client.query_resource(
             resource_name=condition.resource_name, multiple=False
@@ -1,74 +1,270 @@
 """Default MADSci Workcell scheduler"""
 
+import json
 import traceback
 from datetime import datetime, timedelta
+from typing import Any, Optional
 
 from madsci.common.types.action_types import ActionStatus
 from madsci.common.types.event_types import EventType
+from madsci.common.types.location_types import Location
+from madsci.common.types.node_types import Node
+from madsci.common.types.resource_types import Resource
 from madsci.common.types.step_types import Step
+from madsci.common.types.workcell_types import WorkcellInfo
 from madsci.common.types.workflow_types import (
     SchedulerMetadata,
     Workflow,
 )
 from madsci.workcell_manager.condition_checks import evaluate_condition_checks
 from madsci.workcell_manager.schedulers.scheduler import AbstractScheduler
+from madsci.workcell_manager.state_handler import WorkcellStateHandler
 from madsci.workcell_manager.workflow_utils import prepare_workflow_step
 
 
+class IterationSnapshot:
+    """Workcell state shared by every workflow evaluated in a single scheduler iteration.
+
+    Locations are fetched in bulk when the snapshot is created; nodes, node locks, and resources are fetched at most once each, the first time a workflow needs them.
+    """
+
+    def __init__(self, scheduler: AbstractScheduler) -> None:
+        """Fetch all locations from the scheduler's location client"""
+        self.scheduler = scheduler
+        self.locations: Optional[list[Location]] = None
+        self.locations_fingerprint: Optional[str] = None
+        self._locations_by_id: dict[str, Location] = {}
+        self._locations_by_name: dict[str, Location] = {}
+        self._nodes: dict[str, Optional[Node]] = {}
+        self._node_fingerprints: dict[str, Optional[str]] = {}
+        self._node_locked: dict[str, bool] = {}
+        self._resources: dict[str, Optional[Resource]] = {}
+        if scheduler.location_client is not None:
+            try:
+                self.locations = scheduler.location_client.get_locations()
+            except Exception:
+                # * Leave locations unset; lookups fall back to the location client
+                self.locations = None
+        if self.locations is not None:
+            self._locations_by_id = {loc.location_id: loc for loc in self.locations}
+            self._locations_by_name = {loc.name: loc for loc in self.locations}
+            self.locations_fingerprint = json.dumps(
+                [loc.model_dump(mode="json") for loc in self.locations],
+                sort_keys=True,
+            )
+
+    def get_location(
+        self,
+        location_id: Optional[str] = None,
+        location_name: Optional[str] = None,
+    ) -> Optional[Location]:
+        """Look up a location in the snapshot by ID or name"""
+        if self.locations is None:
+            return AbstractScheduler.get_location(
+                self.scheduler, location_id=location_id, location_name=location_name
+            )
+        if location_id:
+            return self._locations_by_id.get(location_id)
+        if location_name:
+            return self._locations_by_name.get(location_name)
+        return None
+
+    def get_node(self, node_name: str) -> Optional[Node]:
+        """Get a node from the state handler, once per iteration"""
+        if node_name not in self._nodes:
+            self._nodes[node_name] = self.scheduler.state_handler.get_node(node_name)
+        return self._nodes[node_name]
+
+    def node_locked(self, node_name: str) -> bool:
+        """Check whether a node's action lock is held, once per iteration"""
+        if node_name not in self._node_locked:
+            self._node_locked[node_name] = bool(
+                self.scheduler.state_handler.node_lock(node_name).locked()
+            )
+        return self._node_locked[node_name]
+
+    def node_fingerprint(self, node_name: str) -> Optional[str]:
+        """A string that changes whenever the node's status, reservation, info, or lock state changes"""
+        if node_name not in self._node_fingerprints:
+            node = self.get_node(node_name)
+            self._node_fingerprints[node_name] = (
+                None
+                if node is None
+                else json.dumps(
+                    [
+                        node.model_dump(
+                            mode="json", include={"status", "reservation", "info"}
+                        ),
+                        self.node_locked(node_name),
+                    ],
+                    sort_keys=True,
+                )
+            )
+        return self._node_fingerprints[node_name]
+
+    def get_resource(self, resource_id: str) -> Optional[Resource]:
+        """Get a resource from the resource client, once per iteration"""
+        if resource_id not in self._resources:
+            self._resources[resource_id] = AbstractScheduler.get_resource(
+                self.scheduler, resource_id
+            )
+        return self._resources[resource_id]
+
+
 class Scheduler(AbstractScheduler):
     """
     This is the default scheduler for the MADSci Workcell Manager. It is a simple FIFO scheduler that checks if the workflow is ready to run.
 
     - It checks a variety of conditions to determine if a workflow is ready to run. If the workflow is not ready to run, it will add a reason to the scheduler metadata for the workflow.
     - It sets the priority of the workflow based on the order in which the workflows were submitted.
+    - It fetches locations once per iteration, and caches each workflow's evaluation keyed on the inputs it depends on (workflow status, current step, node status and lock, and locations), so only workflows whose inputs changed are re-evaluated.
     """
 
+    def __init__(
+        self,
+        workcell_info: WorkcellInfo,
+        state_handler: WorkcellStateHandler,
+    ) -> "Scheduler":
+        """Initialize the scheduler and its evaluation cache"""
+        super().__init__(workcell_info, state_handler)
+        self.snapshot: Optional[IterationSnapshot] = None
+        self.evaluation_cache: dict[str, tuple[tuple, bool, list[str]]] = {}
+
     def run_iteration(self, workflows: list[Workflow]) -> dict[str, SchedulerMetadata]:
         """Run an iteration of the scheduling algorithm and return a mapping of workflow IDs to SchedulerMetadata"""
-        priority = 0
         workflows = sorted(
             workflows,
             key=lambda item: item.submitted_time,
         )
+        workflow_definition_metadata_map, evaluated = self.evaluate_workflows(
+            workflows
+        )
+        for priority, wf in enumerate(evaluated):
+            workflow_definition_metadata_map[wf.workflow_id].priority = -priority
+        return workflow_definition_metadata_map
+
+    def evaluate_workflows(
+        self, workflows: list[Workflow]
+    ) -> tuple[dict[str, SchedulerMetadata], list[Workflow]]:
+        """Check whether each workflow is ready to run, returning a mapping of workflow IDs to SchedulerMetadata and the workflows (in the given order) that have a step left to run"""
         workflow_definition_metadata_map = {}
+        evaluated = []
+        self.snapshot = IterationSnapshot(self)
 
-        for wf in workflows:
-            try:
-                metadata = wf.scheduler_metadata
-                metadata.ready_to_run = True
-                metadata.reasons = []
-
-                if wf.status.current_step_index < len(wf.steps):
-                    step = wf.steps[wf.status.current_step_index]
-                    updated_step = prepare_workflow_step(
-                        self.workcell_info,
-                        self.state_handler,
-                        step,
-                        wf,
-                        location_client=self.location_client,
+        try:
+            for wf in workflows:
+                try:
+                    metadata = wf.scheduler_metadata
+                    metadata.ready_to_run = True
+                    metadata.reasons = []
+
+                    if wf.status.current_step_index < len(wf.steps):
+                        evaluated.append(wf)
+                        step = wf.steps[wf.status.current_step_index]
+                        metadata = self.evaluate_workflow(wf, step, metadata)
+
+                except Exception as e:
+                    self.evaluation_cache.pop(wf.workflow_id, None)
+                    self.logger.error(
+                        "Error in scheduler while evaluating workflow",
+                        event_type=EventType.MANAGER_ERROR,
+                        workflow_id=wf.workflow_id,
+                        traceback=traceback.format_exc(),
                     )
-                    self.check_workflow_status(wf, metadata)
-                    self.location_checks(updated_step, metadata)
-                    self.resource_checks(updated_step, metadata)
-                    self.node_checks(updated_step, wf, metadata)
-                    self.step_checks(updated_step, metadata)
-                    metadata = evaluate_condition_checks(updated_step, self, metadata)
-                    metadata.priority = priority
-                    priority -= 1
-
-            except Exception as e:
-                self.logger.error(
-                    "Error in scheduler while evaluating workflow",
-                    event_type=EventType.MANAGER_ERROR,
-                    workflow_id=wf.workflow_id,
-                    traceback=traceback.format_exc(),
-                )
-                metadata.ready_to_run = False
-                metadata.reasons.append(f"Exception in scheduler: {e}")
-            finally:
-                workflow_definition_metadata_map[wf.workflow_id] = metadata
+                    metadata.ready_to_run = False
+                    metadata.reasons.append(f"Exception in scheduler: {e}")
+                finally:
+                    workflow_definition_metadata_map[wf.workflow_id] = metadata
+        finally:
+            self.snapshot = None
 
-        return workflow_definition_metadata_map
+        # * Drop cached evaluations for workflows that have left the queue
+        for workflow_id in set(self.evaluation_cache) - set(
+            workflow_definition_metadata_map
+        ):
+            del self.evaluation_cache[workflow_id]
+
+        return workflow_definition_metadata_map, evaluated
+
+    def evaluate_workflow(
+        self, wf: Workflow, step: Step, metadata: SchedulerMetadata
+    ) -> SchedulerMetadata:
+        """Evaluate whether the workflow's current step is ready to run, reusing the cached result if none of its inputs changed"""
+        cache_key = self.evaluation_key(wf, step)
+        cached = self.evaluation_cache.get(wf.workflow_id)
+        if cache_key is not None and cached is not None and cached[0] == cache_key:
+            metadata.ready_to_run = cached[1]
+            metadata.reasons = list(cached[2])
+            return metadata
+        self.evaluation_cache.pop(wf.workflow_id, None)
+
+        updated_step = prepare_workflow_step(
+            self.workcell_info,
+            self.state_handler,
+            step,
+            wf,
+            location_client=self.location_client,
+            locations=self.snapshot.locations if self.snapshot else None,
+            logger=self.logger,
+        )
+        self.check_workflow_status(wf, metadata)
+        self.location_checks(updated_step, metadata)
+        self.resource_checks(updated_step, metadata)
+        self.node_checks(updated_step, wf, metadata)
+        self.step_checks(updated_step, metadata)
+        metadata = evaluate_condition_checks(updated_step, self, metadata)
+
+        if cache_key is not None:
+            self.evaluation_cache[wf.workflow_id] = (
+                cache_key,
+                metadata.ready_to_run,
+                list(metadata.reasons),
+            )
+        return metadata
+
+    def evaluation_key(self, wf: Workflow, step: Step) -> Optional[tuple[Any, ...]]:
+        """Fingerprint the inputs the evaluation of the workflow's current step depends on, or return None if the evaluation can't be cached.
+
+        Steps with conditions depend on live resource contents, and steps that were recently not ready depend on the current time, so they are always re-evaluated.
+        """
+        if self.snapshot is None or step.conditions:
+            return None
+        if step.result is not None and step.result.status == ActionStatus.NOT_READY:
+            return None
+        locations_fingerprint = None
+        if step.locations:
+            locations_fingerprint = self.snapshot.locations_fingerprint
+            if locations_fingerprint is None:
+                return None
+        return (
+            wf.status.model_dump_json(),
+            step.model_dump_json(),
+            json.dumps(wf.parameter_values, sort_keys=True, default=str)
+            if step.use_parameters is not None
+            else None,
+            self.snapshot.node_fingerprint(step.node) if step.node else None,
+            locations_fingerprint,
+        )
+
+    def get_location(
+        self,
+        location_id: Optional[str] = None,
+        location_name: Optional[str] = None,
+    ) -> Optional[Location]:
+        """Look up a location, using the current iteration's snapshot if there is one"""
+        if self.snapshot is not None:
+            return self.snapshot.get_location(
+                location_id=location_id, location_name=location_name
+            )
+        return super().get_location(
+            location_id=location_id, location_name=location_name
+        )
+
+    def get_resource(self, resource_id: str) -> Optional[Resource]:
+        """Look up a resource, using the current iteration's snapshot if there is one"""
+        if self.snapshot is not None:
+            return self.snapshot.get_resource(resource_id)
+        return super().get_resource(resource_id)
 
     def check_workflow_status(self, wf: Workflow, metadata: SchedulerMetadata) -> None:
         """Check if the workflow is ready to run (i.e. not paused, not completed, etc.)"""
@@ -92,21 +288,20 @@ class Scheduler(AbstractScheduler):
             if location is None:
                 continue
             # Get the current location state from LocationManager
-            current_location = location
+            current_location = None
             try:
-                if self.location_client is not None:
-                    current_location = self.location_client.get_location(
-                        location.location_id
-                    )
+                current_location = self.get_location(
+                    location_id=getattr(location, "location_id", None),
+                    location_name=getattr(location, "location_name", None),
+                )
             except Exception:
+                current_location = None
+            if current_location is None:
                 # If LocationManager is not available or location not found, use step's location
                 current_location = location
 
-            if (
-                current_location.resource_id is not None
-                and self.resource_client is not None
-            ):
-                self.resource_client.get_resource(current_location.resource_id)
+            if current_location.resource_id is not None:
+                self.get_resource(current_location.resource_id)
                 # TODO: what do we do with the location_resource?
             if current_location.reservation is not None:
                 metadata.ready_to_run = False
@@ -133,18 +328,27 @@ class Scheduler(AbstractScheduler):
     ) -> None:
         """Check if the node used in the step currently has a "ready" status"""
         if step.node is not None:
-            node = self.state_handler.get_node(step.node)
+            node = (
+                self.snapshot.get_node(step.node)
+                if self.snapshot is not None
+                else self.state_handler.get_node(step.node)
+            )
             if node is None:
                 metadata.ready_to_run = False
                 metadata.reasons.append(f"Node {step.node} not found")
+                return
             if not node.status.ready:
                 metadata.ready_to_run = False
                 metadata.reasons.append(
                     f"Node {step.node} not ready: {node.status.description}"
                 )
             # Check if node is locked (another workflow is currently sending it an action request)
-            node_lock = self.state_handler.node_lock(step.node)
-            if node_lock.locked():
+            node_locked = (
+                self.snapshot.node_locked(step.node)
+                if self.snapshot is not None
+                else self.state_handler.node_lock(step.node).locked()
+            )
+            if node_locked:
                 metadata.ready_to_run = False
                 metadata.reasons.append(f"Node {step.node} is locked by another action")
 
@@ -0,0 +1,242 @@
+"""Priority-aware MADSci Workcell scheduler with fair-share and deadline support"""
+
+import heapq
+import itertools
+from collections import defaultdict, deque
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from typing import Optional
+
+from madsci.common.types.workcell_types import WorkcellInfo, WorkcellManagerSettings
+from madsci.common.types.workflow_types import SchedulerMetadata, Workflow
+from madsci.workcell_manager.schedulers.default_scheduler import (
+    Scheduler as DefaultScheduler,
+)
+from madsci.workcell_manager.state_handler import WorkcellStateHandler
+
+HeapKey = tuple[int, float, str]
+HeapEntry = tuple[HeapKey, int, str]
+
+
+def owner_key(wf: Workflow) -> str:
+    """The fair-share owner of a workflow: its experiment, or its user if it isn't part of an experiment"""
+    ownership = wf.ownership_info
+    if ownership is None:
+        return ""
+    return ownership.experiment_id or ownership.user_id or ""
+
+
+class Scheduler(DefaultScheduler):
+    """
+    A priority-aware scheduler for the MADSci Workcell Manager.
+
+    - Readiness is checked exactly as in the default scheduler, including its per-workflow evaluation cache.
+    - Workflows are kept in a persistent heap keyed on (user priority, submitted time). Only workflows that arrive or change priority are pushed; entries for departed or re-keyed workflows are left in place and skipped, and the heap is rebuilt once they outnumber the live ones.
+    - Ready workflows whose slack (time to their deadline, less the estimated time to run their remaining steps) is within `deadline_urgency_window` seconds are ranked first, earliest deadline first. Step durations are estimated from the start and end times of completed steps. Workflows whose deadline has already passed aren't urgent, so they don't crowd out ones that can still make it.
+    - Remaining ready workflows are ranked by user priority (higher first). Within a priority level, owners (experiments, or users for workflows outside an experiment) take turns in proportion to their `fair_share_weights`, with owners that already have running workflows going later.
+    - Workflows that aren't ready are ranked after all ready workflows.
+    """
+
+    def __init__(
+        self,
+        workcell_info: WorkcellInfo,
+        state_handler: WorkcellStateHandler,
+    ) -> "Scheduler":
+        """Initialize the scheduler and its workflow heap"""
+        super().__init__(workcell_info, state_handler)
+        settings = getattr(state_handler, "workcell_settings", None)
+        if not isinstance(settings, WorkcellManagerSettings):
+            settings = WorkcellManagerSettings()
+        self.fair_share_weights: dict[str, float] = dict(settings.fair_share_weights)
+        self.deadline_urgency_window = timedelta(
+            seconds=settings.deadline_urgency_window
+        )
+        self.heap: list[HeapEntry] = []
+        self.heap_entries: dict[str, HeapEntry] = {}
+        self._counter = itertools.count()
+        self.step_seconds_estimate: Optional[float] = None
+        self.observed_steps: dict[str, int] = {}
+
+    def current_time(self) -> datetime:
+        """The time deadlines are measured against"""
+        return datetime.now().astimezone()
+
+    @staticmethod
+    def heap_key(wf: Workflow) -> HeapKey:
+        """The heap ordering for a workflow: highest user priority first, then first submitted"""
+        return (
+            -wf.priority,
+            wf.submitted_time.timestamp() if wf.submitted_time else 0.0,
+            wf.workflow_id,
+        )
+
+    def update_heap(self, workflows: list[Workflow]) -> None:
+        """Bring the heap in line with the current workflow queue, pushing only new or re-keyed workflows and forgetting departed ones"""
+        queued_ids = set()
+        for wf in workflows:
+            queued_ids.add(wf.workflow_id)
+            entry = self.heap_entries.get(wf.workflow_id)
+            # * Submitted time and ID never change, so only the priority needs checking
+            if entry is not None and entry[0][0] == -wf.priority:
+                continue
+            entry = (self.heap_key(wf), next(self._counter), wf.workflow_id)
+            self.heap_entries[wf.workflow_id] = entry
+            heapq.heappush(self.heap, entry)
+        for workflow_id in set(self.heap_entries) - queued_ids:
+            del self.heap_entries[workflow_id]
+
+        # * Drop stale entries from the top, and rebuild once they outnumber live ones
+        while self.heap and not self._is_live(self.heap[0]):
+            heapq.heappop(self.heap)
+        if len(self.heap) > 2 * len(self.heap_entries):
+            self.heap = [entry for entry in self.heap if self._is_live(entry)]
+            heapq.heapify(self.heap)
+
+    def _is_live(self, entry: HeapEntry) -> bool:
+        """Whether a heap entry is the current one for a queued workflow"""
+        return self.heap_entries.get(entry[2]) is entry
+
+    def iter_heap(self) -> Iterator[str]:
+        """Yield queued workflow IDs in heap order, without popping.
+
+        Walks the heap from the root, always expanding the smallest entry seen so far, so taking the first k IDs costs O(k log k).
+        """
+        heap = self.heap
+        entries = self.heap_entries
+        size = len(heap)
+        frontier = [(heap[0], 0)] if heap else []
+        while frontier:
+            entry, index = heapq.heappop(frontier)
+            if entries.get(entry[2]) is entry:
+                yield entry[2]
+            child = 2 * index + 1
+            if child < size:
+                heapq.heappush(frontier, (heap[child], child))
+            if child + 1 < size:
+                heapq.heappush(frontier, (heap[child + 1], child + 1))
+
+    def observe_step_durations(self, workflows: list[Workflow]) -> None:
+        """Fold the durations of steps completed since the last iteration into the running estimate of how long a step takes"""
+        observed = {}
+        for wf in workflows:
+            completed = wf.status.current_step_index
+            observed[wf.workflow_id] = completed
+            seen = self.observed_steps.get(wf.workflow_id, 0)
+            if completed <= seen:
+                continue
+            for step in wf.steps[seen:completed]:
+                if step.start_time is None or step.end_time is None:
+                    continue
+                seconds = (step.end_time - step.start_time).total_seconds()
+                if self.step_seconds_estimate is None:
+                    self.step_seconds_estimate = seconds
+                else:
+                    self.step_seconds_estimate += 0.1 * (
+                        seconds - self.step_seconds_estimate
+                    )
+        self.observed_steps = observed
+
+    def heap_ordered(self, ready: dict[str, Workflow]) -> list[Workflow]:
+        """Return the given workflows in heap order, walking the heap only as far as the last of them"""
+        ordered = []
+        if not ready:
+            return ordered
+        for workflow_id in self.iter_heap():
+            if workflow_id in ready:
+                ordered.append(ready[workflow_id])
+                if len(ordered) == len(ready):
+                    break
+        return ordered
+
+    def run_iteration(self, workflows: list[Workflow]) -> dict[str, SchedulerMetadata]:
+        """Run an iteration of the scheduling algorithm and return a mapping of workflow IDs to SchedulerMetadata"""
+        self.update_heap(workflows)
+        self.observe_step_durations(workflows)
+        workflow_definition_metadata_map, evaluated = self.evaluate_workflows(
+            workflows
+        )
+        ready: dict[str, Workflow] = {}
+        not_ready: list[Workflow] = []
+        for wf in evaluated:
+            if workflow_definition_metadata_map[wf.workflow_id].ready_to_run:
+                ready[wf.workflow_id] = wf
+            else:
+                not_ready.append(wf)
+
+        ranked = (
+            self.rank_ready_workflows(self.heap_ordered(ready), workflows) + not_ready
+        )
+        for priority, wf in enumerate(ranked):
+            workflow_definition_metadata_map[wf.workflow_id].priority = -priority
+
+        return workflow_definition_metadata_map
+
+    def rank_ready_workflows(
+        self, ready: list[Workflow], workflows: list[Workflow]
+    ) -> list[Workflow]:
+        """Order ready workflows (given in heap order): urgent deadlines first, then by user priority with fair-share turns within each priority level"""
+        now = self.current_time()
+        urgent = []
+        remaining = []
+        for wf in ready:
+            if wf.deadline is not None and self.is_urgent(wf, now):
+                urgent.append(wf)
+            else:
+                remaining.append(wf)
+        urgent.sort(key=lambda wf: wf.deadline.astimezone())
+
+        running: dict[str, int] = defaultdict(int)
+        for wf in workflows:
+            if wf.status.running:
+                running[owner_key(wf)] += 1
+
+        ranked = urgent
+        for _, level in itertools.groupby(remaining, key=lambda wf: wf.priority):
+            ranked.extend(self.fair_share_order(list(level), running))
+        return ranked
+
+    def is_urgent(self, wf: Workflow, now: datetime) -> bool:
+        """Whether a workflow's deadline is still reachable and its slack is within the urgency window"""
+        time_left = wf.deadline.astimezone() - now
+        if time_left <= timedelta(0):
+            return False
+        remaining_steps = len(wf.steps) - wf.status.current_step_index
+        remaining_work = timedelta(
+            seconds=(self.step_seconds_estimate or 0.0) * remaining_steps
+        )
+        return time_left - remaining_work <= self.deadline_urgency_window
+
+    def fair_share_order(
+        self, workflows: list[Workflow], running: dict[str, int]
+    ) -> list[Workflow]:
+        """Interleave workflows (given in heap order) across owners, always picking next from the owner with the lowest weighted share"""
+        queues: dict[str, deque[Workflow]] = defaultdict(deque)
+        for wf in workflows:
+            queues[owner_key(wf)].append(wf)
+        if len(queues) == 1:
+            return workflows
+
+        shares = {owner: running[owner] for owner in queues}
+        owner_heap = [
+            (self._weighted_share(owner, shares[owner]), position, owner)
+            for position, owner in enumerate(queues)
+        ]
+        heapq.heapify(owner_heap)
+        ordered = []
+        while owner_heap:
+            _, position, owner = heapq.heappop(owner_heap)
+            ordered.append(queues[owner].popleft())
+            shares[owner] += 1
+            if queues[owner]:
+                heapq.heappush(
+                    owner_heap,
+                    (self._weighted_share(owner, shares[owner]), position, owner),
+                )
+        return ordered
+
+    def _weighted_share(self, owner: str, share: int) -> float:
+        """An owner's share of the workcell, scaled by its fair-share weight"""
+        weight = self.fair_share_weights.get(owner, 1.0)
+        if weight <= 0:
+            return float("inf")
+        return share / weight
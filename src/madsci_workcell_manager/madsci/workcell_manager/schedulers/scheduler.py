@@ -5,6 +5,8 @@ from typing import ClassVar, Optional
 from madsci.client.event_client import EventClient
 from madsci.client.location_client import LocationClient
 from madsci.client.resource_client import ResourceClient
+from madsci.common.types.location_types import Location
+from madsci.common.types.resource_types import Resource
 from madsci.common.types.workcell_types import WorkcellInfo
 from madsci.common.types.workflow_types import SchedulerMetadata, Workflow
 from madsci.workcell_manager.state_handler import WorkcellStateHandler
@@ -46,3 +48,30 @@ class AbstractScheduler:
     def run_iteration(self, workflows: list[Workflow]) -> dict[str, SchedulerMetadata]:
         """Run an iteration of the scheduler and return a mapping of workflow IDs to SchedulerMetadata"""
         raise NotImplementedError("Subclasses must implement this method")
+
+    def get_location(
+        self,
+        location_id: Optional[str] = None,
+        location_name: Optional[str] = None,
+    ) -> Optional[Location]:
+        """Look up a location by ID or name, returning None if it can't be found"""
+        if self.location_client is None:
+            return None
+        if location_id:
+            return self.location_client.get_location(location_id)
+        if location_name:
+            return next(
+                (
+                    loc
+                    for loc in self.location_client.get_locations()
+                    if loc.name == location_name
+                ),
+                None,
+            )
+        return None
+
+    def get_resource(self, resource_id: str) -> Optional[Resource]:
+        """Look up a resource by ID, returning None if no resource client is configured"""
+        if self.resource_client is None:
+            return None
+        return self.resource_client.get_resource(resource_id)
@@ -2,6 +2,9 @@
 State management for the WorkcellManager
 """
 
+import contextlib
+import json
+import time
 import warnings
 from typing import Any, Callable, Optional, Union
 
@@ -12,26 +15,113 @@ from madsci.common.db_handlers import (
     PyRedisHandler,
     RedisHandler,
 )
+from madsci.common.types.action_types import ActionResult
 from madsci.common.types.node_types import Node
+from madsci.common.types.step_types import Step
 from madsci.common.types.workcell_types import (
     WorkcellInfo,
     WorkcellManagerSettings,
     WorkcellState,
     WorkcellStatus,
 )
-from madsci.common.types.workflow_types import Workflow, WorkflowDefinition
+from madsci.common.types.workflow_types import (
+    SchedulerMetadata,
+    Workflow,
+    WorkflowDefinition,
+    WorkflowStatus,
+)
 from madsci.common.utils import new_ulid_str
 from pydantic import AnyUrl, ValidationError
 
 
+def _step_fields(index: int, step: Step) -> dict[str, str]:
+    """The hash fields storing a workflow step, excluding its history"""
+    return {f"step:{index}": step.model_dump_json(exclude={"history"})}
+
+
+def _history_fields(
+    index: int, history: list[ActionResult], start: int = 0
+) -> dict[str, str]:
+    """The hash fields storing entries ``start`` onward of a step's history, plus its length"""
+    fields = {f"step:{index}:history_length": str(len(history))}
+    for position in range(start, len(history)):
+        fields[f"step:{index}:history:{position}"] = history[position].model_dump_json()
+    return fields
+
+
+def _queue_step_write(
+    pipeline: Any, key: str, index: int, step: Step, stored_length: int
+) -> None:
+    """Queue the writes replacing a step whose stored history has `stored_length` entries"""
+    fields = _step_fields(index, step)
+    if len(step.history) >= stored_length:
+        fields.update(_history_fields(index, step.history, start=stored_length))
+    else:
+        fields.update(_history_fields(index, step.history))
+        pipeline.hdel(
+            key,
+            *(
+                f"step:{index}:history:{position}"
+                for position in range(len(step.history), stored_length)
+            ),
+        )
+    pipeline.hset(key, mapping=fields)
+
+
+def _workflow_fields(wf: Workflow) -> dict[str, str]:
+    """Split a workflow into the hash fields it is stored as"""
+    fields = {
+        "workflow": wf.model_dump_json(
+            exclude={"steps", "status", "scheduler_metadata"}
+        ),
+        "status": wf.status.model_dump_json(),
+        "scheduler_metadata": wf.scheduler_metadata.model_dump_json(),
+    }
+    for index, step in enumerate(wf.steps):
+        fields.update(_step_fields(index, step))
+        fields.update(_history_fields(index, step.history))
+    return fields
+
+
+def _workflow_from_fields(fields: dict[str, str]) -> Workflow:
+    """Reassemble a workflow from its hash fields"""
+    workflow = json.loads(fields["workflow"])
+    workflow["status"] = json.loads(fields["status"])
+    workflow["scheduler_metadata"] = json.loads(fields["scheduler_metadata"])
+    steps = []
+    while f"step:{len(steps)}" in fields:
+        index = len(steps)
+        step = json.loads(fields[f"step:{index}"])
+        step["history"] = [
+            json.loads(fields[f"step:{index}:history:{position}"])
+            for position in range(int(fields.get(f"step:{index}:history_length", 0)))
+        ]
+        steps.append(step)
+    workflow["steps"] = steps
+    return Workflow.model_validate(workflow)
+
+
 class WorkcellStateHandler:
     """
     Manages state for a MADSci Workcell, providing transactional access to reading and writing state with
     optimistic check-and-set and locking.
+
+    Each active workflow is stored as a Redis hash, with its status, scheduler metadata, each step, and each
+    step history entry in separate fields, so the engine can patch just the part of a workflow that changed.
+
+    Locking is scoped to what an operation touches: `wc_state_lock` for queue-wide operations (scheduler
+    iterations, dispatch), `workflow_lock` for multi-step changes to one workflow, and `node_state_lock` for
+    changes to one node. Always acquire them in that order. Single-record read-modify-write updates
+    (`update_current_step`, `update_active_workflow`) use optimistic transactions instead of a lock.
+
+    The workflow queue, active workflows, and nodes are read in bulk with pipelined requests, and cached for
+    the current values of the state change counter and the scheduler metadata counter. Cached objects are shared between callers, so treat them
+    as read-only and write changes back through the handler's setters.
     """
 
     state_change_marker = "0"
     shutdown: bool = False
+    _state_subscription: Optional[Any] = None
 
     def __init__(
         self,
@@ -63,6 +153,7 @@ class WorkcellStateHandler:
             workcell_id or self.workcell_settings.manager_id or new_ulid_str()
         )
         self._nodes_config = nodes or self.workcell_settings.nodes or {}
+        self._read_cache: dict[str, tuple[Optional[str], Any]] = {}
 
         # Initialize Redis handler
         if redis_handler is not None:
@@ -108,7 +199,9 @@ class WorkcellStateHandler:
         """
         self.set_workcell_status(WorkcellStatus(initializing=True))
         self._nodes.clear()
+        self._invalidate_read_cache()
         self.state_change_marker = "0"
+        self.migrate_legacy_active_workflows()
 
         # Initialize the workcell info in Redis from settings
         workcell_info = WorkcellInfo(
@@ -131,6 +224,10 @@ class WorkcellStateHandler:
     def _workcell_prefix(self) -> str:
         return f"madsci:workcell:{self._workcell_id}"
 
+    @property
+    def _state_channel(self) -> str:
+        return f"{self._workcell_prefix}:state_events"
+
     @property
     def _workcell_info(self) -> Any:
         return self._redis_handler.create_dict(f"{self._workcell_prefix}:workcell_info")
@@ -147,10 +244,20 @@ class WorkcellStateHandler:
 
     @property
     def _active_workflows(self) -> Any:
+        """Legacy storage with one JSON document per active workflow, only read to migrate it"""
         return self._redis_handler.create_dict(
             f"{self._workcell_prefix}:active_workflows"
         )
 
+    @property
+    def _active_workflow_index(self) -> Any:
+        return self._redis_handler.create_dict(
+            f"{self._workcell_prefix}:active_workflow_index"
+        )
+
+    def _workflow_key(self, workflow_id: str) -> str:
+        return f"{self._workcell_prefix}:workflow:{workflow_id}"
+
     @property
     def _workcell_status(self) -> Any:
         return self._redis_handler.create_dict(f"{self._workcell_prefix}:status")
@@ -165,6 +272,27 @@ class WorkcellStateHandler:
             auto_release_time=60,
         )
 
+    def workflow_lock(self, workflow_id: str) -> Any:
+        """
+        Gets a lock on a single workflow. Hold this while reading, changing, and writing back a workflow,
+        instead of locking the whole workcell. Acquire it after (never while holding, then acquiring)
+        the workcell state lock.
+        """
+        return self._redis_handler.create_lock(
+            f"{self._workflow_key(workflow_id)}:lock",
+            auto_release_time=60,
+        )
+
+    def node_state_lock(self, node_name: str) -> Any:
+        """
+        Gets a lock on a single node's stored state, for reading, changing, and writing it back. Unlike
+        `node_lock`, this isn't held while the node runs an action.
+        """
+        return self._redis_handler.create_lock(
+            f"{self._workcell_prefix}:node:{node_name}:state_lock",
+            auto_release_time=60,
+        )
+
     def node_lock(self, node_name: str) -> Any:
         """
         Gets a lock on a specific node's state. This should be called before any state updates are made to a node,
@@ -203,19 +331,70 @@ class WorkcellStateHandler:
         self.set_workcell_status(func(self.get_workcell_status(), *args, **kwargs))
 
     def mark_state_changed(self) -> int:
-        """Marks the state as changed and returns the current state change counter"""
-        return int(self._redis_handler.incr(f"{self._workcell_prefix}:state_changed"))
+        """Marks the state as changed, notifies any listeners, and returns the current state change counter"""
+        counter = int(
+            self._redis_handler.incr(f"{self._workcell_prefix}:state_changed")
+        )
+        self._redis_handler.publish(self._state_channel, counter)
+        return counter
+
+    def _get_state_change_counter(self) -> Optional[str]:
+        return self._redis_handler.get(f"{self._workcell_prefix}:state_changed")
+
+    def _get_cache_key(self) -> Optional[str]:
+        """Combine the state change and scheduler metadata counters, which together cover every shared write"""
+        counter = self._get_state_change_counter()
+        if counter is None:
+            return None
+        metadata_counter = self._redis_handler.get(
+            f"{self._workcell_prefix}:scheduler_metadata_changed"
+        )
+        return f"{counter}:{metadata_counter or 0}"
+
+    def _cached_read(self, name: str, load: Callable[[], Any]) -> Any:
+        """Return the result of `load`, reusing the last one if no shared state has changed since"""
+        cache_key = self._get_cache_key()
+        cached = self._read_cache.get(name)
+        if cached is not None and cache_key is not None and cached[0] == cache_key:
+            return cached[1]
+        value = load()
+        self._read_cache[name] = (cache_key, value)
+        return value
+
+    def _invalidate_read_cache(self) -> None:
+        """Drop cached reads after a local write that may not move the state change counter"""
+        self._read_cache.clear()
 
     def has_state_changed(self) -> bool:
         """Returns True if the state has changed since the last time this method was called"""
-        state_change_marker = self._redis_handler.get(
-            f"{self._workcell_prefix}:state_changed"
-        )
+        state_change_marker = self._get_state_change_counter()
         if state_change_marker != self.state_change_marker:
             self.state_change_marker = state_change_marker
             return True
         return False
 
+    def wait_for_state_change(self, timeout: float) -> bool:
+        """
+        Blocks until the state changes or the timeout (in seconds) expires.
+        Returns True if the state changed since the last call to has_state_changed or wait_for_state_change.
+        """
+        if self._state_subscription is None:
+            self._state_subscription = self._redis_handler.create_pubsub(
+                self._state_channel
+            )
+        deadline = time.monotonic() + timeout
+        while not self.has_state_changed():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            self._state_subscription.get_message(
+                ignore_subscribe_messages=True, timeout=remaining
+            )
+        # * Drain notifications already covered by the counter we just observed
+        while self._state_subscription.get_message(ignore_subscribe_messages=True):
+            pass
+        return True
+
     # *Workcell Methods
     def get_workcell_info(self) -> WorkcellInfo:
         """
@@ -292,7 +471,7 @@ class WorkcellStateHandler:
 
     def get_workflow(self, workflow_id: str) -> Workflow:
         """Get an experiment by ID."""
-        if workflow_id in self._active_workflows:
+        if workflow_id in self._active_workflow_index:
             workflow = self.get_active_workflow(workflow_id)
             if workflow:
                 return workflow
@@ -305,22 +484,170 @@ class WorkcellStateHandler:
         """
         Returns a workflow by ID, if it exists in the active workflows.
         """
-        try:
-            return Workflow.model_validate(self._active_workflows[str(workflow_id)])
-        except KeyError:
+        fields = self._redis_handler.hgetall(self._workflow_key(str(workflow_id)))
+        if not fields:
             return None
+        return _workflow_from_fields(fields)
+
+    def _read_active_workflows(self, workflow_ids: list[str]) -> dict[str, Workflow]:
+        """Read and validate several active workflows in one pipelined round trip, skipping missing or invalid ones"""
+        workflow_ids = list(
+            dict.fromkeys(str(workflow_id) for workflow_id in workflow_ids)
+        )
+        hashes = self._redis_handler.hgetall_many(
+            [self._workflow_key(workflow_id) for workflow_id in workflow_ids]
+        )
+        workflows = {}
+        for workflow_id, fields in zip(workflow_ids, hashes, strict=True):
+            if not fields:
+                continue
+            try:
+                workflows[workflow_id] = _workflow_from_fields(fields)
+            except (ValidationError, KeyError, ValueError):
+                continue
+        return workflows
 
     def get_active_workflows(self) -> dict[str, Workflow]:
         """
-        Returns all active workflowS
+        Returns all active workflows. The result is cached until the state changes, so treat it as read-only.
+        """
+        return dict(
+            self._cached_read(
+                "active_workflows",
+                lambda: self._read_active_workflows(list(self._active_workflow_index)),
+            )
+        )
+
+    def get_workflow_status(self, workflow_id: str) -> Optional[WorkflowStatus]:
+        """
+        Returns just the status of an active workflow, or None if it isn't active.
+        """
+        status = self._redis_handler.hget(self._workflow_key(workflow_id), "status")
+        if status is None:
+            return None
+        return WorkflowStatus.model_validate_json(status)
+
+    def set_workflow_status(
+        self, workflow_id: str, status: WorkflowStatus, mark_state_changed: bool = True
+    ) -> None:
+        """
+        Overwrites just the status of an active workflow.
         """
-        valid_workflows = {}
-        for workflow_id, workflow in self._active_workflows.to_dict().items():
+        self._redis_handler.hset(
+            self._workflow_key(workflow_id), {"status": status.model_dump_json()}
+        )
+        self._invalidate_read_cache()
+        if mark_state_changed:
+            self.mark_state_changed()
+
+    def set_scheduler_metadata(
+        self, workflow_id: str, metadata: SchedulerMetadata
+    ) -> None:
+        """
+        Overwrites just the scheduler metadata of an active workflow. Doesn't mark the state as changed, but
+        bumps the scheduler metadata counter so other processes' cached reads pick up the new metadata.
+        """
+        self._redis_handler.hset(
+            self._workflow_key(workflow_id),
+            {"scheduler_metadata": metadata.model_dump_json()},
+        )
+        self._redis_handler.incr(f"{self._workcell_prefix}:scheduler_metadata_changed")
+        self._invalidate_read_cache()
+
+    def set_workflow_step(
+        self,
+        workflow_id: str,
+        index: int,
+        step: Step,
+        mark_state_changed: bool = True,
+    ) -> None:
+        """
+        Overwrites a single step of an active workflow. Only history entries the stored step doesn't already
+        have are written, unless the step's history is now shorter than the stored one, in which case the
+        step's history is rewritten.
+        """
+        key = self._workflow_key(workflow_id)
+
+        def write_step(pipeline: Any) -> None:
+            stored_length = int(pipeline.hget(key, f"step:{index}:history_length") or 0)
+            pipeline.multi()
+            _queue_step_write(pipeline, key, index, step, stored_length)
+
+        self._redis_handler.transaction(write_step, key)
+        self._invalidate_read_cache()
+        if mark_state_changed:
+            self.mark_state_changed()
+
+    def update_current_step(
+        self, workflow_id: str, step: Step, mark_state_changed: bool = True
+    ) -> Optional[WorkflowStatus]:
+        """
+        Overwrites the step at an active workflow's current step index, as `set_workflow_step` does. The
+        index is read and the step written in one optimistic transaction, so no lock is needed. Returns the
+        workflow's status, or None (writing nothing) if the workflow isn't active.
+        """
+        key = self._workflow_key(workflow_id)
+
+        def write_step(pipeline: Any) -> Optional[WorkflowStatus]:
+            status = pipeline.hget(key, "status")
+            if status is None:
+                return None
+            status = WorkflowStatus.model_validate_json(status)
+            index = status.current_step_index
+            stored_length = int(pipeline.hget(key, f"step:{index}:history_length") or 0)
+            pipeline.multi()
+            _queue_step_write(pipeline, key, index, step, stored_length)
+            return status
+
+        status = self._redis_handler.transaction(write_step, key)
+        if status is not None:
+            self._invalidate_read_cache()
+            if mark_state_changed:
+                self.mark_state_changed()
+        return status
+
+    def append_step_history(
+        self,
+        workflow_id: str,
+        index: int,
+        result: ActionResult,
+        mark_state_changed: bool = True,
+    ) -> None:
+        """
+        Appends an entry to the history of a single step of an active workflow. The entry and the new
+        history length are written in one optimistic transaction, so readers never see one without the other.
+        """
+        key = self._workflow_key(workflow_id)
+
+        def write_entry(pipeline: Any) -> None:
+            length = int(pipeline.hget(key, f"step:{index}:history_length") or 0)
+            pipeline.multi()
+            pipeline.hset(
+                key,
+                mapping={
+                    f"step:{index}:history:{length}": result.model_dump_json(),
+                    f"step:{index}:history_length": str(length + 1),
+                },
+            )
+
+        self._redis_handler.transaction(write_entry, key)
+        self._invalidate_read_cache()
+        if mark_state_changed:
+            self.mark_state_changed()
+
+    def migrate_legacy_active_workflows(self) -> None:
+        """
+        Moves active workflows stored in the legacy single-document layout into per-workflow hashes.
+        """
+        legacy_workflows = self._active_workflows
+        for workflow_id, workflow in legacy_workflows.to_dict().items():
             try:
-                valid_workflows[str(workflow_id)] = Workflow.model_validate(workflow)
+                self.set_active_workflow(
+                    Workflow.model_validate(workflow), mark_state_changed=False
+                )
             except ValidationError:
                 continue
-        return valid_workflows
+            del legacy_workflows[workflow_id]
 
     def get_archived_workflows(self, number: int = 20) -> dict[str, Workflow]:
         """Get the latest experiments."""
@@ -336,29 +663,39 @@ class WorkcellStateHandler:
             workflows[valid_workflow.workflow_id] = valid_workflow
         return workflows
 
+    def _read_workflow_queue(self) -> tuple[list[str], dict[str, Workflow]]:
+        """Read the queued workflow IDs, then all of the queued workflows in one pipelined round trip"""
+        queue_ids = [str(wf_id) for wf_id in self._workflow_queue.to_list()]
+        return queue_ids, self._read_active_workflows(queue_ids)
+
+    def _get_workflow_queue_snapshot(self) -> tuple[list[str], dict[str, Workflow]]:
+        return self._cached_read("workflow_queue", self._read_workflow_queue)
+
     def get_workflow_queue(self) -> list[Workflow]:
         """
-        Returns the workflow queue
+        Returns the workflow queue. The result is cached until the state changes, so treat it as read-only.
         """
-        return [
-            self.get_active_workflow(wf_id)
-            for wf_id in self._workflow_queue
-            if self.get_active_workflow(wf_id) is not None
-        ]
+        queue_ids, workflows = self._get_workflow_queue_snapshot()
+        return [workflows[wf_id] for wf_id in queue_ids if wf_id in workflows]
 
     def update_workflow_queue(self) -> None:
         """
         Sets the workflow queue based on the current state of the workflows
         """
-        for wf_id in self._workflow_queue:
-            wf = self.get_active_workflow(wf_id)
+        queue_changed = False
+        queue_ids, workflows = self._get_workflow_queue_snapshot()
+        for wf_id in queue_ids:
+            wf = workflows.get(wf_id)
             if wf is None or not wf.status.active:
                 self._workflow_queue.remove(wf_id)
-        self.mark_state_changed()
+                queue_changed = True
+        if queue_changed:
+            self.mark_state_changed()
 
     def enqueue_workflow(self, workflow_id: str) -> None:
         """add a workflow to the workflow queue"""
         self._workflow_queue.append(workflow_id)
+        self.mark_state_changed()
 
     def set_active_workflow(
         self, wf: Workflow, mark_state_changed: bool = True
@@ -366,34 +703,44 @@ class WorkcellStateHandler:
         """
         Sets a workflow by ID
         """
-        if isinstance(wf, Workflow):
-            wf_dump = wf.model_dump(mode="json")
-        else:
-            wf_dump = Workflow.model_validate(wf).model_dump(mode="json")
-        self._active_workflows[str(wf_dump["workflow_id"])] = wf_dump
+        if not isinstance(wf, Workflow):
+            wf = Workflow.model_validate(wf)
+        self._redis_handler.replace_hash(
+            self._workflow_key(wf.workflow_id), _workflow_fields(wf)
+        )
+        self._active_workflow_index[wf.workflow_id] = True
+        self._invalidate_read_cache()
         if mark_state_changed:
             self.mark_state_changed()
 
     def archive_workflow(self, workflow_id: str) -> None:
-        """Move a workflow from redis to mongo"""
-        try:
+        """
+        Move a workflow from redis to mongo. The workflow is re-read under its lock, and left in place if
+        it is no longer terminal (e.g., it was retried after the caller read it).
+        """
+        with self.workflow_lock(workflow_id):
             workflow = self.get_active_workflow(workflow_id)
-        except Exception:
-            raise ValueError("Workflow is not active!") from None
-        self.archived_workflows.insert_one(workflow.to_mongo())
-        self.delete_active_workflow(workflow_id)
+            if workflow is None:
+                raise ValueError("Workflow is not active!")
+            if not workflow.status.terminal:
+                return
+            self.archived_workflows.insert_one(workflow.to_mongo())
+            self.delete_active_workflow(workflow_id)
 
     def archive_terminal_workflows(self) -> None:
         """Move all completed workflows from redis to mongo"""
-        for workflow_id, workflow in self._active_workflows.items():
-            if Workflow.model_validate(workflow).status.terminal:
-                self.archive_workflow(workflow_id)
+        for workflow_id, workflow in self.get_active_workflows().items():
+            if workflow.status.terminal:
+                with contextlib.suppress(ValueError):
+                    self.archive_workflow(workflow_id)
 
     def delete_active_workflow(self, workflow_id: str) -> None:
         """
         Deletes an active workflow by ID
         """
-        del self._active_workflows[str(workflow_id)]
+        del self._active_workflow_index[str(workflow_id)]
+        self._redis_handler.delete(self._workflow_key(str(workflow_id)))
+        self._invalidate_read_cache()
         self.mark_state_changed()
 
     def delete_archived_workflow(self, workflow_id: str) -> None:
@@ -402,24 +749,42 @@ class WorkcellStateHandler:
 
     def update_active_workflow(
         self, workflow_id: str, func: Callable[..., Any], *args: Any, **kwargs: Any
-    ) -> None:
-        """
-        Updates the state of a workflow.
-        """
-        self.set_active_workflow(
-            func(self.get_active_workflow(workflow_id), *args, **kwargs)
-        )
+    ) -> Workflow:
+        """
+        Updates the state of a workflow by applying `func` to it, as an optimistic compare-and-set: if the
+        workflow changes before the update is written, `func` is applied again to the new version. `func`
+        may be called more than once, so it shouldn't have other side effects. Returns the updated workflow.
+        """
+        key = self._workflow_key(str(workflow_id))
+
+        def apply_update(pipeline: Any) -> Workflow:
+            fields = pipeline.hgetall(key)
+            if not fields:
+                raise ValueError("Workflow is not active!")
+            workflow = func(_workflow_from_fields(fields), *args, **kwargs)
+            if not isinstance(workflow, Workflow):
+                workflow = Workflow.model_validate(workflow)
+            pipeline.multi()
+            pipeline.delete(key)
+            pipeline.hset(key, mapping=_workflow_fields(workflow))
+            return workflow
+
+        workflow = self._redis_handler.transaction(apply_update, key)
+        self._invalidate_read_cache()
+        self.mark_state_changed()
+        return workflow
 
     def get_node(self, node_name: str) -> Node:
         """
-        Returns a node by name
+        Returns a node by name. The result is cached until the state changes, so treat it as read-only.
         """
+        node = self._cached_read("nodes", self._read_nodes).get(node_name)
+        if node is not None:
+            return node
         return Node.model_validate(self._nodes[node_name])
 
-    def get_nodes(self) -> dict[str, Node]:
-        """
-        Returns all nodes
-        """
+    def _read_nodes(self) -> dict[str, Node]:
+        """Read and validate all nodes with a single HGETALL, skipping invalid ones"""
         valid_nodes = {}
         for node_name, node in self._nodes.to_dict().items():
             try:
@@ -428,6 +793,12 @@ class WorkcellStateHandler:
                 continue
         return valid_nodes
 
+    def get_nodes(self) -> dict[str, Node]:
+        """
+        Returns all nodes. The result is cached until the state changes, so treat it as read-only.
+        """
+        return dict(self._cached_read("nodes", self._read_nodes))
+
     def set_node(self, node_name: str, node: Union[Node, dict[str, Any]]) -> None:
         """
         Sets a node by name
@@ -437,6 +808,22 @@ class WorkcellStateHandler:
         else:
             node_dump = Node.model_validate(node).model_dump(mode="json")
         self._nodes[node_name] = node_dump
+        self._invalidate_read_cache()
+        self.mark_state_changed()
+
+    def set_nodes(self, nodes: dict[str, Node]) -> None:
+        """
+        Sets several nodes by name, in a single write
+        """
+        if not nodes:
+            return
+        self._nodes.update(
+            {
+                node_name: node.model_dump(mode="json")
+                for node_name, node in nodes.items()
+            }
+        )
+        self._invalidate_read_cache()
         self.mark_state_changed()
 
     def delete_node(self, node_name: str) -> None:
@@ -444,17 +831,23 @@ class WorkcellStateHandler:
         Deletes a node by name
         """
         del self._nodes[node_name]
+        self._invalidate_read_cache()
         self.mark_state_changed()
 
     def update_node(
         self, node_name: str, func: Callable[..., Any], *args: Any, **kwargs: Any
     ) -> None:
         """
-        Updates the state of a node.
+        Updates the state of a node by applying `func` to a copy of it, holding the node's state lock.
         """
-        self.set_node(node_name, func(self.get_node(node_name), *args, **kwargs))
+        with self.node_state_lock(node_name):
+            node = self.get_node(node_name).model_copy(deep=True)
+            self.set_node(node_name, func(node, *args, **kwargs))
 
     def close(self) -> None:
         """Release Redis and MongoDB connections."""
+        if self._state_subscription is not None:
+            self._state_subscription.close()
+            self._state_subscription = None
         self._redis_handler.close()
         self._mongo_handler.close()
@@ -3,10 +3,13 @@ Engine Class and associated helpers and data
 """
 
 import concurrent
+import contextlib
 import importlib
+import math
 import time
+import traceback
 from datetime import datetime
-from typing import Optional, Union
+from typing import Any, Callable, Optional, Union
 
 from madsci.client.data_client import DataClient
 from madsci.client.event_client import EventClient
@@ -48,6 +51,32 @@ from madsci.workcell_manager.workflow_utils import (
     cancel_active_workflows,
     prepare_workflow_step,
 )
+from opentelemetry import metrics
+
+
+class NodeQuery:
+    """A query to a node on the engine's node update pool, timed from when a worker starts running it rather than from when it was queued"""
+
+    def __init__(
+        self,
+        executor: concurrent.futures.Executor,
+        func: Callable[..., Any],
+        **kwargs: Any,
+    ) -> None:
+        """Submit the query to the executor"""
+        self.started_at: Optional[float] = None
+        self.future = executor.submit(self._run, func, **kwargs)
+
+    def _run(self, func: Callable[..., Any], **kwargs: Any) -> Any:
+        """Record the start time, then run the query"""
+        self.started_at = time.monotonic()
+        return func(**kwargs)
+
+    def deadline(self, timeout: float) -> Optional[float]:
+        """When the query times out, or None if it hasn't started yet"""
+        if self.started_at is None:
+            return None
+        return self.started_at + timeout
 
 
 class Engine:
@@ -76,6 +105,17 @@ class Engine:
         self.resource_client = ResourceClient()
         self.location_client = LocationClient()
         self._node_clients: dict[str, AbstractNodeClient] = {}
+        self._node_update_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.workcell_settings.node_update_concurrency,
+            thread_name_prefix="node_update",
+        )
+        self._dispatch_fanout_histogram = metrics.get_meter(
+            "madsci.workcell_manager"
+        ).create_histogram(
+            name="madsci.workcell.dispatch_fanout",
+            description="Number of workflow steps dispatched per scheduler tick",
+            unit="1",
+        )
         time.sleep(self.workcell_settings.cold_start_delay)
         self.logger.info(
             "Engine initialized, waiting for workflows",
@@ -98,14 +138,32 @@ class Engine:
         """
         Continuously loop, updating node states every Config.update_interval seconds.
         If the state of the workcell has changed, update the active modules and run the scheduler.
+
+        In "event_driven" engine mode, the loop blocks on state change notifications instead of
+        polling, running the scheduler as soon as the state changes (or when scheduler_update_interval
+        elapses without a change).
         """
         self.update_active_nodes(self.state_handler, update_info=True)
         node_tick = time.time()
         info_tick = time.time()
         scheduler_tick = time.time()
         self.reconnect_disconnected_nodes()
+        event_driven = self.workcell_settings.engine_mode == "event_driven"
         while True and not self.state_handler.shutdown:
             try:
+                state_changed = False
+                if event_driven:
+                    now = time.time()
+                    timeout = max(
+                        0.0,
+                        min(
+                            node_tick + self.workcell_settings.node_update_interval,
+                            scheduler_tick
+                            + self.workcell_settings.scheduler_update_interval,
+                        )
+                        - now,
+                    )
+                    state_changed = self.state_handler.wait_for_state_change(timeout)
                 self.workcell_info = self.state_handler.get_workcell_info()
 
                 # Check if it's time to update node info (less frequent)
@@ -126,33 +184,18 @@ class Engine:
                         info_tick = time.time()
 
                 if (
-                    time.time() - scheduler_tick
+                    state_changed
+                    or time.time() - scheduler_tick
                     > self.workcell_settings.scheduler_update_interval
                 ):
-                    with self.state_handler.wc_state_lock():
-                        self.state_handler.update_workflow_queue()
-                        self.state_handler.archive_terminal_workflows()
-                        workflows = self.state_handler.get_workflow_queue()
-                        workflow_definition_metadata_map = self.scheduler.run_iteration(
-                            workflows=workflows
-                        )
-                        for workflow in workflows:
-                            if workflow.workflow_id in workflow_definition_metadata_map:
-                                workflow.scheduler_metadata = (
-                                    workflow_definition_metadata_map[
-                                        workflow.workflow_id
-                                    ]
-                                )
-                                self.state_handler.set_active_workflow(
-                                    workflow, mark_state_changed=False
-                                )
-                            else:
-                                workflow.scheduler_metadata.ready_to_run = False
-                                self.state_handler.set_active_workflow(
-                                    workflow, mark_state_changed=False
-                                )
-                    if self.state_handler.get_workcell_status().ok:
-                        self.run_next_step()
+                    self.run_scheduler_iteration()
+                    workcell_ok = self.state_handler.get_workcell_status().ok
+                    if workcell_ok:
+                        if self.workcell_settings.dispatch_mode == "concurrent":
+                            self.run_ready_steps()
+                        else:
+                            self.run_next_step()
+                    if workcell_ok or event_driven:
                         scheduler_tick = time.time()
             except Exception as e:
                 self.logger.error(
@@ -178,6 +221,34 @@ class Engine:
                     self.state_handler.set_workcell_status(workcell_status)
                 time.sleep(self.workcell_settings.node_update_interval)
 
+    def run_scheduler_iteration(self) -> None:
+        """Refresh the workflow queue and run the scheduler over it, storing the resulting scheduler metadata."""
+        with self.state_handler.wc_state_lock():
+            self.state_handler.update_workflow_queue()
+            self.state_handler.archive_terminal_workflows()
+            workflows = self.state_handler.get_workflow_queue()
+            previous_metadata = {
+                workflow.workflow_id: workflow.scheduler_metadata.model_dump_json()
+                for workflow in workflows
+            }
+            workflow_definition_metadata_map = self.scheduler.run_iteration(
+                workflows=workflows
+            )
+            for workflow in workflows:
+                if workflow.workflow_id in workflow_definition_metadata_map:
+                    workflow.scheduler_metadata = workflow_definition_metadata_map[
+                        workflow.workflow_id
+                    ]
+                else:
+                    workflow.scheduler_metadata.ready_to_run = False
+                if (
+                    workflow.scheduler_metadata.model_dump_json()
+                    != previous_metadata[workflow.workflow_id]
+                ):
+                    self.state_handler.set_scheduler_metadata(
+                        workflow.workflow_id, workflow.scheduler_metadata
+                    )
+
     def run_next_step(self, await_step_completion: bool = False) -> Optional[Workflow]:
         """Runs the next step in the workflow with the highest priority. Returns information about the workflow it ran, if any."""
         next_wf = None
@@ -191,31 +262,10 @@ class Engine:
                 key=lambda wf: wf.scheduler_metadata.priority,
                 reverse=True,
             )
-            while len(sorted_ready_workflows) > 0:
-                next_wf = sorted_ready_workflows[0]
-                # * Check if the workflow is already complete
-                if next_wf.status.current_step_index >= len(next_wf.steps):
-                    self.logger.warning(
-                        "Workflow has no more steps, marking as completed",
-                        event_type=EventType.WORKFLOW_COMPLETE,
-                        workflow_id=next_wf.workflow_id,
-                        workflow_name=next_wf.name,
-                        current_step_index=next_wf.status.current_step_index,
-                        step_count=len(next_wf.steps),
-                    )
-                    next_wf.status.completed = True
-                    self.state_handler.set_active_workflow(next_wf)
-                    self._log_completion_event(next_wf)
-                    sorted_ready_workflows.pop(0)
-                    next_wf = None
-                    continue
-                next_wf = sorted_ready_workflows[0]
-                next_wf.status.running = True
-                next_wf.status.has_started = True
-                if next_wf.status.current_step_index == 0:
-                    next_wf.start_time = datetime.now()
-                self.state_handler.set_active_workflow(next_wf)
-                break
+            for queued_wf in sorted_ready_workflows:
+                next_wf = self._claim_workflow(queued_wf)
+                if next_wf is not None:
+                    break
             else:
                 self.logger.info(
                     "No workflows ready to run",
@@ -223,12 +273,120 @@ class Engine:
                     workcell_id=self.workcell_info.manager_id,
                     workcell_name=self.workcell_info.name,
                 )
+        self._dispatch_fanout_histogram.record(1 if next_wf else 0)
         if next_wf:
             thread = self.run_step(next_wf.workflow_id)
             if await_step_completion:
                 thread.join()
         return next_wf
 
+    def run_ready_steps(self, await_step_completion: bool = False) -> list[Workflow]:
+        """
+        Dispatches the next step of every ready workflow whose target node is free, in one locked pass.
+        Workflows are considered in priority order; at most one step is dispatched per node. A node is not free while
+        it reports itself busy or is the target of a step already running, since its node lock is only held while the
+        action is sent. Returns the dispatched workflows.
+        """
+        dispatched: list[Workflow] = []
+        with self.state_handler.wc_state_lock():
+            workflows = self.state_handler.get_workflow_queue()
+            sorted_ready_workflows = sorted(
+                (wf for wf in workflows if wf.scheduler_metadata.ready_to_run),
+                key=lambda wf: wf.scheduler_metadata.priority,
+                reverse=True,
+            )
+            nodes = self.state_handler.get_nodes()
+            busy_nodes: set[str] = {
+                wf.steps[wf.status.current_step_index].node
+                for wf in workflows
+                if wf.status.running and wf.status.current_step_index < len(wf.steps)
+            }
+            busy_nodes.update(
+                name
+                for name, node in nodes.items()
+                if node.status is not None and node.status.busy
+            )
+            for queued_wf in sorted_ready_workflows:
+                if queued_wf.status.current_step_index >= len(queued_wf.steps):
+                    self._claim_workflow(queued_wf)
+                    continue
+                node_name = queued_wf.steps[queued_wf.status.current_step_index].node
+                if node_name is not None:
+                    node = nodes.get(node_name)
+                    if (
+                        node_name in busy_nodes
+                        or (
+                            node is not None
+                            and node.reservation is not None
+                            and not node.reservation.check(queued_wf.ownership_info)
+                        )
+                    ):
+                        continue
+                wf = self._claim_workflow(queued_wf)
+                if wf is None:
+                    continue
+                if node_name is not None:
+                    busy_nodes.add(node_name)
+                dispatched.append(wf)
+        self._dispatch_fanout_histogram.record(len(dispatched))
+        if dispatched:
+            self.logger.info(
+                "Dispatching workflow steps",
+                event_type=EventType.WORKCELL_STATUS_UPDATE,
+                workcell_id=self.workcell_info.manager_id,
+                workcell_name=self.workcell_info.name,
+                dispatch_fanout=len(dispatched),
+                workflow_ids=[wf.workflow_id for wf in dispatched],
+            )
+        else:
+            self.logger.info(
+                "No workflows ready to run",
+                event_type=EventType.WORKCELL_STATUS_UPDATE,
+                workcell_id=self.workcell_info.manager_id,
+                workcell_name=self.workcell_info.name,
+            )
+        threads = [self.run_step(wf.workflow_id) for wf in dispatched]
+        if await_step_completion:
+            for thread in threads:
+                thread.join()
+        return dispatched
+
+    def _claim_workflow(self, queued_wf: Workflow) -> Optional[Workflow]:
+        """
+        Marks a workflow from the (possibly cached) queue as running, under its workflow lock. The workflow is
+        re-read first, and isn't claimed if it was paused, cancelled, started, or advanced in the meantime.
+        A workflow with no steps left is marked completed instead. Returns the claimed workflow, if any.
+        """
+        with self.state_handler.workflow_lock(queued_wf.workflow_id):
+            wf = self.state_handler.get_active_workflow(queued_wf.workflow_id)
+            if (
+                wf is None
+                or not wf.status.active
+                or wf.status.paused
+                or wf.status.running
+                or wf.status.current_step_index != queued_wf.status.current_step_index
+            ):
+                return None
+            if wf.status.current_step_index >= len(wf.steps):
+                self.logger.warning(
+                    "Workflow has no more steps, marking as completed",
+                    event_type=EventType.WORKFLOW_COMPLETE,
+                    workflow_id=wf.workflow_id,
+                    workflow_name=wf.name,
+                    current_step_index=wf.status.current_step_index,
+                    step_count=len(wf.steps),
+                )
+                wf.status.completed = True
+                self.state_handler.set_active_workflow(wf)
+                self._log_completion_event(wf)
+                return None
+            wf.status.running = True
+            wf.status.has_started = True
+            if wf.status.current_step_index == 0:
+                wf.start_time = datetime.now()
+            self.state_handler.set_active_workflow(wf)
+        return wf
+
     @threaded_daemon
     def run_step(self, workflow_id: str) -> None:
         """Run a step in a standalone thread, updating the workflow as needed"""
@@ -252,6 +410,7 @@ class Engine:
                     workflow=wf,
                     data_client=self.data_client,
                     location_client=self.location_client,
+                    logger=self.logger,
                 )
                 step.start_time = datetime.now()
                 self.logger.info(
@@ -398,16 +557,19 @@ class Engine:
         request: ActionRequest,
         action_id: str,
     ) -> None:
-        """Monitor the progress of the action, querying the action result until it is terminal"""
+        """Monitor the progress of the action until it is terminal, waiting on the node for each status change if it supports it, and otherwise polling the action result"""
         interval = 1.0
         retry_count = 0
+        wait_for_action = self.node_advertises(node, client, "wait_for_action")
         while not response.status.is_terminal:
-            with self.state_handler.wc_state_lock():
-                self.state_handler.get_active_workflow(wf.workflow_id)
-            if not check_node_capability(
-                node_info=node.info, client=client, capability="get_action_result"
-            ) and not check_node_capability(
-                node_info=node.info, client=client, capability="get_action_status"
+            if (
+                not wait_for_action
+                and not check_node_capability(
+                    node_info=node.info, client=client, capability="get_action_result"
+                )
+                and not check_node_capability(
+                    node_info=node.info, client=client, capability="get_action_status"
+                )
             ):
                 self.logger.warning(
                     "Non-terminal action response but node does not support querying",
@@ -420,9 +582,17 @@ class Engine:
                 )
                 break
             try:
-                time.sleep(interval)  # * Exponential backoff with cap
-                interval = interval * 1.5 if interval < 10.0 else 10.0
-                response = client.get_action_result(action_id)
+                if wait_for_action:
+                    # * The node responds as soon as the action's status changes
+                    response = client.wait_for_action(
+                        action_id,
+                        status=response.status,
+                        timeout=self.workcell_settings.action_wait_timeout,
+                    )
+                else:
+                    time.sleep(interval)  # * Exponential backoff with cap
+                    interval = interval * 1.5 if interval < 10.0 else 10.0
+                    response = client.get_action_result(action_id)
                 self.handle_response(wf, step, response)
                 if response.status.is_terminal or response.status in (
                     ActionStatus.UNKNOWN,
@@ -440,6 +610,18 @@ class Engine:
                     # * If the action is unknown, that means the node does not have a record of the action
                     break
             except Exception as e:
+                if wait_for_action:
+                    self.logger.warning(
+                        "Waiting on node for action status failed, falling back to polling",
+                        event_type=EventType.ACTION_STATUS_CHANGE,
+                        workflow_id=wf.workflow_id,
+                        step_id=step.step_id,
+                        node_name=step.node,
+                        action_id=action_id,
+                        error=str(e),
+                    )
+                    wait_for_action = False
+                    continue
                 self.logger.error(
                     "Exception while querying action result",
                     event_type=EventType.ACTION_FAILED,
@@ -472,6 +654,17 @@ class Engine:
                     break
                 retry_count += 1
 
+    @staticmethod
+    def node_advertises(
+        node: Node, client: AbstractNodeClient, capability: str
+    ) -> bool:
+        """Whether both a node and its client support a capability. Unlike `check_node_capability`, the node must advertise it explicitly, for capabilities that nodes predating them don't serve."""
+        capabilities = node.info.capabilities if node.info else None
+        return (
+            getattr(capabilities, capability, None) is True
+            and getattr(client.supported_capabilities, capability, None) is True
+        )
+
     def update_param_value_from_datapoint(
         self,
         wf: Workflow,
@@ -491,7 +684,7 @@ class Engine:
 
     def finalize_step(self, workflow_id: str, step: Step) -> None:
         """Finalize the step, updating the workflow based on the results (setting status, updating index, etc.)"""
-        with self.state_handler.wc_state_lock():
+        with self.state_handler.workflow_lock(workflow_id):
             wf = self.state_handler.get_active_workflow(workflow_id)
             step.end_time = datetime.now()
             wf.steps[wf.status.current_step_index] = step
@@ -570,12 +763,7 @@ class Engine:
                         step_id=step.step_id,
                         step_action=step.action,
                     )
-                    datapoint_ids = step.result.datapoints.model_dump()
-                    # Fetch actual DataPoint objects from data manager using the IDs
-                    datapoint_dict = {}
-                    for key, datapoint_id in datapoint_ids.items():
-                        datapoint = self.data_client.get_datapoint(datapoint_id)
-                        datapoint_dict[key] = datapoint
+                    datapoint_dict = self._fetch_step_datapoints(step)
                 else:
                     raise ValueError(
                         f"Feed-forward parameter {param.key} specified step {param.step} but step has no datapoints"
@@ -607,6 +795,29 @@ class Engine:
                     )
         return wf
 
+    def _fetch_step_datapoints(
+        self, step: Step
+    ) -> dict[str, Union[DataPoint, list[DataPoint]]]:
+        """Fetch a step's result datapoints from the data manager in one request, keyed by label."""
+        datapoint_ids = step.result.datapoints.model_dump()
+        flat_ids = [
+            datapoint_id
+            for value in datapoint_ids.values()
+            for datapoint_id in (value if isinstance(value, list) else [value])
+        ]
+        fetched = self.data_client.get_datapoints_by_ids(flat_ids)
+        missing = [
+            datapoint_id for datapoint_id in flat_ids if datapoint_id not in fetched
+        ]
+        if missing:
+            raise ValueError(f"Step {step.step_id} datapoints not found: {missing}")
+        return {
+            key: [fetched[datapoint_id] for datapoint_id in value]
+            if isinstance(value, list)
+            else fetched[value]
+            for key, value in datapoint_ids.items()
+        }
+
     def _log_completion_event(self, workflow: Workflow) -> None:
         """Log the workflow completion event with structured data."""
         try:
@@ -670,12 +881,20 @@ class Engine:
                 exc_info=True,
             )
 
-    def update_step(self, wf: Workflow, step: Step) -> None:
-        """Update the step in the workflow"""
-        with self.state_handler.wc_state_lock():
-            wf = self.state_handler.get_workflow(wf.workflow_id)
-            wf.steps[wf.status.current_step_index] = step
-            self.state_handler.set_active_workflow(wf)
+    def update_step(self, wf: Workflow, step: Step) -> Workflow:
+        """
+        Update the current step of the workflow, writing only that step and any new history entries.
+        This is an optimistic single-record update, so it doesn't take any lock.
+        """
+        status = self.state_handler.update_current_step(wf.workflow_id, step)
+        if status is None:
+            with self.state_handler.workflow_lock(wf.workflow_id):
+                wf = self.state_handler.get_workflow(wf.workflow_id)
+                wf.steps[wf.status.current_step_index] = step
+                self.state_handler.set_active_workflow(wf)
+            return wf
+        wf.status = status
+        wf.steps[status.current_step_index] = step
         return wf
 
     def handle_response(
@@ -727,50 +946,48 @@ class Engine:
             else None,
             step_id=step.step_id,
         ):
-            # Upload JSON result as ValueDataPoint if present
+            # Collect the JSON result and files as datapoints, to upload in one batch
+            new_datapoints: dict[str, DataPoint] = {}
             if response.json_result is not None:
-                datapoint = ValueDataPoint(
+                new_datapoints["json_result"] = ValueDataPoint(
                     label="json_result",
                     value=response.json_result,
                 )
-                submitted_datapoint = self.data_client.submit_datapoint(datapoint)
-                datapoint_ids["json_result"] = submitted_datapoint.datapoint_id
-                self.logger.log_debug(
-                    "Uploaded JSON result as datapoint",
-                    datapoint_id=submitted_datapoint.datapoint_id,
-                )
-
-            # Upload files as FileDataPoints if present
             if response.files:
                 if isinstance(response.files, ActionFiles):
                     # Multiple files in ActionFiles object
                     response_files = response.files.model_dump(mode="json")
                     for file_key, file_path in response_files.items():
-                        datapoint = FileDataPoint(
+                        new_datapoints[file_key] = FileDataPoint(
                             label=file_key,
                             path=str(file_path),
                         )
-                        submitted_datapoint = self.data_client.submit_datapoint(
-                            datapoint
-                        )
-                        datapoint_ids[file_key] = submitted_datapoint.datapoint_id
-                        self.logger.log_debug(
-                            "Uploaded file as datapoint",
-                            file_key=file_key,
-                            datapoint_id=submitted_datapoint.datapoint_id,
-                        )
                 else:
                     # Single file Path
-                    datapoint = FileDataPoint(
+                    new_datapoints["file"] = FileDataPoint(
                         label="file",
                         path=str(response.files),
                     )
-                    submitted_datapoint = self.data_client.submit_datapoint(datapoint)
-                    datapoint_ids["file"] = submitted_datapoint.datapoint_id
-                    self.logger.log_debug(
-                        "Uploaded file as datapoint",
-                        datapoint_id=submitted_datapoint.datapoint_id,
+
+            if len(new_datapoints) == 1:
+                submitted = [
+                    self.data_client.submit_datapoint(
+                        next(iter(new_datapoints.values()))
                     )
+                ]
+            elif new_datapoints:
+                submitted = self.data_client.submit_datapoints(
+                    list(new_datapoints.values())
+                )
+            else:
+                submitted = []
+            for key, submitted_datapoint in zip(new_datapoints, submitted, strict=True):
+                datapoint_ids[key] = submitted_datapoint.datapoint_id
+                self.logger.log_debug(
+                    "Uploaded result as datapoint",
+                    result_key=key,
+                    datapoint_id=submitted_datapoint.datapoint_id,
+                )
 
             # Update response to contain only datapoint IDs
             response.datapoints = ActionDatapoints.model_validate(datapoint_ids)
@@ -791,17 +1008,15 @@ class Engine:
             state_manager: The workcell state handler
             update_info: Whether to update node info in addition to status and state (default: False)
         """
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            node_futures = []
-            for node_name, node in state_manager.get_nodes().items():
-                if node.status is None or not node.status.disconnected:
-                    node_future = executor.submit(
-                        self.update_node, node_name, node, state_manager, update_info
-                    )
-                    node_futures.append(node_future)
-
-            # Wait for all node updates to complete
-            concurrent.futures.wait(node_futures)
+        self.update_nodes(
+            {
+                node_name: node
+                for node_name, node in state_manager.get_nodes().items()
+                if node.status is None or not node.status.disconnected
+            },
+            state_manager,
+            update_info,
+        )
 
     def update_node(
         self,
@@ -819,39 +1034,180 @@ class Engine:
             update_info: Whether to update node info (default: False). Node info changes
                         infrequently, so it's updated less often to reduce network overhead.
         """
-        try:
-            client = self._get_node_client(node.node_url)
-            node.status = client.get_status()
-            if update_info or node.info is None:
-                node.info = client.get_info()
-            node.state = client.get_state()
-            with state_manager.wc_state_lock():
-                state_manager.set_node(node_name, node)
-        except Exception as e:
-            error = Error.from_exception(e)
-            node.status = NodeStatus(errored=True, errors=[error], disconnected=True)
-            with state_manager.wc_state_lock():
-                state_manager.set_node(node_name, node)
-            with ownership_context(
-                workcell_id=self.workcell_info.manager_id,
-                node_id=node.info.node_id if node.info else None,
-            ):
-                self.logger.warning(
-                    "Node status update failed; marking disconnected",
-                    event_type=EventType.NODE_STATUS_UPDATE,
-                    node_name=node_name,
-                    node_url=str(node.node_url),
-                    error=str(e),
-                    exc_info=True,
+        self.update_nodes({node_name: node}, state_manager, update_info)
+
+    def update_nodes(
+        self,
+        nodes: dict[str, Node],
+        state_manager: WorkcellStateHandler,
+        update_info: bool = False,
+    ) -> None:
+        """Update the status, state, and optionally info of several nodes.
+
+        Every query is submitted to the engine's node update pool at once, so nodes (and the
+        status, state, and info queries for each node) are queried concurrently, up to
+        `node_update_concurrency` requests at a time. Nodes that fail to respond within
+        `node_update_timeout` seconds of their request starting are marked disconnected. The
+        responses are then applied to the latest stored nodes, holding each node's state lock,
+        and only the nodes that changed are written back, in a single write.
+
+        Args:
+            nodes: The nodes to update, by name
+            state_manager: The workcell state handler
+            update_info: Whether to update node info (default: False). Node info changes
+                        infrequently, so it's updated less often to reduce network overhead.
+        """
+        queries: dict[str, dict[str, NodeQuery]] = {}
+        updates: dict[str, dict] = {}
+        for node_name, node in nodes.items():
+            try:
+                client = self._get_node_client(node.node_url)
+            except Exception as e:
+                updates[node_name] = self._node_update_failed(node_name, node, e)
+                continue
+            queries[node_name] = self._submit_node_queries(
+                node, client, update_info or node.info is None
+            )
+
+        self._wait_for_node_queries(
+            [
+                query
+                for node_queries in queries.values()
+                for query in node_queries.values()
+            ]
+        )
+        for node_name, node_queries in queries.items():
+            try:
+                if not all(query.future.done() for query in node_queries.values()):
+                    raise TimeoutError(
+                        f"Node did not respond within {self.workcell_settings.node_update_timeout} seconds"
+                    )
+                update = {
+                    field: query.future.result()
+                    for field, query in node_queries.items()
+                }
+                snapshot = update.pop("snapshot", None)
+                if snapshot is not None:
+                    update = {"status": snapshot.status, "state": snapshot.state}
+                    if snapshot.info is not None:
+                        update["info"] = snapshot.info
+                updates[node_name] = update
+            except Exception as e:
+                for query in node_queries.values():
+                    query.future.cancel()
+                updates[node_name] = self._node_update_failed(
+                    node_name, nodes[node_name], e
                 )
 
+        self._write_node_updates(updates, state_manager)
+
+    def _submit_node_queries(
+        self, node: Node, client: AbstractNodeClient, include_info: bool
+    ) -> dict[str, NodeQuery]:
+        """Submit the queries for a node's status, state, and optionally info to the node update pool, as a single snapshot request if the node supports it"""
+        timeout = self.workcell_settings.node_update_timeout
+        if self.node_advertises(node, client, "get_snapshot"):
+            return {
+                "snapshot": NodeQuery(
+                    self._node_update_executor,
+                    client.get_snapshot,
+                    include_info=include_info,
+                    timeout=timeout,
+                )
+            }
+        fields = ["status", "state", "info"] if include_info else ["status", "state"]
+        return {
+            field: NodeQuery(
+                self._node_update_executor,
+                getattr(client, f"get_{field}"),
+                timeout=timeout,
+            )
+            for field in fields
+        }
+
+    def _wait_for_node_queries(self, queries: list[NodeQuery]) -> None:
+        """Wait until every query has finished or has been running for `node_update_timeout` seconds.
+
+        Queries are timed from when a worker starts them, so requests queued behind others on the pool
+        aren't charged for the wait. In case workers are held by queries that ignore their request
+        timeout, waiting stops once every query could have run for the full timeout in turn.
+        """
+        timeout = self.workcell_settings.node_update_timeout
+        rounds = math.ceil(
+            len(queries) / self.workcell_settings.node_update_concurrency
+        )
+        give_up_at = time.monotonic() + timeout * (rounds + 1)
+        pending = list(queries)
+        while True:
+            now = time.monotonic()
+            pending = [
+                query
+                for query in pending
+                if not query.future.done()
+                and (query.deadline(timeout) is None or query.deadline(timeout) > now)
+            ]
+            if not pending or now >= give_up_at:
+                return
+            # * Wake for the next completion or deadline, and re-check queued queries as workers pick them up
+            wake_at = give_up_at
+            for query in pending:
+                deadline = query.deadline(timeout)
+                wake_at = min(wake_at, deadline or now + timeout / 10)
+            concurrent.futures.wait(
+                [query.future for query in pending],
+                timeout=wake_at - now,
+                return_when=concurrent.futures.FIRST_COMPLETED,
+            )
+
+    def _write_node_updates(
+        self, updates: dict[str, dict], state_manager: WorkcellStateHandler
+    ) -> None:
+        """Apply field updates to the latest stored nodes, holding their state locks, and write back the ones that changed in a single write"""
+        with contextlib.ExitStack() as locks:
+            for node_name in sorted(updates):
+                locks.enter_context(state_manager.node_state_lock(node_name))
+            changed_nodes = {}
+            current_nodes = state_manager.get_nodes()
+            for node_name, update in updates.items():
+                node = current_nodes.get(node_name)
+                if node is None:
+                    continue  # * Removed while it was being queried
+                updated_node = node.model_copy(update=update)
+                if updated_node.model_dump(mode="json") != node.model_dump(mode="json"):
+                    changed_nodes[node_name] = updated_node
+            state_manager.set_nodes(changed_nodes)
+
+    def _node_update_failed(
+        self, node_name: str, node: Node, error: Exception
+    ) -> dict[str, NodeStatus]:
+        """Log a failed node update, and return the update marking the node disconnected"""
+        with ownership_context(
+            workcell_id=self.workcell_info.manager_id,
+            node_id=node.info.node_id if node.info else None,
+        ):
+            self.logger.warning(
+                "Node status update failed; marking disconnected",
+                event_type=EventType.NODE_STATUS_UPDATE,
+                node_name=node_name,
+                node_url=str(node.node_url),
+                error=str(error),
+                traceback="".join(traceback.format_exception(error)),
+            )
+        return {
+            "status": NodeStatus(
+                errored=True,
+                errors=[Error.from_exception(error)],
+                disconnected=True,
+            )
+        }
+
     @threaded_daemon
     def reconnect_disconnected_nodes(self) -> None:
         """Periodically retry connecting to disconnected nodes.
 
         Runs as a separate daemon thread so it does not block the main engine loop.
         Only disconnected nodes are retried — connected nodes are unaffected.
-        On success, update_node() naturally restores the node's status from the
+        On success, update_nodes() naturally restores the node's status from the
         node's own response. On failure, the node remains disconnected and is
         retried on the next interval.
         """
@@ -870,11 +1226,4 @@ class Engine:
                     workcell_id=self.workcell_info.manager_id,
                     workcell_name=self.workcell_info.name,
                 )
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    futures = [
-                        executor.submit(
-                            self.update_node, name, node, self.state_handler
-                        )
-                        for name, node in disconnected_nodes.items()
-                    ]
-                    concurrent.futures.wait(futures)
+                self.update_nodes(disconnected_nodes, self.state_handler)
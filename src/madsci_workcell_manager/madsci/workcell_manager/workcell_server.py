@@ -3,8 +3,17 @@
 import json
 import warnings
 from contextlib import asynccontextmanager
+from datetime import datetime
 from pathlib import Path
-from typing import Annotated, Any, AsyncGenerator, ClassVar, Optional, Union
+from typing import (
+    Annotated,
+    Any,
+    AsyncGenerator,
+    Callable,
+    ClassVar,
+    Optional,
+    Union,
+)
 
 from classy_fastapi import get, post
 from fastapi import FastAPI, Form, HTTPException, UploadFile
@@ -344,8 +353,9 @@ class WorkcellManager(AbstractManagerBase[WorkcellManagerSettings]):
         """Send admin command to a node."""
         node_object = self.state_handler.get_node(node)
         if command == "reset":
-            with self.state_handler.wc_state_lock():
+            with self.state_handler.node_state_lock(node):
                 # Clear errors on reset command
+                node_object = node_object.model_copy(deep=True)
                 node_object.status.errored = False
                 node_object.status.disconnected = False
                 node_object.status.errors = []
@@ -377,90 +387,95 @@ class WorkcellManager(AbstractManagerBase[WorkcellManagerSettings]):
         """Get info on a specific workflow."""
         return self.state_handler.get_workflow(workflow_id)
 
+    def _update_workflow(
+        self, workflow_id: str, func: Callable[[Workflow], Workflow]
+    ) -> Workflow:
+        """
+        Apply `func` to a workflow as a compare-and-set, so step results the engine writes concurrently are
+        never overwritten. Workflows that are no longer active are read and written back as a whole.
+        """
+        with self.state_handler.workflow_lock(workflow_id):
+            return self._update_workflow_locked(workflow_id, func)
+
+    def _update_workflow_locked(
+        self, workflow_id: str, func: Callable[[Workflow], Workflow]
+    ) -> Workflow:
+        """Like `_update_workflow`, for callers already holding the workflow's lock."""
+        try:
+            return self.state_handler.update_active_workflow(workflow_id, func)
+        except ValueError:
+            wf = func(self.state_handler.get_workflow(workflow_id))
+            self.state_handler.set_active_workflow(wf)
+            return wf
+
+    def _send_workflow_node_command(
+        self, wf: Workflow, command: str, warning: str
+    ) -> None:
+        """Send an admin command to the node running the workflow's current step, if any."""
+        if 0 <= wf.status.current_step_index < len(wf.steps):
+            node_name = wf.steps[wf.status.current_step_index].node
+            try:
+                self.send_admin_command_to_node(command, node_name)
+            except HTTPException:
+                self.logger.warning(warning, node_name=node_name, exc_info=True)
+
     @post("/workflow/{workflow_id}/pause")
     def pause_workflow(self, workflow_id: str) -> Workflow:
         """Pause a running workflow."""
-        with self.state_handler.wc_state_lock():
-            wf = self.state_handler.get_workflow(workflow_id)
-            wf = pause_workflow(wf)
-
-            if 0 <= wf.status.current_step_index < len(wf.steps):
-                node_name = wf.steps[wf.status.current_step_index].node
-                try:
-                    self.send_admin_command_to_node("pause", node_name)
-                except HTTPException:
-                    self.logger.warning(
-                        "Pause not supported by node",
-                        node_name=node_name,
-                        exc_info=True,
-                    )
-            self.state_handler.set_active_workflow(wf)
-
+        wf = self._update_workflow(workflow_id, pause_workflow)
+        self._send_workflow_node_command(wf, "pause", "Pause not supported by node")
         return self.state_handler.get_workflow(workflow_id)
 
     @post("/workflow/{workflow_id}/resume")
     def resume_workflow(self, workflow_id: str) -> Workflow:
         """Resume a paused workflow."""
-        with self.state_handler.wc_state_lock():
-            wf = self.state_handler.get_workflow(workflow_id)
-            if wf.status.paused:
-                index = wf.status.current_step_index
-                wf.status.reset(index)
-                if 0 <= wf.status.current_step_index < len(wf.steps):
-                    try:
-                        self.send_admin_command_to_node(
-                            "resume", wf.steps[wf.status.current_step_index].node
-                        )
-                    except HTTPException:
-                        self.logger.warning(
-                            "Resume not supported by node",
-                            node_name=wf.steps[wf.status.current_step_index].node,
-                            exc_info=True,
-                        )
-                self.state_handler.set_active_workflow(wf)
-                self.state_handler.enqueue_workflow(wf.workflow_id)
+        resumed = False
+
+        def resume(wf: Workflow) -> Workflow:
+            nonlocal resumed
+            resumed = wf.status.paused
+            if resumed:
+                wf.status.reset(wf.status.current_step_index)
+            return wf
+
+        wf = self._update_workflow(workflow_id, resume)
+        if resumed:
+            self.state_handler.enqueue_workflow(wf.workflow_id)
+            self._send_workflow_node_command(
+                wf, "resume", "Resume not supported by node"
+            )
         return self.state_handler.get_workflow(workflow_id)
 
     @post("/workflow/{workflow_id}/cancel")
     def cancel_workflow(self, workflow_id: str) -> Workflow:
         """Cancel a specific workflow."""
-        with self.state_handler.wc_state_lock():
-            wf = self.state_handler.get_workflow(workflow_id)
-            wf = cancel_workflow(wf)
-
-            if 0 <= wf.status.current_step_index < len(wf.steps):
-                node_name = wf.steps[wf.status.current_step_index].node
-                try:
-                    self.send_admin_command_to_node("cancel", node_name)
-                except HTTPException:
-                    self.logger.warning(
-                        "Cancel not supported by this node",
-                        node_name=node_name,
-                        exc_info=True,
-                    )
-            self.state_handler.set_active_workflow(wf)
-
+        wf = self._update_workflow(workflow_id, cancel_workflow)
+        self._send_workflow_node_command(
+            wf, "cancel", "Cancel not supported by this node"
+        )
         return self.state_handler.get_workflow(workflow_id)
 
     @post("/workflow/{workflow_id}/retry")
     def retry_workflow(self, workflow_id: str, index: int = -1) -> Workflow:
         """Retry an existing workflow from a specific step."""
-        with self.state_handler.wc_state_lock():
-            wf = self.state_handler.get_workflow(workflow_id)
-            if wf.status.terminal:
-                if index < 0:
-                    index = wf.status.current_step_index
-                if wf.status.completed:
-                    index = 0
-                wf.status.reset(index)
-                self.state_handler.set_active_workflow(wf)
-                self.state_handler.delete_archived_workflow(wf.workflow_id)
-                self.state_handler.enqueue_workflow(wf.workflow_id)
-            else:
+
+        def retry(wf: Workflow) -> Workflow:
+            if not wf.status.terminal:
                 raise HTTPException(
                     status_code=400,
                     detail="Workflow is not in a terminal state, cannot retry",
                 )
+            step_index = index if index >= 0 else wf.status.current_step_index
+            if wf.status.completed:
+                step_index = 0
+            wf.status.reset(step_index)
+            return wf
+
+        # * Hold the lock until the archived copy is gone, so an archive can't slip in between
+        with self.state_handler.workflow_lock(workflow_id):
+            wf = self._update_workflow_locked(workflow_id, retry)
+            self.state_handler.delete_archived_workflow(wf.workflow_id)
+        self.state_handler.enqueue_workflow(wf.workflow_id)
         return self.state_handler.get_workflow(workflow_id)
 
     @post("/workflow_definition")
@@ -535,6 +550,9 @@ class WorkcellManager(AbstractManagerBase[WorkcellManagerSettings]):
         ownership_info: Annotated[Optional[str], Form()] = None,
         json_inputs: Annotated[Optional[str], Form()] = None,
         file_input_paths: Annotated[Optional[str], Form()] = None,
+        *,
+        priority: Annotated[Optional[int], Form()] = None,
+        deadline: Annotated[Optional[datetime], Form()] = None,
         files: list[UploadFile] = [],
     ) -> Workflow:
         """
@@ -548,6 +566,10 @@ class WorkcellManager(AbstractManagerBase[WorkcellManagerSettings]):
         - Dynamic values to insert into the workflow file
         ownership_info: Optional[OwnershipInfo]
         - Information about the experiments, users, etc. that own this workflow
+        priority: Optional[int]
+        - User-supplied priority for the run, used by priority-aware schedulers
+        deadline: Optional[datetime]
+        - Time by which the run should finish, used by deadline-aware schedulers
         simulate: bool
         - whether to use real robots or not
         validate_only: bool
@@ -609,14 +631,17 @@ class WorkcellManager(AbstractManagerBase[WorkcellManagerSettings]):
                         state_handler=self.state_handler,
                         location_client=self.location_client,
                     )
+                    if priority is not None:
+                        wf.priority = priority
+                    wf.deadline = deadline
 
                     wf = save_workflow_files(
                         workflow=wf, files=files, data_client=self.data_client
                     )
 
-                    with self.state_handler.wc_state_lock():
-                        self.state_handler.set_active_workflow(wf)
-                        self.state_handler.enqueue_workflow(wf.workflow_id)
+                    # * Nothing else can see the workflow until it's enqueued, so no lock is needed
+                    self.state_handler.set_active_workflow(wf)
+                    self.state_handler.enqueue_workflow(wf.workflow_id)
 
                     self.logger.info(
                         "Workflow start successful",
@@ -16,6 +16,7 @@ from madsci.common.types.action_types import ActionResult, ActionStatus
 from madsci.common.types.datapoint_types import FileDataPoint
 from madsci.common.types.event_types import EventType
 from madsci.common.types.location_types import (
+    Location,
     LocationArgument,
 )
 from madsci.common.types.parameter_types import ParameterInputFile, ParameterTypes
@@ -262,13 +263,20 @@ def prepare_workflow_step(
     workflow: Workflow,
     data_client: Optional[DataClient] = None,
     location_client: Optional[LocationClient] = None,
+    *,
+    locations: Optional[list[Location]] = None,
+    logger: Optional[EventClient] = None,
 ) -> Step:
-    """Prepares a step for execution by replacing locations and validating it"""
+    """Prepares a step for execution by replacing locations and validating it.
+
+    If ``locations`` is provided, it is used instead of fetching the workcell's locations from ``location_client``.
+    Pass ``logger`` when calling this in a loop; creating an EventClient per call is comparatively expensive.
+    """
     parameter_values = workflow.parameter_values
     working_step = deepcopy(step)
     if step.use_parameters is not None:
         working_step = insert_parameters(working_step, parameter_values)
-    replace_locations(workcell, working_step, location_client)
+    replace_locations(workcell, working_step, location_client, locations=locations)
     valid, validation_string = validate_step(
         working_step,
         state_handler=state_handler,
@@ -276,7 +284,7 @@ def prepare_workflow_step(
     )
     if data_client is not None:
         working_step = prepare_workflow_files(working_step, workflow, data_client)
-    EventClient().info(
+    (logger or EventClient()).info(
         "Workflow step validation",
         event_type=EventType.WORKCELL_STATUS_UPDATE,
         valid=valid,
@@ -359,12 +367,13 @@ def replace_locations(
     workcell: WorkcellInfo,
     step: Step,
     location_client: Optional[LocationClient] = None,
+    locations: Optional[list[Location]] = None,
 ) -> None:
     """Replaces the location names with the location objects"""
-    locations = {}
-    if location_client is not None:
-        location_list = location_client.get_locations()
-        locations = {loc.location_id: loc for loc in location_list}
+    if locations is None:
+        locations = (
+            location_client.get_locations() if location_client is not None else []
+        )
     for location_arg, location_name_or_object in step.locations.items():
         # * No location provided, set to None
         if location_name_or_object is None:
@@ -377,7 +386,7 @@ def replace_locations(
 
         # * Location is a string, find the corresponding Location object from state_handler
         target_loc = next(
-            (loc for loc in locations.values() if loc.name == location_name_or_object),
+            (loc for loc in locations if loc.name == location_name_or_object),
             None,
         )
         if target_loc is None:
@@ -2,7 +2,7 @@
 
 from collections.abc import Generator
 from datetime import datetime, timedelta
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 from madsci.client.resource_client import Resource
@@ -22,6 +22,7 @@ from madsci.common.types.workflow_types import (
     WorkflowStatus,
 )
 from madsci.workcell_manager.schedulers.default_scheduler import Scheduler
+from madsci.workcell_manager.workflow_utils import prepare_workflow_step
 
 
 @pytest.fixture
@@ -292,5 +293,81 @@ def test_node_unlocked(mock_scheduler: Scheduler, workflows: list[Workflow]) ->
     assert result[workflows[0].workflow_id].ready_to_run
 
 
+def test_locations_fetched_once_per_iteration(mock_scheduler: Scheduler) -> None:
+    """Test that locations are fetched in bulk once per iteration, not once per workflow"""
+    workflows = [
+        Workflow(
+            name=f"wf{i}",
+            submitted_time=datetime.now(),
+            steps=[
+                Step(
+                    name="step1",
+                    action="test_action",
+                    node="test_node",
+                    locations={"target": "loc1"},
+                )
+            ],
+        )
+        for i in range(5)
+    ]
+    for location in mock_scheduler.location_client.get_locations.return_value:
+        location.representations = {"test_node": location.name}
+
+    result = mock_scheduler.run_iteration(workflows)
+    assert all(metadata.ready_to_run for metadata in result.values())
+    assert mock_scheduler.location_client.get_locations.call_count == 1
+    mock_scheduler.location_client.get_location.assert_not_called()
+
+
+def test_unchanged_workflows_reuse_cached_evaluation(
+    mock_scheduler: Scheduler, workflows: list[Workflow]
+) -> None:
+    """Test that workflows whose inputs have not changed are not re-evaluated"""
+    with patch(
+        "madsci.workcell_manager.schedulers.default_scheduler.prepare_workflow_step",
+        wraps=prepare_workflow_step,
+    ) as mock_prepare:
+        first = mock_scheduler.run_iteration(workflows)
+        assert mock_prepare.call_count == 2
+        second = mock_scheduler.run_iteration(workflows)
+        assert mock_prepare.call_count == 2
+    for wf in workflows:
+        assert first[wf.workflow_id].ready_to_run == second[wf.workflow_id].ready_to_run
+        assert first[wf.workflow_id].reasons == second[wf.workflow_id].reasons
+    assert (
+        second[workflows[0].workflow_id].priority
+        > second[workflows[1].workflow_id].priority
+    )
+
+
+def test_cached_evaluation_invalidated_by_node_status(
+    mock_scheduler: Scheduler, workflows: list[Workflow]
+) -> None:
+    """Test that a change in node status causes workflows targeting it to be re-evaluated"""
+    result = mock_scheduler.run_iteration(workflows)
+    assert result[workflows[0].workflow_id].ready_to_run
+
+    errored_node = mock_scheduler.state_handler.get_node.return_value.model_copy(
+        update={"status": NodeStatus(errored=True)}
+    )
+    mock_scheduler.state_handler.get_node.return_value = errored_node
+    result = mock_scheduler.run_iteration(workflows)
+    assert not result[workflows[0].workflow_id].ready_to_run
+
+    workflows[0].status.paused = True
+    result = mock_scheduler.run_iteration(workflows)
+    assert "Workflow is paused" in result[workflows[0].workflow_id].reasons
+
+
+def test_cached_evaluations_evicted(
+    mock_scheduler: Scheduler, workflows: list[Workflow]
+) -> None:
+    """Test that cached evaluations are dropped once a workflow leaves the queue"""
+    mock_scheduler.run_iteration(workflows)
+    assert set(mock_scheduler.evaluation_cache) == {wf.workflow_id for wf in workflows}
+    mock_scheduler.run_iteration(workflows[1:])
+    assert set(mock_scheduler.evaluation_cache) == {workflows[1].workflow_id}
+
+
 # TODO: Test Location Reservation
 # TODO: Test Node Reservation
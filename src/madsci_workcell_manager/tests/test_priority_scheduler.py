@@ -0,0 +1,195 @@
+"""Tests for the priority scheduler"""
+
+from collections.abc import Generator
+from datetime import datetime, timedelta
+from typing import Optional
+from unittest.mock import MagicMock
+
+import pytest
+from madsci.common.types.action_types import ActionDefinition
+from madsci.common.types.auth_types import OwnershipInfo
+from madsci.common.types.node_types import Node, NodeInfo, NodeStatus
+from madsci.common.types.step_types import Step
+from madsci.common.types.workcell_types import WorkcellInfo, WorkcellManagerSettings
+from madsci.common.types.workflow_types import Workflow, WorkflowStatus
+from madsci.common.utils import new_ulid_str
+from madsci.workcell_manager.schedulers.priority_scheduler import Scheduler
+
+EXP_LIGHT = new_ulid_str()
+EXP_HEAVY = new_ulid_str()
+
+
+@pytest.fixture
+def mock_scheduler() -> Generator[Scheduler, None, None]:
+    """Fixture to create a priority scheduler with a single ready node"""
+    mock_state_handler = MagicMock()
+    mock_state_handler.workcell_settings = WorkcellManagerSettings(
+        fair_share_weights={EXP_HEAVY: 2.0},
+        deadline_urgency_window=60.0,
+    )
+    test_node = Node(
+        node_url="http://test_node",
+        status=NodeStatus(),
+        info=NodeInfo(
+            node_name="test_node",
+            module_name="test_module",
+            actions={
+                "test_action": ActionDefinition(
+                    name="test_action", description="Test action"
+                )
+            },
+        ),
+    )
+    mock_state_handler.get_node.return_value = test_node
+    mock_state_handler.get_nodes.return_value = {"test_node": test_node}
+    mock_lock = MagicMock()
+    mock_lock.locked.return_value = False
+    mock_state_handler.node_lock.return_value = mock_lock
+
+    scheduler = Scheduler(
+        WorkcellInfo(name="test workcell", nodes={"test_node": "http://test_node"}),
+        mock_state_handler,
+    )
+    scheduler.location_client = MagicMock()
+    scheduler.location_client.get_locations.return_value = []
+    yield scheduler
+
+
+def make_workflow(
+    name: str,
+    minutes_ago: float,
+    priority: int = 0,
+    experiment_id: Optional[str] = None,
+    deadline: Optional[datetime] = None,
+) -> Workflow:
+    """Create a single-step workflow for scheduling tests"""
+    return Workflow(
+        name=name,
+        submitted_time=datetime.now() - timedelta(minutes=minutes_ago),
+        steps=[Step(name="step1", action="test_action", node="test_node")],
+        priority=priority,
+        deadline=deadline,
+        ownership_info=OwnershipInfo(experiment_id=experiment_id),
+    )
+
+
+def ranking(result: dict, workflows: list[Workflow]) -> list[str]:
+    """Names of the workflows, from highest to lowest scheduler priority"""
+    return [
+        wf.name
+        for wf in sorted(
+            workflows, key=lambda wf: result[wf.workflow_id].priority, reverse=True
+        )
+    ]
+
+
+def test_user_priority_ranks_first(mock_scheduler: Scheduler) -> None:
+    """Test that higher user priorities outrank earlier submissions"""
+    workflows = [
+        make_workflow("old", minutes_ago=10),
+        make_workflow("urgent", minutes_ago=1, priority=5),
+        make_workflow("older", minutes_ago=20),
+    ]
+    result = mock_scheduler.run_iteration(workflows)
+    assert ranking(result, workflows) == ["urgent", "older", "old"]
+
+
+def test_deadline_within_window_ranks_first(mock_scheduler: Scheduler) -> None:
+    """Test that workflows with imminent deadlines run first, earliest deadline first"""
+    now = datetime.now().astimezone()
+    workflows = [
+        make_workflow("high", minutes_ago=10, priority=10),
+        make_workflow("soon", minutes_ago=1, deadline=now + timedelta(seconds=30)),
+        make_workflow("sooner", minutes_ago=1, deadline=now + timedelta(seconds=10)),
+        make_workflow("later", minutes_ago=1, deadline=now + timedelta(hours=1)),
+    ]
+    result = mock_scheduler.run_iteration(workflows)
+    assert ranking(result, workflows) == ["sooner", "soon", "high", "later"]
+
+
+def test_missed_deadline_is_not_urgent(mock_scheduler: Scheduler) -> None:
+    """Test that workflows past their deadline don't crowd out ones that can still make theirs"""
+    now = datetime.now().astimezone()
+    workflows = [
+        make_workflow("missed", minutes_ago=10, deadline=now - timedelta(seconds=5)),
+        make_workflow("soon", minutes_ago=1, deadline=now + timedelta(seconds=30)),
+    ]
+    result = mock_scheduler.run_iteration(workflows)
+    assert ranking(result, workflows) == ["soon", "missed"]
+
+
+def test_urgency_accounts_for_remaining_steps(mock_scheduler: Scheduler) -> None:
+    """Test that a deadline outside the window is urgent once the estimated time for its remaining steps is taken off"""
+    now = datetime.now().astimezone()
+    done = make_workflow("done", minutes_ago=30)
+    done.steps[0].start_time = now - timedelta(minutes=5)
+    done.steps[0].end_time = now - timedelta(minutes=3)
+    done.status = WorkflowStatus(current_step_index=1, completed=True)
+    long = make_workflow("long", minutes_ago=1, deadline=now + timedelta(minutes=3))
+    long.steps = [
+        Step(name=f"step{i}", action="test_action", node="test_node") for i in range(3)
+    ]
+    workflows = [make_workflow("first", minutes_ago=10), long]
+
+    result = mock_scheduler.run_iteration(workflows)
+    assert ranking(result, workflows) == ["first", "long"]
+
+    result = mock_scheduler.run_iteration([done, *workflows])
+    assert mock_scheduler.step_seconds_estimate == 120.0
+    assert ranking(result, workflows) == ["long", "first"]
+
+
+def test_fair_share_interleaves_owners(mock_scheduler: Scheduler) -> None:
+    """Test that owners take turns in proportion to their weights within a priority level"""
+    workflows = [
+        make_workflow("light1", minutes_ago=10, experiment_id=EXP_LIGHT),
+        make_workflow("light2", minutes_ago=9, experiment_id=EXP_LIGHT),
+        make_workflow("light3", minutes_ago=8, experiment_id=EXP_LIGHT),
+        make_workflow("heavy1", minutes_ago=5, experiment_id=EXP_HEAVY),
+        make_workflow("heavy2", minutes_ago=4, experiment_id=EXP_HEAVY),
+        make_workflow("heavy3", minutes_ago=3, experiment_id=EXP_HEAVY),
+    ]
+    result = mock_scheduler.run_iteration(workflows)
+    assert ranking(result, workflows) == [
+        "light1",
+        "heavy1",
+        "heavy2",
+        "light2",
+        "heavy3",
+        "light3",
+    ]
+
+
+def test_fair_share_accounts_for_running_workflows(
+    mock_scheduler: Scheduler,
+) -> None:
+    """Test that an owner with running workflows yields to other owners"""
+    running = make_workflow("running", minutes_ago=30, experiment_id=EXP_HEAVY)
+    running.status = WorkflowStatus(running=True)
+    workflows = [
+        running,
+        make_workflow("a1", minutes_ago=10, experiment_id=EXP_HEAVY),
+        make_workflow("b1", minutes_ago=5, experiment_id=EXP_LIGHT),
+    ]
+    result = mock_scheduler.run_iteration(workflows)
+    assert not result[running.workflow_id].ready_to_run
+    assert ranking(result, workflows) == ["b1", "a1", "running"]
+
+
+def test_heap_updated_incrementally(mock_scheduler: Scheduler) -> None:
+    """Test that the heap tracks arrivals, priority changes, and departures"""
+    first = make_workflow("first", minutes_ago=10)
+    second = make_workflow("second", minutes_ago=5)
+    mock_scheduler.run_iteration([first, second])
+    assert set(mock_scheduler.heap_entries) == {first.workflow_id, second.workflow_id}
+
+    second.priority = 1
+    result = mock_scheduler.run_iteration([first, second])
+    assert ranking(result, [first, second]) == ["second", "first"]
+
+    third = make_workflow("third", minutes_ago=1)
+    result = mock_scheduler.run_iteration([second, third])
+    assert set(mock_scheduler.heap_entries) == {second.workflow_id, third.workflow_id}
+    assert list(mock_scheduler.iter_heap()) == [second.workflow_id, third.workflow_id]
+    assert len(mock_scheduler.heap) <= 2 * len(mock_scheduler.heap_entries)
+    assert ranking(result, [second, third]) == ["second", "third"]
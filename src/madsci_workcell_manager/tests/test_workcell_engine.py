@@ -1,8 +1,12 @@
 """Automated unit tests for the Workcell Engine, using pytest."""
 
+import concurrent.futures
 import copy
+import threading
+import time
 import warnings
 from pathlib import Path
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -11,7 +15,9 @@ from madsci.common.db_handlers import InMemoryRedisHandler
 from madsci.common.types.action_types import (
     ActionDefinition,
     ActionFailed,
+    ActionFiles,
     ActionJSON,
+    ActionRequest,
     ActionResult,
     ActionStatus,
     ActionSucceeded,
@@ -22,7 +28,13 @@ from madsci.common.types.datapoint_types import (
     ObjectStorageDataPoint,
     ValueDataPoint,
 )
-from madsci.common.types.node_types import Node, NodeCapabilities, NodeInfo, NodeStatus
+from madsci.common.types.node_types import (
+    Node,
+    NodeCapabilities,
+    NodeInfo,
+    NodeSnapshot,
+    NodeStatus,
+)
 from madsci.common.types.parameter_types import (
     ParameterFeedForwardFile,
     ParameterFeedForwardJson,
@@ -160,6 +172,211 @@ def test_reconnect_disconnected_node(engine: Engine) -> None:
         assert node.status.disconnected is False
 
 
+def make_refreshed_nodes(engine: Engine, count: int) -> dict[str, Node]:
+    """Register several nodes that have already been queried once"""
+    nodes = {
+        f"node{i}": test_node.model_copy(
+            update={"node_url": f"http://node{i}", "status": NodeStatus(), "state": {}},
+            deep=True,
+        )
+        for i in range(count)
+    }
+    engine.state_handler.set_nodes(nodes)
+    return nodes
+
+
+def test_update_nodes_queries_concurrently(engine: Engine) -> None:
+    """Test that nodes, and the status and state of each node, are queried concurrently"""
+    nodes = make_refreshed_nodes(engine, 4)
+    # * Every query must be in flight at once for the barrier to release
+    barrier = threading.Barrier(2 * len(nodes), timeout=5)
+
+    def respond(response: object) -> MagicMock:
+        def wait_then_respond(**_kwargs: Any) -> object:
+            barrier.wait()
+            return response
+
+        return MagicMock(side_effect=wait_then_respond)
+
+    client = MagicMock()
+    client.get_status = respond(NodeStatus(busy=True))
+    client.get_state = respond({"temperature": 25})
+    with patch.object(engine, "_get_node_client", return_value=client):
+        engine.update_active_nodes(engine.state_handler)
+
+    client.get_info.assert_not_called()
+    stored = engine.state_handler.get_nodes()
+    assert set(stored) == set(nodes)
+    for node in stored.values():
+        assert node.status.busy is True
+        assert node.state == {"temperature": 25}
+
+
+def test_update_nodes_skips_unchanged_writes(engine: Engine) -> None:
+    """Test that nodes are written back in one batch, and only when they changed"""
+    nodes = make_refreshed_nodes(engine, 3)
+    client = MagicMock()
+    client.get_status.return_value = NodeStatus()
+    client.get_state.return_value = {}
+    with (
+        patch.object(engine, "_get_node_client", return_value=client),
+        patch.object(
+            engine.state_handler,
+            "set_nodes",
+            wraps=engine.state_handler.set_nodes,
+        ) as mock_set_nodes,
+        patch.object(
+            engine.state_handler,
+            "mark_state_changed",
+            wraps=engine.state_handler.mark_state_changed,
+        ) as mock_mark_state_changed,
+    ):
+        engine.update_nodes(nodes, engine.state_handler)
+        mock_set_nodes.assert_called_once_with({})
+        mock_mark_state_changed.assert_not_called()
+
+        client.get_state.return_value = {"counter": 1}
+        engine.update_nodes(nodes, engine.state_handler)
+        assert set(mock_set_nodes.call_args.args[0]) == set(nodes)
+        mock_mark_state_changed.assert_called_once()
+
+
+def test_update_nodes_times_out_slow_nodes(engine: Engine) -> None:
+    """Test that nodes that don't respond within node_update_timeout are marked disconnected"""
+    nodes = make_refreshed_nodes(engine, 2)
+    engine.workcell_settings.node_update_timeout = 0.2
+    release = threading.Event()
+    fast_client = MagicMock()
+    fast_client.get_status.return_value = NodeStatus(busy=True)
+    fast_client.get_state.return_value = {}
+    slow_client = MagicMock()
+
+    def slow_status(**_kwargs: Any) -> NodeStatus:
+        release.wait(5)
+        return NodeStatus()
+
+    slow_client.get_status.side_effect = slow_status
+    slow_client.get_state.return_value = {}
+    clients = {"http://node0": fast_client, "http://node1": slow_client}
+    try:
+        with patch.object(
+            engine, "_get_node_client", side_effect=lambda url: clients[str(url)]
+        ):
+            engine.update_nodes(nodes, engine.state_handler)
+    finally:
+        release.set()
+
+    stored = engine.state_handler.get_nodes()
+    assert stored["node0"].status.busy is True
+    assert not stored["node0"].status.disconnected
+    assert stored["node1"].status.disconnected is True
+    assert "did not respond" in stored["node1"].status.errors[0].message
+
+
+def test_update_nodes_times_requests_from_when_they_start(engine: Engine) -> None:
+    """Test that requests queued behind others on the node update pool aren't charged for the wait"""
+    nodes = make_refreshed_nodes(engine, 3)
+    engine.workcell_settings.node_update_timeout = 0.3
+    engine._node_update_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+    def respond_slowly(**kwargs: Any) -> NodeStatus:
+        assert kwargs["timeout"] == 0.3
+        time.sleep(0.1)
+        return NodeStatus(busy=True)
+
+    client = MagicMock()
+    client.get_status.side_effect = respond_slowly
+    client.get_state.return_value = {}
+    with (
+        patch.object(engine, "_get_node_client", return_value=client),
+        patch.object(
+            engine.state_handler,
+            "node_state_lock",
+            wraps=engine.state_handler.node_state_lock,
+        ) as mock_node_state_lock,
+    ):
+        engine.update_nodes(nodes, engine.state_handler)
+
+    assert sorted(call.args[0] for call in mock_node_state_lock.call_args_list) == [
+        "node0",
+        "node1",
+        "node2",
+    ]
+    for node in engine.state_handler.get_nodes().values():
+        assert node.status.busy is True
+        assert not node.status.disconnected
+
+
+def test_update_nodes_uses_snapshots(engine: Engine) -> None:
+    """Test that nodes advertising get_snapshot are queried with a single request"""
+    nodes = make_refreshed_nodes(engine, 1)
+    nodes["node0"].info.capabilities.get_snapshot = True
+    engine.state_handler.set_nodes(nodes)
+    client = MagicMock()
+    client.supported_capabilities = NodeCapabilities(get_snapshot=True)
+    client.get_snapshot.return_value = NodeSnapshot(
+        status=NodeStatus(busy=True), state={"temperature": 25}
+    )
+    with patch.object(engine, "_get_node_client", return_value=client):
+        engine.update_nodes(nodes, engine.state_handler)
+
+    client.get_snapshot.assert_called_once_with(
+        include_info=False, timeout=engine.workcell_settings.node_update_timeout
+    )
+    client.get_status.assert_not_called()
+    client.get_state.assert_not_called()
+    stored = engine.state_handler.get_node("node0")
+    assert stored.status.busy is True
+    assert stored.state == {"temperature": 25}
+    assert stored.info == nodes["node0"].info
+
+
+def test_wait_for_state_change(state_handler: WorkcellStateHandler) -> None:
+    """Test that wait_for_state_change wakes on state changes and times out otherwise."""
+    state_handler.initialize_workcell_state()
+    assert state_handler.wait_for_state_change(timeout=0.1) is True
+    assert state_handler.wait_for_state_change(timeout=0.1) is False
+
+    timer = threading.Timer(0.05, state_handler.mark_state_changed)
+    timer.start()
+    start = time.monotonic()
+    assert state_handler.wait_for_state_change(timeout=5.0) is True
+    assert time.monotonic() - start < 5.0
+    timer.join()
+
+
+def test_spin_event_driven_runs_scheduler_on_state_change(
+    engine: Engine, state_handler: WorkcellStateHandler
+) -> None:
+    """Test that the event-driven engine runs the scheduler as soon as a workflow is enqueued."""
+    engine.workcell_settings.engine_mode = "event_driven"
+    engine.workcell_settings.scheduler_update_interval = 60.0
+    engine.workcell_settings.node_update_interval = 60.0
+    scheduled = threading.Event()
+    with (
+        patch.object(engine, "update_active_nodes"),
+        patch.object(engine, "reconnect_disconnected_nodes"),
+        patch.object(engine, "run_next_step"),
+        patch.object(
+            engine,
+            "run_scheduler_iteration",
+            side_effect=scheduled.set,
+        ) as mock_iteration,
+    ):
+        state_handler.wait_for_state_change(timeout=0)
+        thread = engine.spin()
+        try:
+            workflow = Workflow(name="Test Workflow", steps=[])
+            state_handler.set_active_workflow(workflow)
+            state_handler.enqueue_workflow(workflow.workflow_id)
+            assert scheduled.wait(timeout=5.0)
+            assert mock_iteration.call_count >= 1
+        finally:
+            state_handler.shutdown = True
+            state_handler.mark_state_changed()
+            thread.join(timeout=5.0)
+
+
 def test_run_next_step_with_ready_workflow(
     engine: Engine, state_handler: WorkcellStateHandler
 ) -> None:
@@ -181,6 +398,85 @@ def test_run_next_step_with_ready_workflow(
     assert updated_workflow.status.running is True
 
 
+def test_run_ready_steps_dispatches_one_step_per_free_node(
+    engine: Engine, state_handler: WorkcellStateHandler
+) -> None:
+    """Test that concurrent dispatch launches every ready workflow targeting a distinct, free node."""
+    state_handler.set_node(node_name="node2", node=test_node)
+    # * node3 is running an action for something outside the queue
+    state_handler.set_node(
+        node_name="node3",
+        node=test_node.model_copy(update={"status": NodeStatus(busy=True)}),
+    )
+    workflows = [
+        Workflow(
+            name=f"Workflow {i}",
+            steps=[Step(name="Step", action="test_action", node=node, args={})],
+            scheduler_metadata=SchedulerMetadata(ready_to_run=True, priority=priority),
+        )
+        for i, (node, priority) in enumerate(
+            [("node1", 3), ("node1", 2), ("node2", 1), ("node3", 0)]
+        )
+    ]
+    for workflow in workflows:
+        state_handler.set_active_workflow(workflow)
+        state_handler.enqueue_workflow(workflow.workflow_id)
+
+    with patch(
+        "madsci.workcell_manager.workcell_engine.Engine.run_step"
+    ) as mock_run_step:
+        dispatched = engine.run_ready_steps()
+
+    assert [wf.workflow_id for wf in dispatched] == [
+        workflows[0].workflow_id,
+        workflows[2].workflow_id,
+    ]
+    assert mock_run_step.call_count == 2
+    assert state_handler.get_workflow(workflows[0].workflow_id).status.running
+    assert not state_handler.get_workflow(workflows[1].workflow_id).status.running
+    assert not state_handler.get_workflow(workflows[3].workflow_id).status.running
+
+
+def test_run_ready_steps_skips_nodes_with_actions_in_flight(
+    engine: Engine, state_handler: WorkcellStateHandler
+) -> None:
+    """Test that later ticks don't dispatch to a node still running an earlier step, or reporting itself busy."""
+    state_handler.set_node(
+        node_name="node2",
+        node=test_node.model_copy(update={"status": NodeStatus(busy=True)}),
+    )
+    workflows = [
+        Workflow(
+            name=f"Workflow {i}",
+            steps=[Step(name="Step", action="test_action", node=node, args={})],
+            scheduler_metadata=SchedulerMetadata(ready_to_run=True, priority=priority),
+        )
+        for i, (node, priority) in enumerate([("node1", 2), ("node1", 1), ("node2", 0)])
+    ]
+    for workflow in workflows:
+        state_handler.set_active_workflow(workflow)
+        state_handler.enqueue_workflow(workflow.workflow_id)
+
+    with patch(
+        "madsci.workcell_manager.workcell_engine.Engine.run_step"
+    ) as mock_run_step:
+        first_tick = engine.run_ready_steps()
+        # * The first workflow's action is still running on node1
+        second_tick = engine.run_ready_steps()
+
+        finished = state_handler.get_workflow(workflows[0].workflow_id)
+        finished.status.running = False
+        finished.status.completed = True
+        state_handler.set_active_workflow(finished)
+        third_tick = engine.run_ready_steps()
+
+    assert [wf.workflow_id for wf in first_tick] == [workflows[0].workflow_id]
+    assert second_tick == []
+    assert [wf.workflow_id for wf in third_tick] == [workflows[1].workflow_id]
+    assert mock_run_step.call_count == 2
+    assert not state_handler.get_workflow(workflows[2].workflow_id).status.running
+
+
 def test_run_single_step(engine: Engine, state_handler: WorkcellStateHandler) -> None:
     """Test running a step in a workflow."""
     step = Step(name="Test Step 1", action="test_action", node="node1", args={})
@@ -207,6 +503,260 @@ def test_run_single_step(engine: Engine, state_handler: WorkcellStateHandler) ->
         assert updated_workflow.status.active is False
 
 
+def test_active_workflow_round_trip(state_handler: WorkcellStateHandler) -> None:
+    """Test that a workflow stored as a hash reads back unchanged."""
+    step = Step(name="Test Step 1", action="test_action", node="node1")
+    step.history = [ActionSucceeded(), ActionFailed()]
+    workflow = Workflow(
+        name="Test Workflow",
+        steps=[step, Step(name="Test Step 2", action="test_action", node="node1")],
+        status=WorkflowStatus(running=True),
+        scheduler_metadata=SchedulerMetadata(ready_to_run=True, priority=3),
+    )
+    state_handler.set_active_workflow(workflow)
+    stored = state_handler.get_active_workflow(workflow.workflow_id)
+    assert stored.model_dump() == workflow.model_dump()
+    assert list(state_handler.get_active_workflows()) == [workflow.workflow_id]
+    assert state_handler.get_workflow_status(workflow.workflow_id) == workflow.status
+
+    state_handler.delete_active_workflow(workflow.workflow_id)
+    assert state_handler.get_active_workflow(workflow.workflow_id) is None
+    assert state_handler.get_active_workflows() == {}
+
+
+def test_set_workflow_step_writes_only_new_history(
+    state_handler: WorkcellStateHandler,
+) -> None:
+    """Test that updating a step patches it in place, appending only new history entries."""
+    step = Step(name="Test Step 1", action="test_action", node="node1")
+    workflow = Workflow(name="Test Workflow", steps=[step])
+    state_handler.set_active_workflow(workflow)
+    redis_handler = state_handler._redis_handler
+    key = f"{state_handler._workcell_prefix}:workflow:{workflow.workflow_id}"
+
+    step.status = ActionStatus.RUNNING
+    step.history.append(ActionResult(status=ActionStatus.RUNNING))
+    state_handler.set_workflow_step(workflow.workflow_id, 0, step)
+    first_entry = redis_handler.hget(key, "step:0:history:0")
+
+    client = redis_handler._client
+    with patch.object(client, "hset", wraps=client.hset) as hset:
+        step.status = ActionStatus.SUCCEEDED
+        step.history.append(ActionSucceeded())
+        state_handler.set_workflow_step(workflow.workflow_id, 0, step)
+    written = hset.call_args.kwargs["mapping"]
+    assert set(written) == {"step:0", "step:0:history_length", "step:0:history:1"}
+    assert redis_handler.hget(key, "step:0:history:0") == first_entry
+
+    with patch.object(client, "hset", wraps=client.hset) as hset:
+        state_handler.append_step_history(workflow.workflow_id, 0, ActionFailed())
+    hset.assert_called_once()
+    assert set(hset.call_args.kwargs["mapping"]) == {
+        "step:0:history_length",
+        "step:0:history:2",
+    }
+    stored = state_handler.get_active_workflow(workflow.workflow_id)
+    assert stored.steps[0].status == ActionStatus.SUCCEEDED
+    assert [result.status for result in stored.steps[0].history] == [
+        ActionStatus.RUNNING,
+        ActionStatus.SUCCEEDED,
+        ActionStatus.FAILED,
+    ]
+
+    step.history = []
+    state_handler.set_workflow_step(workflow.workflow_id, 0, step)
+    assert (
+        state_handler.get_active_workflow(workflow.workflow_id).steps[0].history == []
+    )
+    assert redis_handler.hget(key, "step:0:history:0") is None
+
+
+def test_workflow_status_and_metadata_patches(
+    state_handler: WorkcellStateHandler,
+) -> None:
+    """Test that the status and scheduler metadata can be updated on their own."""
+    workflow = Workflow(
+        name="Test Workflow",
+        steps=[Step(name="Test Step 1", action="test_action", node="node1")],
+    )
+    state_handler.set_active_workflow(workflow)
+    state_handler.set_workflow_status(workflow.workflow_id, WorkflowStatus(paused=True))
+    state_handler.set_scheduler_metadata(
+        workflow.workflow_id, SchedulerMetadata(ready_to_run=True, priority=7)
+    )
+    stored = state_handler.get_active_workflow(workflow.workflow_id)
+    assert stored.status.paused is True
+    assert stored.scheduler_metadata.priority == 7
+    assert stored.steps == workflow.steps
+
+
+def test_migrate_legacy_active_workflows(
+    state_handler: WorkcellStateHandler,
+) -> None:
+    """Test that workflows stored in the old single-document layout are moved to hashes."""
+    workflow = Workflow(
+        name="Test Workflow",
+        steps=[Step(name="Test Step 1", action="test_action", node="node1")],
+    )
+    state_handler._active_workflows[workflow.workflow_id] = workflow.model_dump(
+        mode="json"
+    )
+    state_handler.migrate_legacy_active_workflows()
+    assert state_handler.get_active_workflow(workflow.workflow_id) == workflow
+    assert len(state_handler._active_workflows) == 0
+
+
+def test_workflow_queue_read_in_bulk_and_cached(
+    state_handler: WorkcellStateHandler,
+) -> None:
+    """Test that the queue is read with one pipelined request, and reused until the state changes."""
+    workflows = [
+        Workflow(
+            name=f"Test Workflow {i}",
+            steps=[Step(name="Test Step 1", action="test_action", node="node1")],
+        )
+        for i in range(3)
+    ]
+    for workflow in workflows:
+        state_handler.set_active_workflow(workflow)
+        state_handler.enqueue_workflow(workflow.workflow_id)
+    redis_handler = state_handler._redis_handler
+
+    with (
+        patch.object(
+            redis_handler, "hgetall_many", wraps=redis_handler.hgetall_many
+        ) as hgetall_many,
+        patch.object(redis_handler, "hgetall", wraps=redis_handler.hgetall) as hgetall,
+    ):
+        queue = state_handler.get_workflow_queue()
+        assert [wf.workflow_id for wf in queue] == [wf.workflow_id for wf in workflows]
+        state_handler.update_workflow_queue()
+        assert state_handler.get_workflow_queue() == queue
+        assert hgetall_many.call_count == 1
+        assert hgetall.call_count == 0
+
+        # * Writes that don't mark the state as changed still invalidate the cache
+        state_handler.set_scheduler_metadata(
+            workflows[0].workflow_id, SchedulerMetadata(priority=5)
+        )
+        assert state_handler.get_workflow_queue()[0].scheduler_metadata.priority == 5
+        assert hgetall_many.call_count == 2
+
+    # * Changes made through another handler are picked up via the state change counter
+    other_handler = WorkcellStateHandler(
+        workcell_settings=state_handler.workcell_settings,
+        workcell_id=state_handler._workcell_id,
+        redis_handler=redis_handler,
+        mongo_handler=state_handler._mongo_handler,
+    )
+    other_handler.set_workflow_status(
+        workflows[1].workflow_id, WorkflowStatus(cancelled=True)
+    )
+    state_handler.update_workflow_queue()
+    assert [wf.workflow_id for wf in state_handler.get_workflow_queue()] == [
+        workflows[0].workflow_id,
+        workflows[2].workflow_id,
+    ]
+
+    # * Scheduler metadata written by another handler is picked up without a state change
+    other_handler.set_scheduler_metadata(
+        workflows[2].workflow_id, SchedulerMetadata(ready_to_run=True, priority=9)
+    )
+    assert state_handler.get_workflow_queue()[1].scheduler_metadata.priority == 9
+
+
+def test_get_nodes_cached_until_state_changes(
+    state_handler: WorkcellStateHandler,
+) -> None:
+    """Test that nodes are validated once per state change."""
+    state_handler.set_node("node1", test_node)
+    with patch(
+        "madsci.workcell_manager.state_handler.Node.model_validate",
+        wraps=Node.model_validate,
+    ) as model_validate:
+        assert list(state_handler.get_nodes()) == ["node1"]
+        assert state_handler.get_node("node1").node_url == test_node.node_url
+        assert model_validate.call_count == 1
+        state_handler.set_node("node2", test_node)
+        assert list(state_handler.get_nodes()) == ["node1", "node2"]
+
+
+def test_update_active_workflow_is_compare_and_set(
+    state_handler: WorkcellStateHandler,
+) -> None:
+    """Test that concurrent optimistic updates to one workflow don't lose writes."""
+    workflow = Workflow(
+        name="Test Workflow",
+        steps=[Step(name="Test Step 1", action="test_action", node="node1")],
+    )
+    state_handler.set_active_workflow(workflow)
+
+    def bump_priority(wf: Workflow) -> Workflow:
+        wf.priority += 1
+        return wf
+
+    threads = [
+        threading.Thread(
+            target=state_handler.update_active_workflow,
+            args=(workflow.workflow_id, bump_priority),
+        )
+        for _ in range(10)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert state_handler.get_active_workflow(workflow.workflow_id).priority == 10
+
+    with pytest.raises(ValueError, match="not active"):
+        state_handler.update_active_workflow(new_ulid_str(), bump_priority)
+
+
+def test_update_current_step_uses_stored_index(
+    state_handler: WorkcellStateHandler,
+) -> None:
+    """Test that the current step is written at the index stored in Redis."""
+    workflow = Workflow(
+        name="Test Workflow",
+        steps=[
+            Step(name="Test Step 1", action="test_action", node="node1"),
+            Step(name="Test Step 2", action="test_action", node="node1"),
+        ],
+        status=WorkflowStatus(current_step_index=1),
+    )
+    state_handler.set_active_workflow(workflow)
+    step = workflow.steps[1].model_copy(update={"status": ActionStatus.RUNNING})
+    status = state_handler.update_current_step(workflow.workflow_id, step)
+    assert status.current_step_index == 1
+    stored = state_handler.get_active_workflow(workflow.workflow_id)
+    assert stored.steps[1].status == ActionStatus.RUNNING
+    assert stored.steps[0].status == workflow.steps[0].status
+    assert state_handler.update_current_step(new_ulid_str(), step) is None
+
+
+def test_dispatch_skips_workflows_changed_since_scheduling(
+    engine: Engine, state_handler: WorkcellStateHandler
+) -> None:
+    """Test that dispatch re-reads each workflow under its lock before claiming it."""
+    workflow = Workflow(
+        name="Test Workflow",
+        steps=[Step(name="Test Step 1", action="test_action", node="node1")],
+        scheduler_metadata=SchedulerMetadata(ready_to_run=True, priority=1),
+    )
+    state_handler.set_active_workflow(workflow)
+    state_handler.enqueue_workflow(workflow.workflow_id)
+    queued = state_handler.get_workflow_queue()
+    state_handler.set_workflow_status(workflow.workflow_id, WorkflowStatus(paused=True))
+    with (
+        patch.object(state_handler, "get_workflow_queue", return_value=queued),
+        patch.object(engine, "run_step") as run_step,
+    ):
+        assert engine.run_next_step() is None
+        assert engine.run_ready_steps() == []
+    run_step.assert_not_called()
+    assert not state_handler.get_active_workflow(workflow.workflow_id).status.running
+
+
 # Parameter Insertion Tests
 def test_insert_parameter_values_basic() -> None:
     """Test basic parameter value insertion."""
@@ -398,6 +948,44 @@ def test_handle_data_and_files_with_files(engine: Engine) -> None:
         assert submitted_datapoint.path == "/path/to/file"
 
 
+def test_handle_data_and_files_batches_many_outputs(engine: Engine) -> None:
+    """Test that a step with several outputs submits them in one batch."""
+    step = Step(name="Test Step", action="test_action", node="node1", args={})
+    workflow = Workflow(
+        name="Test Workflow",
+        steps=[step],
+        status=WorkflowStatus(running=True),
+    )
+    action_result = ActionSucceeded(
+        json_result={"reading": 1},
+        files=ActionFiles(plate_map="/path/to/map.csv", image="/path/to/image.png"),
+    )
+
+    with (
+        patch.object(
+            engine.data_client,
+            "submit_datapoints",
+            side_effect=list,
+        ) as mock_submit_many,
+        patch.object(engine.data_client, "submit_datapoint") as mock_submit,
+    ):
+        updated_result = engine.handle_data_and_files(step, workflow, action_result)
+
+    mock_submit.assert_not_called()
+    mock_submit_many.assert_called_once()
+    submitted = mock_submit_many.call_args[0][0]
+    assert [datapoint.label for datapoint in submitted] == [
+        "json_result",
+        "plate_map",
+        "image",
+    ]
+    assert updated_result.datapoints.model_dump() == {
+        datapoint.label: datapoint.datapoint_id for datapoint in submitted
+    }
+    assert updated_result.json_result is None
+    assert updated_result.files is None
+
+
 def test_run_step_send_action_exception_then_get_action_result_success(
     engine: Engine, state_handler: WorkcellStateHandler
 ) -> None:
@@ -465,14 +1053,100 @@ def test_run_step_send_action_and_get_action_result_fail(
         mock_client.return_value.get_action_result.assert_called()
 
 
+def make_monitored_step(
+    state_handler: WorkcellStateHandler,
+) -> tuple[Workflow, Step, ActionRequest]:
+    """Create an active workflow whose only step has a running action"""
+    step = Step(name="Test Step 1", action="test_action", node="node1", args={})
+    workflow = Workflow(
+        name="Test Workflow",
+        steps=[step],
+        status=WorkflowStatus(running=True),
+    )
+    state_handler.set_active_workflow(workflow)
+    request = ActionRequest(action_name="test_action", args={})
+    return workflow, step, request
+
+
+def test_monitor_action_progress_waits_on_node(
+    engine: Engine, state_handler: WorkcellStateHandler
+) -> None:
+    """Test that actions on nodes supporting wait_for_action are followed by waiting on each status change, without polling"""
+    workflow, step, request = make_monitored_step(state_handler)
+    node = test_node.model_copy(deep=True)
+    node.info.capabilities.wait_for_action = True
+    client = MagicMock()
+    client.supported_capabilities = NodeCapabilities(wait_for_action=True)
+    client.wait_for_action.side_effect = [
+        request.running(json_result={"progress": 0.5}),
+        request.succeeded(),
+    ]
+
+    with patch("madsci.workcell_manager.workcell_engine.time.sleep") as mock_sleep:
+        engine.monitor_action_progress(
+            workflow,
+            step,
+            node,
+            client,
+            request.running(),
+            request,
+            request.action_id,
+        )
+
+    assert step.status == ActionStatus.SUCCEEDED
+    assert [
+        call.kwargs["status"] for call in client.wait_for_action.call_args_list
+    ] == [
+        ActionStatus.RUNNING,
+        ActionStatus.RUNNING,
+    ]
+    client.get_action_result.assert_not_called()
+    mock_sleep.assert_not_called()
+    stored = state_handler.get_workflow(workflow.workflow_id)
+    assert stored.steps[0].status == ActionStatus.SUCCEEDED
+
+
+def test_monitor_action_progress_falls_back_to_polling(
+    engine: Engine, state_handler: WorkcellStateHandler
+) -> None:
+    """Test that the engine polls when waiting on the node fails, or when the node doesn't advertise wait_for_action"""
+    workflow, step, request = make_monitored_step(state_handler)
+    node = test_node.model_copy(deep=True)
+    node.info.capabilities.wait_for_action = True
+    client = MagicMock()
+    client.supported_capabilities = NodeCapabilities(wait_for_action=True)
+    client.wait_for_action.side_effect = Exception("404 Not Found")
+    client.get_action_result.return_value = request.succeeded()
+
+    with patch("madsci.workcell_manager.workcell_engine.time.sleep"):
+        engine.monitor_action_progress(
+            workflow,
+            step,
+            node,
+            client,
+            request.running(),
+            request,
+            request.action_id,
+        )
+
+    assert step.status == ActionStatus.SUCCEEDED
+    client.wait_for_action.assert_called_once()
+    client.get_action_result.assert_called_once()
+
+    # * A node that predates the capability is polled even if its client supports it
+    assert not Engine.node_advertises(test_node, client, "wait_for_action")
+
+
 # Feed Data Forward Tests
 def test_feed_data_forward_value_by_label(engine: Engine) -> None:
     """Test feed forward with value datapoint matched by label."""
     value_datapoint = ValueDataPoint(label="output_label", value="test_value")
 
-    # Mock the data client to return the datapoint when requested
+    # Mock the data client to return the datapoints when requested
     with patch.object(
-        engine.data_client, "get_datapoint", return_value=value_datapoint
+        engine.data_client,
+        "get_datapoints_by_ids",
+        return_value={value_datapoint.datapoint_id: value_datapoint},
     ):
         step = Step(
             name="Test Step",
@@ -507,8 +1181,12 @@ def test_feed_data_forward_file_by_label(engine: Engine) -> None:
     """Test feed forward with file datapoint matched by label."""
     file_datapoint = FileDataPoint(label="output_file", path="/path/to/file.txt")
 
-    # Mock the data client to return the datapoint when requested
-    with patch.object(engine.data_client, "get_datapoint", return_value=file_datapoint):
+    # Mock the data client to return the datapoints when requested
+    with patch.object(
+        engine.data_client,
+        "get_datapoints_by_ids",
+        return_value={file_datapoint.datapoint_id: file_datapoint},
+    ):
         step = Step(
             name="Test Step",
             key="step1",
@@ -542,9 +1220,11 @@ def test_feed_data_forward_by_step_index(engine: Engine) -> None:
     """Test feed forward matched by step index."""
     value_datapoint = ValueDataPoint(label="output", value=42)
 
-    # Mock the data client to return the datapoint when requested
+    # Mock the data client to return the datapoints when requested
     with patch.object(
-        engine.data_client, "get_datapoint", return_value=value_datapoint
+        engine.data_client,
+        "get_datapoints_by_ids",
+        return_value={value_datapoint.datapoint_id: value_datapoint},
     ):
         step = Step(
             name="Test Step",
@@ -581,9 +1261,11 @@ def test_feed_data_forward_no_step_single_datapoint(engine: Engine) -> None:
     """Test feed forward with no step specified and single datapoint."""
     value_datapoint = ValueDataPoint(label="only_output", value="single_value")
 
-    # Mock the data client to return the datapoint when requested
+    # Mock the data client to return the datapoints when requested
     with patch.object(
-        engine.data_client, "get_datapoint", return_value=value_datapoint
+        engine.data_client,
+        "get_datapoints_by_ids",
+        return_value={value_datapoint.datapoint_id: value_datapoint},
     ):
         step = Step(
             name="Test Step",
@@ -621,16 +1303,15 @@ def test_feed_data_forward_no_step_multiple_datapoints_error(engine: Engine) ->
     value_datapoint1 = ValueDataPoint(label="output1", value="value1")
     value_datapoint2 = ValueDataPoint(label="output2", value="value2")
 
-    # Mock the data client to return the datapoints when requested
-    def mock_get_datapoint(datapoint_id):
-        if datapoint_id == value_datapoint1.datapoint_id:
-            return value_datapoint1
-        if datapoint_id == value_datapoint2.datapoint_id:
-            return value_datapoint2
-        return None
+    # Mock the data client to return the requested datapoints
+    def mock_get_datapoints_by_ids(datapoint_ids):
+        known = {dp.datapoint_id: dp for dp in (value_datapoint1, value_datapoint2)}
+        return {i: known[i] for i in datapoint_ids if i in known}
 
     with patch.object(
-        engine.data_client, "get_datapoint", side_effect=mock_get_datapoint
+        engine.data_client,
+        "get_datapoints_by_ids",
+        side_effect=mock_get_datapoints_by_ids,
     ):
         step = Step(
             name="Test Step",
@@ -670,9 +1351,11 @@ def test_feed_data_forward_label_not_found_error(engine: Engine) -> None:
     """Test feed forward error when specified label is not found."""
     value_datapoint = ValueDataPoint(label="existing_output", value="value")
 
-    # Mock the data client to return the datapoint when requested
+    # Mock the data client to return the datapoints when requested
     with patch.object(
-        engine.data_client, "get_datapoint", return_value=value_datapoint
+        engine.data_client,
+        "get_datapoints_by_ids",
+        return_value={value_datapoint.datapoint_id: value_datapoint},
     ):
         step = Step(
             name="Test Step",
@@ -780,16 +1463,15 @@ def test_feed_data_forward_multiple_parameters(engine: Engine) -> None:
     value_datapoint = ValueDataPoint(label="value_output", value="test_value")
     file_datapoint = FileDataPoint(label="file_output", path="/test/file.txt")
 
-    # Mock the data client to return the appropriate datapoint when requested
-    def mock_get_datapoint(datapoint_id):
-        if datapoint_id == value_datapoint.datapoint_id:
-            return value_datapoint
-        if datapoint_id == file_datapoint.datapoint_id:
-            return file_datapoint
-        return None
+    # Mock the data client to return the requested datapoints
+    def mock_get_datapoints_by_ids(datapoint_ids):
+        known = {dp.datapoint_id: dp for dp in (value_datapoint, file_datapoint)}
+        return {i: known[i] for i in datapoint_ids if i in known}
 
     with patch.object(
-        engine.data_client, "get_datapoint", side_effect=mock_get_datapoint
+        engine.data_client,
+        "get_datapoints_by_ids",
+        side_effect=mock_get_datapoints_by_ids,
     ):
         step = Step(
             name="Test Step",
@@ -837,9 +1519,11 @@ def test_feed_data_forward_object_storage_by_label(engine: Engine) -> None:
         object_name="data/file.dat",
     )
 
-    # Mock the data client to return the datapoint when requested
+    # Mock the data client to return the datapoints when requested
     with patch.object(
-        engine.data_client, "get_datapoint", return_value=object_storage_datapoint
+        engine.data_client,
+        "get_datapoints_by_ids",
+        return_value={object_storage_datapoint.datapoint_id: object_storage_datapoint},
     ):
         step = Step(
             name="Test Step",
@@ -2,6 +2,7 @@
 
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -22,6 +23,7 @@ from madsci.common.types.workflow_types import (
     WorkflowDefinition,
     WorkflowParameters,
 )
+from madsci.workcell_manager.state_handler import WorkcellStateHandler
 from madsci.workcell_manager.workcell_server import WorkcellManager
 from madsci.workcell_manager.workflow_utils import check_parameters
 from pydantic import AnyUrl
@@ -208,6 +210,39 @@ def test_cancel_workflow(test_client: TestClient) -> None:
         assert workflow.status.cancelled is True
 
 
+def test_workflow_commands_update_active_workflow_in_place(
+    test_client: TestClient,
+) -> None:
+    """Test that pause and cancel write through a compare-and-set, not a whole-workflow overwrite."""
+    with test_client as client:
+        workflow_def = WorkflowDefinition(name="Test Workflow")
+        id = client.post(
+            "/workflow_definition", json=workflow_def.model_dump(mode="json")
+        ).json()
+        workflow = Workflow.model_validate(
+            client.post("/workflow", data={"workflow_definition_id": id}).json()
+        )
+        with (
+            patch.object(
+                WorkcellStateHandler,
+                "update_active_workflow",
+                autospec=True,
+                side_effect=WorkcellStateHandler.update_active_workflow,
+            ) as update_active_workflow,
+            patch.object(
+                WorkcellStateHandler, "set_active_workflow", autospec=True
+            ) as set_active_workflow,
+        ):
+            response = client.post(f"/workflow/{workflow.workflow_id}/pause")
+            assert response.status_code == 200
+            assert Workflow.model_validate(response.json()).status.paused is True
+            response = client.post(f"/workflow/{workflow.workflow_id}/cancel")
+            assert response.status_code == 200
+            assert Workflow.model_validate(response.json()).status.cancelled is True
+        assert update_active_workflow.call_count == 2
+        assert set_active_workflow.call_count == 0
+
+
 def test_retry_workflow(test_client: TestClient) -> None:
     """Test retrying a workflow."""
     with test_client as client:
@@ -236,6 +271,54 @@ def test_retry_workflow(test_client: TestClient) -> None:
         assert new_workflow.status.ok is True
 
 
+def test_archive_concurrent_with_retry_keeps_workflow(
+    test_client: TestClient,
+) -> None:
+    """Test that an archive working from a stale read doesn't archive a workflow that was just retried."""
+    with test_client as client:
+        workflow_def = WorkflowDefinition(name="Test Workflow")
+        id = client.post(
+            "/workflow_definition", json=workflow_def.model_dump(mode="json")
+        ).json()
+        workflow = Workflow.model_validate(
+            client.post("/workflow", data={"workflow_definition_id": id}).json()
+        )
+        cancelled = Workflow.model_validate(
+            client.post(f"/workflow/{workflow.workflow_id}/cancel").json()
+        )
+        assert cancelled.status.terminal is True
+        delete_archived_workflow = WorkcellStateHandler.delete_archived_workflow
+
+        def archive_then_delete(
+            state_handler: WorkcellStateHandler, workflow_id: str
+        ) -> None:
+            # * The engine archives from its cached read, taken before the retry
+            with patch.object(
+                state_handler,
+                "get_active_workflows",
+                return_value={cancelled.workflow_id: cancelled},
+            ):
+                state_handler.archive_terminal_workflows()
+            delete_archived_workflow(state_handler, workflow_id)
+
+        with patch.object(
+            WorkcellStateHandler,
+            "delete_archived_workflow",
+            autospec=True,
+            side_effect=archive_then_delete,
+        ):
+            response = client.post(
+                f"/workflow/{workflow.workflow_id}/retry", params={"index": 0}
+            )
+        assert response.status_code == 200
+        assert workflow.workflow_id in client.get("/workflows/active").json()
+        assert workflow.workflow_id not in client.get("/workflows/archived").json()
+        retried = Workflow.model_validate(
+            client.get(f"/workflow/{workflow.workflow_id}").json()
+        )
+        assert retried.status.terminal is False
+
+
 def test_check_parameter_missing() -> None:
     """Test parameter insertion with missing required parameter."""
     workflow = WorkflowDefinition(